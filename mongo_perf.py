@@ -29,18 +29,41 @@ exit 2
         or inserted into a Mongo database.
 
     Usage:
-        mongo_perf.py -c file -d path
+        mongo_perf.py {-c file | -F file [file2 ...] | -F dir_path} -d path
             {-S [-f] [-n count] [-b seconds] [-o file [-a]]
-                [-t ToEmail [ToEmail2 ...] [-s Subject Line] [-u]]
-                [-i db_name:table_name [-m file]] [-p path] [-w] [-z] [-r]}
+                [-t ToEmail [ToEmail2 ...] [-s Subject Line] [-u] [-q [-Z]]]
+                [-i db_name:table_name [-m file] [-U] [-W concern]
+                    [-G dir_path] [-H]]
+                [-k count] [-K seconds] [-B bytes [count] [seconds]]
+                [-Y seconds]
+                [-C gzip|zstd] [-O size|interval [...]] [-A count] [-p path]
+                [-w] [-z] [-r]
+                [-l] [-N] [-R] [-x count] [-D] [-T] [-Q policy [size]]
+                [-J dir_path] [-X dir_path] [-g [host:]port]
+                [-M host:port [statsd|graphite]] [-e module:class [...]]
+                [-j seconds]}
+            [-P cprofile|sample|alloc [seconds]]
             [-y flavor_id]
             [-v | -h]
 
+        mongo_perf.py -L file
+        mongo_perf.py -V file [file2 ...] -X dir_path
+        mongo_perf.py -I file|- [date] [-E] [-d path] {-S output options}
+            [-P cprofile|sample|alloc [seconds]]
+
     Arguments:
         -c file => Mongo configuration file.
-        -d dir path => Directory path to config file (-c option).
+        -F file [file2 ...] | dir_path => Fleet mode.  Monitors a number of
+                Mongo databases from a single process instead of the one
+                database in the -c option.  Either a list of Mongo
+                configuration files in the -d directory or a directory path
+                in which every configuration file (*.py) is loaded.  Fleet
+                mode always uses the native collector (-N option).
+        -d dir path => Directory path to config file (-c and -F options).
 
-        -S => Mongo Statistics option.
+        -S => Mongo Statistics option.  A mongostat run without the -i, -N,
+            -R or -D options makes no database connection of its own, so
+            pymongo is not loaded, unless the database uses SSL or TLS.
             -f => Flatten the JSON data structure to file and standard out.
             -n count => Number of loops to run the program. Default = 1.
             -b seconds => Polling interval in seconds.  Default = 1.
@@ -50,26 +73,230 @@ exit 2
                 -s Subject Line => Subject line of email.  If none is provided
                     then a default one will be used.
                 -u => Override the default mail command and use mailx.
+                -q => Digest.  Mails a summary table of the minimum,
+                    average, maximum and 95th percentile of each numeric
+                    statistic of each server instead of every sample.  The
+                    memory used does not grow with the number of samples,
+                    the percentile is an estimate once a statistic has
+                    more than 100 samples (DIGEST_EXACT).
+                    -Z => Attach the samples to the digest as a gzip
+                        compressed file, compressed to a temporary file as
+                        the samples arrive.  The mail library only sends a
+                        text body, so the digest with the attachment is
+                        sent directly through the local mail server, or
+                        mailx -a with the -u option.
             -i [database:collection] => Name of database and collection to
                     insert the database performance statistics data into.
+                    One connection to the insert database is kept for the
+                    run and the samples are inserted in batches.
                     Default value:  sysmon.mongo_perf
                 -m file => Mongo configuration file for inserting results into
                     a Mongo database.  This is loaded as a python module, do
                     not include the .py extension with the name.
+                -U => Unordered inserts.  The rest of a batch is inserted
+                    even if one document in the batch fails.
+                -W concern => Write concern for the inserts, either a number
+                    of members or a name, for example:  0, 1, majority.
+                    Default is the write concern of the insert database.
+                -G dir_path => Spool directory.  Samples that cannot be
+                    inserted are written to the spool on disk instead of
+                    being held in memory and inserted in the background
+                    once the insert database is reachable again.  The
+                    samples are given an _id of "Server|AsOf" so a sample
+                    is never inserted twice.  Directory must exist and be
+                    writable.  Cannot be used with the -H option, as a
+                    time-series collection does not enforce a unique _id.
+                -H => Insert into a time-series collection.  The collection
+                    is created if it does not exist, with AsOf as the time
+                    field and Meta (Server and RepSet) as the meta field
+                    and the granularity set from the -b option.  AsOf is
+                    stored as a date instead of a string.  Requires a
+                    Mongo 5.0 or better insert database.  Cannot be used
+                    with the -G option.
+            -k count => Number of samples inserted into the Mongo database
+                    (-i option) in one batch.  Default = 1.
+            -K seconds => Maximum number of seconds a sample is held before
+                    its batch is inserted.  A timer inserts the batch once
+                    its oldest sample is this old, without waiting for the
+                    next sample.  Default is to wait for a full batch (-k
+                    option).
             -o directory_path/file => Directory path and file name for output.
+                    The file is kept open for the run and written through a
+                    buffer, the buffer is written to the file every count
+                    samples and every number of seconds of the -B option
+                    and at the end of the run.
                 -a => Append output to output file.
+                -B bytes [count] [seconds] => Size of the output file
+                    buffer in bytes, the number of samples between writes
+                    of the buffer to the file and the maximum number of
+                    seconds a sample is held in the buffer.  A size of 0 is
+                    the system default buffer size.  Default is the system
+                    default buffer size and a write for every sample.
+                -Y seconds => Sync the output file to disk every number of
+                    seconds.  Default is to leave it to the system.
+                -C gzip|zstd => Compress the output file.  The output is
+                    compressed in its own thread and written as segments
+                    named file.<timestamp>.gz (or .zst).  A segment is
+                    written to a .part file and renamed once complete.
+                    zstd requires the zstandard package.
+                -O size|interval [...] => Rotate the output file to a new
+                    segment at a size in bytes (K, M, G suffix) or on a
+                    wall-clock interval (s, h, d suffix), for example:
+                    -O 100M 1d.  With the -C option the size is of the
+                    records before compression, so the segments on disk
+                    are smaller than the size.
+                    -A count => Number of segments to keep, the oldest
+                        segments are removed.  Default is to keep all.
+                The -a, -B and -Y options do not apply to segments.
             -p path =>  Path to Mongo binaries.  Only required if the user
                 running the program does not have the Mongo binaries in their
                 path.
             -w => Suppress printing initial connection errors.
             -z => Suppress standard out.
             -r => Turn off TLS checking.
+            -l => Stream the mongostat output.  Each sample is processed as
+                soon as mongostat produces it instead of waiting for
+                mongostat to complete all of its loops.
+            -N => Native collector.  Runs the serverStatus command over the
+                existing database connection and calculates the mongostat
+                equivalent statistics in the program instead of running the
+                mongostat utility program.  The -p, -r and -l options are
+                ignored.
+            -R => Replica set members.  Captures the statistics from every
+                member listed in repset_hosts at the same time, using one
+                direct connection per member.  Each sample is tagged with the
+                member's host:port, the replica set name and the member's
+                state.  Ignored if the configuration file is not for a
+                replica set.
+            -x count => Maximum number of databases sampled at the same time
+                in fleet mode (-F option).  Default = 10.
+            -D => Daemon mode.  Runs until the program is stopped, keeping
+                the connections to the monitored database and to the insert
+                database (-m option) open between samples.  Samples are taken
+                on a fixed schedule and a lost connection is reconnected with
+                an increasing wait between attempts (up to 5 minutes).  A
+                replica set member (-R option) or fleet database (-F option)
+                that fails to connect at start up is retried the same way.
+                Daemon mode always uses the native collector (-N option) and
+                the -n option is ignored.
+            -Q policy [size] => Queued outputs.  Each output (Mongo
+                database, output file, standard out and email) runs in its
+                own thread fed by a queue of up to size samples, so a slow
+                output does not delay the next sample.  The policy for a
+                full queue is one of:
+                    block => Wait for room in the queue.
+                    drop => Drop the oldest sample in the queue.
+                    spill => Write the sample to a temporary file on disk
+                        until the output catches up.
+                Default size = 1000.  The queue depth and lag of any output
+                that is falling behind is printed to standard error every
+                minute.
+            -T => Typed statistics.  Converts the mongostat values to
+                numbers:  sizes to bytes, percentages to floats, "a|b" pairs
+                into two fields (qrw to qr and qw, arw to ar and aw, command
+                to command and command_repl) and the "*" replicated operation
+                marker to a <operation>_repl true/false field.  The native
+                collector (-N option) always returns typed statistics.
+            -J dir_path => Round-robin history.  Each sample is averaged
+                into a fixed size, memory-mapped file per server
+                (<server>.rrd) holding 1 second rows for an hour, 1 minute
+                rows for a week and 1 hour rows for a year.  The metrics are
+                the numeric statistics of the first sample, the file does
+                not grow once created.  Metric names longer than 32 bytes
+                are not stored and are printed as a warning.  Directory
+                must exist and be writable.
+            -X dir_path => Columnar archive.  The numeric statistics are
+                written to <dir_path>/<server>/<YYYYMMDD>/ as one file of
+                float64 values per metric (<metric>.f64), the sample times
+                in seconds since the epoch (AsOf.f64) and a manifest.json
+                with the row count, time range and metrics of the block.
+                Rows are written in chunks of 600 samples and at the end
+                of the run.  A single metric can be read with
+                read_column or numpy.memmap without decoding any other
+                metric.  Directory must exist and be writable.
+            -g [host:]port => Prometheus endpoint.  Serves the latest sample
+                of each server at http://host:port/metrics in the text
+                exposition format, with server, repset and state labels.
+                The page is built at most once per sample from the cached
+                samples, scrapes never touch the monitored database.
+                Requires the -D option.  Default host is all interfaces.
+            -M host:port [statsd|graphite] => UDP emitter.  Sends each
+                numeric statistic to a StatsD daemon as a gauge or to a
+                Graphite (carbon) UDP listener as a plaintext line, named
+                mongo_perf.<server>.<statistic>.  The lines of a sample are
+                packed into datagrams of up to 1432 bytes.  Nothing is
+                waited on and datagrams that cannot be sent are dropped.
+                Default format is statsd.
+            -e module:class [...] => Output plugins.  Each class is
+                imported from a module on the Python path and must subclass
+                Sink, overriding write_batch(batch) and optionally
+                open(args), flush() and close().  The batch_size, max_wait
+                and retries class attributes set the batching and retries
+                of the output.  The built-in outputs run through the same
+                interface.  A batch that still fails after its retries is
+                dropped and printed as an output error, the other outputs
+                carry on.  The time spent in each output is printed to
+                standard error at the end of the run if a batch had to be
+                retried or was dropped.
+            -j seconds => Stage timers.  Times each stage of the pipeline
+                (sample:  waiting for the next sample, mongostat:  reading
+                the mongostat output, parse, decode (-T option), document,
+                encode and output_<output>) into histograms.  Every number
+                of seconds the count, average, 50th and 95th percentile and
+                maximum time in microseconds of each stage are sent through
+                the outputs as a sample of server mongo_perf, for example
+                encode_p95_us, and the totals of the run are printed to
+                standard error at the end of the run.  Off by default, the
+                stages are not wrapped at all when off.
 
+        -P mode [seconds] => Profile the run (-S, -F and -I options).  The
+                reports are written next to the output file (-o option) as
+                <file>.<ext>, or as mongo_perf.<ext> in the current
+                directory.  Only the main thread is profiled.  The mode is
+                one of:
+                cprofile => Profile every call with cProfile.  Writes a
+                    pstats file (.prof) and the top 20 functions by
+                    cumulative time (.prof.txt) at the end of the run.
+                sample => Sample the stack every number of seconds, for
+                    long runs where cProfile costs too much.
+                    Default = 0.01.  Writes the folded stacks (.stacks,
+                    for flame graph tools) and the top 20 functions by
+                    samples (.prof.txt) at the end of the run.
+                alloc => Take a tracemalloc snapshot every number of
+                    seconds and append the call sites that allocated the
+                    most since the start and since the last snapshot to
+                    the report (.alloc.txt), to find memory growth in long
+                    runs.  Default = 60.
         -y value => A flavor id for the program lock.  To create unique lock.
         -v => Display version of this program.
         -h => Help and usage message.
 
+        -L file => Dump a round-robin file (-J option) to standard out, one
+            JSON document per row with the archive step in seconds, the row
+            time and the average of each metric.  The -c and -d options
+            are not required.
+
+        -V file [file2 ...] => Convert JSON output files (-o option, also
+            .gz and .zst segments) into the columnar archive in the -X
+            option.  The -c and -d options are not required.
+
+        -I file|- [date] => Replay recorded mongostat --json output from a
+            file (also .gz and .zst) or from standard in (-).  The samples
+            go through the same processing and outputs as a live capture
+            and take the same output options as the -S option, for example
+            -T, -f, -o, -i, -t and -Q.  The server name is the host:port of
+            each row.  The date (YYYY-MM-DD) is the date of the first
+            sample, default is the date the file was last modified or
+            today for standard in.  Give the date for a capture that ran
+            past midnight.  The samples move to the next day when their
+            recorded time goes back.  The sample count and rate are
+            printed to standard error.  The -c option is not required,
+            the -d option is only required for the -m option.
+            -E => Pace the samples at their recorded times instead of
+                replaying them as fast as possible.
+
         NOTE 1:  -v and/or -h overrides all other options.
+        NOTE 2:  -c option is not required when the -F option is used.
 
     Known Bug:  The -a option is not working for the standard out format.
 
@@ -145,301 +372,5005 @@ exit 2
     Example:
         mongo_perf.py -c mongo -d config -S -f -n 12 -b 5 -i -m mongo2
         mongo_perf.py -c mongo -d config -S -o /data/perf_file.txt -a -n 5
+        mongo_perf.py -c mongo -d config -S -D -N -f -o /data/perf_file.txt -a
+            -B 1048576 60 30 -Y 300 -z
+        mongo_perf.py -c mongo -d config -S -l -n 720 -b 5 -i -m mongo2
+        mongo_perf.py -c mongo -d config -S -l -T -n 720 -b 5 -i -m mongo2
+        mongo_perf.py -c mongo -d config -S -N -n 720 -b 5 -i -m mongo2
+        mongo_perf.py -c mongo -d config -S -N -R -n 12 -b 5 -o /data/perf
+        mongo_perf.py -F /opt/fleet/config -d config -S -n 720 -b 5 -x 20 -i
+            -m mongo2
+        mongo_perf.py -c mongo -d config -S -D -b 5 -i -m mongo2 -z
+        mongo_perf.py -c mongo -d config -S -D -b 1 -i -m mongo2 -o
+            /data/perf_file.txt -Q drop 600 -z
+        mongo_perf.py -F /opt/fleet/config -d config -S -D -b 1 -i -m mongo2
+            -k 500 -K 10 -U -W 1 -z
+        mongo_perf.py -c mongo -d config -S -D -b 5 -i -m mongo2
+            -G /var/spool/mongo_perf -z
+        mongo_perf.py -c mongo -d config -S -D -b 10 -i sysmon:perf_ts
+            -m mongo2 -H -k 100 -z
+        mongo_perf.py -c mongo -d config -S -D -b 5 -f
+            -o /var/log/mongo_perf.json -C zstd -O 100M 1d -A 30 -z
+        mongo_perf.py -c mongo -d config -S -D -J /var/lib/mongo_perf -z
+        mongo_perf.py -L /var/lib/mongo_perf/hostname_27017.rrd
+        mongo_perf.py -c mongo -d config -S -D -X /data/archive -z
+        mongo_perf.py -V /var/log/mongo_perf.json.* -X /data/archive
+        mongo_perf.py -I /data/incident/mongostat.json.gz 2026-10-12 -T -f
+            -z -o /data/incident/perf.json
+        mongostat --json 1 | mongo_perf.py -I - -E -d config -i -m mongo2 -z
+        mongo_perf.py -F /opt/fleet/config -d config -S -D -b 15 -g 9216 -z
+        mongo_perf.py -c mongo -d config -S -D -b 1 -M localhost:8125 -z
+        mongo_perf.py -c mongo -d config -S -N -n 86400 -b 1 -t dba@domain
+            -q -Z -z
+        mongo_perf.py -c mongo -d config -S -D -b 1 -e kafka_sink:KafkaSink -z
 
 ":"""
 # Python program follows
+# pylint:disable=C0302
 
 
 # Libraries and Global Variables
 
 # Standard
 import sys
-import subprocess
-import ast
+import os
+import time
+import datetime
+import signal
+import glob
+import math
+import struct
+import itertools
+import functools
+import queue
+import importlib
+import importlib.util
+import re
+import threading
+import types
 
-try:
-    import simplejson as json
-except ImportError:
-    import json
+
+class LazyModule(types.ModuleType):                     # pylint:disable=R0903
+
+    """Class:  LazyModule
+
+    Description:  Stand-in for a module that imports the module on the
+        first attribute access and then takes on the module's attributes,
+        so later accesses are plain attribute lookups.  Used for the
+        modules only some options need, so a run does not pay for
+        importing them up front.
+
+    Methods:
+        __getattr__
+
+    """
+
+    def __getattr__(self, name):
+
+        """Method:  __getattr__
+
+        Description:  Imports the module, copies its attributes to this
+            instance and returns the attribute.  Only called for an
+            attribute the instance does not have.
+
+        Arguments:
+            (input) name -> Attribute name
+            (output) Attribute of the module
+
+        """
+
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+
+        return getattr(module, name)
+
+
+def lazy_import(name):
+
+    """Function:  lazy_import
+
+    Description:  Returns a module that is imported on first use.
+
+    Arguments:
+        (input) name -> Full module name
+        (output) LazyModule class instance or None if the module is not
+            installed
+
+    """
+
+    return LazyModule(name) \
+        if importlib.util.find_spec(name.split(".")[0]) else None
+
+
+# Imported on first use.
+subprocess = lazy_import("subprocess")
+gzip = lazy_import("gzip")
+mmap = lazy_import("mmap")
+array = lazy_import("array")
+tempfile = lazy_import("tempfile")
+cProfile = lazy_import("cProfile")                     # pylint:disable=C0103
+pstats = lazy_import("pstats")
+tracemalloc = lazy_import("tracemalloc")
+smtplib = lazy_import("smtplib")
+socket = lazy_import("socket")
+http_server = lazy_import("http.server")
+email_message = lazy_import("email.message")
+futures = lazy_import("concurrent.futures")
+json = lazy_import("simplejson") or lazy_import("json")
+
+# Third party
+pymongo = lazy_import("pymongo")
+json_util = lazy_import("bson.json_util")
+zstandard = lazy_import("zstandard")
 
 # Local
 try:
     from .lib import gen_libs
     from .lib import gen_class
-    from .mongo_lib import mongo_libs
-    from .mongo_lib import mongo_class
     from . import version
 
+    mongo_libs = lazy_import(__package__ + ".mongo_lib.mongo_libs")
+    mongo_class = lazy_import(__package__ + ".mongo_lib.mongo_class")
+
 except (ValueError, ImportError) as err:
     import lib.gen_libs as gen_libs                     # pylint:disable=R0402
     import lib.gen_class as gen_class                   # pylint:disable=R0402
-    import mongo_lib.mongo_libs as mongo_libs           # pylint:disable=R0402
-    import mongo_lib.mongo_class as mongo_class         # pylint:disable=R0402
     import version
 
+    mongo_libs = lazy_import("mongo_lib.mongo_libs")
+    mongo_class = lazy_import("mongo_lib.mongo_class")
+
 __version__ = version.__version__
 
 # Global
+OP_FIELDS = ["insert", "query", "update", "delete", "getmore"]
+REPL_OPS = ["insert", "update", "delete"]
+MAX_BACKOFF = 300
+MAX_PENDING = 10000
+STATUS_INTERVAL = 60
+SPOOL_SEGMENT = 16 * 2**20
+REPLAY_BATCH = 1000
+GRANULARITY = [(60, "seconds"), (3600, "minutes")]
+COMPRESS_EXT = {"gzip": ".gz", "zstd": ".zst"}
+TIME_UNITS = {"s": 1, "h": 3600, "d": 86400}
+RRD_MAGIC = b"MPRRD001"
+RRD_HEADER = struct.Struct("<8sII")
+RRD_NAME = struct.Struct("32s")
+RRD_ARCHIVE = struct.Struct("<II")
+RRD_ARCHIVES = [(1, 3600), (60, 10080), (3600, 8760)]
+ARCHIVE_CHUNK = 600
+NAME_CHARS = str.maketrans(":/", "__")
+PROM_LABELS = [("server", "Server"), ("repset", "RepSet"),
+               ("state", "RepState")]
+PROM_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+UDP_MTU = 1432
+UDP_FORMATS = ["statsd", "graphite"]
+DIGEST_PCT = 0.95
+DIGEST_EXACT = 100
+SINK_RETRY_WAIT = 0.5
+STAGE_BUCKETS = 32
+PROFILE_MODES = ["cprofile", "sample", "alloc"]
+PROFILE_WAIT = {"sample": 0.01, "alloc": 60}
+PROFILE_TOP = 20
+ALLOC_FRAMES = 5
+SELF_SERVER = "mongo_perf"
+SIZE_UNITS = {"b": 1, "k": 10**3, "m": 10**6, "g": 10**9, "t": 10**12,
+              "K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+MONGO_OPTS = ["-i", "-N", "-R", "-D"]
+SECURE_CFG = ["auth_type", "ssl_client_ca", "ssl_client_key",
+              "ssl_client_cert", "ssl_client_phrase", "tls_ca_certs",
+              "tls_certkey", "tls_certkey_phrase"]
 
 
-def help_message():
+class MongoInsert():                                    # pylint:disable=R0902
 
-    """Function:  help_message
+    """Class:  MongoInsert
 
-    Description:  Displays the program's docstring which is the help and usage
-        message when -h option is selected.
+    Description:  Holds an open connection to the Mongo database that the
+        performance documents are inserted into.  Documents are buffered and
+        inserted in batches, a batch is inserted when it reaches the batch
+        size or, by a timer, when its oldest document reaches the maximum
+        latency.  If the connection is lost, reconnects with an increasing
+        wait between attempts and keeps the buffered documents for the next
+        attempt, or writes them to the spool if there is one.  Can insert
+        into a time-series collection, reshaping each document to fit.
 
-    Arguments:
+    Methods:
+        __init__
+        connect
+        create_timeseries
+        insert
+        start_timer
+        expire
+        flush
+        spool_docs
+        replay
+        close
 
     """
 
-    print(__doc__)
+    def __init__(self, cfg, db_tbl, **kwargs):
 
+        """Method:  __init__
 
-def get_data(cmd):
+        Description:  Class initialization.
 
-    """Function:  get_data
+        Arguments:
+            (input) cfg -> Mongo server configuration
+            (input) db_tbl -> database:table_name
+            (input) **kwargs:
+                batch_size -> Number of documents per insert
+                max_latency -> Maximum seconds a document is buffered
+                ordered -> False for unordered inserts
+                write_concern -> Write concern (w) for the inserts
+                spool -> Spool class instance for undelivered documents
+                timeseries -> Granularity of the time-series collection
 
-    Description:  Opens a system call to run the program command.
+        """
 
-    Arguments:
-        (input) cmd -> List array holding program command line
-        (output) out -> Results of program command
+        self.cfg = cfg
+        self.dbn, self.tbl = db_tbl.split(":")
+        self.batch_size = kwargs.get("batch_size", 1)
+        self.max_latency = kwargs.get("max_latency", None)
+        self.ordered = kwargs.get("ordered", True)
+        self.write_concern = kwargs.get("write_concern", None)
+        self.spool = kwargs.get("spool", None)
+        self.timeseries = kwargs.get("timeseries", None)
+        self.replayer = None
+        self.coll = None
+        self.db_coll = None
+        self.docs = []
+        self.first_time = None
+        self.backoff = 1
+        self.retry_time = 0
+        self.timer = None
+        self.lock = threading.RLock()
 
-    """
+    def connect(self):
 
-    cmd = list(cmd)
-    proc1 = subprocess.Popen(                           # pylint:disable=R1732
-        cmd, stdout=subprocess.PIPE)
-    out, _ = proc1.communicate()
+        """Method:  connect
 
-    return out
+        Description:  Connects to the Mongo collection.  On a failure, sets
+            the time of the next connection attempt.
 
+        Arguments:
+            (output) status -> Tuple of connection status and error message
 
-def mongo_stat(server, args, **kwargs):                 # pylint:disable=R0914
+        """
 
-    """Function:  mongo_stat
+        self.coll = mongo_libs.crt_coll_inst(self.cfg, self.dbn, self.tbl)
+        status = self.coll.connect()
 
-    Description:  Creates and executes the mongostat utility program.
+        if status[0]:
+            self.db_coll = self.coll.db_coll
 
-    Arguments:
-        (input) server -> Database server instance
-        (input) args -> ArgParser class instance
-        (input) **kwargs:
-            req_arg -> List of options to add to cmd line
-            opt_arg -> Dictionary of additional options to add
-            ofile -> file name - Name of output file
-            db_tbl database:table_name -> Mongo database and table name
-            class_cfg -> Mongo server configuration
+            if self.write_concern is not None:
+                self.db_coll = self.db_coll.with_options(
+                    write_concern=pymongo.WriteConcern(w=self.write_concern))
 
-    """
+            if self.timeseries:
+                status = self.create_timeseries()
 
-    mail = None
-    mail_body = []
-    mode = "w"
-    indent = 4
-    outfile = kwargs.get("ofile", None)
-    no_std = args.arg_exist("-z")
-    cmd = mongo_libs.create_cmd(server, args, "mongostat", "-p", **kwargs)
+        if status[0]:
+            self.backoff = 1
 
-    if args.arg_exist("-a"):
-        mode = "a"
+        else:
+            self.coll = None
+            self.retry_time = time.monotonic() + self.backoff
+            self.backoff = min(self.backoff * 2, MAX_BACKOFF)
 
-    if args.arg_exist("-f"):
-        indent = None
+        return status
 
-    if args.arg_exist("-b"):
-        cmd.append(args.get_val("-b"))
+    def create_timeseries(self):
 
-    if args.arg_exist("-t"):
-        mail = gen_class.setup_mail(
-            args.get_val("-t"),
-            subj=args.get_val("-s", def_val="Mongodb_Performance"))
-
-    data = get_data(cmd)
-    data = data.decode()
-
-    for row in data.rstrip().split("\n"):
-        # Evaluate "row" to dict format.
-        _, value = ast.literal_eval(row).popitem()
-        time = value["time"]
-        value = gen_libs.rm_key(value, "time")
-        data = {
-            "Server": server.name,
-            "AsOf": gen_libs.get_date() + " " + time, "PerfStats": value}
-
-        if hasattr(value, "set") and hasattr(value, "repl"):
-            rep_set = value["set"]
-            rep_state = value["repl"]
-            value = gen_libs.rm_key(value, "set")
-            value = gen_libs.rm_key(value, "repl")
-            data["RepSet"] = rep_set
-            data["RepState"] = rep_state
-
-        mail_body.append(data)
-        process_json(data, outfile, indent, no_std, mode, **kwargs)
-
-        # Append to file after first loop.
-        mode = "a"
-
-    if mail:
-        for line in mail_body:
-            mail.add_2_msg(json.dumps(line, indent=indent))
+        """Method:  create_timeseries
 
-        mail.send_mail(use_mailx=args.arg_exist("-u"))
+        Description:  Creates the time-series collection if it does not
+            exist.
 
+        Arguments:
+            (output) status -> Tuple of create status and error message
 
-def process_json(data, outfile, indent, no_std, mode, **kwargs):
+        """
 
-    """Function:  process_json
+        database = self.db_coll.database
 
-    Description:  Process JSON data.
+        try:
+            if not database.list_collection_names(filter={"name": self.tbl}):
+                database.create_collection(
+                    self.tbl, timeseries={
+                        "timeField": "AsOf", "metaField": "Meta",
+                        "granularity": self.timeseries})
 
-    Arguments:
-        (input) data -> Dictionary of Mongo performance stat
-        (input) outfile -> Name of output file
-        (input) indent -> Indentation setting for JSON format
-        (input) no_std -> Suppress standard out
-        (input) mode -> File write mode (append|write)
-        (input) **kwargs:
-            db_tbl -> Mongo database and table name
-            class_cfg -> Mongo server configuration
+        # Created by another process since the check.
+        except pymongo.errors.CollectionInvalid:
+            pass
 
-    """
+        except pymongo.errors.PyMongoError as err:
+            mongo_libs.disconnect([self.coll])
+            return False, f"Unable to create time-series collection: {err}"
 
-    data = dict(data)
+        return True, None
 
-    if kwargs.get("db_tbl", False) and kwargs.get("class_cfg", False):
-        dbn, tbl = kwargs.get("db_tbl").split(":")
-        status = mongo_libs.ins_doc(kwargs.get("class_cfg"), dbn, tbl, data)
+    def insert(self, doc):
 
-        if not status[0]:
-            print(f"Insert error:  {status[1]}")
+        """Method:  insert
 
-    if outfile:
-        gen_libs.write_file(outfile, mode, json.dumps(data, indent=indent))
+        Description:  Adds a document to the buffer and inserts the buffered
+            documents if the batch size or the maximum latency is reached.
+            Otherwise starts the timer for the maximum latency, if it is not
+            already running.
 
-    if not no_std:
-        gen_libs.print_data(json.dumps(data, indent=indent))
+        Arguments:
+            (input) doc -> Dictionary document
+            (output) Tuple of insert status and error message
 
+        """
 
-def run_program(args, func_dict, **kwargs):
+        with self.lock:
+            if not self.docs:
+                self.first_time = time.monotonic()
 
-    """Function:  run_program
+            doc = dict(doc)
 
-    Description:  Creates class instance(s) and controls flow of the program.
+            # A repeated insert of a spooled document is then a duplicate.
+            if self.spool:
+                doc["_id"] = f"{doc.get('Server')}|{doc.get('AsOf')}"
 
-    Arguments:
-        (input) args -> ArgParser class instance
-        (input) func_dict -> Dictionary list of functions and options
-        (input) **kwargs:
-            req_arg -> List of options to add to cmd line
-            opt_arg -> Dictionary of additional options to add
+            if self.timeseries:
+                doc = timeseries_doc(doc)
+
+            self.docs.append(doc)
+
+            # Drop the oldest documents if the database has been unreachable.
+            del self.docs[:-MAX_PENDING]
+
+            if len(self.docs) >= self.batch_size:
+                return self.flush()
+
+            if self.max_latency is not None:
+                wait = self.first_time + self.max_latency - time.monotonic()
+
+                if wait <= 0:
+                    return self.flush()
+
+                if not self.timer:
+                    self.start_timer(wait)
+
+            return True, None
+
+    def start_timer(self, wait):
+
+        """Method:  start_timer
+
+        Description:  Starts a timer thread that calls expire after a number
+            of seconds.
+
+        Arguments:
+            (input) wait -> Seconds before the timer expires
+
+        """
+
+        self.timer = threading.Timer(wait, self.expire)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def expire(self):
+
+        """Method:  expire
+
+        Description:  Inserts the buffered documents once the oldest reaches
+            the maximum latency, without waiting for the next document.  The
+            timer is started again while documents are waiting, either for a
+            newer batch or to reconnect to the insert database.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            # The timer was cancelled while waiting for the lock.
+            if threading.current_thread() is not self.timer:
+                return
+
+            self.timer = None
+
+            if not self.docs:
+                return
+
+            wait = max(self.first_time + self.max_latency,
+                       self.retry_time) - time.monotonic()
+
+            if wait <= 0:
+                status = self.flush()
+
+                if not status[0]:
+                    print(f"Insert error:  {status[1]}")
+
+                wait = max(self.retry_time - time.monotonic(), 1)
+
+            if self.docs:
+                self.start_timer(wait)
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Inserts the buffered documents, reconnecting first if
+            the connection was lost.
+
+        Arguments:
+            (output) Tuple of insert status and error message
+
+        """
+
+        if not self.docs:
+            return True, None
+
+        if not self.coll:
+            status = (False, "Waiting to reconnect to the insert database") \
+                if time.monotonic() < self.retry_time else self.connect()
+
+            if not status[0]:
+                self.spool_docs()
+                return status
+
+        docs, self.docs = self.docs, []
+
+        try:
+            insert_docs(self.db_coll, docs, self.ordered)
+
+        # The server rejected documents, sending them again will not help.
+        except pymongo.errors.BulkWriteError as err:
+            return False, str(err)
+
+        except Exception as err:                        # pylint:disable=W0718
+            self.docs = docs + self.docs
+            self.spool_docs()
+            mongo_libs.disconnect([self.coll])
+            self.coll = None
+            self.retry_time = time.monotonic() + self.backoff
+            self.backoff = min(self.backoff * 2, MAX_BACKOFF)
+
+            return False, str(err)
+
+        self.replay()
+
+        return True, None
+
+    def spool_docs(self):
+
+        """Method:  spool_docs
+
+        Description:  Moves the buffered documents into the spool, if there
+            is one, so they are not held in memory or lost.
+
+        Arguments:
+
+        """
+
+        if self.spool and self.docs:
+            self.spool.append(self.docs)
+            self.docs = []
+
+    def replay(self):
+
+        """Method:  replay
+
+        Description:  Starts a background thread to insert the spooled
+            documents, if there are any and one is not already running.
+
+        Arguments:
+
+        """
+
+        if self.spool and self.spool.pending and not (
+                self.replayer and self.replayer.is_alive()):
+            self.replayer = threading.Thread(
+                target=self.spool.replay, args=(self.db_coll,),
+                name="spool-replay", daemon=True)
+            self.replayer.start()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Inserts any buffered documents and disconnects from the
+            Mongo collection.
+
+        Arguments:
+            (output) status -> Tuple of insert status and error message
+
+        """
+
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+
+            # Last attempt to insert the buffered documents.
+            self.retry_time = 0
+            status = self.flush()
+
+        if self.replayer:
+            self.replayer.join()
+
+        if self.spool:
+            self.spool.close()
+
+        if self.coll:
+            mongo_libs.disconnect([self.coll])
+            self.coll = None
+            self.db_coll = None
+
+        return status
+
+
+class Spool():
+
+    """Class:  Spool
+
+    Description:  Append-only local spool of the documents that could not be
+        inserted into the Mongo database.  Documents are written to segment
+        files in the spool directory, a segment is only removed once all of
+        its documents are inserted.
+
+    Methods:
+        __init__
+        append
+        segments
+        replay
+        close
 
     """
 
-    authdb = "--authenticationDatabase="
-    func_dict = dict(func_dict)
-    outfile = args.get_val("-o", def_val=False)
-    db_tbl = args.get_val("-i", def_val=False)
-    cfg = None
-    server = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
-    req_arg = list(kwargs.get("req_arg", []))
-    opt_arg = dict(kwargs.get("opt_arg", {}))
+    def __init__(self, spool_dir, segment_size=SPOOL_SEGMENT):
 
-    if authdb in req_arg:
-        req_arg.remove(authdb)
-        req_arg.append(authdb + server.auth_db)
+        """Method:  __init__
 
-    if args.arg_exist("-m"):
-        cfg = gen_libs.load_module(args.get_val("-m"), args.get_val("-d"))
+        Description:  Class initialization.
 
-    if server.repset and server.repset_hosts:
-        config = mongo_libs.create_security_config(cfg=server)
-        mongo = mongo_class.RepSet(
-            server.name, server.user, server.japd, host=server.host,
-            port=server.port, auth=server.auth, repset=server.repset,
-            repset_hosts=server.repset_hosts, **config)
+        Arguments:
+            (input) spool_dir -> Directory path to the spool segments
+            (input) segment_size -> Size in bytes to start a new segment
 
-    else:
-        mongo = mongo_libs.create_instance(
-            args.get_val("-c"), args.get_val("-d"), mongo_class.Server)
+        """
 
-    status = mongo.connect()
+        self.spool_dir = spool_dir
+        self.segment_size = segment_size
+        self.fhandle = None
+        self.lock = threading.Lock()
+        self.pending = bool(self.segments())
 
-    if status[0]:
-        # Call function(s) - intersection of command line and function dict.
-        for item in set(args.get_args_keys()) & set(func_dict.keys()):
-            func_dict[item](
-                mongo, args, ofile=outfile, db_tbl=db_tbl, class_cfg=cfg,
-                req_arg=req_arg, opt_arg=opt_arg)
+    def append(self, docs):
 
-        mongo_libs.disconnect([mongo])
+        """Method:  append
 
-    else:
-        if not args.arg_exist("-w"):
-            print(f"run_program: Connection failure:  {status[1]}")
+        Description:  Writes documents to the current segment and syncs the
+            segment to disk.
 
+        Arguments:
+            (input) docs -> List of dictionary documents
 
-def main():
+        """
 
-    """Function:  main
+        with self.lock:
+            if not self.fhandle:
+                self.fhandle = open(                    # pylint:disable=R1732
+                    os.path.join(self.spool_dir,
+                                 f"spool-{time.time_ns():020d}.json"),
+                    mode="a", encoding="UTF-8")
 
-    Description:  Initializes program-wide used variables and processes command
-        line arguments and values.
+            self.fhandle.write(
+                "".join(json_util.dumps(doc) + "\n" for doc in docs))
+            self.fhandle.flush()
+            os.fsync(self.fhandle.fileno())
+            self.pending = True
 
-    Variables:
-        dir_perms_chk -> contains directories and their octal permissions
-        file_perm_chk -> file check options with their perms in octal
-        file_crt -> contains options which require files to be created
-        func_dict -> dictionary list for the function calls or other options
-        opt_arg_list -> contains optional arguments for the command line
-        opt_con_req_list -> contains the options that require other options
-        opt_def_dict -> contains options with their default values
-        opt_def_dict2 -> default values for "-S" option
-        opt_multi_list -> contains the options that will have multiple values
-        opt_req_list -> contains the options that are required for the program
-        opt_val_list -> contains options which require values
-        req_arg_list -> contains arguments to add to command line by default
+            if self.fhandle.tell() >= self.segment_size:
+                self.fhandle.close()
+                self.fhandle = None
+
+    def segments(self):
+
+        """Method:  segments
+
+        Description:  Ends the current segment and returns the segment files,
+            oldest first.
+
+        Arguments:
+            (output) List of segment file names
+
+        """
+
+        if self.fhandle:
+            self.fhandle.close()
+            self.fhandle = None
+
+        return sorted(glob.glob(os.path.join(self.spool_dir, "spool-*.json")))
+
+    def replay(self, db_coll):
+
+        """Method:  replay
+
+        Description:  Inserts the documents in each segment in batches and
+            removes the segment.  Stops at the first failure, leaving the
+            rest of the segments for the next replay.
+
+        Arguments:
+            (input) db_coll -> Collection to insert the documents into
+
+        """
+
+        with self.lock:
+            segments = self.segments()
+
+        try:
+            for segment in segments:
+                docs = []
+
+                with open(segment, mode="r", encoding="UTF-8") as fhdr:
+                    for line in fhdr:
+                        # Skip a partly written document from a crash.
+                        try:
+                            docs.append(json_util.loads(line))
+
+                        except ValueError:
+                            continue
+
+                for item in range(0, len(docs), REPLAY_BATCH):
+                    insert_docs(
+                        db_coll, docs[item:item + REPLAY_BATCH], False)
+
+                os.remove(segment)
+
+        except Exception as err:                        # pylint:disable=W0718
+            print(f"Spool replay error:  {err}")
+
+        with self.lock:
+            self.pending = bool(self.fhandle or glob.glob(
+                os.path.join(self.spool_dir, "spool-*.json")))
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Closes the current segment.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            if self.fhandle:
+                self.fhandle.close()
+                self.fhandle = None
+
+
+def timeseries_doc(doc):
+
+    """Function:  timeseries_doc
+
+    Description:  Reshapes a performance document for a time-series
+        collection.  The server and replica set name are moved into the Meta
+        field and AsOf is converted from local time to a date.
 
     Arguments:
-        (input) argv -> Arguments from the command line
+        (input) doc -> Dictionary of Mongo performance stat
+        (output) data -> Time-series document
 
     """
 
-    dir_perms_chk = {"-d": 5, "-p": 5}
-    file_perm_chk = {"-o": 6}
-    file_crt = ["-o"]
-    func_dict = {"-S": mongo_stat}
-    opt_arg_list = {"-n": "-n=", "-r": "--tlsInsecure"}
-    opt_con_req_list = {"-i": ["-m"], "-s": ["-t"], "-u": ["-t"]}
-    opt_def_dict = {"-i": "sysmon:mongo_perf", "-n": "1", "-b": "1"}
-    opt_def_dict2 = {"-n": "1", "-b": "1"}
-    opt_multi_list = ["-s", "-t"]
-    opt_req_list = ["-c", "-d"]
-    opt_val_list = ["-c", "-d", "-b", "-i", "-m", "-n", "-o", "-p", "-s", "-t"]
-    req_arg_list = ["--authenticationDatabase=", "--json"]
+    data = {key: val for key, val in doc.items()
+            if key not in ("Server", "RepSet")}
+    data["AsOf"] = datetime.datetime.strptime(
+        doc["AsOf"], "%Y-%m-%d %H:%M:%S").astimezone(datetime.timezone.utc)
+    data["Meta"] = {"Server": doc["Server"]}
 
-    # Process argument list from command line.
-    args = gen_class.ArgParser(
-        sys.argv, opt_val=opt_val_list, opt_def=opt_def_dict,
-        multi_val=opt_multi_list, do_parse=True)
+    if "RepSet" in doc:
+        data["Meta"]["RepSet"] = doc["RepSet"]
 
-    # Add default arguments for certain argument combinations.
-    if args.arg_exist("-S"):
-        args.arg_add_def(defaults=opt_def_dict2)
+    return data
 
-    if not gen_libs.help_func(args, __version__, help_message)              \
-       and args.arg_require(opt_req=opt_req_list)                           \
-       and args.arg_cond_req(opt_con_req=opt_con_req_list)                  \
-       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)                    \
-       and args.arg_file_chk(file_perm_chk=file_perm_chk, file_crt=file_crt):
 
-        try:
-            proglock = gen_class.ProgramLock(
-                sys.argv, args.get_val("-y", def_val=""))
-            run_program(
-                args, func_dict, req_arg=req_arg_list, opt_arg=opt_arg_list)
+def insert_docs(db_coll, docs, ordered):
+
+    """Function:  insert_docs
+
+    Description:  Inserts documents into a collection, skipping documents
+        that are already in the collection (duplicate _id).
+
+    Arguments:
+        (input) db_coll -> Collection to insert the documents into
+        (input) docs -> List of dictionary documents
+        (input) ordered -> False for unordered inserts
+
+    """
+
+    try:
+        db_coll.insert_many(docs, ordered=ordered)
+
+    except pymongo.errors.BulkWriteError as err:
+        errors = err.details.get("writeErrors", [])
+
+        if not errors or any(item.get("code") != 11000 for item in errors):
+            raise
+
+        # An ordered insert stops at the duplicate, insert the rest.
+        if ordered and errors[-1]["index"] + 1 < len(docs):
+            insert_docs(db_coll, docs[errors[-1]["index"] + 1:], ordered)
+
+
+class RoundRobin():
+
+    """Class:  RoundRobin
+
+    Description:  Fixed size store of numeric metrics in a memory-mapped
+        file.  The file holds a number of archives, each with a fixed number
+        of rows at its own step in seconds.  A sample is averaged into the
+        current row of every archive, overwriting the oldest row once the
+        archive wraps around.  Readers use the rows and fetch methods.
+
+    Methods:
+        __init__
+        create
+        update
+        rows
+        fetch
+        close
+
+    """
+
+    def __init__(self, fname, metrics=None, readonly=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.  Creates the file if it does not
+            exist and maps it into memory.
+
+        Arguments:
+            (input) fname -> Name of round-robin file
+            (input) metrics -> List of metric names to create the file with
+            (input) readonly -> True to open the file for reading only
+
+        """
+
+        if not os.path.exists(fname) and not readonly:
+            self.create(fname, metrics)
+
+        self.fhandle = open(                            # pylint:disable=R1732
+            fname, mode="rb" if readonly else "r+b")
+        self.mmap = mmap.mmap(
+            self.fhandle.fileno(), 0,
+            access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+        magic, count, arch_count = RRD_HEADER.unpack_from(self.mmap, 0)
+
+        if magic != RRD_MAGIC:
+            self.close()
+            raise ValueError(f"Not a round-robin file:  {fname}")
+
+        offset = RRD_HEADER.size
+        self.metrics = []
+
+        for _ in range(count):
+            self.metrics.append(RRD_NAME.unpack_from(
+                self.mmap, offset)[0].rstrip(b"\0").decode("UTF-8"))
+            offset += RRD_NAME.size
+
+        self.row = struct.Struct("<qq" + "d" * count)
+        self.archives = []
+        data_offset = offset + RRD_ARCHIVE.size * arch_count
+
+        for _ in range(arch_count):
+            step, rows = RRD_ARCHIVE.unpack_from(self.mmap, offset)
+            self.archives.append((step, rows, data_offset))
+            offset += RRD_ARCHIVE.size
+            data_offset += rows * self.row.size
+
+    def create(self, fname, metrics):
+
+        """Method:  create
+
+        Description:  Creates an empty round-robin file at its full size.
+            The file is written under a temporary name and renamed.  Metric
+            names longer than the name field (32 bytes) are left out of the
+            file with a warning, as a truncated name would never match.
+
+        Arguments:
+            (input) fname -> Name of round-robin file
+            (input) metrics -> List of metric names
+
+        """
+
+        long_names = [name for name in metrics
+                      if len(name.encode("UTF-8")) > RRD_NAME.size]
+
+        if long_names:
+            print(f"Warning:  -J {fname}:  Metric names longer than "
+                  f"{RRD_NAME.size} bytes not stored:  {long_names}",
+                  file=sys.stderr)
+            metrics = [name for name in metrics if name not in long_names]
+
+        row = struct.Struct("<qq" + "d" * len(metrics))
+        header = RRD_HEADER.pack(RRD_MAGIC, len(metrics), len(RRD_ARCHIVES))
+        header += b"".join(RRD_NAME.pack(name.encode("UTF-8"))
+                           for name in metrics)
+        header += b"".join(RRD_ARCHIVE.pack(step, rows)
+                           for step, rows in RRD_ARCHIVES)
+
+        with open(fname + ".part", mode="wb") as fhdr:
+            fhdr.write(header)
+            fhdr.truncate(len(header) + row.size * sum(
+                rows for _, rows in RRD_ARCHIVES))
+
+        os.replace(fname + ".part", fname)
+
+    def update(self, timestamp, values):
+
+        """Method:  update
+
+        Description:  Averages the metric values into the current row of
+            each archive.  A row left from a previous pass of the archive is
+            started over.
+
+        Arguments:
+            (input) timestamp -> Sample time in seconds since the epoch
+            (input) values -> Dictionary of metric names and values
+
+        """
+
+        for step, rows, offset in self.archives:
+            slot = int(timestamp // step) * step
+            pos = offset + (slot // step % rows) * self.row.size
+            row = self.row.unpack_from(self.mmap, pos)
+            count = row[1] if row[0] == slot else 0
+            new = []
+
+            for old, name in zip(row[2:], self.metrics):
+                value = values.get(name)
+
+                if value is None:
+                    value = old if count else math.nan
+
+                elif count and not math.isnan(old):
+                    value = old + (value - old) / (count + 1)
+
+                new.append(value)
+
+            self.row.pack_into(self.mmap, pos, slot, count + 1, *new)
+
+    def rows(self, step):
+
+        """Method:  rows
+
+        Description:  Returns the rows of an archive oldest first, skipping
+            empty rows and metrics without a value.
+
+        Arguments:
+            (input) step -> Step in seconds of the archive
+            (output) List of row time and dictionary of metric values pairs
+
+        """
+
+        data = []
+
+        for arch_step, rows, offset in self.archives:
+            if arch_step == step:
+                for idx in range(rows):
+                    row = self.row.unpack_from(
+                        self.mmap, offset + idx * self.row.size)
+
+                    if row[1]:
+                        data.append((row[0], {
+                            name: value for name, value in
+                            zip(self.metrics, row[2:])
+                            if not math.isnan(value)}))
+
+        return sorted(data, key=lambda item: item[0])
+
+    def fetch(self, metric, step=None, start=0, end=None):
+
+        """Method:  fetch
+
+        Description:  Returns the values of a metric in a time range.
+
+        Arguments:
+            (input) metric -> Name of metric
+            (input) step -> Step in seconds of the archive, default is the
+                finest archive
+            (input) start -> Start time in seconds since the epoch
+            (input) end -> End time in seconds since the epoch
+            (output) List of row time and value pairs
+
+        """
+
+        step = step or self.archives[0][0]
+
+        return [(stamp, values[metric]) for stamp, values in self.rows(step)
+                if stamp >= start and (end is None or stamp <= end)
+                and metric in values]
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Writes the changes to disk and closes the file.
+
+        Arguments:
+
+        """
+
+        if self.fhandle.writable():
+            self.mmap.flush()
+
+        self.mmap.close()
+        self.fhandle.close()
+
+
+class ColumnArchive():
+
+    """Class:  ColumnArchive
+
+    Description:  Columnar archive of the numeric statistics.  Each server
+        has a directory of daily blocks, a block holds one file of float64
+        values per metric, the sample times (AsOf.f64) and a manifest.json.
+        Rows are buffered and appended to the column files in chunks.  A
+        metric that first appears part way through a block is padded with
+        NaN values so every column in a block has the same rows.
+
+    Methods:
+        __init__
+        append
+        open_block
+        flush
+        close
+
+    """
+
+    def __init__(self, archive_dir, chunk_rows=ARCHIVE_CHUNK):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) archive_dir -> Directory of the archive
+            (input) chunk_rows -> Number of rows buffered between writes
+
+        """
+
+        self.archive_dir = archive_dir
+        self.chunk_rows = chunk_rows
+        self.blocks = {}
+
+    def append(self, data, metrics=None):
+
+        """Method:  append
+
+        Description:  Adds the numeric statistics of a performance document
+            to the block of its server and day.
+
+        Arguments:
+            (input) data -> Dictionary of Mongo performance stat
+            (input) metrics -> Sample time and metrics pair from
+                sample_metrics, decoded from the data if not given
+
+        """
+
+        stamp, stats = metrics or sample_metrics(data)
+        name = time.strftime("%Y%m%d", time.localtime(stamp))
+        block = self.blocks.get(data["Server"])
+
+        if not block or block["name"] != name:
+            if block:
+                self.flush(data["Server"])
+
+            block = self.open_block(data["Server"], name)
+            self.blocks[data["Server"]] = block
+
+        columns = block["buffer"]
+        count = len(columns["AsOf"])
+
+        for key in stats:
+            if key not in columns:
+                columns[key] = array.array("d", [math.nan] * count)
+
+        for key, column in columns.items():
+            column.append(stamp if key == "AsOf" else
+                          stats.get(key, math.nan))
+
+        if count + 1 >= self.chunk_rows:
+            self.flush(data["Server"])
+
+    def open_block(self, server, name):
+
+        """Method:  open_block
+
+        Description:  Opens the block of a server and day, continuing an
+            existing block from its manifest.  Column data written after the
+            last manifest update is removed, including the column files of
+            metrics not yet in the manifest.
+
+        Arguments:
+            (input) server -> Server name
+            (input) name -> Block name (YYYYMMDD)
+            (output) block -> Dictionary of the block state
+
+        """
+
+        path = os.path.join(
+            self.archive_dir, server.translate(NAME_CHARS), name)
+        os.makedirs(path, exist_ok=True)
+        block = {"server": server, "name": name, "path": path, "rows": 0,
+                 "columns": [], "start": None, "end": None}
+
+        if os.path.exists(os.path.join(path, "manifest.json")):
+            with open(os.path.join(path, "manifest.json"), mode="r",
+                      encoding="UTF-8") as fhdr:
+                manifest = json.load(fhdr)
+
+            block.update(rows=manifest["Rows"], columns=manifest["Columns"],
+                         start=manifest["Start"], end=manifest["End"])
+
+        for fname in os.listdir(path):
+            if not fname.endswith(".f64"):
+                continue
+
+            if fname[:-4] not in ["AsOf"] + block["columns"]:
+                os.remove(os.path.join(path, fname))
+
+            elif os.path.getsize(os.path.join(path, fname)) \
+                    > block["rows"] * 8:
+                os.truncate(os.path.join(path, fname), block["rows"] * 8)
+
+        block["buffer"] = {key: array.array("d")
+                           for key in ["AsOf"] + block["columns"]}
+
+        return block
+
+    def flush(self, server):
+
+        """Method:  flush
+
+        Description:  Appends the buffered rows of a server to the column
+            files and replaces the manifest.
+
+        Arguments:
+            (input) server -> Server name
+
+        """
+
+        block = self.blocks[server]
+        columns = block["buffer"]
+
+        if not columns["AsOf"]:
+            return
+
+        for key, column in columns.items():
+            with open(os.path.join(block["path"], key + ".f64"),
+                      mode="ab") as fhdr:
+                if key != "AsOf" and key not in block["columns"]:
+                    fhdr.write(array.array(
+                        "d", [math.nan] * block["rows"]).tobytes())
+
+                fhdr.write(column.tobytes())
+
+        block["rows"] += len(columns["AsOf"])
+        block["columns"] = sorted(key for key in columns if key != "AsOf")
+        block["start"] = block["start"] or columns["AsOf"][0]
+        block["end"] = columns["AsOf"][-1]
+        manifest = os.path.join(block["path"], "manifest.json")
+
+        with open(manifest + ".part", mode="w", encoding="UTF-8") as fhdr:
+            json.dump({"Server": server, "Block": block["name"],
+                       "Rows": block["rows"], "Start": block["start"],
+                       "End": block["end"], "Type": "float64",
+                       "ByteOrder": sys.byteorder,
+                       "Columns": block["columns"]}, fhdr)
+
+        os.replace(manifest + ".part", manifest)
+        block["buffer"] = {key: array.array("d") for key in columns}
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Writes the buffered rows of every server.
+
+        Arguments:
+
+        """
+
+        for server in self.blocks:
+            self.flush(server)
+
+
+class MetricsServer():
+
+    """Class:  MetricsServer
+
+    Description:  Embedded HTTP server for Prometheus scrapes.  Holds the
+        latest numeric statistics of each server and serves them in the text
+        exposition format.  The page is rendered on the first scrape after a
+        new sample and the encoded page is served to every scrape until the
+        next sample.
+
+    Methods:
+        __init__
+        update
+        render
+        close
+
+    """
+
+    def __init__(self, address):
+
+        """Method:  __init__
+
+        Description:  Class initialization and starts the HTTP server thread.
+
+        Arguments:
+            (input) address -> Listen address as [host:]port
+
+        """
+
+        host, _, port = address.rpartition(":")
+        self.samples = {}
+        self.snapshot = None
+        self.lock = threading.Lock()
+        self.httpd = http_server.ThreadingHTTPServer(
+            (host, int(port)), type("MetricsHandler", (
+                MetricsHandler, http_server.BaseHTTPRequestHandler), {}))
+        self.httpd.daemon_threads = True
+        self.httpd.metrics = self
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, name="metrics", daemon=True)
+        self.thread.start()
+
+    def update(self, data, metrics=None):
+
+        """Method:  update
+
+        Description:  Replaces the latest sample of a server.
+
+        Arguments:
+            (input) data -> Dictionary of Mongo performance stat
+            (input) metrics -> Sample time and metrics pair from
+                sample_metrics, decoded from the data if not given
+
+        """
+
+        stamp, stats = metrics or sample_metrics(data)
+        labels = ",".join(
+            f'{name}="{str(data[key]).translate(PROM_ESCAPE)}"'
+            for name, key in PROM_LABELS if key in data)
+        stats = dict(stats, sample_time_seconds=stamp)
+
+        with self.lock:
+            self.samples[data["Server"]] = (labels, stats)
+            self.snapshot = None
+
+    def render(self):
+
+        """Method:  render
+
+        Description:  Returns the encoded exposition page, rendering it
+            if there is a new sample since the last render.
+
+        Arguments:
+            (output) Exposition page as bytes
+
+        """
+
+        with self.lock:
+            if self.snapshot is None:
+                lines = []
+                names = sorted({key for _, stats in self.samples.values()
+                                for key in stats})
+
+                for key in names:
+                    metric = "mongo_perf_" + re.sub(r"[^a-zA-Z0-9_]", "_", key)
+                    lines.append(f"# TYPE {metric} gauge")
+                    lines.extend(
+                        f"{metric}{{{labels}}} {stats[key]}" for labels, stats
+                        in self.samples.values() if key in stats)
+
+                self.snapshot = ("\n".join(lines) + "\n").encode("UTF-8")
+
+            return self.snapshot
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stops the HTTP server.
+
+        Arguments:
+
+        """
+
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+
+class MetricsHandler():                                 # pylint:disable=E1101
+
+    """Class:  MetricsHandler
+
+    Description:  Request handler methods for the MetricsServer class,
+        combined with http.server.BaseHTTPRequestHandler when the server
+        starts so http.server is only imported for the -g option.
+
+    Methods:
+        do_GET
+        log_message
+
+    """
+
+    def do_GET(self):                                   # pylint:disable=C0103
+
+        """Method:  do_GET
+
+        Description:  Sends the exposition page for /metrics.
+
+        Arguments:
+
+        """
+
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = self.server.metrics.render()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):      # pylint:disable=W0622,W0221
+
+        """Method:  log_message
+
+        Description:  Turns off the request log.
+
+        Arguments:
+
+        """
+
+
+class UdpEmitter():
+
+    """Class:  UdpEmitter
+
+    Description:  Fire-and-forget UDP sender of the numeric statistics as
+        StatsD gauges or Graphite plaintext lines.  The lines of a sample are
+        packed into as few datagrams as fit the MTU and a datagram that
+        cannot be sent is counted and dropped.
+
+    Methods:
+        __init__
+        lines
+        send
+        close
+
+    """
+
+    def __init__(self, address, fmt="statsd", mtu=UDP_MTU):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) address -> Destination address as host:port
+            (input) fmt -> Line format:  statsd or graphite
+            (input) mtu -> Maximum datagram payload in bytes
+
+        """
+
+        host, _, port = address.rpartition(":")
+        family, stype, proto, _, addr = socket.getaddrinfo(
+            host or "localhost", int(port), type=socket.SOCK_DGRAM)[0]
+        self.sock = socket.socket(family, stype, proto)
+        self.sock.connect(addr)
+        self.fmt = fmt
+        self.mtu = mtu
+        self.sent = 0
+        self.dropped = 0
+
+    def lines(self, data, metrics=None):
+
+        """Method:  lines
+
+        Description:  Returns the encoded lines of a performance document,
+            one per numeric statistic, named
+            mongo_perf.<server>.<statistic>.
+
+        Arguments:
+            (input) data -> Dictionary of Mongo performance stat
+            (input) metrics -> Sample time and metrics pair from
+                sample_metrics, decoded from the data if not given
+            (output) List of encoded lines
+
+        """
+
+        stamp, stats = metrics or sample_metrics(data)
+        prefix = "mongo_perf." + re.sub(r"[^a-zA-Z0-9_-]", "_", data["Server"])
+        lines = []
+
+        for key, val in stats.items():
+            name = prefix + "." + re.sub(r"[^a-zA-Z0-9_-]", "_", key)
+
+            if self.fmt == "graphite":
+                lines.append(f"{name} {val} {int(stamp)}".encode("UTF-8"))
+
+            else:
+                lines.append(f"{name}:{val}|g".encode("UTF-8"))
+
+        return lines
+
+    def send(self, data, metrics=None):
+
+        """Method:  send
+
+        Description:  Sends the statistics of a performance document.
+
+        Arguments:
+            (input) data -> Dictionary of Mongo performance stat
+            (input) metrics -> Sample time and metrics pair from
+                sample_metrics, decoded from the data if not given
+
+        """
+
+        packets = [b""]
+
+        for line in self.lines(data, metrics):
+            if packets[-1] and len(packets[-1]) + len(line) + 1 > self.mtu:
+                packets.append(b"")
+
+            packets[-1] += (b"\n" if packets[-1] else b"") + line
+
+        for packet in filter(None, packets):
+            try:
+                self.sock.send(packet)
+                self.sent += 1
+
+            except OSError:
+                self.dropped += 1
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Closes the socket.
+
+        Arguments:
+
+        """
+
+        self.sock.close()
+
+
+class Aggregate():                                      # pylint:disable=R0902
+
+    """Class:  Aggregate
+
+    Description:  Running minimum, average, maximum and percentile of a
+        series of values in constant memory.  The first DIGEST_EXACT values
+        are kept and give an exact percentile, after that the percentile is
+        estimated with the P-square algorithm, which keeps five markers
+        started from the kept values.
+
+    Methods:
+        __init__
+        add
+        quantile
+
+    """
+
+    def __init__(self, pct=DIGEST_PCT):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) pct -> Percentile to estimate, between 0 and 1
+
+        """
+
+        self.pct = pct
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.values = []
+        self.step = [0, pct / 2, pct, (1 + pct) / 2, 1]
+        self.heights = []
+        self.pos = []
+        self.want = []
+
+    def add(self, value):
+
+        """Method:  add
+
+        Description:  Adds a value to the aggregate.
+
+        Arguments:
+            (input) value -> Number
+
+        """
+
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if self.values is not None:
+            self.values.append(value)
+
+            if self.count == DIGEST_EXACT:
+                self.values.sort()
+                self.want = [(self.count - 1) * frac for frac in self.step]
+                self.pos = [round(want) for want in self.want]
+                self.heights = [self.values[idx] for idx in self.pos]
+                self.values = None
+
+            return
+
+        hgt, pos = self.heights, self.pos
+
+        hgt[0] = min(hgt[0], value)
+        hgt[4] = max(hgt[4], value)
+        cell = next(idx for idx in range(1, 4) if value < hgt[idx]) - 1 \
+            if value < hgt[3] else 3
+
+        for idx in range(cell + 1, 5):
+            pos[idx] += 1
+
+        for idx in range(5):
+            self.want[idx] += self.step[idx]
+
+        for idx in range(1, 4):
+            diff = self.want[idx] - pos[idx]
+
+            if (diff >= 1 and pos[idx + 1] - pos[idx] > 1) or \
+               (diff <= -1 and pos[idx - 1] - pos[idx] < -1):
+                diff = 1 if diff > 0 else -1
+                height = hgt[idx] + diff / (pos[idx + 1] - pos[idx - 1]) * (
+                    (pos[idx] - pos[idx - 1] + diff)
+                    * (hgt[idx + 1] - hgt[idx]) / (pos[idx + 1] - pos[idx])
+                    + (pos[idx + 1] - pos[idx] - diff)
+                    * (hgt[idx] - hgt[idx - 1]) / (pos[idx] - pos[idx - 1]))
+
+                if not hgt[idx - 1] < height < hgt[idx + 1]:
+                    height = hgt[idx] + diff * (hgt[idx + diff] - hgt[idx]) \
+                        / (pos[idx + diff] - pos[idx])
+
+                hgt[idx] = height
+                pos[idx] += diff
+
+    def quantile(self):
+
+        """Method:  quantile
+
+        Description:  Returns the percentile, exact for fewer than
+            DIGEST_EXACT values and estimated after that.
+
+        Arguments:
+            (output) Percentile or None if there are no values
+
+        """
+
+        if self.values is None:
+            return self.heights[2]
+
+        return sorted(self.values)[math.ceil(self.pct * self.count) - 1] \
+            if self.count else None
+
+
+class MailDigest():
+
+    """Class:  MailDigest
+
+    Description:  Mails a summary table of the samples instead of the
+        samples.  Keeps an Aggregate per statistic per server, so memory
+        does not grow with the number of samples.  The samples can be sent
+        along as a gzip attachment, compressed into a temporary file as they
+        arrive.
+
+    Methods:
+        __init__
+        add
+        table
+        send
+        close
+
+    """
+
+    def __init__(self, attach=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) attach -> True|False - Attach the samples
+
+        """
+
+        self.servers = {}
+        self.first = None
+        self.last = None
+        self.count = 0
+        self.tmp = None
+        self.raw = None
+
+        if attach:
+            self.tmp = tempfile.NamedTemporaryFile(   # pylint:disable=R1732
+                prefix="mongo_perf_", suffix=".json.gz")
+            self.raw = gzip.GzipFile(fileobj=self.tmp, mode="wb")
+
+    def add(self, data, text=None, metrics=None):
+
+        """Method:  add
+
+        Description:  Adds a sample to the digest.
+
+        Arguments:
+            (input) data -> Dictionary of Mongo performance stat
+            (input) text -> Sample encoded as JSON, for the attachment
+            (input) metrics -> Sample time and metrics pair from
+                sample_metrics, decoded from the data if not given
+
+        """
+
+        _, stats = metrics or sample_metrics(data)
+        server = self.servers.setdefault(data["Server"], {})
+
+        for key, val in stats.items():
+            server.setdefault(key, Aggregate()).add(val)
+
+        self.first = self.first or data["AsOf"]
+        self.last = data["AsOf"]
+        self.count += 1
+
+        if self.raw:
+            self.raw.write((text or json.dumps(data)).encode("UTF-8") + b"\n")
+
+    def table(self):
+
+        """Method:  table
+
+        Description:  Returns the summary table of the digest.
+
+        Arguments:
+            (output) Summary table as a string
+
+        """
+
+        lines = [f"Samples:  {self.count}  From:  {self.first}  "
+                 f"To:  {self.last}"]
+
+        for server, stats in sorted(self.servers.items()):
+            lines.extend(["", f"Server:  {server}",
+                          f"{'Statistic':<24}{'Min':>14}{'Avg':>14}"
+                          f"{'Max':>14}{'P95':>14}"])
+            lines.extend(
+                f"{key:<24}{agg.min:>14.6g}{agg.total / agg.count:>14.6g}"
+                f"{agg.max:>14.6g}{agg.quantile():>14.6g}"
+                for key, agg in sorted(stats.items()))
+
+        return "\n".join(lines) + "\n"
+
+    def send(self, mail, use_mailx=False):
+
+        """Method:  send
+
+        Description:  Mails the summary table, with the samples attached if
+            requested, and removes the temporary file.  Without an
+            attachment the mail goes through Mail.send_mail.  Mail only
+            sends a text body, so a mail with an attachment is built here
+            from the Mail instance's addresses, subject and message and
+            sent the same two ways Mail.send_mail does:  mailx (with -a)
+            or the SMTP server on localhost.
+
+        Arguments:
+            (input) mail -> Mail class instance
+            (input) use_mailx -> True|False - Use mailx to send the mail
+
+        """
+
+        mail.add_2_msg(self.table())
+
+        if not self.raw:
+            mail.send_mail(use_mailx=use_mailx)
+            return
+
+        self.raw.close()
+        self.tmp.flush()
+        subj = " ".join(mail.subj) if isinstance(mail.subj, list) \
+            else mail.subj
+        to_addr = mail.to if isinstance(mail.to, list) else [mail.to]
+
+        if use_mailx:
+            subprocess.run(
+                ["mailx", "-s", subj, "-a", self.tmp.name] + to_addr,
+                input=mail.msg.encode("UTF-8"), check=False)
+
+        else:
+            msg = email_message.EmailMessage()
+            msg["Subject"] = subj
+            msg["From"] = mail.frm
+            msg["To"] = ", ".join(to_addr)
+            msg.set_content(mail.msg)
+            self.tmp.seek(0)
+            msg.add_attachment(
+                self.tmp.read(), maintype="application", subtype="gzip",
+                filename="mongo_perf_samples.json.gz")
+
+            with smtplib.SMTP("localhost") as smtp:
+                smtp.send_message(msg)
+
+        self.close()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Closes and removes the temporary file.
+
+        Arguments:
+
+        """
+
+        if self.tmp:
+            self.raw.close()
+            self.tmp.close()
+
+
+class FileWriter():                                     # pylint:disable=R0902
+
+    """Class:  FileWriter
+
+    Description:  Holds the output file open for the run.  Records are
+        written through a buffer that is flushed every number of records,
+        every number of seconds and when the file is closed.  The file can
+        also be synced to disk on an interval.
+
+    Methods:
+        __init__
+        write
+        flush
+        close
+
+    """
+
+    def __init__(self, fname, mode, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) fname -> Name of output file
+            (input) mode -> File write mode (append|write)
+            (input) **kwargs:
+                buffer_size -> Size of the file buffer in bytes
+                flush_count -> Number of records between flushes
+                flush_interval -> Maximum seconds between flushes
+                fsync_interval -> Seconds between syncs to disk
+
+        """
+
+        self.fname = fname
+        self.mode = mode
+        self.buffer_size = kwargs.get("buffer_size", -1)
+        self.flush_count = kwargs.get("flush_count", 1)
+        self.flush_interval = kwargs.get("flush_interval", None)
+        self.fsync_interval = kwargs.get("fsync_interval", None)
+        self.fhandle = None
+        self.count = 0
+        self.flush_time = 0
+        self.fsync_time = 0
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Writes a record to the output file, opening the file on
+            the first record.
+
+        Arguments:
+            (input) data -> Record to write
+
+        """
+
+        if not self.fhandle:
+            self.fhandle = open(                        # pylint:disable=R1732
+                self.fname, mode=self.mode, buffering=self.buffer_size,
+                encoding="UTF-8")
+            self.flush_time = self.fsync_time = time.monotonic()
+
+        self.fhandle.write(data + "\n")
+        self.count += 1
+        now = time.monotonic()
+
+        if self.fsync_interval is not None and \
+           now - self.fsync_time >= self.fsync_interval:
+            self.flush(fsync=True)
+
+        elif self.count >= self.flush_count or (
+                self.flush_interval is not None
+                and now - self.flush_time >= self.flush_interval):
+            self.flush()
+
+    def flush(self, fsync=False):
+
+        """Method:  flush
+
+        Description:  Writes the buffered records to the output file.
+
+        Arguments:
+            (input) fsync -> True to also sync the file to disk
+
+        """
+
+        if self.fhandle:
+            self.fhandle.flush()
+            self.count = 0
+            self.flush_time = time.monotonic()
+
+            if fsync:
+                os.fsync(self.fhandle.fileno())
+                self.fsync_time = self.flush_time
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Writes the buffered records and closes the output file.
+
+        Arguments:
+
+        """
+
+        if self.fhandle:
+            self.flush(fsync=self.fsync_interval is not None)
+            self.fhandle.close()
+            self.fhandle = None
+
+
+class Sink():
+
+    """Class:  Sink
+
+    Description:  Base class of an output.  An output plugin (-e option)
+        subclasses Sink and overrides write_batch and any of the other
+        methods it needs.  The batch_size, max_wait and retries class
+        attributes set the batching and retries done for the output by
+        SinkRunner.
+
+    Methods:
+        open
+        write_batch
+        flush
+        close
+
+    """
+
+    batch_size = 1
+    max_wait = None
+    retries = 0
+
+    def open(self, args):
+
+        """Method:  open
+
+        Description:  Called once before the first batch.
+
+        Arguments:
+            (input) args -> ArgParser class instance
+
+        """
+
+    def write_batch(self, batch):
+
+        """Method:  write_batch
+
+        Description:  Sends a batch of records to the output.  An exception
+            fails the batch and the batch is retried.
+
+        Arguments:
+            (input) batch -> List of data and text pairs, text is the data
+                encoded as JSON or None if no output needs the JSON
+
+        """
+
+        raise NotImplementedError
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Called after the last batch.
+
+        Arguments:
+
+        """
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Called at the end of the run.
+
+        Arguments:
+
+        """
+
+
+class FuncSink(Sink):
+
+    """Class:  FuncSink
+
+    Description:  Output that sends each record of a batch to a function,
+        used for the built-in outputs.
+
+    Methods:
+        __init__
+        write_batch
+
+    """
+
+    def __init__(self, func):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) func -> Function that sends a record to the output
+
+        """
+
+        self.func = func
+
+    def write_batch(self, batch):
+
+        """Method:  write_batch
+
+        Description:  Sends each record of the batch to the function.
+
+        Arguments:
+            (input) batch -> List of data and text pairs
+
+        """
+
+        for data, text in batch:
+            self.func(data, text)
+
+
+class SinkRunner():                                     # pylint:disable=R0902
+
+    """Class:  SinkRunner
+
+    Description:  Batches the records of an output, retries a failed batch
+        with an increasing wait and times each batch.
+
+    Methods:
+        __init__
+        write
+        send
+        flush
+        close
+        status
+
+    """
+
+    def __init__(self, name, sink):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Name of the output
+            (input) sink -> Sink class instance
+
+        """
+
+        self.name = name
+        self.sink = sink
+        self.batch = []
+        self.batch_time = 0.0
+        self.batches = 0
+        self.records = 0
+        self.retries = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+    def write(self, data, text):
+
+        """Method:  write
+
+        Description:  Adds a record to the batch and sends the batch once it
+            is full or its first record is older than max_wait seconds.
+
+        Arguments:
+            (input) data -> Dictionary of Mongo performance stat
+            (input) text -> Data encoded as JSON
+
+        """
+
+        if not self.batch:
+            self.batch_time = time.monotonic()
+
+        self.batch.append((data, text))
+
+        if len(self.batch) >= self.sink.batch_size or (
+                self.sink.max_wait is not None and
+                time.monotonic() - self.batch_time >= self.sink.max_wait):
+            self.send()
+
+    def send(self):
+
+        """Method:  send
+
+        Description:  Sends the batch to the output, retrying up to the
+            output's retries.  The error of the last try is raised.
+
+        Arguments:
+
+        """
+
+        batch, self.batch = self.batch, []
+
+        for attempt in itertools.count():
+            start = time.monotonic()
+
+            try:
+                self.sink.write_batch(batch)
+                break
+
+            except Exception:                           # pylint:disable=W0718
+                if attempt >= self.sink.retries:
+                    raise
+
+                self.retries += 1
+                time.sleep(min(SINK_RETRY_WAIT * 2 ** attempt, MAX_BACKOFF))
+
+            finally:
+                elapsed = time.monotonic() - start
+                self.seconds += elapsed
+                self.max_seconds = max(self.max_seconds, elapsed)
+
+        self.batches += 1
+        self.records += len(batch)
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Sends a partial batch and flushes the output.
+
+        Arguments:
+
+        """
+
+        if self.batch:
+            self.send()
+
+        self.sink.flush()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Flushes and closes the output.
+
+        Arguments:
+
+        """
+
+        try:
+            self.flush()
+
+        finally:
+            self.sink.close()
+
+    def status(self):
+
+        """Method:  status
+
+        Description:  Returns the batch count and timing of the output.
+
+        Arguments:
+            (output) Dictionary of output status
+
+        """
+
+        return {"batches": self.batches, "records": self.records,
+                "retries": self.retries, "errors": self.errors,
+                "seconds": round(self.seconds, 3),
+                "max_seconds": round(self.max_seconds, 3)}
+
+
+class SinkWorker():                                     # pylint:disable=R0902
+
+    """Class:  SinkWorker
+
+    Description:  Runs an output in its own thread and feeds it from a
+        bounded queue.  When the queue is full the new record either waits
+        for room (block), replaces the oldest record in the queue (drop) or
+        is written to a spill file on disk until the output catches up
+        (spill).
+
+    Methods:
+        __init__
+        put
+        run
+        drain_spill
+        process
+        status
+        close
+
+    """
+
+    def __init__(self, name, func, policy="block", size=1000):
+
+        """Method:  __init__
+
+        Description:  Class initialization and starts the worker thread.
+
+        Arguments:
+            (input) name -> Name of the output
+            (input) func -> Function that sends a record to the output
+            (input) policy -> Full queue policy:  block, drop or spill
+            (input) size -> Maximum number of records in the queue
+
+        """
+
+        self.name = name
+        self.func = func
+        self.policy = policy
+        self.queue = queue.Queue(maxsize=size)
+        self.lock = threading.Lock()
+        self.spill = None
+        self.spilled = 0
+        self.dropped = 0
+        self.errors = 0
+        self.lag = 0.0
+        self.thread = threading.Thread(
+            target=self.run, name="sink-" + name, daemon=True)
+        self.thread.start()
+
+    def put(self, data, text):
+
+        """Method:  put
+
+        Description:  Adds a record to the queue using the full queue policy.
+
+        Arguments:
+            (input) data -> Dictionary of Mongo performance stat
+            (input) text -> Data encoded as JSON
+
+        """
+
+        item = (time.monotonic(), data, text)
+
+        if self.policy == "drop":
+            while True:
+                try:
+                    self.queue.put_nowait(item)
+                    break
+
+                except queue.Full:
+                    try:
+                        self.queue.get_nowait()
+                        self.dropped += 1
+
+                    except queue.Empty:
+                        pass
+
+        elif self.policy == "spill":
+            with self.lock:
+                # Once records are spilled, new records follow them to keep
+                #   the records in order.
+                if not self.spilled:
+                    try:
+                        self.queue.put_nowait(item)
+                        return
+
+                    except queue.Full:
+                        pass
+
+                if not self.spill:
+                    self.spill = tempfile.TemporaryFile(
+                        mode="w+", encoding="UTF-8")
+
+                self.spill.write(json.dumps(item) + "\n")
+                self.spilled += 1
+
+        else:
+            self.queue.put(item)
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Sends each record in the queue to the output until the
+            end of queue marker is received.
+
+        Arguments:
+
+        """
+
+        while True:
+            try:
+                item = self.queue.get(block=not self.spilled)
+
+            except queue.Empty:
+                self.drain_spill()
+                continue
+
+            if item is None:
+                self.drain_spill()
+                break
+
+            self.process(item)
+
+    def drain_spill(self):
+
+        """Method:  drain_spill
+
+        Description:  Sends the records in the spill file to the output.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            if not self.spilled:
+                return
+
+            self.spill.seek(0)
+            lines = self.spill.readlines()
+            self.spill.seek(0)
+            self.spill.truncate()
+            self.spilled = 0
+
+        for line in lines:
+            self.process(json.loads(line))
+
+    def process(self, item):
+
+        """Method:  process
+
+        Description:  Sends a record to the output and records the lag.
+
+        Arguments:
+            (input) item -> Queued time, data and text of a record
+
+        """
+
+        queued_time, data, text = item
+
+        try:
+            self.func(data, text)
+
+        except Exception as err:                        # pylint:disable=W0718
+            self.errors += 1
+            print(f"Output error:  {self.name}:  {err}")
+
+        self.lag = time.monotonic() - queued_time
+
+    def status(self):
+
+        """Method:  status
+
+        Description:  Returns the queue depth and lag of the output.
+
+        Arguments:
+            (output) Dictionary of queue status
+
+        """
+
+        return {"depth": self.queue.qsize() + self.spilled,
+                "lag": round(self.lag, 3), "dropped": self.dropped,
+                "errors": self.errors}
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Sends the remaining records to the output and stops the
+            worker thread.
+
+        Arguments:
+
+        """
+
+        self.queue.put(None)
+        self.thread.join()
+
+        if self.spill:
+            self.spill.close()
+            self.spill = None
+
+
+class StageTimers():
+
+    """Class:  StageTimers
+
+    Description:  Histograms of the time spent in each stage of the
+        pipeline (-j option).  Each stage keeps a count, total, maximum and
+        a histogram of log2 microsecond buckets, for the current interval
+        and for the run.  The interval histograms are sent through the
+        outputs as a self-metrics record and the run histograms are printed
+        at the end of the run.
+
+    Methods:
+        __init__
+        add
+        iterate
+        due
+        summary
+        record
+        print_summary
+
+    """
+
+    def __init__(self, interval):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) interval -> Seconds between self-metrics records
+
+        """
+
+        self.interval = interval
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+        self.current = {}
+        self.run = {}
+
+    def add(self, stage, secs):
+
+        """Method:  add
+
+        Description:  Adds a timing to a stage.  Safe to call from the
+            output threads (-Q option).
+
+        Arguments:
+            (input) stage -> Stage name
+            (input) secs -> Seconds spent in the stage
+
+        """
+
+        bucket = 3 + min(int(secs * 1e6).bit_length(), STAGE_BUCKETS - 1)
+
+        with self.lock:
+            for hists in (self.current, self.run):
+                hist = hists.get(stage)
+
+                if hist is None:
+                    hist = hists[stage] = [0, 0.0, 0.0] + [0] * STAGE_BUCKETS
+
+                hist[0] += 1
+                hist[1] += secs
+                hist[2] = max(hist[2], secs)
+                hist[bucket] += 1
+
+    def iterate(self, stage, items):
+
+        """Method:  iterate
+
+        Description:  Times the wait for each item of an iterable.
+
+        Arguments:
+            (input) stage -> Stage name
+            (input) items -> Iterable
+            (output) Each item of the iterable
+
+        """
+
+        items = iter(items)
+
+        while True:
+            start = time.perf_counter()
+
+            try:
+                item = next(items)
+
+            except StopIteration:
+                return
+
+            self.add(stage, time.perf_counter() - start)
+
+            yield item
+
+    def due(self):
+
+        """Method:  due
+
+        Description:  Returns True once every interval seconds.
+
+        Arguments:
+            (output) True if a self-metrics record is due
+
+        """
+
+        if time.monotonic() - self.last < self.interval:
+            return False
+
+        self.last = time.monotonic()
+
+        return True
+
+    @staticmethod
+    def summary(hists):
+
+        """Method:  summary
+
+        Description:  Returns the count, total, average, 50th and 95th
+            percentile and maximum of each stage.  The percentiles are the
+            upper bound of their histogram bucket.
+
+        Arguments:
+            (input) hists -> Dictionary of stage names and histograms
+            (output) Dictionary of stage names and statistics
+
+        """
+
+        stats = {}
+
+        for stage, hist in sorted(hists.items()):
+            max_us = hist[2] * 1e6
+            item = {"count": hist[0], "seconds": round(hist[1], 6),
+                    "avg_us": round(hist[1] * 1e6 / hist[0], 1)}
+
+            for label, pct in [("p50_us", 0.5), ("p95_us", 0.95)]:
+                total = 0
+
+                for bucket, count in enumerate(hist[3:]):
+                    total += count
+
+                    if total >= pct * hist[0]:
+                        item[label] = round(min(2.0 ** bucket, max_us), 1)
+                        break
+
+            item["max_us"] = round(max_us, 1)
+            stats[stage] = item
+
+        return stats
+
+    def record(self):
+
+        """Method:  record
+
+        Description:  Returns the current interval as a self-metrics
+            performance document and starts a new interval.
+
+        Arguments:
+            (output) data -> Dictionary of the stage statistics
+
+        """
+
+        with self.lock:
+            hists, self.current = self.current, {}
+
+        return {
+            "Server": SELF_SERVER,
+            "AsOf": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "PerfStats": {f"{stage}_{key}": value
+                          for stage, item in self.summary(hists).items()
+                          for key, value in item.items()}}
+
+    def print_summary(self):
+
+        """Method:  print_summary
+
+        Description:  Prints the run statistics of each stage to standard
+            error.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            stats = self.summary(self.run)
+
+        if stats:
+            print("Stage timers:  " + json.dumps(stats), file=sys.stderr)
+
+
+class Profiler():                                       # pylint:disable=R0902
+
+    """Class:  Profiler
+
+    Description:  Profiles the thread that starts it (-P option), either
+        every call with cProfile, by sampling the stack every interval
+        seconds, or by taking a tracemalloc snapshot every interval seconds.
+        The sampling and snapshots run in a background thread.
+
+    Methods:
+        __init__
+        start
+        run
+        sample
+        snapshot
+        alloc_report
+        write_stacks
+        stop
+
+    """
+
+    def __init__(self, mode, interval=None, base="mongo_perf"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) mode -> cprofile, sample or alloc
+            (input) interval -> Seconds between samples or snapshots
+            (input) base -> Path and file name the report extensions are
+                added to
+
+        """
+
+        self.mode = mode
+        self.interval = float(interval or PROFILE_WAIT.get(mode, 0))
+        self.base = base
+        self.profile = None
+        self.stacks = {}
+        self.first = None
+        self.last = None
+        self.ident = None
+        self.done = threading.Event()
+        self.thread = None
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Starts profiling the calling thread.
+
+        Arguments:
+
+        """
+
+        if self.mode == "cprofile":
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+            return
+
+        if self.mode == "alloc":
+            tracemalloc.start(ALLOC_FRAMES)
+            self.first = self.last = self.snapshot()
+
+        self.ident = threading.get_ident()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Takes a sample or snapshot every interval seconds
+            until stopped.
+
+        Arguments:
+
+        """
+
+        while not self.done.wait(self.interval):
+            if self.mode == "sample":
+                self.sample()
+
+            else:
+                self.alloc_report()
+
+    def sample(self):
+
+        """Method:  sample
+
+        Description:  Counts the current stack of the profiled thread.
+
+        Arguments:
+
+        """
+
+        frame = sys._current_frames().get(self.ident)  # pylint:disable=W0212
+        stack = []
+
+        while frame is not None:
+            stack.append(f"{os.path.basename(frame.f_code.co_filename)}:"
+                         f"{frame.f_code.co_name}")
+            frame = frame.f_back
+
+        if stack:
+            key = ";".join(reversed(stack))
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    @staticmethod
+    def snapshot():
+
+        """Method:  snapshot
+
+        Description:  Takes a tracemalloc snapshot without the allocations
+            of tracemalloc and the import system.
+
+        Arguments:
+            (output) tracemalloc.Snapshot instance
+
+        """
+
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>")])
+
+    def alloc_report(self):
+
+        """Method:  alloc_report
+
+        Description:  Appends the call sites that allocated the most since
+            the start and since the last snapshot to the report.
+
+        Arguments:
+
+        """
+
+        snapshot = self.snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+
+        with open(self.base + ".alloc.txt", mode="a",
+                  encoding="UTF-8") as fhdr:
+            fhdr.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')}  "
+                       f"traced={current}  peak={peak}\n")
+            fhdr.write("Growth since start:\n")
+
+            for stat in snapshot.compare_to(
+                    self.first, "traceback")[:PROFILE_TOP]:
+                fhdr.write(f"  {stat.size_diff:+} B  "
+                           f"{stat.count_diff:+} blocks\n")
+                fhdr.writelines(
+                    f"    {line}\n" for line in
+                    stat.traceback.format(most_recent_first=True))
+
+            fhdr.write("Since last snapshot:\n")
+            fhdr.writelines(
+                f"  {stat}\n" for stat in
+                snapshot.compare_to(self.last, "lineno")[:PROFILE_TOP])
+            fhdr.write("\n")
+
+        self.last = snapshot
+
+    def write_stacks(self):
+
+        """Method:  write_stacks
+
+        Description:  Writes the folded stacks and the functions with the
+            most samples.
+
+        Arguments:
+
+        """
+
+        total = sum(self.stacks.values())
+        counts = {}
+
+        for key, count in self.stacks.items():
+            funcs = key.split(";")
+            counts.setdefault(funcs[-1], [0, 0])[0] += count
+
+            for func in set(funcs):
+                counts.setdefault(func, [0, 0])[1] += count
+
+        with open(self.base + ".stacks", mode="w", encoding="UTF-8") as fhdr:
+            fhdr.writelines(f"{key} {count}\n"
+                            for key, count in sorted(self.stacks.items()))
+
+        with open(self.base + ".prof.txt", mode="w",
+                  encoding="UTF-8") as fhdr:
+            fhdr.write(f"{total} samples every {self.interval} seconds\n\n"
+                       f"{'self %':>8}{'total %':>9}  function\n")
+
+            for func, (own, cumul) in sorted(
+                    counts.items(), key=lambda item: -item[1][0])[
+                        :PROFILE_TOP]:
+                fhdr.write(f"{own * 100 / total:>8.1f}"
+                           f"{cumul * 100 / total:>9.1f}  {func}\n")
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stops profiling and writes the reports.
+
+        Arguments:
+
+        """
+
+        if self.profile:
+            self.profile.disable()
+            self.profile.dump_stats(self.base + ".prof")
+
+            with open(self.base + ".prof.txt", mode="w",
+                      encoding="UTF-8") as fhdr:
+                pstats.Stats(self.profile, stream=fhdr).sort_stats(
+                    "cumulative").print_stats(PROFILE_TOP)
+
+            return
+
+        self.done.set()
+        self.thread.join()
+
+        if self.mode == "sample":
+            self.write_stacks()
+
+        else:
+            self.alloc_report()
+            tracemalloc.stop()
+
+
+class SegmentWriter():                                  # pylint:disable=R0902
+
+    """Class:  SegmentWriter
+
+    Description:  Writes the output file as a series of segments that are
+        rotated at a size or on a wall-clock interval and can be compressed.
+        Records are compressed and written in a worker thread so compression
+        does not delay the collection.  A segment is written to a .part file
+        and renamed once complete, and only the newest segments up to the
+        retention count are kept.
+
+    Methods:
+        __init__
+        write
+        write_record
+        open_segment
+        finalize
+        prune
+        close
+
+    """
+
+    def __init__(self, fname, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization and starts the worker thread.
+
+        Arguments:
+            (input) fname -> Base name of the output segments
+            (input) **kwargs:
+                compress -> Compression:  gzip, zstd or None
+                rotate_size -> Segment size in bytes to rotate at
+                rotate_interval -> Seconds between rotations
+                retention -> Number of segments to keep
+
+        """
+
+        self.fname = fname
+        self.compress = kwargs.get("compress", None)
+        self.ext = COMPRESS_EXT.get(self.compress, "")
+        self.rotate_size = kwargs.get("rotate_size", None)
+        self.rotate_interval = kwargs.get("rotate_interval", None)
+        self.retention = kwargs.get("retention", None)
+        self.part = None
+        self.raw = None
+        self.stream = None
+        self.size = 0
+        self.rotate_time = None
+        self.worker = SinkWorker(
+            "compress", lambda data, text: self.write_record(text))
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Queues a record for the worker thread.
+
+        Arguments:
+            (input) data -> Record to write
+
+        """
+
+        self.worker.put(None, data)
+
+    def write_record(self, data):
+
+        """Method:  write_record
+
+        Description:  Writes a record to the current segment, rotating to a
+            new segment first if the current one is due.  The rotate size is
+            checked against the bytes of the records written, before any
+            compression, as the compressor holds back data it has not
+            flushed to the file yet.
+
+        Arguments:
+            (input) data -> Record to write
+
+        """
+
+        if self.stream and (
+                (self.rotate_size and self.size >= self.rotate_size)
+                or (self.rotate_time and time.time() >= self.rotate_time)):
+            self.finalize()
+
+        if not self.stream:
+            self.open_segment()
+
+        data = (data + "\n").encode("UTF-8")
+        self.size += len(data)
+        self.stream.write(data)
+
+    def open_segment(self):
+
+        """Method:  open_segment
+
+        Description:  Opens a new segment and sets the time of its rotation
+            on the next interval boundary.
+
+        Arguments:
+
+        """
+
+        self.part = f"{self.fname}.{time.time_ns():020d}{self.ext}.part"
+        self.raw = open(self.part, mode="wb")          # pylint:disable=R1732
+        self.size = 0
+
+        if self.compress == "gzip":
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode="wb")
+
+        elif self.compress == "zstd":
+            self.stream = zstandard.ZstdCompressor().stream_writer(
+                self.raw, closefd=False)
+
+        else:
+            self.stream = self.raw
+
+        if self.rotate_interval:
+            self.rotate_time = (time.time() // self.rotate_interval + 1) \
+                * self.rotate_interval
+
+    def finalize(self):
+
+        """Method:  finalize
+
+        Description:  Completes the current segment, syncs it to disk and
+            renames it to its final name.
+
+        Arguments:
+
+        """
+
+        if self.stream is not self.raw:
+            self.stream.close()
+
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+        self.raw.close()
+        os.replace(self.part, self.part[:-len(".part")])
+        self.stream = self.raw = None
+
+        if self.retention:
+            self.prune()
+
+    def prune(self):
+
+        """Method:  prune
+
+        Description:  Removes the oldest segments over the retention count.
+
+        Arguments:
+
+        """
+
+        segments = sorted(glob.glob(
+            glob.escape(self.fname) + "." + "[0-9]" * 20 + self.ext))
+
+        for segment in segments[:-self.retention]:
+            os.remove(segment)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Writes the queued records, stops the worker thread and
+            completes the current segment.
+
+        Arguments:
+
+        """
+
+        self.worker.close()
+
+        if self.stream:
+            self.finalize()
+
+
+def sigterm_handler(signum, frame):                     # pylint:disable=W0613
+
+    """Function:  sigterm_handler
+
+    Description:  Converts a terminate signal into a normal program exit so
+        that open connections are closed.
+
+    Arguments:
+        (input) signum -> Signal number
+        (input) frame -> Current stack frame
+
+    """
+
+    sys.exit(0)
+
+
+def help_message():
+
+    """Function:  help_message
+
+    Description:  Displays the program's docstring which is the help and usage
+        message when -h option is selected.
+
+    Arguments:
+
+    """
+
+    print(__doc__)
+
+
+def get_data(cmd):
+
+    """Function:  get_data
+
+    Description:  Opens a system call to run the program command.
+
+    Arguments:
+        (input) cmd -> List array holding program command line
+        (output) out -> Results of program command
+
+    """
+
+    cmd = list(cmd)
+    proc1 = subprocess.Popen(                           # pylint:disable=R1732
+        cmd, stdout=subprocess.PIPE)
+    out, _ = proc1.communicate()
+
+    return out
+
+
+def stream_data(cmd):
+
+    """Function:  stream_data
+
+    Description:  Opens a system call to run the program command and returns
+        each line of output as soon as the program produces it.
+
+    Arguments:
+        (input) cmd -> List array holding program command line
+        (output) line -> Line of output from program command
+
+    """
+
+    cmd = list(cmd)
+    proc1 = subprocess.Popen(                           # pylint:disable=R1732
+        cmd, stdout=subprocess.PIPE)
+
+    try:
+        yield from iter(proc1.stdout.readline, b"")
+
+    except GeneratorExit:
+        proc1.terminate()
+        raise
+
+    finally:
+        proc1.stdout.close()
+        proc1.wait()
+
+
+def mongostat_cmd(server, args, **kwargs):
+
+    """Function:  mongostat_cmd
+
+    Description:  Creates the mongostat utility program command line.  A
+        database server instance goes through mongo_libs.create_cmd.  A Mongo
+        configuration module, used when the run has no database connection,
+        is made into the command line here so pymongo is not imported.
+
+    Arguments:
+        (input) server -> Database server instance or Mongo configuration
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            req_arg -> List of options to add to cmd line
+            opt_arg -> Dictionary of additional options to add
+        (output) cmd -> List of the command line arguments
+
+    """
+
+    if not isinstance(server, types.ModuleType):
+        return mongo_libs.create_cmd(
+            server, args, "mongostat", "-p", **kwargs)
+
+    host = f"{server.host}:{server.port}"
+
+    if server.repset and server.repset_hosts:
+        host = server.repset + "/" + ",".join(
+            f"{item}:{port}" for item, port in get_members(
+                server.repset_hosts))
+
+    cmd = [os.path.join(args.get_val("-p", def_val=""), "mongostat"),
+           "--host=" + host]
+
+    if server.auth:
+        cmd.extend(["--username=" + server.user,
+                    "--password=" + server.japd])
+
+        if getattr(server, "auth_mech", None):
+            cmd.append("--authenticationMechanism=" + server.auth_mech)
+
+    cmd.extend(kwargs.get("req_arg", []))
+
+    for opt, arg in kwargs.get("opt_arg", {}).items():
+        if args.arg_exist(opt):
+            value = args.get_val(opt)
+            cmd.append(arg + value if isinstance(value, str) else arg)
+
+    return cmd
+
+
+def get_mongostat(server, args, **kwargs):
+
+    """Function:  get_mongostat
+
+    Description:  Creates and executes the mongostat utility program and
+        returns the statistics for each sample.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            req_arg -> List of options to add to cmd line
+            opt_arg -> Dictionary of additional options to add
+            timers -> StageTimers class instance or None
+        (output) value -> Dictionary of performance statistics
+
+    """
+
+    timers = kwargs.get("timers", None)
+    parse = timed(timers, "parse", parse_rows)
+    decode = timed(timers, "decode", decode_stats)
+    cmd = mongostat_cmd(server, args, **kwargs)
+
+    if args.arg_exist("-b"):
+        cmd.append(args.get_val("-b"))
+
+    # Streamed output is decoded one line at a time, otherwise as one chunk.
+    if args.arg_exist("-l"):
+        chunks = ([line.decode()] for line in
+                  timed_iter(timers, "mongostat", stream_data(cmd)))
+
+    else:
+        chunks = [timed(timers, "mongostat", get_data)(cmd).decode().split(
+            "\n")]
+
+    for chunk in chunks:
+        if args.arg_exist("-T"):
+            yield from (decode(value) for value in parse(chunk))
+
+        else:
+            yield from parse(chunk)
+
+
+def parse_rows(rows, names=False):
+
+    """Function:  parse_rows
+
+    Description:  Decodes a chunk of mongostat JSON output rows with a single
+        JSON decode and returns the statistics from each row.
+
+    Arguments:
+        (input) rows -> List of mongostat JSON output rows
+        (input) names -> True|False - Return the host of each statistics,
+            for rows of several hosts
+        (output) List of dictionaries of performance statistics, or of
+            host:port and statistics pairs with names
+
+    """
+
+    rows = [row for row in rows if row.strip()]
+
+    if not rows:
+        return []
+
+    # Each row is {"host:port": {statistics}}, one key per host.
+    docs = json.loads("[" + ",".join(rows) + "]")
+
+    if names:
+        return [item for doc in docs for item in doc.items()]
+
+    return [doc.popitem()[1] for doc in docs]
+
+
+def to_number(value):
+
+    """Function:  to_number
+
+    Description:  Converts a mongostat number to an integer or float.  A size
+        suffix is converted to bytes, lowercase suffixes (b, k, m, g, t) are
+        decimal and uppercase suffixes (K, M, G, T) are binary.
+
+    Arguments:
+        (input) value -> Number string, for example:  "45", "1.2G", "158b"
+        (output) Integer or float value
+
+    """
+
+    if value.isdigit():
+        return int(value)
+
+    unit = SIZE_UNITS.get(value[-1:])
+
+    if unit:
+        return int(round(float(value[:-1]) * unit))
+
+    number = float(value)
+
+    return int(number) if number.is_integer() else number
+
+
+def decode_op(key, value):
+
+    """Function:  decode_op
+
+    Description:  Decodes a mongostat operation count.  A leading "*" marks
+        the operations as replicated.
+
+    Arguments:
+        (input) key -> Column name
+        (input) value -> Column value, for example:  "*0", "12"
+        (output) Dictionary of the count and the replicated flag
+
+    """
+
+    is_repl = value.startswith("*")
+
+    return {key: to_number(value.lstrip("*")), key + "_repl": is_repl}
+
+
+def decode_pair(keys, value):
+
+    """Function:  decode_pair
+
+    Description:  Splits a mongostat "a|b" pair into two fields.
+
+    Arguments:
+        (input) keys -> Tuple of the two field names
+        (input) value -> Column value, for example:  "3|0"
+        (output) Dictionary of the two fields
+
+    """
+
+    first, second = value.split("|")
+
+    return {keys[0]: to_number(first), keys[1]: to_number(second)}
+
+
+def decode_pct(key, value):
+
+    """Function:  decode_pct
+
+    Description:  Converts a mongostat percentage to a float.
+
+    Arguments:
+        (input) key -> Column name
+        (input) value -> Column value, for example:  "12.3%"
+        (output) Dictionary of the percentage
+
+    """
+
+    return {key: float(value.rstrip("%"))}
+
+
+def decode_num(key, value):
+
+    """Function:  decode_num
+
+    Description:  Converts a mongostat number or size to a number.
+
+    Arguments:
+        (input) key -> Column name
+        (input) value -> Column value, for example:  "45", "1.2G"
+        (output) Dictionary of the number
+
+    """
+
+    return {key: to_number(value)}
+
+
+# Decoder for each mongostat column, columns not listed are left as is.
+DECODERS = dict(
+    [(key, functools.partial(decode_op, key)) for key in OP_FIELDS]
+    + [(key, functools.partial(decode_pct, key)) for key in ["dirty", "used"]]
+    + [(key, functools.partial(decode_num, key))
+       for key in ["flushes", "vsize", "res", "net_in", "net_out", "conn",
+                   "mapped", "faults"]]
+    + [(key, functools.partial(decode_pair, fields))
+       for key, fields in [("command", ("command", "command_repl")),
+                           ("qrw", ("qr", "qw")), ("arw", ("ar", "aw"))]])
+
+
+def decode_stats(stats):
+
+    """Function:  decode_stats
+
+    Description:  Converts the mongostat string values of a sample into typed
+        numbers using the DECODERS table.  A value that cannot be decoded is
+        left as is.
+
+    Arguments:
+        (input) stats -> Dictionary of mongostat performance statistics
+        (output) doc -> Dictionary of typed performance statistics
+
+    """
+
+    doc = {}
+
+    for key, value in stats.items():
+        decoder = DECODERS.get(key)
+
+        try:
+            doc.update(decoder(value) if decoder else {key: value})
+
+        except (ValueError, TypeError, AttributeError):
+            doc[key] = value
+
+    return doc
+
+
+def get_value(doc, keys, def_val=0):
+
+    """Function:  get_value
+
+    Description:  Returns a value from a nested document.
+
+    Arguments:
+        (input) doc -> Dictionary document
+        (input) keys -> List of keys to the value
+        (input) def_val -> Default value if the value is not found
+        (output) doc -> Value from the document
+
+    """
+
+    for key in keys:
+        if not isinstance(doc, dict) or key not in doc:
+            return def_val
+
+        doc = doc[key]
+
+    return doc
+
+
+def get_rate(prev, curr, keys, elapsed):
+
+    """Function:  get_rate
+
+    Description:  Returns the per second rate of a counter between two
+        serverStatus command results.
+
+    Arguments:
+        (input) prev -> Previous serverStatus command results
+        (input) curr -> Current serverStatus command results
+        (input) keys -> List of keys to the counter
+        (input) elapsed -> Number of seconds between the two results
+        (output) Per second rate of the counter
+
+    """
+
+    delta = get_value(curr, keys) - get_value(prev, keys)
+    elapsed = elapsed if elapsed > 0 else 1
+
+    return int(round(max(delta, 0) / elapsed))
+
+
+def calc_stats(prev, curr, elapsed):
+
+    """Function:  calc_stats
+
+    Description:  Calculates the mongostat equivalent statistics between two
+        serverStatus command results.
+
+    Arguments:
+        (input) prev -> Previous serverStatus command results
+        (input) curr -> Current serverStatus command results
+        (input) elapsed -> Number of seconds between the two results
+        (output) stats -> Dictionary of performance statistics
+
+    """
+
+    secondary = bool(get_value(curr, ["repl", "secondary"], False))
+    checkpoint = ["wiredTiger", "transaction", "transaction checkpoints"]
+    cache = get_value(curr, ["wiredTiger", "cache"], {})
+    stats = {}
+
+    for item in OP_FIELDS:
+        is_repl = secondary and item in REPL_OPS
+        stats[item] = get_rate(
+            prev, curr, ["opcountersRepl" if is_repl else "opcounters", item],
+            elapsed)
+        stats[item + "_repl"] = is_repl
+
+    stats["command"] = get_rate(prev, curr, ["opcounters", "command"], elapsed)
+    stats["command_repl"] = get_rate(
+        prev, curr, ["opcountersRepl", "command"], elapsed)
+    stats["qr"] = get_value(curr, ["globalLock", "currentQueue", "readers"])
+    stats["qw"] = get_value(curr, ["globalLock", "currentQueue", "writers"])
+    stats["ar"] = get_value(curr, ["globalLock", "activeClients", "readers"])
+    stats["aw"] = get_value(curr, ["globalLock", "activeClients", "writers"])
+    stats["flushes"] = \
+        get_value(curr, checkpoint) - get_value(prev, checkpoint)
+
+    if cache.get("maximum bytes configured"):
+        stats["dirty"] = round(
+            cache.get("tracked dirty bytes in the cache", 0) * 100.0
+            / cache["maximum bytes configured"], 1)
+        stats["used"] = round(
+            cache.get("bytes currently in the cache", 0) * 100.0
+            / cache["maximum bytes configured"], 1)
+
+    stats["vsize"] = get_value(curr, ["mem", "virtual"]) * 1048576
+    stats["res"] = get_value(curr, ["mem", "resident"]) * 1048576
+    stats["net_in"] = get_rate(prev, curr, ["network", "bytesIn"], elapsed)
+    stats["net_out"] = get_rate(prev, curr, ["network", "bytesOut"], elapsed)
+    stats["conn"] = get_value(curr, ["connections", "current"])
+
+    if get_value(curr, ["repl", "setName"], None):
+        stats["set"] = curr["repl"]["setName"]
+
+        if get_value(curr, ["repl", "ismaster"], False) or \
+           get_value(curr, ["repl", "isWritablePrimary"], False):
+            stats["repl"] = "PRI"
+
+        elif secondary:
+            stats["repl"] = "SEC"
+
+        elif get_value(curr, ["repl", "arbiterOnly"], False):
+            stats["repl"] = "ARB"
+
+        else:
+            stats["repl"] = "UNK"
+
+    return stats
+
+
+def srv_stat(mongo, count, interval):
+
+    """Function:  srv_stat
+
+    Description:  Runs the serverStatus command over the database connection
+        at each polling interval and returns the mongostat equivalent
+        statistics for each sample.  The polling interval is kept on a fixed
+        schedule so the time spent processing a sample does not add to it.
+        A sample which falls behind by more than a polling interval skips the
+        missed intervals instead of sampling in a burst.
+
+    Arguments:
+        (input) mongo -> Database server instance
+        (input) count -> Number of samples to return or None to run forever
+        (input) interval -> Polling interval in seconds
+        (output) stats -> Dictionary of performance statistics
+
+    """
+
+    prev = mongo.adm_cmd("serverStatus")
+    prev_time = time.monotonic()
+    deadline = prev_time
+
+    for _ in itertools.count() if count is None else range(count):
+        deadline += interval
+        now = time.monotonic()
+
+        if deadline < now:
+            deadline += ((now - deadline) // interval + 1) * interval
+
+        time.sleep(deadline - now)
+        curr = mongo.adm_cmd("serverStatus")
+        curr_time = time.monotonic()
+        stats = calc_stats(prev, curr, curr_time - prev_time)
+        stats["time"] = time.strftime("%H:%M:%S")
+
+        yield stats
+
+        prev, prev_time = curr, curr_time
+
+
+def daemon_stat(mongo, interval, args):
+
+    """Function:  daemon_stat
+
+    Description:  Runs the native collector until the program is stopped.  If
+        the connection to the database is lost, reconnects with an increasing
+        wait between attempts.
+
+    Arguments:
+        (input) mongo -> Database server instance
+        (input) interval -> Polling interval in seconds
+        (input) args -> ArgParser class instance
+        (output) stats -> Dictionary of performance statistics
+
+    """
+
+    backoff = interval
+
+    while True:
+        try:
+            for stats in srv_stat(mongo, None, interval):
+                backoff = interval
+
+                yield stats
+
+        except Exception as err:                        # pylint:disable=W0718
+            if not args.arg_exist("-w"):
+                print(f"daemon_stat: Connection lost:  {mongo.name}:  {err}")
+
+        backoff = reconnect(mongo, backoff, args, mongo.name)
+
+
+def reconnect(mongo, backoff, args, name):
+
+    """Function:  reconnect
+
+    Description:  Reconnects to a database with an increasing wait between
+        attempts until the connection is made.
+
+    Arguments:
+        (input) mongo -> Database server instance
+        (input) backoff -> Wait in seconds before the first attempt
+        (input) args -> ArgParser class instance
+        (input) name -> Database name used in the failure message
+        (output) backoff -> Wait in seconds before the next attempt
+
+    """
+
+    status = (False, None)
+
+    while not status[0]:
+        time.sleep(backoff)
+        backoff = min(backoff * 2, MAX_BACKOFF)
+        mongo_libs.disconnect([mongo])
+        status = mongo.connect()
+
+        if not status[0] and not args.arg_exist("-w"):
+            print(f"Reconnect failure:  {name}:  {status[1]}")
+
+    return backoff
+
+
+def get_members(repset_hosts):
+
+    """Function:  get_members
+
+    Description:  Converts the replica set hosts entry into a list of host and
+        port pairs.
+
+    Arguments:
+        (input) repset_hosts -> String or list of HOST:PORT entries
+        (output) members -> List of (host, port) tuples
+
+    """
+
+    members = []
+
+    if isinstance(repset_hosts, str):
+        repset_hosts = repset_hosts.split(",")
+
+    for item in repset_hosts:
+        host, _, port = item.strip().partition(":")
+
+        if host:
+            members.append((host, int(port) if port else 27017))
+
+    return members
+
+
+def member_stat(cfg, member, args, **kwargs):
+
+    """Function:  member_stat
+
+    Description:  Connects directly to a replica set member and returns the
+        statistics for each sample.  In daemon mode, a member which fails to
+        connect is retried with an increasing wait between attempts.
+
+    Arguments:
+        (input) cfg -> Mongo server configuration
+        (input) member -> Tuple of the member's host and port
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            req_arg -> List of options to add to cmd line
+            opt_arg -> Dictionary of additional options to add
+        (output) value -> Dictionary of performance statistics
+
+    """
+
+    host, port = member
+    config = mongo_libs.create_security_config(cfg=cfg)
+    config["direct_connect"] = True
+    mongo = mongo_class.Server(
+        cfg.name, cfg.user, cfg.japd, host=host, port=port, auth=cfg.auth,
+        **config)
+    status = mongo.connect()
+
+    if not status[0]:
+        if not args.arg_exist("-w"):
+            print(f"member_stat: Connection failure:  {host}:{port}:"
+                  f"  {status[1]}")
+
+        if not args.arg_exist("-D"):
+            return
+
+        reconnect(mongo, float(args.get_val("-b", def_val=1)), args,
+                  f"{host}:{port}")
+
+    try:
+        if args.arg_exist("-D"):
+            yield from daemon_stat(
+                mongo, float(args.get_val("-b", def_val=1)), args)
+
+        elif args.arg_exist("-N"):
+            yield from srv_stat(
+                mongo, int(args.get_val("-n", def_val=1)),
+                float(args.get_val("-b", def_val=1)))
+
+        else:
+            yield from get_mongostat(mongo, args, **kwargs)
+
+    finally:
+        mongo_libs.disconnect([mongo])
+
+
+def put_samples(name, source, samples, stop):
+
+    """Function:  put_samples
+
+    Description:  Places each sample from a sample source into a queue and
+        places None into the queue once the source is finished.
+
+    Arguments:
+        (input) name -> Source name
+        (input) source -> Sample generator
+        (input) samples -> Queue.Queue instance
+        (input) stop -> Threading.Event instance to stop the source
+
+    """
+
+    try:
+        for value in source:
+            if stop.is_set():
+                break
+
+            samples.put((name, value))
+
+    except Exception as err:                            # pylint:disable=W0718
+        print(f"put_samples: {name}:  {err}")
+
+    finally:
+        samples.put((name, None))
+
+
+def merge_samples(sources):
+
+    """Function:  merge_samples
+
+    Description:  Runs each sample source in its own thread and returns the
+        samples from all of them as they arrive.
+
+    Arguments:
+        (input) sources -> Dictionary of names and sample generators
+        (output) name, value -> Source name and sample from the source
+
+    """
+
+    samples = queue.Queue()
+    stop = threading.Event()
+    running = len(sources)
+
+    with futures.ThreadPoolExecutor(
+            max_workers=max(running, 1)) as executor:
+        for name, source in sources.items():
+            executor.submit(put_samples, name, source, samples, stop)
+
+        try:
+            while running:
+                name, value = samples.get()
+
+                if value is None:
+                    running -= 1
+
+                else:
+                    yield name, value
+
+        finally:
+            stop.set()
+
+
+def mongo_stat(server, args, **kwargs):
+
+    """Function:  mongo_stat
+
+    Description:  Captures the database performance statistics and sends
+        each sample to the requested outputs.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            req_arg -> List of options to add to cmd line
+            opt_arg -> Dictionary of additional options to add
+            ofile -> file name - Name of output file
+            db_tbl database:table_name -> Mongo database and table name
+            class_cfg -> Mongo server configuration
+            mongo_cfg -> Mongo configuration of the monitored server
+
+    """
+
+    cfg = kwargs.get("mongo_cfg", None)
+    kwargs["timers"] = create_timers(args)
+
+    if args.arg_exist("-R") and cfg and cfg.repset and cfg.repset_hosts:
+        samples = merge_samples(
+            {f"{host}:{port}": member_stat(cfg, (host, port), args, **kwargs)
+             for host, port in get_members(cfg.repset_hosts)})
+
+    elif args.arg_exist("-D"):
+        samples = ((server.name, value) for value in daemon_stat(
+            server, float(args.get_val("-b", def_val=1)), args))
+
+    elif args.arg_exist("-N"):
+        samples = ((server.name, value) for value in srv_stat(
+            server, int(args.get_val("-n", def_val=1)),
+            float(args.get_val("-b", def_val=1))))
+
+    else:
+        samples = ((server.name, value)
+                   for value in get_mongostat(server, args, **kwargs))
+
+    proc_samples(samples, args, **kwargs)
+
+
+def proc_samples(samples, args, **kwargs):
+
+    """Function:  proc_samples
+
+    Description:  Converts each sample into a performance document and sends
+        the document to the requested outputs.
+
+    Arguments:
+        (input) samples -> Generator of server name and sample pairs
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            ofile -> file name - Name of output file
+            db_tbl database:table_name -> Mongo database and table name
+            class_cfg -> Mongo server configuration
+            timers -> StageTimers class instance of the collector
+
+    """
+
+    indent = None if args.arg_exist("-f") else 4
+    outfile = kwargs.get("ofile", None)
+    no_std = args.arg_exist("-z")
+    mail, digest = create_mail(args)
+
+    kwargs["timers"] = kwargs.get("timers", None) or create_timers(args)
+    kwargs["file_out"] = create_writer(
+        outfile, "a" if args.arg_exist("-a") else "w", args) if outfile \
+        else None
+    kwargs["rrd"] = {}
+    kwargs["rrd_dir"] = args.get_val("-J")
+    kwargs["archive"] = ColumnArchive(args.get_val("-X")) \
+        if args.arg_exist("-X") else None
+    kwargs["metrics"] = MetricsServer(args.get_val("-g")) \
+        if args.arg_exist("-g") else None
+    kwargs["udp"] = UdpEmitter(*args.get_val("-M")[:2]) \
+        if args.arg_exist("-M") else None
+
+    records = get_records(
+        timed_iter(kwargs["timers"], "sample", samples), indent,
+        (mail and (not digest or digest.raw)) or outfile or not no_std,
+        timers=kwargs["timers"])
+    runners = [SinkRunner(name, sink) for name, sink in create_sinks(
+        mail, no_std, args, digest=digest, **kwargs).items()]
+    writes = {runner.name: timed(kwargs["timers"], "output_" + runner.name,
+                                 runner.write) for runner in runners}
+
+    try:
+        if args.arg_exist("-Q"):
+            queue_records(records, writes, args)
+
+        else:
+            for record in records:
+                for runner in runners:
+                    guard(runner, writes[runner.name], *record)
+
+    finally:
+        for runner in runners:
+            guard(runner, runner.close)
+
+        print_status([runner for runner in runners
+                      if runner.retries or runner.errors],
+                     label="Output status")
+
+        if kwargs["timers"]:
+            kwargs["timers"].print_summary()
+
+        for item in list(kwargs["rrd"].values()) + [
+                kwargs[name] for name in ["file_out", "archive", "metrics",
+                                          "udp"]]:
+            if item:
+                item.close()
+
+    if digest:
+        digest.send(mail, use_mailx=args.arg_exist("-u"))
+
+    elif mail:
+        mail.send_mail(use_mailx=args.arg_exist("-u"))
+
+
+def guard(runner, func, *fargs):
+
+    """Function:  guard
+
+    Description:  Calls a function of an output, counting and printing an
+        error instead of raising it, so a failed output does not stop the
+        collection or the other outputs.
+
+    Arguments:
+        (input) runner -> SinkRunner class instance of the output
+        (input) func -> Function of the output
+        (input) *fargs -> Arguments of the function
+
+    """
+
+    try:
+        func(*fargs)
+
+    except Exception as err:                            # pylint:disable=W0718
+        runner.errors += 1
+        print(f"Output error:  {runner.name}:  {err}")
+
+
+def create_mail(args):
+
+    """Function:  create_mail
+
+    Description:  Creates the mail for the -t option and the digest of the
+        samples for the -q option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) mail -> Mail class instance or None
+        (output) digest -> MailDigest class instance or None
+
+    """
+
+    if not args.arg_exist("-t"):
+        return None, None
+
+    mail = gen_class.setup_mail(
+        args.get_val("-t"),
+        subj=args.get_val("-s", def_val="Mongodb_Performance"))
+    digest = MailDigest(args.arg_exist("-Z")) if args.arg_exist("-q") \
+        else None
+
+    return mail, digest
+
+
+def create_timers(args):
+
+    """Function:  create_timers
+
+    Description:  Creates the stage timers for the -j option.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) StageTimers class instance or None
+
+    """
+
+    return StageTimers(float(args.get_val("-j"))) if args.arg_exist("-j") \
+        else None
+
+
+def timed(timers, stage, func):
+
+    """Function:  timed
+
+    Description:  Returns the function, wrapped to time each call under the
+        stage if there are stage timers.  Resolved once per run so the
+        function is called directly when the timers are off.
+
+    Arguments:
+        (input) timers -> StageTimers class instance or None
+        (input) stage -> Stage name
+        (input) func -> Function
+        (output) Function or timed function
+
+    """
+
+    if not timers:
+        return func
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+
+        finally:
+            timers.add(stage, time.perf_counter() - start)
+
+    return wrapper
+
+
+def timed_iter(timers, stage, items):
+
+    """Function:  timed_iter
+
+    Description:  Returns the iterable, wrapped to time the wait for each
+        item under the stage if there are stage timers.
+
+    Arguments:
+        (input) timers -> StageTimers class instance or None
+        (input) stage -> Stage name
+        (input) items -> Iterable
+        (output) Iterable or timed generator
+
+    """
+
+    return timers.iterate(stage, items) if timers else items
+
+
+def create_writer(outfile, mode, args):
+
+    """Function:  create_writer
+
+    Description:  Creates the writer for the output file, a SegmentWriter
+        when the output is compressed or rotated, otherwise a FileWriter.
+
+    Arguments:
+        (input) outfile -> Name of output file
+        (input) mode -> File write mode (append|write)
+        (input) args -> ArgParser class instance
+        (output) FileWriter or SegmentWriter class instance
+
+    """
+
+    if args.arg_exist("-C") or args.arg_exist("-O"):
+        rotate = {}
+
+        for value in args.get_val("-O", def_val=[]):
+            if value[-1:] in TIME_UNITS:
+                rotate["rotate_interval"] = \
+                    float(value[:-1]) * TIME_UNITS[value[-1]]
+
+            else:
+                rotate["rotate_size"] = to_number(value)
+
+        return SegmentWriter(
+            outfile, compress=args.get_val("-C"),
+            retention=int(args.get_val("-A")) if args.arg_exist("-A") else
+            None, **rotate)
+
+    values = list(args.get_val("-B", def_val=[]))[:3]
+    size, count, seconds = values + ["0", "1", None][len(values):]
+
+    return FileWriter(
+        outfile, mode, buffer_size=int(size) if int(size) > 0 else -1,
+        flush_count=int(count),
+        flush_interval=float(seconds) if seconds is not None else None,
+        fsync_interval=float(args.get_val("-Y")) if args.arg_exist("-Y")
+        else None)
+
+
+def get_records(samples, indent, encode, timers=None):
+
+    """Function:  get_records
+
+    Description:  Converts each sample into a performance document and
+        encodes it once to share with every text output.  With stage timers
+        a self-metrics record is added every timer interval.
+
+    Arguments:
+        (input) samples -> Generator of server name and sample pairs
+        (input) indent -> Indentation setting for JSON format
+        (input) encode -> True if there is a text output
+        (input) timers -> StageTimers class instance or None
+        (output) data -> Dictionary of Mongo performance stat
+        (output) text -> Data encoded as JSON or None
+
+    """
+
+    make_doc = timed(timers, "document", sample_doc)
+    dumps = timed(timers, "encode", json.dumps)
+
+    for name, value in samples:
+        data = make_doc(name, value)
+
+        yield data, dumps(data, indent=indent) if encode else None
+
+        if timers and timers.due():
+            data = timers.record()
+
+            yield data, json.dumps(data, indent=indent) if encode else None
+
+
+def sample_doc(name, value):
+
+    """Function:  sample_doc
+
+    Description:  Converts a sample into a performance document.  The
+        sample time is given today's date unless it already has a date.
+
+    Arguments:
+        (input) name -> Server name
+        (input) value -> Dictionary of performance statistics
+        (output) data -> Dictionary of Mongo performance stat
+
+    """
+
+    stat_time = value["time"]
+    value = gen_libs.rm_key(value, "time")
+
+    # A replayed sample (-I option) already has its recorded date.
+    data = {
+        "Server": name,
+        "AsOf": stat_time if " " in stat_time
+        else gen_libs.get_date() + " " + stat_time,
+        "PerfStats": value}
+
+    if "set" in value and "repl" in value:
+        data["RepSet"] = value["set"]
+        data["RepState"] = value["repl"]
+        value = gen_libs.rm_key(value, "set")
+        value = gen_libs.rm_key(value, "repl")
+        data["PerfStats"] = value
+
+    return data
+
+
+def sink_funcs(mail, no_std, **kwargs):
+
+    """Function:  sink_funcs
+
+    Description:  Returns a function for each requested output that sends a
+        record to the output.
+
+    Arguments:
+        (input) mail -> Mail class instance or None
+        (input) no_std -> Suppress standard out
+        (input) **kwargs:
+            db_tbl -> Mongo database and table name
+            class_cfg -> Mongo server configuration
+            ins_conn -> MongoInsert class instance
+            file_out -> FileWriter class instance
+            rrd -> Dictionary of server names and RoundRobin instances
+            rrd_dir -> Directory of the round-robin files
+            archive -> ColumnArchive class instance
+            metrics -> MetricsServer class instance
+            udp -> UdpEmitter class instance
+            digest -> MailDigest class instance
+        (output) sinks -> Dictionary of output names and functions
+
+    """
+
+    sinks = {}
+    mongo_args = {key: kwargs.get(key) for key in
+                  ["db_tbl", "class_cfg", "ins_conn"] if kwargs.get(key)}
+    metrics = metrics_once()
+
+    if kwargs.get("ins_conn") or (
+            kwargs.get("db_tbl") and kwargs.get("class_cfg")):
+        sinks["mongo"] = lambda data, text: process_json(data, **mongo_args)
+
+    if kwargs.get("file_out"):
+        sinks["file"] = lambda data, text: kwargs["file_out"].write(text)
+
+    if kwargs.get("rrd_dir"):
+        sinks["rrd"] = lambda data, text: rrd_update(
+            kwargs["rrd"], kwargs["rrd_dir"], data, metrics(data))
+
+    if kwargs.get("archive"):
+        sinks["archive"] = lambda data, text: kwargs["archive"].append(
+            data, metrics(data))
+
+    if kwargs.get("metrics"):
+        sinks["metrics"] = lambda data, text: kwargs["metrics"].update(
+            data, metrics(data))
+
+    if kwargs.get("udp"):
+        sinks["udp"] = lambda data, text: kwargs["udp"].send(
+            data, metrics(data))
+
+    if not no_std:
+        sinks["stdout"] = lambda data, text: gen_libs.print_data(text)
+
+    if kwargs.get("digest"):
+        sinks["mail"] = lambda data, text: kwargs["digest"].add(
+            data, text, metrics(data))
+
+    elif mail:
+        sinks["mail"] = lambda data, text: mail.add_2_msg(text)
+
+    return sinks
+
+
+def create_sinks(mail, no_std, args, **kwargs):
+
+    """Function:  create_sinks
+
+    Description:  Returns the built-in outputs and the output plugins (-e
+        option) as opened Sink class instances.
+
+    Arguments:
+        (input) mail -> Mail class instance or None
+        (input) no_std -> Suppress standard out
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            Outputs passed on to sink_funcs
+        (output) sinks -> Dictionary of output names and Sink instances
+
+    """
+
+    sinks = {name: FuncSink(func) for name, func in
+             sink_funcs(mail, no_std, **kwargs).items()}
+
+    for spec in args.get_val("-e", def_val=[]):
+        sinks[spec] = load_sink(spec)()
+
+    for sink in sinks.values():
+        sink.open(args)
+
+    return sinks
+
+
+def load_sink(spec):
+
+    """Function:  load_sink
+
+    Description:  Imports an output plugin class.
+
+    Arguments:
+        (input) spec -> Plugin as module:class, the module must be on the
+            Python path
+        (output) Sink subclass
+
+    """
+
+    module, _, name = spec.partition(":")
+
+    if not module or not name:
+        raise ValueError("plugin must be given as module:class")
+
+    return getattr(importlib.import_module(module), name)
+
+
+def queue_records(records, sinks, args):
+
+    """Function:  queue_records
+
+    Description:  Runs each output in its own worker thread fed by a bounded
+        queue, so a slow output does not hold up the collection.  The queue
+        status of any output that is falling behind is printed to standard
+        error every STATUS_INTERVAL seconds and all of them at the end of
+        the run if records were dropped or could not be sent.
+
+    Arguments:
+        (input) records -> Generator of data and text pairs
+        (input) sinks -> Dictionary of output names and functions
+        (input) args -> ArgParser class instance
+
+    """
+
+    policy = list(args.get_val("-Q")) + ["1000"]
+    workers = [SinkWorker(name, func, policy[0], int(policy[1]))
+               for name, func in sinks.items()]
+    status_time = time.monotonic()
+
+    try:
+        for data, text in records:
+            for worker in workers:
+                worker.put(data, text)
+
+            if time.monotonic() - status_time >= STATUS_INTERVAL:
+                print_status(
+                    [item for item in workers if item.status()["depth"]])
+                status_time = time.monotonic()
+
+    finally:
+        for worker in workers:
+            worker.close()
+
+        print_status([item for item in workers
+                      if item.dropped or item.errors])
+
+
+def print_status(workers, label="Output queue status"):
+
+    """Function:  print_status
+
+    Description:  Prints the status of the outputs to standard error.
+
+    Arguments:
+        (input) workers -> List of SinkWorker or SinkRunner class instances
+        (input) label -> Label of the status line
+
+    """
+
+    if workers:
+        print(f"{label}:  " + json.dumps(
+            {worker.name: worker.status() for worker in workers}),
+            file=sys.stderr)
+
+
+def process_json(data, **kwargs):
+
+    """Function:  process_json
+
+    Description:  Inserts a performance document into the Mongo database,
+        through the open insert connection if there is one.  The document
+        is copied first as the insert adds an _id to it and the same
+        document goes to the other outputs.
+
+    Arguments:
+        (input) data -> Dictionary of Mongo performance stat
+        (input) **kwargs:
+            db_tbl -> Mongo database and table name
+            class_cfg -> Mongo server configuration
+            ins_conn -> MongoInsert class instance
+
+    """
+
+    data = dict(data)
+
+    if kwargs.get("ins_conn", None):
+        status = kwargs.get("ins_conn").insert(data)
+
+        if not status[0]:
+            print(f"Insert error:  {status[1]}")
+
+    elif kwargs.get("db_tbl", False) and kwargs.get("class_cfg", False):
+        dbn, tbl = kwargs.get("db_tbl").split(":")
+        status = mongo_libs.ins_doc(kwargs.get("class_cfg"), dbn, tbl, data)
+
+        if not status[0]:
+            print(f"Insert error:  {status[1]}")
+
+
+def sample_metrics(data):
+
+    """Function:  sample_metrics
+
+    Description:  Returns the sample time and the numeric statistics of a
+        performance document.
+
+    Arguments:
+        (input) data -> Dictionary of Mongo performance stat
+        (output) Sample time in seconds since the epoch
+        (output) Dictionary of metric names and values
+
+    """
+
+    stats = {key: val for key, val in decode_stats(data["PerfStats"]).items()
+             if isinstance(val, (int, float)) and not isinstance(val, bool)}
+
+    return time.mktime(time.strptime(data["AsOf"], "%Y-%m-%d %H:%M:%S")), \
+        stats
+
+
+def metrics_once():
+
+    """Function:  metrics_once
+
+    Description:  Returns a function that decodes the numeric statistics of
+        a performance document with sample_metrics once and returns the
+        same result to every output of the record.  Each output receives the
+        same document instance, so only the last one is kept.
+
+    Arguments:
+        (output) metrics -> Function of a performance document that returns
+            the sample time and metrics pair
+
+    """
+
+    last = [(None, None)]
+
+    # The pair is replaced as a whole, safe for the -Q worker threads.
+    def metrics(data):
+        item = last[0]
+
+        if item[0] is not data:
+            item = (data, sample_metrics(data))
+            last[0] = item
+
+        return item[1]
+
+    return metrics
+
+
+def rrd_update(stores, rrd_dir, data, metrics=None):
+
+    """Function:  rrd_update
+
+    Description:  Averages the numeric statistics of a performance document
+        into the round-robin file of its server.  The file is opened on the
+        server's first sample and created with that sample's statistics as
+        its metrics.
+
+    Arguments:
+        (input) stores -> Dictionary of server names and RoundRobin instances
+        (input) rrd_dir -> Directory of the round-robin files
+        (input) data -> Dictionary of Mongo performance stat
+        (input) metrics -> Sample time and metrics pair from sample_metrics,
+            decoded from the data if not given
+
+    """
+
+    stamp, stats = metrics or sample_metrics(data)
+
+    if data["Server"] not in stores:
+        stores[data["Server"]] = RoundRobin(
+            os.path.join(rrd_dir, data["Server"].translate(NAME_CHARS)
+                         + ".rrd"), metrics=sorted(stats))
+
+    stores[data["Server"]].update(stamp, stats)
+
+
+def dump_rrd(args):
+
+    """Function:  dump_rrd
+
+    Description:  Prints each row of a round-robin file as a JSON document.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    store = RoundRobin(args.get_val("-L"), readonly=True)
+
+    try:
+        for step, _, _ in store.archives:
+            for stamp, values in store.rows(step):
+                print(json.dumps({
+                    "Step": step,
+                    "AsOf": time.strftime(
+                        "%Y-%m-%d %H:%M:%S", time.localtime(stamp)),
+                    "PerfStats": values}))
+
+    finally:
+        store.close()
+
+
+def read_column(archive_dir, server, metric, start=None, end=None):
+
+    """Function:  read_column
+
+    Description:  Returns the values of a metric from the columnar archive.
+        Only the time and metric column files of each block in the time
+        range are read, through memory mapping.
+
+    Arguments:
+        (input) archive_dir -> Directory of the archive
+        (input) server -> Server name
+        (input) metric -> Name of metric
+        (input) start -> Start time in seconds since the epoch
+        (input) end -> End time in seconds since the epoch
+        (output) data -> List of sample time and value pairs
+
+    """
+
+    path = os.path.join(archive_dir, server.translate(NAME_CHARS))
+    data = []
+
+    for name in sorted(os.listdir(path)):
+        # A block without a manifest has no rows written yet.
+        if not os.path.exists(os.path.join(path, name, "manifest.json")):
+            continue
+
+        with open(os.path.join(path, name, "manifest.json"), mode="r",
+                  encoding="UTF-8") as fhdr:
+            manifest = json.load(fhdr)
+
+        if metric not in manifest["Columns"] \
+           or (start is not None and manifest["End"] < start) \
+           or (end is not None and manifest["Start"] > end):
+            continue
+
+        with open(os.path.join(path, name, "AsOf.f64"), mode="rb") as fhdr, \
+                open(os.path.join(path, name, metric + ".f64"),
+                     mode="rb") as fhdr2, \
+                mmap.mmap(fhdr.fileno(), 0, access=mmap.ACCESS_READ) \
+                as stamps, \
+                mmap.mmap(fhdr2.fileno(), 0, access=mmap.ACCESS_READ) \
+                as values:
+            data.extend(
+                (stamp, value) for stamp, value in zip(
+                    array.array("d", stamps[:manifest["Rows"] * 8]),
+                    array.array("d", values[:manifest["Rows"] * 8]))
+                if not math.isnan(value)
+                and (start is None or stamp >= start)
+                and (end is None or stamp <= end))
+
+    return data
+
+
+def open_text(fname):
+
+    """Function:  open_text
+
+    Description:  Opens a text file for reading, gzip or zstd compressed
+        files are decompressed as they are read.
+
+    Arguments:
+        (input) fname -> Name of file
+        (output) File handle
+
+    """
+
+    if fname.endswith(".gz"):
+        return gzip.open(fname, mode="rt", encoding="UTF-8")
+
+    if fname.endswith(".zst"):
+        return zstandard.open(fname, mode="rt", encoding="UTF-8")
+
+    return open(fname, mode="r", encoding="UTF-8")      # pylint:disable=R1732
+
+
+def load_json(fname):
+
+    """Function:  load_json
+
+    Description:  Returns each JSON document in an output file.  The file
+        can hold indented or flattened documents and be gzip or zstd
+        compressed.
+
+    Arguments:
+        (input) fname -> Name of output file
+        (output) Dictionary of Mongo performance stat
+
+    """
+
+    with open_text(fname) as fhdr:
+        text = fhdr.read()
+
+    decoder = json.JSONDecoder()
+    idx = 0
+
+    while True:
+        while idx < len(text) and text[idx].isspace():
+            idx += 1
+
+        if idx >= len(text):
+            break
+
+        data, idx = decoder.raw_decode(text, idx)
+
+        yield data
+
+
+def convert_json(args):
+
+    """Function:  convert_json
+
+    Description:  Converts JSON output files into the columnar archive.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    archive = ColumnArchive(args.get_val("-X"))
+    count = 0
+
+    try:
+        for fname in args.get_val("-V"):
+            for data in load_json(fname):
+                if "PerfStats" in data and "AsOf" in data:
+                    archive.append(data)
+                    count += 1
+
+    finally:
+        archive.close()
+
+    print(f"Converted {count} samples from {len(args.get_val('-V'))} files")
+
+
+def replay_samples(fhdr, typed=False, pace=False, **kwargs):
+
+    """Function:  replay_samples
+
+    Description:  Returns the samples in recorded mongostat --json output,
+        either as fast as they can be read or paced at the recorded sample
+        times.  The recorded time of day is given the capture date, moving
+        to the next day when the time goes back by more than half a day.
+
+    Arguments:
+        (input) fhdr -> File handle of mongostat JSON output rows
+        (input) typed -> True|False - Convert the statistics to numbers
+        (input) pace -> True|False - Pace the samples at the recorded times
+        (input) **kwargs:
+            date -> Date of the first sample (YYYY-MM-DD), default is today
+            timers -> StageTimers class instance or None
+        (output) name -> Server name
+        (output) value -> Dictionary of performance statistics, the time is
+            the recorded date and time (YYYY-MM-DD HH:MM:SS)
+
+    """
+
+    parse = timed(kwargs.get("timers"), "parse", parse_rows)
+    decode = timed(kwargs.get("timers"), "decode", decode_stats)
+    day = datetime.date.fromisoformat(
+        kwargs.get("date", None) or gen_libs.get_date())
+    start = time.monotonic()
+    first = None
+    prev = None
+
+    for line in fhdr:
+        for name, value in parse([line], names=True):
+            match = re.search(r"(\d+):(\d\d):(\d\d)", str(value.get("time")))
+
+            if match:
+                secs = int(match[1]) * 3600 + int(match[2]) * 60 + \
+                    int(match[3])
+
+                # The recorded time has no date, a big step back is a new
+                #   day and a small one is rows of one sample out of order.
+                if prev is not None and prev - secs > 43200:
+                    day += datetime.timedelta(days=1)
+
+                first = first or (day, secs)
+                prev = secs
+                value = dict(value, time=f"{day} {int(match[1]):02}:"
+                             f"{match[2]}:{match[3]}")
+
+                if pace:
+                    time.sleep(max(0, start + (day - first[0]).days * 86400
+                                   + secs - first[1] - time.monotonic()))
+
+            yield name, decode(value) if typed else value
+
+
+def run_replay(args):
+
+    """Function:  run_replay
+
+    Description:  Sends recorded mongostat --json output through the same
+        processing and outputs as a live capture, without a monitored
+        database.  The sample count and rate are printed to standard error.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+
+    """
+
+    cfg = None
+    ins_conn = None
+    db_tbl = args.get_val("-i", def_val=False)
+    fname, date = (list(args.get_val("-I")) + [None])[:2]
+    timers = create_timers(args)
+
+    try:
+        fhdr = sys.stdin if fname == "-" else open_text(fname)
+
+        if not date and fhdr is not sys.stdin:
+            date = time.strftime(
+                "%Y-%m-%d", time.localtime(os.path.getmtime(fname)))
+
+    except OSError as err:
+        print(f"Error:  -I {fname}:  {err}")
+        return
+
+    if args.arg_exist("-m"):
+        cfg = gen_libs.load_module(args.get_val("-m"), args.get_val("-d"))
+
+    if cfg and db_tbl:
+        ins_conn = create_insert(cfg, db_tbl, args)
+
+    # zip stops on the samples first, so the counter is left at the count.
+    counter = itertools.count()
+    start = time.monotonic()
+
+    try:
+        proc_samples(
+            (item for item, _ in zip(replay_samples(
+                fhdr, args.arg_exist("-T"), args.arg_exist("-E"), date=date,
+                timers=timers), counter)),
+            args, ofile=args.get_val("-o", def_val=False), db_tbl=db_tbl,
+            class_cfg=cfg, ins_conn=ins_conn, timers=timers)
+
+    finally:
+        if fhdr is not sys.stdin:
+            fhdr.close()
+
+        if ins_conn:
+            status = ins_conn.close()
+
+            if not status[0]:
+                print(f"Insert error:  {status[1]}")
+
+    count = next(counter)
+    elapsed = time.monotonic() - start
+    print(f"Replayed {count} samples in {elapsed:.3f} seconds "
+          f"({count / max(elapsed, 1e-9):.0f} samples/s)", file=sys.stderr)
+
+
+def get_fleet(fleet, dir_path):
+
+    """Function:  get_fleet
+
+    Description:  Returns the Mongo configuration files for fleet mode.
+
+    Arguments:
+        (input) fleet -> List of configuration files or a directory path
+        (input) dir_path -> Directory path to the configuration files
+        (output) cfg_list -> List of (configuration file, directory) pairs
+
+    """
+
+    fleet = list(fleet) if isinstance(fleet, list) else [fleet]
+
+    if len(fleet) == 1 and os.path.isdir(fleet[0]):
+        dir_path = fleet[0]
+        fleet = sorted(
+            os.path.splitext(fname)[0] for fname in os.listdir(dir_path)
+            if fname.endswith(".py") and not fname.startswith("_"))
+
+    return [(cfg_name, dir_path) for cfg_name in fleet]
+
+
+def create_server(cfg):
+
+    """Function:  create_server
+
+    Description:  Creates a database server instance from a Mongo
+        configuration.
+
+    Arguments:
+        (input) cfg -> Mongo server configuration
+        (output) Mongo_class.Server or mongo_class.RepSet instance
+
+    """
+
+    config = mongo_libs.create_security_config(cfg=cfg)
+
+    if "direct_connect" not in config and hasattr(cfg, "direct_connect"):
+        config["direct_connect"] = cfg.direct_connect
+
+    if cfg.repset and cfg.repset_hosts:
+        return mongo_class.RepSet(
+            cfg.name, cfg.user, cfg.japd, host=cfg.host, port=cfg.port,
+            auth=cfg.auth, repset=cfg.repset, repset_hosts=cfg.repset_hosts,
+            **config)
+
+    return mongo_class.Server(
+        cfg.name, cfg.user, cfg.japd, host=cfg.host, port=cfg.port,
+        auth=cfg.auth, **config)
+
+
+def sample_target(mongo):
+
+    """Function:  sample_target
+
+    Description:  Runs the serverStatus command against a database and
+        records when the results were received.
+
+    Arguments:
+        (input) mongo -> Database server instance
+        (output) Tuple of serverStatus results and the monotonic time
+
+    """
+
+    return mongo.adm_cmd("serverStatus"), time.monotonic()
+
+
+def connect_target(mongo):
+
+    """Function:  connect_target
+
+    Description:  Makes a new connection attempt to a database.
+
+    Arguments:
+        (input) mongo -> Database server instance
+
+    """
+
+    mongo_libs.disconnect([mongo])
+    status = mongo.connect()
+
+    if not status[0]:
+        raise ConnectionError(f"Reconnect failure:  {status[1]}")
+
+
+def fleet_samples(                              # pylint:disable=R0914,R0912
+        targets, count, interval, max_workers, down=None):
+
+    """Function:  fleet_samples
+
+    Description:  Samples every database on a single shared schedule using a
+        bounded pool of worker threads and returns each sample as it is
+        calculated.  A database which is still processing a previous sample
+        skips the polling interval, so a slow database does not delay the
+        others.  A failure on one database does not affect the others.  A
+        database which failed to connect is retried with an increasing wait
+        between attempts and sampled once it is connected.
+
+    Arguments:
+        (input) targets -> Dictionary of names and database server instances
+        (input) count -> Number of samples to return for each database or
+            None to run forever
+        (input) interval -> Polling interval in seconds
+        (input) max_workers -> Maximum number of databases sampled at once
+        (input) down -> Dictionary of names and database server instances
+            which failed to connect
+        (output) name, stats -> Server name and performance statistics
+
+    """
+
+    prev = {}
+    pending = {}
+    deadline = time.monotonic()
+    targets = dict(targets, **(down or {}))
+    retry = {name: (deadline + interval, min(interval * 2, MAX_BACKOFF))
+             for name in down or {}}
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max(max_workers, 1))
+
+    try:
+        for _ in itertools.count() if count is None else range(count + 1):
+            for name, mongo in targets.items():
+                if name in pending:
+                    continue
+
+                if name not in retry:
+                    pending[name] = executor.submit(sample_target, mongo)
+
+                elif retry[name][0] <= time.monotonic():
+                    pending[name] = executor.submit(connect_target, mongo)
+
+            deadline += interval
+
+            while pending and time.monotonic() < deadline:
+                done, _ = futures.wait(
+                    list(pending.values()),
+                    timeout=max(deadline - time.monotonic(), 0),
+                    return_when=futures.FIRST_COMPLETED)
+
+                for name in [key for key, item in pending.items()
+                             if item in done]:
+                    try:
+                        result = pending.pop(name).result()
+
+                    except Exception as err:            # pylint:disable=W0718
+                        if name in retry:
+                            backoff = retry[name][1]
+                            retry[name] = (time.monotonic() + backoff,
+                                           min(backoff * 2, MAX_BACKOFF))
+
+                        print(f"fleet_samples: {name}:  {err}")
+                        continue
+
+                    if name in retry:
+                        del retry[name]
+                        continue
+
+                    curr, curr_time = result
+
+                    if name in prev:
+                        stats = calc_stats(
+                            prev[name][0], curr, curr_time - prev[name][1])
+                        stats["time"] = time.strftime("%H:%M:%S")
+
+                        yield targets[name].name, stats
+
+                    prev[name] = (curr, curr_time)
+
+            time.sleep(max(deadline - time.monotonic(), 0))
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_insert(cfg, db_tbl, args):
+
+    """Function:  create_insert
+
+    Description:  Creates the MongoInsert class instance that holds the
+        connection to the insert database for the run.
+
+    Arguments:
+        (input) cfg -> Mongo server configuration
+        (input) db_tbl -> database:table_name
+        (input) args -> ArgParser class instance
+        (output) MongoInsert class instance
+
+    """
+
+    write_concern = args.get_val("-W", def_val=None)
+    timeseries = None
+
+    if write_concern is not None and write_concern.isdigit():
+        write_concern = int(write_concern)
+
+    if args.arg_exist("-H"):
+        interval = float(args.get_val("-b", def_val=1))
+        timeseries = next((name for limit, name in GRANULARITY
+                           if interval < limit), "hours")
+
+    return MongoInsert(
+        cfg, db_tbl, batch_size=int(args.get_val("-k", def_val=1)),
+        max_latency=float(args.get_val("-K")) if args.arg_exist("-K") else
+        None, ordered=not args.arg_exist("-U"), write_concern=write_concern,
+        spool=Spool(args.get_val("-G")) if args.arg_exist("-G") else None,
+        timeseries=timeseries)
+
+
+def run_fleet(args, **kwargs):
+
+    """Function:  run_fleet
+
+    Description:  Loads each Mongo configuration file in the fleet once,
+        connects to each database and captures the performance statistics
+        from all of them in a single process.  In daemon mode, a database
+        which fails to connect is retried until it is connected.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            req_arg -> List of options to add to cmd line
+            opt_arg -> Dictionary of additional options to add
+
+    """
+
+    targets = {}
+    down = {}
+    cfg = None
+    ins_conn = None
+    db_tbl = args.get_val("-i", def_val=False)
+
+    if args.arg_exist("-m"):
+        cfg = gen_libs.load_module(args.get_val("-m"), args.get_val("-d"))
+
+    if cfg and db_tbl:
+        ins_conn = create_insert(cfg, db_tbl, args)
+
+    for cfg_name, dir_path in get_fleet(
+            args.get_val("-F"), args.get_val("-d")):
+        mongo = create_server(gen_libs.load_module(cfg_name, dir_path))
+        status = mongo.connect()
+
+        if status[0]:
+            targets[cfg_name] = mongo
+
+        else:
+            if not args.arg_exist("-w"):
+                print(f"run_fleet: Connection failure:  {cfg_name}:"
+                      f"  {status[1]}")
+
+            if args.arg_exist("-D"):
+                down[cfg_name] = mongo
+
+    try:
+        if (targets or down) and args.arg_exist("-S"):
+            proc_samples(
+                fleet_samples(
+                    targets,
+                    None if args.arg_exist("-D") else
+                    int(args.get_val("-n", def_val=1)),
+                    float(args.get_val("-b", def_val=1)),
+                    int(args.get_val("-x", def_val=10)), down=down),
+                args, ofile=args.get_val("-o", def_val=False), db_tbl=db_tbl,
+                class_cfg=cfg, ins_conn=ins_conn, **kwargs)
+
+    finally:
+        if ins_conn:
+            status = ins_conn.close()
+
+            if not status[0]:
+                print(f"Insert error:  {status[1]}")
+
+        mongo_libs.disconnect(list(targets.values()) + list(down.values()))
+
+
+def needs_connection(server, args):
+
+    """Function:  needs_connection
+
+    Description:  Checks if the run needs a connection to the monitored
+        database.  A mongostat run to the output file, standard out or email
+        does not, mongostat makes its own connection.  A database using SSL
+        or TLS is always connected, as its mongostat options come from the
+        database server instance.
+
+    Arguments:
+        (input) server -> Mongo configuration
+        (input) args -> ArgParser class instance
+        (output) True|False -> If a database connection is needed
+
+    """
+
+    return bool([opt for opt in MONGO_OPTS if args.arg_exist(opt)]
+                or [key for key in SECURE_CFG if getattr(server, key, None)])
+
+
+def run_program(args, func_dict, **kwargs):             # pylint:disable=R0912
+
+    """Function:  run_program
+
+    Description:  Creates class instance(s) and controls flow of the program.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) **kwargs:
+            req_arg -> List of options to add to cmd line
+            opt_arg -> Dictionary of additional options to add
+
+    """
+
+    authdb = "--authenticationDatabase="
+    func_dict = dict(func_dict)
+    outfile = args.get_val("-o", def_val=False)
+    db_tbl = args.get_val("-i", def_val=False)
+    cfg = None
+    server = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
+    req_arg = list(kwargs.get("req_arg", []))
+    opt_arg = dict(kwargs.get("opt_arg", {}))
+
+    if authdb in req_arg:
+        req_arg.remove(authdb)
+        req_arg.append(authdb + server.auth_db)
+
+    if args.arg_exist("-m"):
+        cfg = gen_libs.load_module(args.get_val("-m"), args.get_val("-d"))
+
+    # Without a database connection, pymongo is not imported.
+    mongo = server
+    status = (True, None)
+
+    if needs_connection(server, args):
+        if server.repset and server.repset_hosts:
+            config = mongo_libs.create_security_config(cfg=server)
+            mongo = mongo_class.RepSet(
+                server.name, server.user, server.japd, host=server.host,
+                port=server.port, auth=server.auth, repset=server.repset,
+                repset_hosts=server.repset_hosts, **config)
+
+        else:
+            mongo = mongo_libs.create_instance(
+                args.get_val("-c"), args.get_val("-d"), mongo_class.Server)
+
+        status = mongo.connect()
+
+    if status[0]:
+        ins_conn = None
+
+        if cfg and db_tbl:
+            ins_conn = create_insert(cfg, db_tbl, args)
+
+        try:
+            # Call function(s) - intersection of command line and function
+            #   dict.
+            for item in set(args.get_args_keys()) & set(func_dict.keys()):
+                func_dict[item](
+                    mongo, args, ofile=outfile, db_tbl=db_tbl, class_cfg=cfg,
+                    req_arg=req_arg, opt_arg=opt_arg, mongo_cfg=server,
+                    ins_conn=ins_conn)
+
+        finally:
+            if ins_conn:
+                status = ins_conn.close()
+
+                if not status[0]:
+                    print(f"Insert error:  {status[1]}")
+
+            if mongo is not server:
+                mongo_libs.disconnect([mongo])
+
+    else:
+        if not args.arg_exist("-w"):
+            print(f"run_program: Connection failure:  {status[1]}")
+
+
+def profile_run(args, func, *fargs, **fkwargs):
+
+    """Function:  profile_run
+
+    Description:  Runs a function, under the profiler when -P option is
+        passed.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func -> Function to run
+        (input) *fargs -> Positional arguments of the function
+        (input) **fkwargs -> Keyword arguments of the function
+
+    """
+
+    if not args.arg_exist("-P"):
+        func(*fargs, **fkwargs)
+        return
+
+    profiler = Profiler(*args.get_val("-P")[:2],
+                        base=args.get_val("-o", def_val="mongo_perf"))
+    profiler.start()
+
+    try:
+        func(*fargs, **fkwargs)
+
+    finally:
+        profiler.stop()
+
+
+def check_options(args):                                # pylint:disable=R0911
+
+    """Function:  check_options
+
+    Description:  Checks the option values that the argument parser cannot
+        check and prints an error for the first one that is not valid.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) True|False -> If the option values are valid
+
+    """
+
+    if args.get_val("-C") == "zstd" and zstandard is None:
+        print("Error:  -C zstd option requires the zstandard package.")
+        return False
+
+    if not set(args.get_val("-M", def_val=[])[1:]).issubset(UDP_FORMATS):
+        print(f"Error:  -M format must be one of:  {UDP_FORMATS}")
+        return False
+
+    if not set(args.get_val("-P", def_val=[])[:1]).issubset(PROFILE_MODES):
+        print(f"Error:  -P mode must be one of:  {PROFILE_MODES}")
+        return False
+
+    # A time-series collection does not enforce a unique _id, so a replayed
+    #   spool could insert a sample twice.
+    if args.arg_exist("-G") and args.arg_exist("-H"):
+        print("Error:  -G option cannot be used with -H option.")
+        return False
+
+    try:
+        for date in args.get_val("-I", def_val=[])[1:2]:
+            datetime.date.fromisoformat(date)
+
+    except ValueError:
+        print("Error:  -I date must be given as YYYY-MM-DD")
+        return False
+
+    for spec in args.get_val("-e", def_val=[]):
+        try:
+            load_sink(spec)
+
+        except (ImportError, AttributeError, ValueError) as err:
+            print(f"Error:  -e {spec}:  {err}")
+            return False
+
+    return True
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Initializes program-wide used variables and processes command
+        line arguments and values.
+
+    Variables:
+        dir_perms_chk -> contains directories and their octal permissions
+        file_perm_chk -> file check options with their perms in octal
+        file_crt -> contains options which require files to be created
+        func_dict -> dictionary list for the function calls or other options
+        opt_arg_list -> contains optional arguments for the command line
+        opt_con_req_list -> contains the options that require other options
+        opt_def_dict -> contains options with their default values
+        opt_def_dict2 -> default values for "-S" option
+        opt_multi_list -> contains the options that will have multiple values
+        opt_req_list -> contains the options that are required for the program
+        opt_val_list -> contains options which require values
+        opt_valid_val -> contains options with their valid values
+        req_arg_list -> contains arguments to add to command line by default
+
+    Arguments:
+        (input) argv -> Arguments from the command line
+
+    """
+
+    dir_perms_chk = {"-d": 5, "-p": 5, "-G": 7, "-J": 7, "-X": 7}
+    file_perm_chk = {"-o": 6, "-L": 4}
+    file_crt = ["-o"]
+    func_dict = {"-S": mongo_stat}
+    opt_arg_list = {"-n": "-n=", "-r": "--tlsInsecure"}
+    opt_con_req_list = {
+        "-i": ["-m"], "-s": ["-t"], "-u": ["-t"], "-U": ["-i"], "-W": ["-i"],
+        "-G": ["-i"], "-H": ["-i"], "-C": ["-o"], "-O": ["-o"], "-A": ["-O"],
+        "-V": ["-X"], "-g": ["-D"], "-q": ["-t"], "-Z": ["-q"],
+        "-E": ["-I"]}
+    opt_def_dict = {"-i": "sysmon:mongo_perf", "-n": "1", "-b": "1"}
+    opt_def_dict2 = {"-n": "1", "-b": "1"}
+    opt_multi_list = ["-s", "-t", "-F", "-Q", "-O", "-V", "-M", "-e", "-P",
+                      "-I", "-B"]
+    opt_req_list = ["-c", "-d"]
+    opt_val_list = ["-c", "-d", "-b", "-i", "-m", "-n", "-o", "-p", "-s", "-t",
+                    "-F", "-x", "-k", "-K", "-W", "-B", "-Y", "-Q", "-G",
+                    "-C", "-O", "-A", "-J", "-L", "-X", "-V", "-g", "-M",
+                    "-e", "-I", "-j", "-P"]
+    opt_valid_val = {"-C": list(COMPRESS_EXT.keys())}
+    req_arg_list = ["--authenticationDatabase=", "--json"]
+
+    # Process argument list from command line.
+    args = gen_class.ArgParser(
+        sys.argv, opt_val=opt_val_list, opt_def=opt_def_dict,
+        multi_val=opt_multi_list, do_parse=True)
+
+    # Add default arguments for certain argument combinations.
+    if args.arg_exist("-S"):
+        args.arg_add_def(defaults=opt_def_dict2)
+
+    # Fleet mode replaces the -c option.
+    if args.arg_exist("-F"):
+        opt_req_list = ["-d"]
+
+    # Dumping a round-robin file, converting output files or replaying
+    #   recorded output needs no configuration.
+    if args.arg_exist("-L") or args.arg_exist("-V") or args.arg_exist("-I"):
+        opt_req_list = []
+
+    if not gen_libs.help_func(args, __version__, help_message)              \
+       and args.arg_require(opt_req=opt_req_list)                           \
+       and args.arg_cond_req(opt_con_req=opt_con_req_list)                  \
+       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)                    \
+       and args.arg_file_chk(file_perm_chk=file_perm_chk, file_crt=file_crt):
+
+        if not args.arg_valid_val(opt_valid_val=opt_valid_val) \
+           or not check_options(args):
+            return
+
+        try:
+            proglock = gen_class.ProgramLock(
+                sys.argv, args.get_val("-y", def_val=""))
+
+            if args.arg_exist("-D"):
+                signal.signal(signal.SIGTERM, sigterm_handler)
+
+            if args.arg_exist("-L"):
+                dump_rrd(args)
+
+            elif args.arg_exist("-V"):
+                convert_json(args)
+
+            elif args.arg_exist("-I"):
+                profile_run(args, run_replay, args)
+
+            elif args.arg_exist("-F"):
+                profile_run(args, run_fleet, args, req_arg=req_arg_list,
+                            opt_arg=opt_arg_list)
+
+            else:
+                profile_run(
+                    args, run_program, args, func_dict, req_arg=req_arg_list,
+                    opt_arg=opt_arg_list)
+
             del proglock
 
         except gen_class.SingleInstanceException:
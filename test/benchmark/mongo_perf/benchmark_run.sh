@@ -0,0 +1,11 @@
+#!/bin/bash
+# Benchmark program for the program module.
+# This will run all the benchmarks for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Benchmarking..."
+/usr/bin/python ./test/benchmark/mongo_perf/parse_rows.py
+/usr/bin/python ./test/benchmark/mongo_perf/pipeline.py
+/usr/bin/python ./test/benchmark/mongo_perf/import_time.py
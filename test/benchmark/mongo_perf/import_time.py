@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  import_time.py
+
+    Description:  Benchmark of the start up of mongo_perf.py.  Imports the
+        program with python -X importtime in a new interpreter a number of
+        times and prints the best import time of the program, the modules
+        that took the longest to import and which of the modules that are
+        only needed by some options were imported.  Also times the
+        interpreter start up to the version message (-v option).
+
+    Usage:
+        test/benchmark/mongo_perf/import_time.py [repeat]
+
+    Arguments:
+        repeat -> Number of times the program is imported, best time is
+            used.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import subprocess
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+TOP = 15
+LAZY = ["pymongo", "bson", "mongo_lib.mongo_libs", "mongo_lib.mongo_class",
+        "simplejson", "smtplib", "ssl", "http.server", "concurrent.futures",
+        "subprocess", "pstats"]
+
+
+def import_times():
+
+    """Function:  import_times
+
+    Description:  Imports mongo_perf.py in a new interpreter with
+        -X importtime.
+
+    Arguments:
+        (output) Dictionary of module names and cumulative import time in
+            microseconds
+
+    """
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mongo_perf"],
+        stderr=subprocess.PIPE, check=True)
+    times = {}
+
+    # Lines are:  import time: self [us] | cumulative | imported package
+    for line in proc.stderr.decode().split("\n"):
+        fields = line.partition(":")[2].split("|")
+
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+
+    return times
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Prints the best import time of mongo_perf.py, the slowest
+        imports and the start up time to the version message.
+
+    Variables:
+        TOP -> Number of slowest imports printed
+        LAZY -> Modules only some options need
+
+    Arguments:
+
+    """
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    runs = [import_times() for _ in range(repeat)]
+    best = min(runs, key=lambda item: item["mongo_perf"])
+    walls = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "mongo_perf.py", "-v"],
+                       stdout=subprocess.DEVNULL, check=False)
+        walls.append(time.perf_counter() - start)
+
+    print(f"import mongo_perf{best['mongo_perf'] / 1000:>12.1f} ms "
+          f"(best of {repeat})")
+    print(f"mongo_perf.py -v{min(walls) * 1000:>13.1f} ms "
+          f"(interpreter start up included)")
+    print("\nSlowest imports (cumulative ms):")
+
+    for name, usec in sorted(best.items(), key=lambda item: -item[1])[
+            1:TOP + 1]:
+        print(f"  {name:<40}{usec / 1000:>8.1f}")
+
+    print("\nImported at start up:  "
+          + (", ".join(name for name in LAZY if name in best) or "none of "
+             + ", ".join(LAZY)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
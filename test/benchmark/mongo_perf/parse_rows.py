@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  parse_rows.py
+
+    Description:  Benchmark of the mongostat output row parsing in
+        mongo_perf.py.  Compares the rows per second of the former
+        ast.literal_eval row parsing against parse_rows, and the cost of the
+        typed decoding (-T option), using recorded mongostat JSON output.
+
+    Usage:
+        test/benchmark/mongo_perf/parse_rows.py [repeat]
+
+    Arguments:
+        repeat -> Number of times each parser is timed, best time is used.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import ast
+import timeit
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+BASELINE = "test/benchmark/mongo_perf/baseline/mongostat.json"
+
+
+def literal_eval_rows(rows):
+
+    """Function:  literal_eval_rows
+
+    Description:  Row parsing as done before parse_rows, one
+        ast.literal_eval per row.
+
+    Arguments:
+        (input) rows -> List of mongostat JSON output rows
+        (output) List of dictionaries of performance statistics
+
+    """
+
+    return [ast.literal_eval(row).popitem()[1]
+            for row in rows if row.strip()]
+
+
+def stream_rows(rows):
+
+    """Function:  stream_rows
+
+    Description:  Row parsing as done for streamed output, one parse_rows
+        call per row.
+
+    Arguments:
+        (input) rows -> List of mongostat JSON output rows
+        (output) List of dictionaries of performance statistics
+
+    """
+
+    return [value for row in rows for value in mongo_perf.parse_rows([row])]
+
+
+def typed_rows(rows):
+
+    """Function:  typed_rows
+
+    Description:  Row parsing with the typed decoding (-T option).
+
+    Arguments:
+        (input) rows -> List of mongostat JSON output rows
+        (output) List of dictionaries of typed performance statistics
+
+    """
+
+    return [mongo_perf.decode_stats(value)
+            for value in mongo_perf.parse_rows(rows)]
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Times each parser and prints the rows per second.
+
+    Variables:
+        BASELINE -> Recorded mongostat JSON output
+
+    Arguments:
+
+    """
+
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with open(BASELINE, mode="r", encoding="UTF-8") as fhdr:
+        rows = fhdr.read().split("\n")
+
+    count = len([row for row in rows if row.strip()])
+    parsers = [("ast.literal_eval per row", literal_eval_rows),
+               ("parse_rows per row (-l)", stream_rows),
+               ("parse_rows per chunk", mongo_perf.parse_rows),
+               ("parse_rows + decode_stats", typed_rows)]
+
+    if literal_eval_rows(rows) != mongo_perf.parse_rows(rows):
+        print("Error:  Parsers do not return the same results")
+        sys.exit(1)
+
+    print(f"{count} rows from {BASELINE}")
+
+    for name, func in parsers:
+        secs = min(timeit.repeat(lambda f=func: f(rows), number=10,
+                                 repeat=repeat)) / 10
+        print(f"{name:<26}{count / secs:>12,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
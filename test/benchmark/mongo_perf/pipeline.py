@@ -0,0 +1,362 @@
+# Classification (U)
+
+"""Program:  pipeline.py
+
+    Description:  End-to-end throughput benchmark of mongo_perf.py.  Runs
+        mongo_stat against the fake mongostat program in the bin directory
+        once for each output (scenario) and measures the rows per second,
+        the per-row latency from mongostat writing a row to the last output
+        receiving it, the CPU time and the peak resident memory.  Each
+        scenario runs in its own process so the peak memory of one does not
+        hide another.  The results are saved as JSON to the results
+        directory, one file per program version, and compared with the
+        results of the last version benchmarked.  The results directory is
+        ignored by git so a run does not leave the checkout dirty.
+
+    Usage:
+        test/benchmark/mongo_perf/pipeline.py [-n ticks] [-H hosts]
+            [-R rate] [-s scenario [scenario ...]]
+            [-m file -d dir_path [-i database:collection]]
+
+    Arguments:
+        -n ticks => Number of samples of every simulated host.
+            Default = 2000.
+        -H hosts => Number of simulated hosts.  Default = 5.
+        -R rate => Samples per second of each host, 0 is as fast as the
+            pipeline reads them.  Default = 0.
+        -s scenario [scenario ...] => Scenarios to run.  Default is all of
+            them.
+        -m file => Mongo configuration file of an insert database, adds the
+            mongo scenario.  Loaded as a python module, do not include the
+            .py extension with the name.
+            -d dir path => Directory path to the -m file.
+            -i database:collection => Insert database and collection.
+                Default = benchmark:mongo_perf.
+        -x scenario => Internal, runs one scenario in this process.
+            -w file => Internal, file the scenario results are written to.
+
+    Notes:
+        Scenarios:
+            none => No output, collection and parsing only.
+            stdout => Standard out (to /dev/null).
+            file => Output file (-o option).
+            file_gzip => Compressed output file (-o and -C gzip options).
+            typed => Typed statistics (-T option), no output.
+            rrd => Round-robin history (-J option).
+            archive => Columnar archive (-X option).
+            prometheus => Prometheus endpoint (-g option).
+            udp => StatsD UDP emitter (-M option) to the discard port.
+            queued => Output file through the output queue (-Q option).
+            mongo => Mongo database (-m option) if requested.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import glob
+import shutil
+import platform
+import resource
+import datetime
+import tempfile
+import subprocess
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+BENCH_DIR = "test/benchmark/mongo_perf"
+BIN_DIR = os.path.join(BENCH_DIR, "bin")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+PROBE = "pipeline:LatencyProbe"
+SCENARIOS = {
+    "none": ["-z"],
+    "stdout": [],
+    "file": ["-z", "-o", "{tmp}/out.json", "-B", "0", "100"],
+    "file_gzip": ["-z", "-o", "{tmp}/out.json", "-C", "gzip"],
+    "typed": ["-z", "-T"],
+    "rrd": ["-z", "-J", "{tmp}"],
+    "archive": ["-z", "-X", "{tmp}"],
+    "prometheus": ["-z", "-g", "127.0.0.1:0"],
+    "udp": ["-z", "-M", "127.0.0.1:9", "statsd"],
+    "queued": ["-z", "-o", "{tmp}/out.json", "-B", "0", "100", "-Q",
+               "block"],
+    "mongo": ["-z", "-k", "100"]}
+OPT_VAL = ["-n", "-H", "-R", "-s", "-m", "-d", "-i", "-x", "-w", "-b", "-o",
+           "-p", "-k", "-B", "-C", "-J", "-X", "-g", "-M", "-Q", "-e"]
+OPT_MULTI = ["-s", "-M", "-Q", "-e", "-B"]
+
+
+class LatencyProbe(mongo_perf.Sink):                 # pylint:disable=R0903
+
+    """Class:  LatencyProbe
+
+    Description:  Output plugin that records the time from the fake
+        mongostat writing each row (bench_ns statistic) to the row reaching
+        the output.  Loaded as the last output so the latency covers every
+        output before it.
+
+    Methods:
+        write_batch
+
+    """
+
+    latency = []
+
+    def write_batch(self, batch):
+
+        """Method:  write_batch
+
+        Description:  Records the latency of each row of the batch.
+
+        Arguments:
+            (input) batch -> List of data and text pairs
+
+        """
+
+        now = time.time_ns()
+
+        for data, _ in batch:
+            self.latency.append(now - int(data["PerfStats"]["bench_ns"]))
+
+
+def percentile(values, pct):
+
+    """Function:  percentile
+
+    Description:  Returns the nearest rank percentile of a list of values.
+
+    Arguments:
+        (input) values -> Sorted list of values
+        (input) pct -> Percentile, 0 to 1
+        (output) Value at the percentile or None if the list is empty
+
+    """
+
+    return values[min(len(values) - 1, int(pct * len(values)))] \
+        if values else None
+
+
+def run_scenario(name, args):
+
+    """Function:  run_scenario
+
+    Description:  Runs mongo_stat with the outputs of a scenario in this
+        process and returns its measurements.
+
+    Arguments:
+        (input) name -> Scenario name
+        (input) args -> ArgParser class instance
+        (output) Dictionary of the scenario's measurements
+
+    """
+
+    tmp = tempfile.mkdtemp()
+    argv = ["mongo_perf.py", "-S", "-l", "-p", BIN_DIR + os.sep,
+            "-n", args.get_val("-n"), "-b", "1"] \
+        + [item.format(tmp=tmp) for item in SCENARIOS[name]] + ["-e", PROBE]
+    kwargs = {}
+
+    if name == "mongo":
+        argv += ["-i", args.get_val("-i"), "-m", args.get_val("-m"),
+                 "-d", args.get_val("-d")]
+
+    run_args = mongo_perf.gen_class.ArgParser(
+        argv, opt_val=OPT_VAL, multi_val=OPT_MULTI, do_parse=True)
+
+    if name == "mongo":
+        kwargs["class_cfg"] = mongo_perf.gen_libs.load_module(
+            args.get_val("-m"), args.get_val("-d"))
+        kwargs["db_tbl"] = args.get_val("-i")
+        kwargs["ins_conn"] = mongo_perf.create_insert(
+            kwargs["class_cfg"], kwargs["db_tbl"], run_args)
+
+    server = mongo_perf.mongo_class.Server(
+        "benchmark", "benchmark", "benchmark", host="127.0.0.1", port=27017)
+    req_arg = ["--json", "--fakeHosts=" + args.get_val("-H"),
+               "--fakeRate=" + args.get_val("-R")]
+    probe = mongo_perf.load_sink(PROBE)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+
+    try:
+        mongo_perf.mongo_stat(
+            server, run_args, req_arg=req_arg, opt_arg={"-n": "-n="},
+            ofile=run_args.get_val("-o"), **kwargs)
+        secs = time.perf_counter() - start
+        end = resource.getrusage(resource.RUSAGE_SELF)
+
+    finally:
+        if kwargs.get("ins_conn"):
+            kwargs["ins_conn"].close()
+
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    latency = sorted(probe.latency)
+    cpu = end.ru_utime - usage.ru_utime + end.ru_stime - usage.ru_stime
+
+    return {
+        "rows": len(latency), "seconds": round(secs, 4),
+        "rows_sec": round(len(latency) / secs, 1) if secs else None,
+        "latency_ms": {
+            label: round(percentile(latency, pct) / 1e6, 3)
+            if latency else None
+            for label, pct in [("p50", 0.5), ("p95", 0.95), ("max", 1)]},
+        "cpu_sec": round(cpu, 4),
+        "cpu_us_row": round(cpu * 1e6 / len(latency), 2) if latency else None,
+        "peak_rss_kb": end.ru_maxrss}
+
+
+def run_child(name, args):
+
+    """Function:  run_child
+
+    Description:  Runs a scenario in a new process and returns its
+        measurements.
+
+    Arguments:
+        (input) name -> Scenario name
+        (input) args -> ArgParser class instance
+        (output) Dictionary of the scenario's measurements or None if the
+            scenario failed
+
+    """
+
+    with tempfile.NamedTemporaryFile(suffix=".json") as fhdr:
+        cmd = [sys.executable, __file__, "-x", name, "-w", fhdr.name] \
+            + [item for opt in ["-n", "-H", "-R", "-m", "-d", "-i"]
+               if args.arg_exist(opt) for item in [opt, args.get_val(opt)]]
+        proc = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            check=False)
+
+        if proc.returncode:
+            print(f"Error:  Scenario {name} failed:  "
+                  f"{proc.stderr.decode().strip()}", file=sys.stderr)
+            return None
+
+        return json.load(fhdr)
+
+
+def last_results(current):
+
+    """Function:  last_results
+
+    Description:  Returns the newest results file other than the current
+        one.
+
+    Arguments:
+        (input) current -> Current results file name
+        (output) Dictionary of the previous results or None
+
+    """
+
+    names = [name for name in
+             glob.glob(os.path.join(RESULTS_DIR, "pipeline_*.json"))
+             if os.path.abspath(name) != os.path.abspath(current)]
+
+    if not names:
+        return None
+
+    with open(max(names, key=os.path.getmtime), mode="r",
+              encoding="UTF-8") as fhdr:
+        return json.load(fhdr)
+
+
+def print_results(results, previous):
+
+    """Function:  print_results
+
+    Description:  Prints the measurements of each scenario and the change
+        in rows per second from the previous results.
+
+    Arguments:
+        (input) results -> Dictionary of the current results
+        (input) previous -> Dictionary of the previous results or None
+
+    """
+
+    print(f"{results['hosts']} hosts x {results['ticks']} samples, "
+          f"version {results['version']}")
+
+    if previous:
+        print(f"Compared with version {previous['version']} "
+              f"({previous['date']})")
+
+    print(f"{'scenario':<12}{'rows/sec':>12}{'p50 ms':>9}{'p95 ms':>9}"
+          f"{'max ms':>9}{'us/row':>9}{'rss MB':>8}{'change':>9}")
+
+    for name, item in results["scenarios"].items():
+        prev = (previous or {}).get("scenarios", {}).get(name)
+        change = f"{(item['rows_sec'] / prev['rows_sec'] - 1) * 100:+.1f}%" \
+            if prev and prev.get("rows_sec") and item["rows_sec"] else ""
+        lat = item["latency_ms"]
+        print(f"{name:<12}{item['rows_sec'] or 0:>12,.0f}"
+              f"{lat['p50'] or 0:>9.2f}{lat['p95'] or 0:>9.2f}"
+              f"{lat['max'] or 0:>9.2f}{item['cpu_us_row'] or 0:>9.1f}"
+              f"{item['peak_rss_kb'] / 1024:>8.1f}{change:>9}")
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Runs each scenario in its own process, saves the results
+        and prints them against the previous version's results.
+
+    Variables:
+        BIN_DIR -> Directory of the fake mongostat program
+        RESULTS_DIR -> Directory of the saved results
+
+    Arguments:
+
+    """
+
+    args = mongo_perf.gen_class.ArgParser(
+        sys.argv, opt_val=OPT_VAL, multi_val=OPT_MULTI, do_parse=True)
+    args.arg_add_def(defaults={"-n": "2000", "-H": "5", "-R": "0",
+                               "-i": "benchmark:mongo_perf"})
+
+    if args.arg_exist("-x"):
+        with open(args.get_val("-w"), mode="w", encoding="UTF-8") as fhdr:
+            json.dump(run_scenario(args.get_val("-x"), args), fhdr)
+
+        return
+
+    names = [name for name in SCENARIOS
+             if name != "mongo" or args.arg_exist("-m")]
+    names = [name for name in args.get_val("-s", def_val=names)
+             if name in SCENARIOS]
+    results = {
+        "version": __version__, "python": platform.python_version(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "ticks": int(args.get_val("-n")), "hosts": int(args.get_val("-H")),
+        "rate": float(args.get_val("-R")), "scenarios": {}}
+
+    for name in names:
+        item = run_child(name, args)
+
+        if item:
+            results["scenarios"][name] = item
+
+    outfile = os.path.join(RESULTS_DIR, f"pipeline_{__version__}.json")
+    previous = last_results(outfile)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+
+    with open(outfile, mode="w", encoding="UTF-8") as fhdr:
+        json.dump(results, fhdr, indent=4)
+
+    print_results(results, previous)
+    print(f"Results saved to {outfile}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  aggregate_add.py
+
+    Description:  Unit testing of Aggregate.add in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/aggregate_add.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exact
+        test_markers
+        test_min_max
+        test_constant_memory
+        test_estimate
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.agg = mongo_perf.Aggregate()
+
+    def test_exact(self):
+
+        """Function:  test_exact
+
+        Description:  Test the values are kept up to DIGEST_EXACT.
+
+        Arguments:
+
+        """
+
+        for value in range(mongo_perf.DIGEST_EXACT - 1):
+            self.agg.add(value)
+
+        self.assertEqual(len(self.agg.values), mongo_perf.DIGEST_EXACT - 1)
+        self.assertEqual(self.agg.heights, [])
+
+    def test_markers(self):
+
+        """Function:  test_markers
+
+        Description:  Test the markers are started from the kept values.
+
+        Arguments:
+
+        """
+
+        for value in reversed(range(mongo_perf.DIGEST_EXACT)):
+            self.agg.add(value)
+
+        self.assertIsNone(self.agg.values)
+        self.assertEqual(self.agg.pos, [0, 47, 94, 97, 99])
+        self.assertEqual(self.agg.heights, [0, 47, 94, 97, 99])
+
+    def test_min_max(self):
+
+        """Function:  test_min_max
+
+        Description:  Test the minimum, total and maximum.
+
+        Arguments:
+
+        """
+
+        for value in [5, -2, 7.5, 3]:
+            self.agg.add(value)
+
+        self.assertEqual((self.agg.count, self.agg.total, self.agg.min,
+                          self.agg.max), (4, 13.5, -2, 7.5))
+
+    def test_constant_memory(self):
+
+        """Function:  test_constant_memory
+
+        Description:  Test the memory does not grow after DIGEST_EXACT values.
+
+        Arguments:
+
+        """
+
+        for value in range(10000):
+            self.agg.add(value % 7)
+
+        self.assertIsNone(self.agg.values)
+        self.assertEqual(len(self.agg.heights), 5)
+        self.assertEqual(self.agg.count, 10000)
+
+    def test_estimate(self):
+
+        """Function:  test_estimate
+
+        Description:  Test the estimate of a large series.
+
+        Arguments:
+
+        """
+
+        values = [(num * 7919) % 10007 for num in range(20000)]
+
+        for value in values:
+            self.agg.add(value)
+
+        values.sort()
+
+        self.assertLess(abs(self.agg.heights[2] - values[18999]), 100)
+        self.assertEqual(self.agg.heights[0], values[0])
+        self.assertEqual(self.agg.heights[4], values[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Classification (U)
+
+"""Program:  aggregate_init.py
+
+    Description:  Unit testing of Aggregate.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/aggregate_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_pct
+        test_init
+
+    """
+
+    def test_pct(self):
+
+        """Function:  test_pct
+
+        Description:  Test with a percentile.
+
+        Arguments:
+
+        """
+
+        agg = mongo_perf.Aggregate(0.5)
+
+        self.assertEqual(agg.step, [0, 0.25, 0.5, 0.75, 1])
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        agg = mongo_perf.Aggregate()
+
+        self.assertEqual((agg.count, agg.total, agg.min, agg.max),
+                         (0, 0, None, None))
+        self.assertEqual(agg.values, [])
+        self.assertEqual(agg.pct, mongo_perf.DIGEST_PCT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  aggregate_quantile.py
+
+    Description:  Unit testing of Aggregate.quantile in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/aggregate_quantile.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_values
+        test_exact
+        test_quantile
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.agg = mongo_perf.Aggregate()
+
+    def test_no_values(self):
+
+        """Function:  test_no_values
+
+        Description:  Test with no values.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.agg.quantile())
+
+    def test_exact(self):
+
+        """Function:  test_exact
+
+        Description:  Test with fewer than DIGEST_EXACT values.
+
+        Arguments:
+
+        """
+
+        for value in [9, 1, 5, 3, 7, 2, 8, 4, 6, 10]:
+            self.agg.add(value)
+
+        self.assertEqual(self.agg.quantile(), 10)
+
+    def test_quantile(self):
+
+        """Function:  test_quantile
+
+        Description:  Test quantile method.
+
+        Arguments:
+
+        """
+
+        for value in range(1000):
+            self.agg.add(value)
+
+        self.assertAlmostEqual(self.agg.quantile(), 949, delta=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+# Classification (U)
+
+"""Program:  calc_stats.py
+
+    Description:  Unit testing of calc_stats in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/calc_stats.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import copy
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def srv_status(count):
+
+    """Function:  srv_status
+
+    Description:  Returns a serverStatus document with all counters set to
+        the count.
+
+    Arguments:
+        (input) count -> Counter value
+        (output) Dictionary of serverStatus results
+
+    """
+
+    ops = {"insert": count, "query": count, "update": count,
+           "delete": count, "getmore": count, "command": count}
+
+    return {
+        "opcounters": dict(ops), "opcountersRepl": dict(ops),
+        "globalLock": {"currentQueue": {"readers": 1, "writers": 2},
+                       "activeClients": {"readers": 3, "writers": 4}},
+        "wiredTiger": {
+            "transaction": {"transaction checkpoints": count},
+            "cache": {"maximum bytes configured": 1000,
+                      "tracked dirty bytes in the cache": 25,
+                      "bytes currently in the cache": 500}},
+        "mem": {"virtual": 2, "resident": 1},
+        "network": {"bytesIn": count * 10, "bytesOut": count * 20},
+        "connections": {"current": 7}}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_cache
+        test_arbiter
+        test_secondary
+        test_primary
+        test_standalone
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.prev = srv_status(100)
+        self.curr = srv_status(200)
+        self.elapsed = 2
+        self.results = {
+            "insert": 50, "insert_repl": False, "query": 50,
+            "query_repl": False, "update": 50, "update_repl": False,
+            "delete": 50, "delete_repl": False, "getmore": 50,
+            "getmore_repl": False, "command": 50, "command_repl": 50,
+            "qr": 1, "qw": 2, "ar": 3, "aw": 4, "flushes": 100,
+            "dirty": 2.5, "used": 50.0, "vsize": 2097152, "res": 1048576,
+            "net_in": 500, "net_out": 1000, "conn": 7}
+
+    def test_no_cache(self):
+
+        """Function:  test_no_cache
+
+        Description:  Test with no WiredTiger cache statistics.
+
+        Arguments:
+
+        """
+
+        del self.curr["wiredTiger"]
+
+        stats = mongo_perf.calc_stats(self.prev, self.curr, self.elapsed)
+
+        self.assertFalse("dirty" in stats or "used" in stats)
+
+    def test_arbiter(self):
+
+        """Function:  test_arbiter
+
+        Description:  Test with an arbiter replica set member.
+
+        Arguments:
+
+        """
+
+        self.curr["repl"] = {"setName": "spock", "arbiterOnly": True}
+
+        stats = mongo_perf.calc_stats(self.prev, self.curr, self.elapsed)
+
+        self.assertEqual(stats["repl"], "ARB")
+
+    def test_secondary(self):
+
+        """Function:  test_secondary
+
+        Description:  Test with a secondary replica set member.
+
+        Arguments:
+
+        """
+
+        self.curr["repl"] = {"setName": "spock", "secondary": True}
+        self.curr["opcountersRepl"]["insert"] = 300
+        results = copy.deepcopy(self.results)
+        results.update(
+            {"insert": 100, "insert_repl": True, "update_repl": True,
+             "delete_repl": True, "set": "spock", "repl": "SEC"})
+
+        self.assertEqual(
+            mongo_perf.calc_stats(self.prev, self.curr, self.elapsed),
+            results)
+
+    def test_primary(self):
+
+        """Function:  test_primary
+
+        Description:  Test with a primary replica set member.
+
+        Arguments:
+
+        """
+
+        self.curr["repl"] = {"setName": "spock", "isWritablePrimary": True}
+        self.results.update({"set": "spock", "repl": "PRI"})
+
+        self.assertEqual(
+            mongo_perf.calc_stats(self.prev, self.curr, self.elapsed),
+            self.results)
+
+    def test_standalone(self):
+
+        """Function:  test_standalone
+
+        Description:  Test with a standalone database.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.calc_stats(self.prev, self.curr, self.elapsed),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
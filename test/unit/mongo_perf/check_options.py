@@ -0,0 +1,296 @@
+# Classification (U)
+
+"""Program:  check_options.py
+
+    Description:  Unit testing of check_options in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/check_options.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-Q": ["block"]}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_zstd_missing
+        test_bad_udp_format
+        test_udp_format
+        test_udp_default
+        test_bad_plugin
+        test_plugin
+        test_bad_profile
+        test_profile
+        test_spool_timeseries
+        test_bad_replay_date
+        test_replay_date
+        test_check_options
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("mongo_perf.zstandard", None)
+    def test_zstd_missing(self):
+
+        """Function:  test_zstd_missing
+
+        Description:  Test with zstd compression and no zstandard package.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "zstd"
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            self.assertFalse(mongo_perf.check_options(self.args))
+
+    def test_bad_udp_format(self):
+
+        """Function:  test_bad_udp_format
+
+        Description:  Test with an unknown UDP format.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-M"] = ["localhost:8125", "influx"]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            self.assertFalse(mongo_perf.check_options(self.args))
+
+    def test_udp_format(self):
+
+        """Function:  test_udp_format
+
+        Description:  Test with a UDP format.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-M"] = ["localhost:8125", "graphite"]
+
+        self.assertTrue(mongo_perf.check_options(self.args))
+
+    def test_udp_default(self):
+
+        """Function:  test_udp_default
+
+        Description:  Test with the default UDP format.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-M"] = ["localhost:8125"]
+
+        self.assertTrue(mongo_perf.check_options(self.args))
+
+    def test_bad_plugin(self):
+
+        """Function:  test_bad_plugin
+
+        Description:  Test with an output plugin that cannot be loaded.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-e"] = ["no_such_module:Sink"]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            self.assertFalse(mongo_perf.check_options(self.args))
+
+    def test_plugin(self):
+
+        """Function:  test_plugin
+
+        Description:  Test with an output plugin.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-e"] = ["mongo_perf:FuncSink"]
+
+        self.assertTrue(mongo_perf.check_options(self.args))
+
+    def test_bad_profile(self):
+
+        """Function:  test_bad_profile
+
+        Description:  Test with an unknown profile mode.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = ["trace"]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            self.assertFalse(mongo_perf.check_options(self.args))
+
+    def test_profile(self):
+
+        """Function:  test_profile
+
+        Description:  Test with a profile mode.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = ["alloc", "30"]
+
+        self.assertTrue(mongo_perf.check_options(self.args))
+
+    def test_spool_timeseries(self):
+
+        """Function:  test_spool_timeseries
+
+        Description:  Test with a spool and a time-series collection.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-G"] = "/dir/spool"
+        self.args.args_array["-H"] = True
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as out:
+            self.assertFalse(mongo_perf.check_options(self.args))
+
+        self.assertIn("-G option", out.getvalue())
+
+    def test_bad_replay_date(self):
+
+        """Function:  test_bad_replay_date
+
+        Description:  Test with a replay date that is not YYYY-MM-DD.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-I"] = ["mongostat.json", "05/01/2024"]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as out:
+            self.assertFalse(mongo_perf.check_options(self.args))
+
+        self.assertIn("-I date", out.getvalue())
+
+    def test_replay_date(self):
+
+        """Function:  test_replay_date
+
+        Description:  Test with a replay date.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-I"] = ["mongostat.json", "2024-05-01"]
+
+        self.assertTrue(mongo_perf.check_options(self.args))
+
+    def test_check_options(self):
+
+        """Function:  test_check_options
+
+        Description:  Test check_options function.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mongo_perf.check_options(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# Classification (U)
+
+"""Program:  columnarchive_append.py
+
+    Description:  Unit testing of ColumnArchive.append in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/columnarchive_append.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_new_metric
+        test_new_day
+        test_chunk
+        test_append
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.archive = mongo_perf.ColumnArchive(self.tmp_dir)
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "res": 1024}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_new_metric(self):
+
+        """Function:  test_new_metric
+
+        Description:  Test a new metric is padded for the earlier rows.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+        self.data["PerfStats"]["query"] = 2
+        self.archive.append(self.data)
+
+        column = self.archive.blocks["host:27017"]["buffer"]["query"]
+
+        self.assertTrue(mongo_perf.math.isnan(column[0]))
+        self.assertEqual(column[1], 2)
+
+    def test_new_day(self):
+
+        """Function:  test_new_day
+
+        Description:  Test a new block is started on a new day.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+        self.data["AsOf"] = "2026-10-19 00:00:01"
+        self.archive.append(self.data)
+
+        self.assertEqual(self.archive.blocks["host:27017"]["name"],
+                         "20261019")
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.tmp_dir, "host_27017"))),
+            ["20261018", "20261019"])
+        self.assertEqual(
+            mongo_perf.read_column(self.tmp_dir, "host:27017", "insert"),
+            [(mongo_perf.time.mktime((2026, 10, 18, 10, 0, 1, 0, 0, -1)), 5)])
+
+    def test_chunk(self):
+
+        """Function:  test_chunk
+
+        Description:  Test the rows are written at the chunk size.
+
+        Arguments:
+
+        """
+
+        self.archive.chunk_rows = 2
+
+        self.archive.append(self.data)
+        self.archive.append(self.data)
+
+        self.assertEqual(self.archive.blocks["host:27017"]["rows"], 2)
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test append method.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+
+        block = self.archive.blocks["host:27017"]
+
+        self.assertEqual(block["name"], "20261018")
+        self.assertEqual(
+            {key: list(val) for key, val in block["buffer"].items()},
+            {"AsOf": [mongo_perf.time.mktime(
+                (2026, 10, 18, 10, 0, 1, 0, 0, -1))],
+             "insert": [5], "res": [1024]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  columnarchive_close.py
+
+    Description:  Unit testing of ColumnArchive.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/columnarchive_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.archive = mongo_perf.ColumnArchive(self.tmp_dir)
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "res": 1024}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+        self.data["Server"] = "host2:27017"
+        self.archive.append(self.data)
+
+        self.archive.close()
+
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir)), ["host2_27017", "host_27017"])
+        self.assertEqual(self.archive.blocks["host2:27017"]["rows"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
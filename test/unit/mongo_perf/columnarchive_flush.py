@@ -0,0 +1,142 @@
+# Classification (U)
+
+"""Program:  columnarchive_flush.py
+
+    Description:  Unit testing of ColumnArchive.flush in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/columnarchive_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_rows
+        test_new_column
+        test_flush
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "host_27017", "20261018")
+        self.archive = mongo_perf.ColumnArchive(self.tmp_dir)
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "res": 1024}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_rows(self):
+
+        """Function:  test_no_rows
+
+        Description:  Test with no buffered rows.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+        self.archive.flush("host:27017")
+
+        self.archive.flush("host:27017")
+
+        self.assertEqual(self.archive.blocks["host:27017"]["rows"], 1)
+
+    def test_new_column(self):
+
+        """Function:  test_new_column
+
+        Description:  Test a new column is padded in the file.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+        self.archive.flush("host:27017")
+        self.data["PerfStats"]["query"] = 2
+        self.archive.append(self.data)
+
+        self.archive.flush("host:27017")
+
+        self.assertEqual(
+            os.path.getsize(os.path.join(self.path, "query.f64")), 16)
+        self.assertEqual(
+            len(mongo_perf.read_column(self.tmp_dir, "host:27017", "query")),
+            1)
+
+    def test_flush(self):
+
+        """Function:  test_flush
+
+        Description:  Test flush method.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+
+        self.archive.flush("host:27017")
+
+        with open(os.path.join(self.path, "manifest.json"), mode="r",
+                  encoding="UTF-8") as fhdr:
+            manifest = mongo_perf.json.load(fhdr)
+
+        self.assertEqual(
+            (manifest["Rows"], manifest["Columns"], manifest["Block"]),
+            (1, ["insert", "res"], "20261018"))
+        self.assertEqual(
+            os.path.getsize(os.path.join(self.path, "AsOf.f64")), 8)
+        self.assertEqual(
+            len(self.archive.blocks["host:27017"]["buffer"]["AsOf"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
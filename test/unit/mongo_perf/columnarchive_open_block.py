@@ -0,0 +1,162 @@
+# Classification (U)
+
+"""Program:  columnarchive_open_block.py
+
+    Description:  Unit testing of ColumnArchive.open_block in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/columnarchive_open_block.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_crash_recovery
+        test_existing_block
+        test_open_block
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.archive = mongo_perf.ColumnArchive(self.tmp_dir)
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "res": 1024}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_crash_recovery(self):
+
+        """Function:  test_crash_recovery
+
+        Description:  Test a block continued after a crash between writing
+            the column files and replacing the manifest.
+
+        Arguments:
+
+        """
+
+        archive = mongo_perf.ColumnArchive(self.tmp_dir, chunk_rows=2)
+
+        for sec, stats in [(1, {}), (2, {}), (3, {"faults": 30}),
+                           (4, {"faults": 40})]:
+            data = dict(self.data, AsOf=f"2026-10-18 10:00:0{sec}")
+            data["PerfStats"] = dict(self.data["PerfStats"], **stats)
+
+            if sec < 4:
+                archive.append(data)
+                continue
+
+            with mock.patch("mongo_perf.os.replace",
+                            mock.Mock(side_effect=OSError("Crash"))):
+                self.assertRaises(OSError, archive.append, data)
+
+        archive = mongo_perf.ColumnArchive(self.tmp_dir, chunk_rows=2)
+
+        for sec, faults in [(5, 50), (6, 60)]:
+            data = dict(self.data, AsOf=f"2026-10-18 10:00:0{sec}")
+            data["PerfStats"] = dict(self.data["PerfStats"], faults=faults)
+            archive.append(data)
+
+        results = mongo_perf.read_column(self.tmp_dir, "host:27017", "faults")
+        stamps = mongo_perf.read_column(self.tmp_dir, "host:27017", "insert")
+
+        self.assertEqual([value for _, value in results], [50, 60])
+        self.assertEqual([stamp for stamp, _ in results],
+                         [stamp for stamp, _ in stamps][2:])
+        self.assertEqual(len(stamps), 4)
+        self.assertEqual(os.path.getsize(os.path.join(
+            self.tmp_dir, "host_27017", "20261018", "faults.f64")), 4 * 8)
+
+    def test_existing_block(self):
+
+        """Function:  test_existing_block
+
+        Description:  Test continuing a block from its manifest.
+
+        Arguments:
+
+        """
+
+        self.archive.append(self.data)
+        self.archive.close()
+        path = os.path.join(self.tmp_dir, "host_27017", "20261018")
+
+        with open(os.path.join(path, "insert.f64"), mode="ab") as fhdr:
+            fhdr.write(b"\0" * 8)
+
+        block = mongo_perf.ColumnArchive(self.tmp_dir).open_block(
+            "host:27017", "20261018")
+
+        self.assertEqual((block["rows"], block["columns"]),
+                         (1, ["insert", "res"]))
+        self.assertEqual(os.path.getsize(os.path.join(path, "insert.f64")), 8)
+        self.assertEqual(sorted(block["buffer"]), ["AsOf", "insert", "res"])
+
+    def test_open_block(self):
+
+        """Function:  test_open_block
+
+        Description:  Test open_block method.
+
+        Arguments:
+
+        """
+
+        block = self.archive.open_block("host:27017", "20261018")
+
+        self.assertEqual(block["path"], os.path.join(
+            self.tmp_dir, "host_27017", "20261018"))
+        self.assertTrue(os.path.isdir(block["path"]))
+        self.assertEqual((block["rows"], block["columns"]), (0, []))
+        self.assertEqual(list(block["buffer"]), ["AsOf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
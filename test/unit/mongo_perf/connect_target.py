@@ -0,0 +1,127 @@
+# Classification (U)
+
+"""Program:  connect_target.py
+
+    Description:  Unit testing of connect_target in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/connect_target.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.status = (True, None)
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        return self.status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect_fail
+        test_connect_target
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect",
+                mock.Mock(return_value=True))
+    def test_connect_fail(self):
+
+        """Function:  test_connect_fail
+
+        Description:  Test with a failed connection.
+
+        Arguments:
+
+        """
+
+        self.server.status = (False, "Error Connection Message")
+
+        with self.assertRaises(ConnectionError):
+            mongo_perf.connect_target(self.server)
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    def test_connect_target(self, mock_disconn):
+
+        """Function:  test_connect_target
+
+        Description:  Test connect_target function.
+
+        Arguments:
+
+        """
+
+        mock_disconn.return_value = True
+
+        self.assertIsNone(mongo_perf.connect_target(self.server))
+        mock_disconn.assert_called_once_with([self.server])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  convert_json.py
+
+    Description:  Unit testing of convert_json in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/convert_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-X": "/dir/archive",
+                           "-V": ["perf.json", "perf2.json"]}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_closed_on_error
+        test_convert_json
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.data = {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 1}}
+
+    @mock.patch("mongo_perf.load_json")
+    @mock.patch("mongo_perf.ColumnArchive")
+    def test_closed_on_error(self, mock_archive, mock_load):
+
+        """Function:  test_closed_on_error
+
+        Description:  Test the archive is closed when a file fails.
+
+        Arguments:
+
+        """
+
+        mock_load.side_effect = ValueError("Bad file")
+
+        with self.assertRaises(ValueError):
+            mongo_perf.convert_json(self.args)
+
+        mock_archive.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.load_json")
+    @mock.patch("mongo_perf.ColumnArchive")
+    def test_convert_json(self, mock_archive, mock_load):
+
+        """Function:  test_convert_json
+
+        Description:  Test convert_json function.
+
+        Arguments:
+
+        """
+
+        mock_load.side_effect = [[self.data, {"Other": 1}], [self.data]]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            mongo_perf.convert_json(self.args)
+
+        mock_archive.assert_called_once_with("/dir/archive")
+        self.assertEqual(mock_archive.return_value.append.call_count, 2)
+        mock_archive.return_value.close.assert_called_once_with()
+        self.assertEqual(mock_out.getvalue(),
+                         "Converted 2 samples from 2 files\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
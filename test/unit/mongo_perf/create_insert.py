@@ -0,0 +1,247 @@
+# Classification (U)
+
+"""Program:  create_insert.py
+
+    Description:  Unit testing of create_insert in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/create_insert.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-i": "sysmon:mongo_perf"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_write_concern_name
+        test_write_concern_number
+        test_batch_options
+        test_spool
+        test_timeseries_minutes
+        test_timeseries_hours
+        test_timeseries
+        test_create_insert
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.db_tbl = "sysmon:mongo_perf"
+
+    def test_write_concern_name(self):
+
+        """Function:  test_write_concern_name
+
+        Description:  Test with a write concern name.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-W"] = "majority"
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        self.assertEqual(ins_conn.write_concern, "majority")
+
+    def test_write_concern_number(self):
+
+        """Function:  test_write_concern_number
+
+        Description:  Test with a write concern number.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-W"] = "0"
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        self.assertEqual(ins_conn.write_concern, 0)
+
+    def test_batch_options(self):
+
+        """Function:  test_batch_options
+
+        Description:  Test with the batch options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-k": "50", "-K": "2.5", "-U": True})
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        self.assertEqual(
+            (ins_conn.batch_size, ins_conn.max_latency, ins_conn.ordered),
+            (50, 2.5, False))
+
+    @mock.patch("mongo_perf.Spool")
+    def test_spool(self, mock_spool):
+
+        """Function:  test_spool
+
+        Description:  Test with a spool directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-G"] = "/dir/spool"
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        mock_spool.assert_called_once_with("/dir/spool")
+        self.assertEqual(ins_conn.spool, mock_spool.return_value)
+
+    def test_timeseries_minutes(self):
+
+        """Function:  test_timeseries_minutes
+
+        Description:  Test the time-series granularity with a minute interval.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-H": True, "-b": "300"})
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        self.assertEqual(ins_conn.timeseries, "minutes")
+
+    def test_timeseries_hours(self):
+
+        """Function:  test_timeseries_hours
+
+        Description:  Test the time-series granularity with an hour interval.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-H": True, "-b": "3600"})
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        self.assertEqual(ins_conn.timeseries, "hours")
+
+    def test_timeseries(self):
+
+        """Function:  test_timeseries
+
+        Description:  Test with a time-series collection.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = True
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        self.assertEqual(ins_conn.timeseries, "seconds")
+
+    def test_create_insert(self):
+
+        """Function:  test_create_insert
+
+        Description:  Test create_insert function.
+
+        Arguments:
+
+        """
+
+        ins_conn = mongo_perf.create_insert("Cfg", self.db_tbl, self.args)
+
+        self.assertEqual(
+            (ins_conn.cfg, ins_conn.dbn, ins_conn.tbl, ins_conn.batch_size,
+             ins_conn.max_latency, ins_conn.ordered, ins_conn.write_concern),
+            ("Cfg", "sysmon", "mongo_perf", 1, None, True, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+# Classification (U)
+
+"""Program:  create_mail.py
+
+    Description:  Unit testing of create_mail in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/create_mail.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-Q": ["block"]}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_mail
+        test_digest
+        test_create_mail
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("mongo_perf.gen_class.setup_mail", mock.Mock())
+    def test_no_mail(self):
+
+        """Function:  test_no_mail
+
+        Description:  Test without the email option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.create_mail(self.args), (None, None))
+
+    @mock.patch("mongo_perf.gen_class.setup_mail", mock.Mock())
+    def test_digest(self):
+
+        """Function:  test_digest
+
+        Description:  Test with the digest option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-t": ["dba@domain"], "-q": True})
+
+        _, digest = mongo_perf.create_mail(self.args)
+
+        self.assertIsInstance(digest, mongo_perf.MailDigest)
+        self.assertIsNone(digest.raw)
+
+    @mock.patch("mongo_perf.gen_class.setup_mail")
+    def test_create_mail(self, mock_mail):
+
+        """Function:  test_create_mail
+
+        Description:  Test create_mail function.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = ["dba@domain"]
+
+        self.assertEqual(mongo_perf.create_mail(self.args),
+                         (mock_mail.return_value, None))
+        mock_mail.assert_called_once_with(
+            ["dba@domain"], subj="Mongodb_Performance")
+
+
+if __name__ == "__main__":
+    unittest.main()
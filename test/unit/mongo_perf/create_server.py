@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  create_server.py
+
+    Description:  Unit testing of create_server in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/create_server.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.name = "Mongo"
+        self.user = "mongo"
+        self.japd = None
+        self.host = "hostname"
+        self.port = 27017
+        self.auth = True
+        self.direct_connect = True
+        self.repset = None
+        self.repset_hosts = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_security_config
+        test_replica_set
+        test_standalone
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+
+    @mock.patch("mongo_perf.mongo_libs.create_security_config")
+    @mock.patch("mongo_perf.mongo_class.Server")
+    def test_security_config(self, mock_inst, mock_config):
+
+        """Function:  test_security_config
+
+        Description:  Test with direct_connect in the security config.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = "Server"
+        mock_config.return_value = {"direct_connect": False}
+
+        mongo_perf.create_server(self.cfg)
+
+        self.assertFalse(mock_inst.call_args[1]["direct_connect"])
+
+    @mock.patch("mongo_perf.mongo_libs.create_security_config")
+    @mock.patch("mongo_perf.mongo_class.RepSet")
+    def test_replica_set(self, mock_inst, mock_config):
+
+        """Function:  test_replica_set
+
+        Description:  Test with a replica set configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.repset = "spock"
+        self.cfg.repset_hosts = "host1:27017, host2:27017"
+
+        mock_inst.return_value = "RepSet"
+        mock_config.return_value = {}
+
+        self.assertEqual(mongo_perf.create_server(self.cfg), "RepSet")
+
+    @mock.patch("mongo_perf.mongo_libs.create_security_config")
+    @mock.patch("mongo_perf.mongo_class.Server")
+    def test_standalone(self, mock_inst, mock_config):
+
+        """Function:  test_standalone
+
+        Description:  Test with a standalone configuration.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = "Server"
+        mock_config.return_value = {}
+
+        self.assertEqual(mongo_perf.create_server(self.cfg), "Server")
+        self.assertTrue(mock_inst.call_args[1]["direct_connect"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+# Classification (U)
+
+"""Program:  create_sinks.py
+
+    Description:  Unit testing of create_sinks in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/create_sinks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class PluginSink(mongo_perf.Sink):                      # pylint:disable=R0903
+
+    """Class:  PluginSink
+
+    Description:  Output plugin for testing.
+
+    Methods:
+        write_batch
+
+    """
+
+    def write_batch(self, batch):
+
+        """Method:  write_batch
+
+        Description:  Discards the batch.
+
+        Arguments:
+
+        """
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_plugin
+        test_opened
+        test_create_sinks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        sys.path.append("test/unit/mongo_perf")
+        self.args = ArgParser()
+
+    def test_plugin(self):
+
+        """Function:  test_plugin
+
+        Description:  Test with an output plugin.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-e"] = ["create_sinks:PluginSink"]
+
+        sinks = mongo_perf.create_sinks(None, False, self.args)
+
+        self.assertEqual(list(sinks), ["stdout", "create_sinks:PluginSink"])
+        self.assertEqual(type(sinks["create_sinks:PluginSink"]).__name__,
+                         "PluginSink")
+
+    @mock.patch("mongo_perf.FuncSink.open")
+    def test_opened(self, mock_open):
+
+        """Function:  test_opened
+
+        Description:  Test the outputs are opened.
+
+        Arguments:
+
+        """
+
+        mongo_perf.create_sinks(None, False, self.args)
+
+        mock_open.assert_called_once_with(self.args)
+
+    def test_create_sinks(self):
+
+        """Function:  test_create_sinks
+
+        Description:  Test create_sinks function.
+
+        Arguments:
+
+        """
+
+        sinks = mongo_perf.create_sinks(None, False, self.args)
+
+        self.assertEqual(list(sinks), ["stdout"])
+        self.assertIsInstance(sinks["stdout"], mongo_perf.FuncSink)
+
+
+if __name__ == "__main__":
+    unittest.main()
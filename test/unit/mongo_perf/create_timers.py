@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  create_timers.py
+
+    Description:  Unit testing of create_timers in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/create_timers.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timers
+        test_create_timers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_timers(self):
+
+        """Function:  test_timers
+
+        Description:  Test with the stage timers option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "30"
+
+        timers = mongo_perf.create_timers(self.args)
+
+        self.assertIsInstance(timers, mongo_perf.StageTimers)
+        self.assertEqual(timers.interval, 30.0)
+
+    def test_create_timers(self):
+
+        """Function:  test_create_timers
+
+        Description:  Test create_timers function.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_perf.create_timers(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+# Classification (U)
+
+"""Program:  create_writer.py
+
+    Description:  Unit testing of create_writer in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/create_writer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rotate
+        test_compress
+        test_buffer_default
+        test_buffer_size
+        test_create_writer
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("mongo_perf.SegmentWriter")
+    def test_rotate(self, mock_seg):
+
+        """Function:  test_rotate
+
+        Description:  Test with rotation by size and interval.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-O": ["100M", "1d"], "-A": "5"})
+
+        mongo_perf.create_writer("perf.json", "w", self.args)
+
+        mock_seg.assert_called_once_with(
+            "perf.json", compress=None, retention=5, rotate_size=100 * 2**20,
+            rotate_interval=86400.0)
+
+    @mock.patch("mongo_perf.SegmentWriter")
+    def test_compress(self, mock_seg):
+
+        """Function:  test_compress
+
+        Description:  Test with compression.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "gzip"
+
+        mongo_perf.create_writer("perf.json", "w", self.args)
+
+        mock_seg.assert_called_once_with(
+            "perf.json", compress="gzip", retention=None)
+
+    @mock.patch("mongo_perf.FileWriter")
+    def test_buffer_default(self, mock_file):
+
+        """Function:  test_buffer_default
+
+        Description:  Test the output file defaults are not taken from the
+            Mongo insert batch options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-k": "500", "-K": "60"})
+
+        mongo_perf.create_writer("perf.json", "a", self.args)
+
+        mock_file.assert_called_once_with(
+            "perf.json", "a", buffer_size=-1, flush_count=1,
+            flush_interval=None, fsync_interval=None)
+
+    @mock.patch("mongo_perf.FileWriter")
+    def test_buffer_size(self, mock_file):
+
+        """Function:  test_buffer_size
+
+        Description:  Test with only the output file buffer size.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-B"] = ["4096"]
+
+        mongo_perf.create_writer("perf.json", "a", self.args)
+
+        mock_file.assert_called_once_with(
+            "perf.json", "a", buffer_size=4096, flush_count=1,
+            flush_interval=None, fsync_interval=None)
+
+    @mock.patch("mongo_perf.FileWriter")
+    def test_create_writer(self, mock_file):
+
+        """Function:  test_create_writer
+
+        Description:  Test create_writer function.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-k": "500", "-K": "60", "-B": ["4096", "10", "5"]})
+
+        mongo_perf.create_writer("perf.json", "a", self.args)
+
+        mock_file.assert_called_once_with(
+            "perf.json", "a", buffer_size=4096, flush_count=10,
+            flush_interval=5.0, fsync_interval=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
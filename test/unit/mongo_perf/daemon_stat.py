@@ -0,0 +1,275 @@
+# Classification (U)
+
+"""Program:  daemon_stat.py
+
+    Description:  Unit testing of daemon_stat in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/daemon_stat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def stat_gen(count, fail=True):
+
+    """Function:  stat_gen
+
+    Description:  Sample generator for testing which loses the connection
+        after the samples.
+
+    Arguments:
+        (input) count -> Number of samples to return
+        (input) fail -> Raise an exception after the samples
+
+    """
+
+    for item in range(count):
+        yield {"insert": item}
+
+    if fail:
+        raise ConnectionError("Connection lost")
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-D": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.status = [(True, None)]
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        return self.status.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_backoff_limit
+        test_reconnect_fail
+        test_reconnect_suppress
+        test_reconnect
+        test_daemon_stat
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args2.args_array["-w"] = True
+
+    @mock.patch("mongo_perf.time.sleep")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.srv_stat")
+    def test_backoff_limit(self, mock_stat, mock_disconn, mock_sleep):
+
+        """Function:  test_backoff_limit
+
+        Description:  Test the wait between reconnects is limited.
+
+        Arguments:
+
+        """
+
+        self.server.status = [(False, "Error")] * 10 + [(True, None)]
+
+        mock_stat.side_effect = [stat_gen(0), stat_gen(1, fail=False)]
+        mock_disconn.return_value = True
+
+        stats = mongo_perf.daemon_stat(self.server, 100, self.args2)
+
+        self.assertEqual(next(stats), {"insert": 0})
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list],
+            [100, 200, 300, 300, 300, 300, 300, 300, 300, 300, 300])
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.srv_stat")
+    def test_reconnect_fail(self, mock_stat, mock_disconn):
+
+        """Function:  test_reconnect_fail
+
+        Description:  Test with a failed reconnect.
+
+        Arguments:
+
+        """
+
+        self.server.status = [(False, "Error"), (True, None)]
+
+        mock_stat.side_effect = [stat_gen(1), stat_gen(1)]
+        mock_disconn.return_value = True
+
+        stats = mongo_perf.daemon_stat(self.server, 1, self.args)
+
+        with gen_libs.no_std_out():
+            results = [next(stats), next(stats)]
+
+        self.assertEqual(results, [{"insert": 0}, {"insert": 0}])
+        self.assertEqual(mock_disconn.call_count, 2)
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.srv_stat")
+    def test_reconnect_suppress(self, mock_stat, mock_disconn):
+
+        """Function:  test_reconnect_suppress
+
+        Description:  Test with a lost connection with suppression.
+
+        Arguments:
+
+        """
+
+        mock_stat.side_effect = [stat_gen(1), stat_gen(1)]
+        mock_disconn.return_value = True
+
+        stats = mongo_perf.daemon_stat(self.server, 1, self.args2)
+
+        self.assertEqual(
+            [next(stats), next(stats)], [{"insert": 0}, {"insert": 0}])
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.srv_stat")
+    def test_reconnect(self, mock_stat, mock_disconn):
+
+        """Function:  test_reconnect
+
+        Description:  Test with a lost connection.
+
+        Arguments:
+
+        """
+
+        mock_stat.side_effect = [stat_gen(2), stat_gen(1)]
+        mock_disconn.return_value = True
+
+        stats = mongo_perf.daemon_stat(self.server, 1, self.args)
+
+        with gen_libs.no_std_out():
+            results = [next(stats), next(stats), next(stats)]
+
+        self.assertEqual(
+            results, [{"insert": 0}, {"insert": 1}, {"insert": 0}])
+        mock_disconn.assert_called_once_with([self.server])
+
+    @mock.patch("mongo_perf.srv_stat")
+    def test_daemon_stat(self, mock_stat):
+
+        """Function:  test_daemon_stat
+
+        Description:  Test daemon_stat function.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = stat_gen(2)
+
+        stats = mongo_perf.daemon_stat(self.server, 5, self.args)
+
+        self.assertEqual([next(stats), next(stats)],
+                         [{"insert": 0}, {"insert": 1}])
+        mock_stat.assert_called_once_with(self.server, None, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
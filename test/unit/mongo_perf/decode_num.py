@@ -0,0 +1,67 @@
+# Classification (U)
+
+"""Program:  decode_num.py
+
+    Description:  Unit testing of decode_num in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/decode_num.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_size
+        test_decode_num
+
+    """
+
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test with a size value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_num("res", "2K"), {"res": 2048})
+
+    def test_decode_num(self):
+
+        """Function:  test_decode_num
+
+        Description:  Test decode_num function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_num("conn", "5"), {"conn": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# Classification (U)
+
+"""Program:  decode_op.py
+
+    Description:  Unit testing of decode_op in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/decode_op.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_replicated
+        test_decode_op
+
+    """
+
+    def test_not_replicated(self):
+
+        """Function:  test_not_replicated
+
+        Description:  Test with an operation count that is not replicated.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_op("insert", "12"),
+                         {"insert": 12, "insert_repl": False})
+
+    def test_decode_op(self):
+
+        """Function:  test_decode_op
+
+        Description:  Test decode_op function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_op("update", "*3"),
+                         {"update": 3, "update_repl": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
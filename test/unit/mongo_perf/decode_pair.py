@@ -0,0 +1,69 @@
+# Classification (U)
+
+"""Program:  decode_pair.py
+
+    Description:  Unit testing of decode_pair in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/decode_pair.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_pair
+        test_decode_pair
+
+    """
+
+    def test_not_pair(self):
+
+        """Function:  test_not_pair
+
+        Description:  Test with a value that is not a pair.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mongo_perf.decode_pair(("qr", "qw"), "3")
+
+    def test_decode_pair(self):
+
+        """Function:  test_decode_pair
+
+        Description:  Test decode_pair function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_pair(("qr", "qw"), "3|0"),
+                         {"qr": 3, "qw": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
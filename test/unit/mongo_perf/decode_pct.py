@@ -0,0 +1,55 @@
+# Classification (U)
+
+"""Program:  decode_pct.py
+
+    Description:  Unit testing of decode_pct in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/decode_pct.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_decode_pct
+
+    """
+
+    def test_decode_pct(self):
+
+        """Function:  test_decode_pct
+
+        Description:  Test decode_pct function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_pct("dirty", "12.3%"),
+                         {"dirty": 12.3})
+
+
+if __name__ == "__main__":
+    unittest.main()
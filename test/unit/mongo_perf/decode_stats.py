@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  decode_stats.py
+
+    Description:  Unit testing of decode_stats in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/decode_stats.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_bad_value
+        test_unknown_column
+        test_decode_stats
+
+    """
+
+    def test_bad_value(self):
+
+        """Function:  test_bad_value
+
+        Description:  Test with a value that cannot be decoded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_stats({"qrw": "n/a", "conn": 5}),
+                         {"qrw": "n/a", "conn": 5})
+
+    def test_unknown_column(self):
+
+        """Function:  test_unknown_column
+
+        Description:  Test with a column without a decoder.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.decode_stats({"host": "host1:27017"}),
+                         {"host": "host1:27017"})
+
+    def test_decode_stats(self):
+
+        """Function:  test_decode_stats
+
+        Description:  Test decode_stats function.
+
+        Arguments:
+
+        """
+
+        stats = {"insert": "*0", "query": "45", "update": "*0",
+                 "delete": "*0", "getmore": "0", "command": "2|0",
+                 "flushes": "0", "dirty": "0.1%", "used": "1.5%",
+                 "vsize": "1.5G", "res": "74.0M", "qrw": "0|0",
+                 "arw": "1|0", "net_in": "158b", "net_out": "62.3k",
+                 "conn": "5", "set": "spock", "repl": "PRI",
+                 "time": "10:15:31"}
+        results = {"insert": 0, "insert_repl": True, "query": 45,
+                   "query_repl": False, "update": 0, "update_repl": True,
+                   "delete": 0, "delete_repl": True, "getmore": 0,
+                   "getmore_repl": False, "command": 2, "command_repl": 0,
+                   "flushes": 0, "dirty": 0.1, "used": 1.5,
+                   "vsize": 1610612736, "res": 77594624, "qr": 0, "qw": 0,
+                   "ar": 1, "aw": 0, "net_in": 158, "net_out": 62300,
+                   "conn": 5, "set": "spock", "repl": "PRI",
+                   "time": "10:15:31"}
+
+        self.assertEqual(mongo_perf.decode_stats(stats), results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  dump_rrd.py
+
+    Description:  Unit testing of dump_rrd in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/dump_rrd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-L": "Server1.rrd"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_closed_on_error
+        test_dump_rrd
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("mongo_perf.RoundRobin")
+    def test_closed_on_error(self, mock_rrd):
+
+        """Function:  test_closed_on_error
+
+        Description:  Test the file is closed when printing fails.
+
+        Arguments:
+
+        """
+
+        mock_rrd.return_value.archives = [(1, 4, 0)]
+        mock_rrd.return_value.rows.side_effect = ValueError("Bad row")
+
+        with self.assertRaises(ValueError):
+            mongo_perf.dump_rrd(self.args)
+
+        mock_rrd.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.RoundRobin")
+    def test_dump_rrd(self, mock_rrd):
+
+        """Function:  test_dump_rrd
+
+        Description:  Test dump_rrd function.
+
+        Arguments:
+
+        """
+
+        mock_rrd.return_value.archives = [(1, 4, 0), (60, 2, 0)]
+        mock_rrd.return_value.rows.side_effect = [
+            [(60, {"insert": 1.0})], []]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            mongo_perf.dump_rrd(self.args)
+
+        mock_rrd.assert_called_once_with("Server1.rrd", readonly=True)
+        self.assertEqual(
+            mongo_perf.json.loads(mock_out.getvalue()),
+            {"Step": 1, "AsOf": mongo_perf.time.strftime(
+                "%Y-%m-%d %H:%M:%S", mongo_perf.time.localtime(60)),
+             "PerfStats": {"insert": 1.0}})
+
+
+if __name__ == "__main__":
+    unittest.main()
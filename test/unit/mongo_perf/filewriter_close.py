@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  filewriter_close.py
+
+    Description:  Unit testing of FileWriter.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/filewriter_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_open
+        test_fsync
+        test_close
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/mongo_perf/tmp/filewriter_close.txt"
+
+    def test_not_open(self):
+
+        """Function:  test_not_open
+
+        Description:  Test with the output file not open.
+
+        Arguments:
+
+        """
+
+        file_out = mongo_perf.FileWriter(self.fname, "w")
+        file_out.close()
+
+        self.assertFalse(os.path.isfile(self.fname))
+
+    @mock.patch("mongo_perf.os.fsync")
+    def test_fsync(self, mock_fsync):
+
+        """Function:  test_fsync
+
+        Description:  Test the file is synced to disk when a sync interval
+            is set.
+
+        Arguments:
+
+        """
+
+        file_out = mongo_perf.FileWriter(
+            self.fname, "w", flush_count=10, fsync_interval=60)
+        file_out.write("Line1")
+        file_out.close()
+
+        self.assertTrue(mock_fsync.called)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        file_out = mongo_perf.FileWriter(self.fname, "w", flush_count=10)
+        file_out.write("Line1")
+        file_out.close()
+
+        with open(self.fname, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "Line1\n")
+
+        self.assertIsNone(file_out.fhandle)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
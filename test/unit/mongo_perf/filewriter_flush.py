@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  filewriter_flush.py
+
+    Description:  Unit testing of FileWriter.flush in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/filewriter_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_open
+        test_fsync
+        test_flush
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/mongo_perf/tmp/filewriter_flush.txt"
+        self.file_out = mongo_perf.FileWriter(
+            self.fname, "w", buffer_size=8192, flush_count=10)
+
+    @mock.patch("mongo_perf.os.fsync")
+    def test_not_open(self, mock_fsync):
+
+        """Function:  test_not_open
+
+        Description:  Test with the output file not open.
+
+        Arguments:
+
+        """
+
+        self.file_out.flush(fsync=True)
+
+        self.assertFalse(mock_fsync.called)
+
+    @mock.patch("mongo_perf.os.fsync")
+    def test_fsync(self, mock_fsync):
+
+        """Function:  test_fsync
+
+        Description:  Test with a sync to disk.
+
+        Arguments:
+
+        """
+
+        self.file_out.write("Line1")
+        self.file_out.flush(fsync=True)
+
+        mock_fsync.assert_called_once_with(self.file_out.fhandle.fileno())
+        self.assertEqual(self.file_out.fsync_time, self.file_out.flush_time)
+        self.file_out.close()
+
+    def test_flush(self):
+
+        """Function:  test_flush
+
+        Description:  Test flush method.
+
+        Arguments:
+
+        """
+
+        self.file_out.write("Line1")
+
+        with open(self.fname, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "")
+
+        self.file_out.flush()
+
+        with open(self.fname, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "Line1\n")
+
+        self.assertEqual(self.file_out.count, 0)
+        self.file_out.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+# Classification (U)
+
+"""Program:  filewriter_write.py
+
+    Description:  Unit testing of FileWriter.write in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/filewriter_write.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fsync_interval
+        test_flush_interval
+        test_flush_count
+        test_append
+        test_write
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/mongo_perf/tmp/filewriter_write.txt"
+
+    @mock.patch("mongo_perf.time.monotonic")
+    @mock.patch("mongo_perf.FileWriter.flush")
+    def test_fsync_interval(self, mock_flush, mock_time):
+
+        """Function:  test_fsync_interval
+
+        Description:  Test the file is synced to disk on an interval.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100, 101, 102]
+        file_out = mongo_perf.FileWriter(
+            self.fname, "w", flush_count=10, fsync_interval=2)
+
+        file_out.write("Line1")
+        file_out.write("Line2")
+        file_out.fhandle.close()
+
+        mock_flush.assert_called_once_with(fsync=True)
+
+    @mock.patch("mongo_perf.time.monotonic")
+    @mock.patch("mongo_perf.FileWriter.flush")
+    def test_flush_interval(self, mock_flush, mock_time):
+
+        """Function:  test_flush_interval
+
+        Description:  Test the buffer is flushed on an interval.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100, 104, 105]
+        file_out = mongo_perf.FileWriter(
+            self.fname, "w", flush_count=10, flush_interval=5)
+
+        file_out.write("Line1")
+        self.assertFalse(mock_flush.called)
+
+        file_out.write("Line2")
+        file_out.fhandle.close()
+
+        mock_flush.assert_called_once_with()
+
+    @mock.patch("mongo_perf.FileWriter.flush")
+    def test_flush_count(self, mock_flush):
+
+        """Function:  test_flush_count
+
+        Description:  Test the buffer is flushed every number of records.
+
+        Arguments:
+
+        """
+
+        file_out = mongo_perf.FileWriter(self.fname, "w", flush_count=3)
+
+        file_out.write("Line1")
+        file_out.write("Line2")
+        self.assertFalse(mock_flush.called)
+
+        file_out.write("Line3")
+        file_out.fhandle.close()
+
+        mock_flush.assert_called_once_with()
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test with appending to the output file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write("Line1\n")
+
+        file_out = mongo_perf.FileWriter(self.fname, "a")
+        file_out.write("Line2")
+        file_out.close()
+
+        with open(self.fname, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "Line1\nLine2\n")
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test write method.
+
+        Arguments:
+
+        """
+
+        file_out = mongo_perf.FileWriter(self.fname, "w")
+        file_out.write("Line1")
+
+        with open(self.fname, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "Line1\n")
+
+        file_out.write("Line2")
+        file_out.close()
+
+        with open(self.fname, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "Line1\nLine2\n")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
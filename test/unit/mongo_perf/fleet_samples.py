@@ -0,0 +1,220 @@
+# Classification (U)
+
+"""Program:  fleet_samples.py
+
+    Description:  Unit testing of fleet_samples in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/fleet_samples.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        connect
+        adm_cmd
+
+    """
+
+    def __init__(self, name, delay=0, fail=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) delay
+            (input) fail
+
+        """
+
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.count = 0
+        self.status = []
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        return self.status.pop(0)
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub method holder for mongo_class.Server.adm_cmd.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        time.sleep(self.delay)
+
+        if self.fail:
+            raise ValueError(f"{cmd} failure")
+
+        self.count += 10
+
+        return {"opcounters": {"insert": self.count}}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_targets
+        test_slow_target
+        test_failed_target
+        test_down_target
+        test_fleet_samples
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.interval = 0.05
+        self.targets = {"mongo1": Server("Server1"),
+                        "mongo2": Server("Server2")}
+
+    def test_no_targets(self):
+
+        """Function:  test_no_targets
+
+        Description:  Test with no databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mongo_perf.fleet_samples({}, 2, self.interval, 2)), [])
+
+    def test_slow_target(self):
+
+        """Function:  test_slow_target
+
+        Description:  Test with a database slower than the polling interval.
+
+        Arguments:
+
+        """
+
+        self.targets["mongo3"] = Server("Server3", delay=self.interval * 3)
+        names = [name for name, _ in mongo_perf.fleet_samples(
+            self.targets, 4, self.interval, 3)]
+
+        self.assertEqual(names.count("Server1"), 4)
+        self.assertEqual(names.count("Server2"), 4)
+        self.assertTrue(names.count("Server3") < 4)
+
+    def test_failed_target(self):
+
+        """Function:  test_failed_target
+
+        Description:  Test with a database failing the serverStatus command.
+
+        Arguments:
+
+        """
+
+        self.targets["mongo3"] = Server("Server3", fail=True)
+
+        with gen_libs.no_std_out():
+            names = [name for name, _ in mongo_perf.fleet_samples(
+                self.targets, 2, self.interval, 1)]
+
+        self.assertEqual(
+            sorted(names), ["Server1", "Server1", "Server2", "Server2"])
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect",
+                mock.Mock(return_value=True))
+    def test_down_target(self):
+
+        """Function:  test_down_target
+
+        Description:  Test with a database which failed to connect and
+            connects on a later attempt.
+
+        Arguments:
+
+        """
+
+        down = Server("Server3")
+        down.status = [(False, "Error"), (True, None)]
+
+        with gen_libs.no_std_out():
+            names = [name for name, _ in mongo_perf.fleet_samples(
+                self.targets, 8, self.interval, 3,
+                down={"mongo3": down})]
+
+        self.assertEqual(names.count("Server1"), 8)
+        self.assertTrue(names.count("Server3") >= 1)
+        self.assertEqual(down.status, [])
+
+    def test_fleet_samples(self):
+
+        """Function:  test_fleet_samples
+
+        Description:  Test fleet_samples function.
+
+        Arguments:
+
+        """
+
+        results = list(mongo_perf.fleet_samples(
+            self.targets, 2, self.interval, 2))
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all("time" in stats for _, stats in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
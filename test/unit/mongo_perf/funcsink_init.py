@@ -0,0 +1,59 @@
+# Classification (U)
+
+"""Program:  funcsink_init.py
+
+    Description:  Unit testing of FuncSink.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/funcsink_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_init
+
+    """
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        func = mock.Mock()
+        sink = mongo_perf.FuncSink(func)
+
+        self.assertIs(sink.func, func)
+        self.assertIsInstance(sink, mongo_perf.Sink)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Classification (U)
+
+"""Program:  funcsink_write_batch.py
+
+    Description:  Unit testing of FuncSink.write_batch in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/funcsink_write_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_empty
+        test_write_batch
+
+    """
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty batch.
+
+        Arguments:
+
+        """
+
+        func = mock.Mock()
+
+        mongo_perf.FuncSink(func).write_batch([])
+
+        self.assertFalse(func.called)
+
+    def test_write_batch(self):
+
+        """Function:  test_write_batch
+
+        Description:  Test write_batch method.
+
+        Arguments:
+
+        """
+
+        func = mock.Mock()
+
+        mongo_perf.FuncSink(func).write_batch(
+            [({"Server": "Server1"}, "Text1"), ({"Server": "Server2"}, None)])
+
+        self.assertEqual(func.call_args_list,
+                         [mock.call({"Server": "Server1"}, "Text1"),
+                          mock.call({"Server": "Server2"}, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
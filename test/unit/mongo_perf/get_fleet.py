@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  get_fleet.py
+
+    Description:  Unit testing of get_fleet in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/get_fleet.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_directory
+        test_single_file
+        test_file_list
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_perf/tmp/fleet"
+        self.fnames = ["mongo2.py", "mongo1.py", "__init__.py",
+                       "mongo.py.TEMPLATE"]
+
+    def test_directory(self):
+
+        """Function:  test_directory
+
+        Description:  Test with a directory of configuration files.
+
+        Arguments:
+
+        """
+
+        os.makedirs(self.dir_path)
+
+        for fname in self.fnames:
+            with open(os.path.join(self.dir_path, fname), "w",
+                      encoding="UTF-8"):
+                pass
+
+        self.assertEqual(
+            mongo_perf.get_fleet([self.dir_path], "config"),
+            [("mongo1", self.dir_path), ("mongo2", self.dir_path)])
+
+    def test_single_file(self):
+
+        """Function:  test_single_file
+
+        Description:  Test with a single configuration file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_fleet("mongo1", "config"), [("mongo1", "config")])
+
+    def test_file_list(self):
+
+        """Function:  test_file_list
+
+        Description:  Test with a list of configuration files.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_fleet(["mongo1", "mongo2"], "config"),
+            [("mongo1", "config"), ("mongo2", "config")])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.dir_path):
+            for fname in os.listdir(self.dir_path):
+                os.remove(os.path.join(self.dir_path, fname))
+
+            os.rmdir(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
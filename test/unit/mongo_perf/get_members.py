@@ -0,0 +1,112 @@
+# Classification (U)
+
+"""Program:  get_members.py
+
+    Description:  Unit testing of get_members in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/get_members.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_entry
+        test_default_port
+        test_list
+        test_string
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.results = [("host1", 27017), ("host2", 27018)]
+
+    def test_empty_entry(self):
+
+        """Function:  test_empty_entry
+
+        Description:  Test with an empty entry in the hosts string.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_members("host1:27017, host2:27018,"),
+            self.results)
+
+    def test_default_port(self):
+
+        """Function:  test_default_port
+
+        Description:  Test with a host without a port.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_members("host1, host2:27018"), self.results)
+
+    def test_list(self):
+
+        """Function:  test_list
+
+        Description:  Test with a list of hosts.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_members(["host1:27017", "host2:27018"]),
+            self.results)
+
+    def test_string(self):
+
+        """Function:  test_string
+
+        Description:  Test with a string of hosts.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_members("host1:27017, host2:27018"), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+# Classification (U)
+
+"""Program:  get_mongostat.py
+
+    Description:  Unit testing of get_mongostat in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/get_mongostat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mongo_cfg", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_typed
+        test_stream
+        test_blank_line
+        test_polling
+        test_timers
+        test_get_mongostat
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args3 = ArgParser()
+        self.args2.args_array["-b"] = "5"
+        self.args3.args_array["-l"] = True
+        self.args4 = ArgParser()
+        self.args4.args_array["-T"] = True
+        self.row = b'{"host1": {"insert": "*0", "time": "timestamp"}}'
+        self.results = [{"insert": "*0", "time": "timestamp"}]
+
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs.create_cmd")
+    def test_typed(self, mock_cmd, mock_data):
+
+        """Function:  test_typed
+
+        Description:  Test with typed statistics.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongostat"]
+        mock_data.return_value = self.row + b"\n"
+
+        self.assertEqual(
+            list(mongo_perf.get_mongostat(self.server, self.args4)),
+            [{"insert": 0, "insert_repl": True, "time": "timestamp"}])
+
+    @mock.patch("mongo_perf.stream_data")
+    @mock.patch("mongo_perf.mongo_libs.create_cmd")
+    def test_stream(self, mock_cmd, mock_stream):
+
+        """Function:  test_stream
+
+        Description:  Test with streaming the mongostat output.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongostat"]
+        mock_stream.return_value = iter([self.row + b"\n", self.row + b"\n"])
+
+        self.assertEqual(
+            list(mongo_perf.get_mongostat(self.server, self.args3)),
+            self.results * 2)
+
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs.create_cmd")
+    def test_blank_line(self, mock_cmd, mock_data):
+
+        """Function:  test_blank_line
+
+        Description:  Test with a blank line in the mongostat output.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongostat"]
+        mock_data.return_value = self.row + b"\n\n" + self.row + b"\n"
+
+        self.assertEqual(
+            list(mongo_perf.get_mongostat(self.server, self.args)),
+            self.results * 2)
+
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs.create_cmd")
+    def test_polling(self, mock_cmd, mock_data):
+
+        """Function:  test_polling
+
+        Description:  Test with the polling option.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongostat"]
+        mock_data.return_value = self.row + b"\n"
+
+        list(mongo_perf.get_mongostat(self.server, self.args2))
+
+        mock_data.assert_called_once_with(["mongostat", "5"])
+
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs.create_cmd")
+    def test_timers(self, mock_cmd, mock_data):
+
+        """Function:  test_timers
+
+        Description:  Test with stage timers.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongostat"]
+        mock_data.return_value = self.row + b"\n"
+        timers = mongo_perf.StageTimers(60)
+
+        self.assertEqual(
+            list(mongo_perf.get_mongostat(self.server, self.args4,
+                                          timers=timers)),
+            [{"insert": 0, "insert_repl": True, "time": "timestamp"}])
+        self.assertEqual(sorted(timers.run), ["decode", "mongostat", "parse"])
+
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs.create_cmd")
+    def test_get_mongostat(self, mock_cmd, mock_data):
+
+        """Function:  test_get_mongostat
+
+        Description:  Test get_mongostat function.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongostat"]
+        mock_data.return_value = self.row + b"\n"
+
+        self.assertEqual(
+            list(mongo_perf.get_mongostat(self.server, self.args)),
+            self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  get_rate.py
+
+    Description:  Unit testing of get_rate in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/get_rate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_zero_elapsed
+        test_counter_reset
+        test_missing_counter
+        test_get_rate
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.prev = {"opcounters": {"insert": 100}}
+        self.curr = {"opcounters": {"insert": 150}}
+        self.keys = ["opcounters", "insert"]
+
+    def test_zero_elapsed(self):
+
+        """Function:  test_zero_elapsed
+
+        Description:  Test with zero elapsed seconds.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_rate(self.prev, self.curr, self.keys, 0), 50)
+
+    def test_counter_reset(self):
+
+        """Function:  test_counter_reset
+
+        Description:  Test with the counter reset by a server restart.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_rate(self.curr, self.prev, self.keys, 5), 0)
+
+    def test_missing_counter(self):
+
+        """Function:  test_missing_counter
+
+        Description:  Test with a counter missing from the results.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_rate(
+                self.prev, self.curr, ["opcounters", "query"], 5), 0)
+
+    def test_get_rate(self):
+
+        """Function:  test_get_rate
+
+        Description:  Test get_rate function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_rate(self.prev, self.curr, self.keys, 5), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
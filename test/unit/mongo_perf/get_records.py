@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  get_records.py
+
+    Description:  Unit testing of get_records in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/get_records.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_encode
+        test_rep_tags
+        test_timers
+        test_get_records
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.samples = [
+            ("Server1", {"insert": 1, "time": "10:00:01"}),
+            ("Server2", {"insert": 2, "time": "10:00:01", "set": "spock",
+                         "repl": "SEC"})]
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    def test_no_encode(self):
+
+        """Function:  test_no_encode
+
+        Description:  Test with no text output.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mongo_perf.get_records(self.samples[:1], 4, False)),
+            [({"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+               "PerfStats": {"insert": 1}}, None)])
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    def test_rep_tags(self):
+
+        """Function:  test_rep_tags
+
+        Description:  Test with replica set name and state in the sample.
+
+        Arguments:
+
+        """
+
+        data, _ = list(mongo_perf.get_records(self.samples[1:], 4, True))[0]
+
+        self.assertEqual(
+            data, {"Server": "Server2", "AsOf": "2026-10-18 10:00:01",
+                   "RepSet": "spock", "RepState": "SEC",
+                   "PerfStats": {"insert": 2}})
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    def test_timers(self):
+
+        """Function:  test_timers
+
+        Description:  Test with stage timers and a self-metrics record.
+
+        Arguments:
+
+        """
+
+        timers = mongo_perf.StageTimers(60)
+        timers.due = mock.Mock(side_effect=[True, False])
+
+        records = list(mongo_perf.get_records(
+            self.samples, None, True, timers=timers))
+
+        self.assertEqual([data["Server"] for data, _ in records],
+                         ["Server1", "mongo_perf", "Server2"])
+        self.assertEqual(mongo_perf.json.loads(records[1][1]), records[1][0])
+        self.assertEqual(timers.run["document"][0], 2)
+        self.assertEqual(timers.run["encode"][0], 2)
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    def test_get_records(self):
+
+        """Function:  test_get_records
+
+        Description:  Test get_records function.
+
+        Arguments:
+
+        """
+
+        data, text = list(
+            mongo_perf.get_records(self.samples[:1], None, True))[0]
+
+        self.assertEqual(mongo_perf.json.loads(text), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
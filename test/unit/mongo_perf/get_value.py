@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  get_value.py
+
+    Description:  Unit testing of get_value in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/get_value.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_dict
+        test_default_value
+        test_missing_key
+        test_nested_value
+        test_value
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.doc = {"mem": {"resident": 81, "virtual": 1556}, "uptime": 10}
+
+    def test_not_dict(self):
+
+        """Function:  test_not_dict
+
+        Description:  Test with a key below a non-dictionary value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.get_value(self.doc, ["uptime", "a"]), 0)
+
+    def test_default_value(self):
+
+        """Function:  test_default_value
+
+        Description:  Test with a missing key and a default value.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mongo_perf.get_value(self.doc, ["repl", "setName"], None))
+
+    def test_missing_key(self):
+
+        """Function:  test_missing_key
+
+        Description:  Test with a missing key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.get_value(self.doc, ["mem", "bits"]), 0)
+
+    def test_nested_value(self):
+
+        """Function:  test_nested_value
+
+        Description:  Test with a nested value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.get_value(self.doc, ["mem", "resident"]), 81)
+
+    def test_value(self):
+
+        """Function:  test_value
+
+        Description:  Test with a top level value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.get_value(self.doc, ["uptime"]), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
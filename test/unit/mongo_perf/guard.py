@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  guard.py
+
+    Description:  Unit testing of guard in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/guard.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_error
+        test_guard
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.runner = mongo_perf.SinkRunner("plugin", mock.Mock())
+        self.func = mock.Mock()
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test an error is counted and printed, not raised.
+
+        Arguments:
+
+        """
+
+        self.func.side_effect = ValueError("Down")
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as out:
+            mongo_perf.guard(self.runner, self.func, "Data", "Text")
+
+        self.assertEqual(self.runner.errors, 1)
+        self.assertEqual(out.getvalue(), "Output error:  plugin:  Down\n")
+
+    def test_guard(self):
+
+        """Function:  test_guard
+
+        Description:  Test guard function.
+
+        Arguments:
+
+        """
+
+        mongo_perf.guard(self.runner, self.func, "Data", "Text")
+
+        self.func.assert_called_once_with("Data", "Text")
+        self.assertEqual(self.runner.errors, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  insert_docs.py
+
+    Description:  Unit testing of insert_docs in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/insert_docs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class DbColl():                                         # pylint:disable=R0903
+
+    """Class:  DbColl
+
+    Description:  Class stub holder for pymongo.collection.Collection class.
+
+    Methods:
+        __init__
+        insert_many
+
+    """
+
+    def __init__(self, errors=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) errors
+
+        """
+
+        self.errors = list(errors or [])
+        self.docs = []
+
+    def insert_many(self, docs, ordered=True):
+
+        """Method:  insert_many
+
+        Description:  Stub method holder for Collection.insert_many.
+
+        Arguments:
+            (input) docs
+            (input) ordered
+
+        """
+
+        self.docs.append((list(docs), ordered))
+
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_other_error
+        test_duplicate_unordered
+        test_duplicate_ordered
+        test_insert_docs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.docs = [{"_id": "Server1|1"}, {"_id": "Server1|2"}]
+
+    def test_other_error(self):
+
+        """Function:  test_other_error
+
+        Description:  Test a rejected document that is not a duplicate.
+
+        Arguments:
+
+        """
+
+        db_coll = DbColl([pymongo.errors.BulkWriteError(
+            {"writeErrors": [{"index": 0, "code": 121}]})])
+
+        with self.assertRaises(pymongo.errors.BulkWriteError):
+            mongo_perf.insert_docs(db_coll, self.docs, False)
+
+    def test_duplicate_unordered(self):
+
+        """Function:  test_duplicate_unordered
+
+        Description:  Test duplicates are skipped with unordered inserts.
+
+        Arguments:
+
+        """
+
+        db_coll = DbColl([pymongo.errors.BulkWriteError(
+            {"writeErrors": [{"index": 0, "code": 11000}]})])
+
+        mongo_perf.insert_docs(db_coll, self.docs, False)
+
+        self.assertEqual(db_coll.docs, [(self.docs, False)])
+
+    def test_duplicate_ordered(self):
+
+        """Function:  test_duplicate_ordered
+
+        Description:  Test the documents after a duplicate are inserted with
+            ordered inserts.
+
+        Arguments:
+
+        """
+
+        db_coll = DbColl([pymongo.errors.BulkWriteError(
+            {"writeErrors": [{"index": 0, "code": 11000}]})])
+
+        mongo_perf.insert_docs(db_coll, self.docs, True)
+
+        self.assertEqual(db_coll.docs,
+                         [(self.docs, True), (self.docs[1:], True)])
+
+    def test_insert_docs(self):
+
+        """Function:  test_insert_docs
+
+        Description:  Test insert_docs function.
+
+        Arguments:
+
+        """
+
+        db_coll = DbColl()
+
+        mongo_perf.insert_docs(db_coll, self.docs, True)
+
+        self.assertEqual(db_coll.docs, [(self.docs, True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Classification (U)
+
+"""Program:  lazy_import.py
+
+    Description:  Unit testing of lazy_import in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/lazy_import.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_installed
+        test_submodule
+        test_lazy_import
+
+    """
+
+    def test_not_installed(self):
+
+        """Function:  test_not_installed
+
+        Description:  Test with a module that is not installed.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_perf.lazy_import("no_such_module.json"))
+
+    def test_submodule(self):
+
+        """Function:  test_submodule
+
+        Description:  Test with a module of a package.
+
+        Arguments:
+
+        """
+
+        module = mongo_perf.lazy_import("email.message")
+
+        self.assertIsInstance(module, mongo_perf.LazyModule)
+        self.assertEqual(module.__name__, "email.message")
+
+    def test_lazy_import(self):
+
+        """Function:  test_lazy_import
+
+        Description:  Test lazy_import function.
+
+        Arguments:
+
+        """
+
+        sys.modules.pop("colorsys", None)
+
+        module = mongo_perf.lazy_import("colorsys")
+
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertEqual(module.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertIn("colorsys", sys.modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  lazymodule_getattr.py
+
+    Description:  Unit testing of LazyModule.__getattr__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/lazymodule_getattr.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import colorsys
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_patch
+        test_missing
+        test_cached
+        test_getattr
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.module = mongo_perf.LazyModule("colorsys")
+
+    def test_patch(self):
+
+        """Function:  test_patch
+
+        Description:  Test patching an attribute of the module.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(self.module, "rgb_to_hsv", mock.Mock(
+                return_value="Patched")):
+            self.assertEqual(self.module.rgb_to_hsv(1, 0, 0), "Patched")
+
+        self.assertIs(self.module.rgb_to_hsv, colorsys.rgb_to_hsv)
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with an attribute the module does not have.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(AttributeError):
+            self.module.no_such_function            # pylint:disable=W0104
+
+    def test_cached(self):
+
+        """Function:  test_cached
+
+        Description:  Test the module is only imported on the first
+            access.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_perf.importlib.import_module",
+                        mock.Mock(return_value=colorsys)) as mock_import:
+            self.module.rgb_to_hsv              # pylint:disable=W0104
+            self.module.hsv_to_rgb              # pylint:disable=W0104
+
+        mock_import.assert_called_once_with("colorsys")
+
+    def test_getattr(self):
+
+        """Function:  test_getattr
+
+        Description:  Test __getattr__ method.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.module.rgb_to_hsv, colorsys.rgb_to_hsv)
+
+
+if __name__ == "__main__":
+    unittest.main()
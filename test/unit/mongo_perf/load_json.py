@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  load_json.py
+
+    Description:  Unit testing of load_json in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/load_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_zstd
+        test_gzip
+        test_empty
+        test_load_json
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.docs = [{"Server": "Server1", "PerfStats": {"insert": 1}},
+                     {"Server": "Server2", "PerfStats": {"insert": 2}}]
+        self.text = mongo_perf.json.dumps(self.docs[0], indent=4) + "\n" \
+            + mongo_perf.json.dumps(self.docs[1]) + "\n"
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mongo_perf.zstandard")
+    def test_zstd(self, mock_zstd):
+
+        """Function:  test_zstd
+
+        Description:  Test with a zstd compressed file.
+
+        Arguments:
+
+        """
+
+        mock_zstd.open.return_value = io.StringIO('{"a": 1}')
+
+        self.assertEqual(list(mongo_perf.load_json("perf.json.zst")),
+                         [{"a": 1}])
+
+    def test_gzip(self):
+
+        """Function:  test_gzip
+
+        Description:  Test with a gzip compressed file.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "perf.json.gz")
+
+        with mongo_perf.gzip.open(fname, mode="wt", encoding="UTF-8") as fhdr:
+            fhdr.write(self.text)
+
+        self.assertEqual(list(mongo_perf.load_json(fname)), self.docs)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "perf.json")
+
+        with open(fname, mode="w", encoding="UTF-8"):
+            pass
+
+        self.assertEqual(list(mongo_perf.load_json(fname)), [])
+
+    def test_load_json(self):
+
+        """Function:  test_load_json
+
+        Description:  Test load_json function.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "perf.json")
+
+        with open(fname, mode="w", encoding="UTF-8") as fhdr:
+            fhdr.write(self.text)
+
+        self.assertEqual(list(mongo_perf.load_json(fname)), self.docs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  load_sink.py
+
+    Description:  Unit testing of load_sink in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/load_sink.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_class
+        test_no_module
+        test_no_attr
+        test_load_sink
+
+    """
+
+    def test_no_class(self):
+
+        """Function:  test_no_class
+
+        Description:  Test with no class name.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mongo_perf.load_sink("mongo_perf")
+
+    def test_no_module(self):
+
+        """Function:  test_no_module
+
+        Description:  Test with a module that does not exist.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ImportError):
+            mongo_perf.load_sink("no_such_module:Sink")
+
+    def test_no_attr(self):
+
+        """Function:  test_no_attr
+
+        Description:  Test with a class that does not exist.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(AttributeError):
+            mongo_perf.load_sink("mongo_perf:NoSuchSink")
+
+    def test_load_sink(self):
+
+        """Function:  test_load_sink
+
+        Description:  Test load_sink function.
+
+        Arguments:
+
+        """
+
+        self.assertIs(mongo_perf.load_sink("mongo_perf:FuncSink"),
+                      mongo_perf.FuncSink)
+
+
+if __name__ == "__main__":
+    unittest.main()
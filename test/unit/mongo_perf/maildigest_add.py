@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  maildigest_add.py
+
+    Description:  Unit testing of MailDigest.add in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/maildigest_add.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import gzip
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_attach
+        test_servers
+        test_add
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.digest = mongo_perf.MailDigest()
+        self.data = {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "qrw": "1|0", "set": "a"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.digest.close()
+
+    def test_attach(self):
+
+        """Function:  test_attach
+
+        Description:  Test with the samples attached.
+
+        Arguments:
+
+        """
+
+        digest = mongo_perf.MailDigest(True)
+        digest.add(self.data, "Text")
+        digest.add(self.data)
+        digest.raw.close()
+        digest.tmp.seek(0)
+
+        self.assertEqual(
+            gzip.decompress(digest.tmp.read()).decode().split("\n"),
+            ["Text", json.dumps(self.data), ""])
+
+        digest.close()
+
+    def test_servers(self):
+
+        """Function:  test_servers
+
+        Description:  Test with more than one server.
+
+        Arguments:
+
+        """
+
+        self.digest.add(self.data)
+        self.data["Server"] = "Server2"
+        self.data["AsOf"] = "2026-10-18 10:00:02"
+        self.digest.add(self.data)
+
+        self.assertEqual(list(self.digest.servers), ["Server1", "Server2"])
+        self.assertEqual(self.digest.first, "2026-10-18 10:00:01")
+        self.assertEqual(self.digest.last, "2026-10-18 10:00:02")
+
+    def test_add(self):
+
+        """Function:  test_add
+
+        Description:  Test add method.
+
+        Arguments:
+
+        """
+
+        self.digest.add(self.data)
+        self.digest.add(self.data)
+        stats = self.digest.servers["Server1"]
+
+        self.assertEqual(sorted(stats), ["insert", "qr", "qw"])
+        self.assertEqual(stats["insert"].count, 2)
+        self.assertEqual(self.digest.count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
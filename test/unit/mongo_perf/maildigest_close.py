@@ -0,0 +1,76 @@
+# Classification (U)
+
+"""Program:  maildigest_close.py
+
+    Description:  Unit testing of MailDigest.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/maildigest_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_attach
+        test_close
+
+    """
+
+    def test_no_attach(self):
+
+        """Function:  test_no_attach
+
+        Description:  Test without the samples attached.
+
+        Arguments:
+
+        """
+
+        digest = mongo_perf.MailDigest()
+
+        digest.close()
+
+        self.assertIsNone(digest.tmp)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        digest = mongo_perf.MailDigest(True)
+
+        digest.close()
+
+        self.assertTrue(digest.raw.closed)
+        self.assertFalse(os.path.exists(digest.tmp.name))
+
+
+if __name__ == "__main__":
+    unittest.main()
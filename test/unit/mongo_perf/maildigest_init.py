@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  maildigest_init.py
+
+    Description:  Unit testing of MailDigest.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/maildigest_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_attach
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.digest = mongo_perf.MailDigest()
+        self.data = {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "qrw": "1|0", "set": "a"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.digest.close()
+
+    def test_attach(self):
+
+        """Function:  test_attach
+
+        Description:  Test with the samples attached.
+
+        Arguments:
+
+        """
+
+        digest = mongo_perf.MailDigest(True)
+
+        self.assertTrue(os.path.exists(digest.tmp.name))
+        self.assertIsNotNone(digest.raw)
+
+        digest.close()
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.digest.servers, {})
+        self.assertEqual(self.digest.count, 0)
+        self.assertIsNone(self.digest.raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
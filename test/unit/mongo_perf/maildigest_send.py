@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  maildigest_send.py
+
+    Description:  Unit testing of MailDigest.send in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/maildigest_send.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import gzip
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_mailx
+        test_attach
+        test_send
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mail = mock.Mock(to="dba@domain", subj=["Mongo", "Perf"],
+                              frm="user@host", msg="")
+        self.mail.add_2_msg.side_effect = \
+            lambda text: setattr(self.mail, "msg", self.mail.msg + text)
+        self.data = {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5}}
+        self.digest = mongo_perf.MailDigest(True)
+        self.digest.add(self.data, "Text")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.digest.close()
+
+    @mock.patch("mongo_perf.subprocess.run")
+    def test_mailx(self, mock_run):
+
+        """Function:  test_mailx
+
+        Description:  Test with the samples attached and mailx.
+
+        Arguments:
+
+        """
+
+        self.digest.send(self.mail, use_mailx=True)
+
+        cmd = mock_run.call_args[0][0]
+
+        self.assertEqual(cmd[:4], ["mailx", "-s", "Mongo Perf", "-a"])
+        self.assertEqual(cmd[5:], ["dba@domain"])
+        self.assertEqual(mock_run.call_args[1]["input"],
+                         self.digest.table().encode())
+
+    @mock.patch("mongo_perf.smtplib.SMTP")
+    def test_attach(self, mock_smtp):
+
+        """Function:  test_attach
+
+        Description:  Test with the samples attached.
+
+        Arguments:
+
+        """
+
+        self.digest.send(self.mail)
+
+        msg = mock_smtp.return_value.__enter__.return_value \
+            .send_message.call_args[0][0]
+        part = list(msg.iter_attachments())[0]
+
+        self.assertEqual(msg["To"], "dba@domain")
+        self.assertEqual(msg["Subject"], "Mongo Perf")
+        self.assertEqual(part.get_filename(), "mongo_perf_samples.json.gz")
+        self.assertEqual(
+            gzip.decompress(part.get_content()).decode(), "Text\n")
+        self.assertTrue(self.digest.tmp.closed)
+
+    def test_send(self):
+
+        """Function:  test_send
+
+        Description:  Test send method.
+
+        Arguments:
+
+        """
+
+        digest = mongo_perf.MailDigest()
+        digest.add(self.data)
+
+        digest.send(self.mail)
+
+        self.assertEqual(self.mail.msg, digest.table())
+        self.mail.send_mail.assert_called_once_with(use_mailx=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
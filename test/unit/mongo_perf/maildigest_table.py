@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  maildigest_table.py
+
+    Description:  Unit testing of MailDigest.table in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/maildigest_table.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_samples
+        test_table
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.digest = mongo_perf.MailDigest()
+        self.data = {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "qrw": "1|0", "set": "a"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.digest.close()
+
+    def test_no_samples(self):
+
+        """Function:  test_no_samples
+
+        Description:  Test with no samples.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.digest.table(),
+                         "Samples:  0  From:  None  To:  None\n")
+
+    def test_table(self):
+
+        """Function:  test_table
+
+        Description:  Test table method.
+
+        Arguments:
+
+        """
+
+        self.digest.add(self.data)
+        self.data["PerfStats"]["insert"] = 7
+        self.digest.add(self.data)
+
+        self.assertEqual(
+            self.digest.table().split("\n"),
+            ["Samples:  2  From:  2026-10-18 10:00:01  "
+             "To:  2026-10-18 10:00:01", "", "Server:  Server1",
+             f"{'Statistic':<24}{'Min':>14}{'Avg':>14}{'Max':>14}"
+             f"{'P95':>14}",
+             f"{'insert':<24}{5:>14}{6:>14}{7:>14}{7:>14}",
+             f"{'qr':<24}{1:>14}{1:>14}{1:>14}{1:>14}",
+             f"{'qw':<24}{0:>14}{0:>14}{0:>14}{0:>14}", ""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import io
 import mock
 
 # Local
@@ -41,6 +42,7 @@ class ArgParser():
         arg_cond_req
         arg_dir_chk
         arg_file_chk
+        arg_valid_val
         arg_require
         get_val
 
@@ -72,6 +74,8 @@ class ArgParser():
         self.opt_con_req2 = True
         self.dir_perms_chk = None
         self.dir_perms_chk2 = True
+        self.opt_valid_val = None
+        self.opt_valid_val2 = True
 
     def arg_exist(self, arg):
 
@@ -144,6 +148,20 @@ class ArgParser():
 
         return self.arg_file_chk2
 
+    def arg_valid_val(self, opt_valid_val):
+
+        """Method:  arg_valid_val
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_valid_val.
+
+        Arguments:
+
+        """
+
+        self.opt_valid_val = opt_valid_val
+
+        return self.opt_valid_val2
+
     def arg_require(self, opt_req):
 
         """Method:  arg_require
@@ -198,7 +216,7 @@ class ProgramLock():                                    # pylint:disable=R0903
         self.flavor = flavor
 
 
-class UnitTest(unittest.TestCase):
+class UnitTest(unittest.TestCase):                      # pylint:disable=R0904
 
     """Class:  UnitTest
 
@@ -222,6 +240,14 @@ class UnitTest(unittest.TestCase):
         test_programlock_id
         test_set_j_option
         test_set_default_args
+        test_daemon
+        test_arg_valid_false
+        test_zstd_missing
+        test_dump_rrd
+        test_convert_json
+        test_bad_option
+        test_replay
+        test_fleet
 
     """
 
@@ -239,6 +265,8 @@ class UnitTest(unittest.TestCase):
         self.args2 = ArgParser()
         self.args4 = ArgParser()
         self.args6 = ArgParser()
+        self.args7 = ArgParser()
+        self.args8 = ArgParser()
         self.args.args_array = {"-c": "CfgFile", "-d": "CfgDir"}
         self.args2.args_array = {
             "-c": "CfgFile", "-d": "CfgDir", "-S": True, "-j": True}
@@ -246,6 +274,10 @@ class UnitTest(unittest.TestCase):
             "-c": "CfgFile", "-d": "CfgDir", "-S": True, "-i": True}
         self.args6.args_array = {
             "-c": "CfgFile", "-d": "CfgDir", "-y": "Flavor"}
+        self.args7.args_array = {
+            "-F": ["CfgFile", "CfgFile2"], "-d": "CfgDir", "-S": True}
+        self.args8.args_array = {
+            "-c": "CfgFile", "-d": "CfgDir", "-S": True, "-D": True}
         self.proglock = ProgramLock(["cmdline"], "FlavorID")
 
     @mock.patch("mongo_perf.gen_libs.help_func")
@@ -558,6 +590,201 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mongo_perf.main())
 
+    @mock.patch("mongo_perf.signal.signal")
+    @mock.patch("mongo_perf.run_program", mock.Mock(return_value=True))
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_daemon(self, mock_arg, mock_help, mock_lock, mock_signal):
+
+        """Function:  test_daemon
+
+        Description:  Test with daemon mode.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args8
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mongo_perf.main())
+        mock_signal.assert_called_once_with(
+            mongo_perf.signal.SIGTERM, mongo_perf.sigterm_handler)
+
+    @mock.patch("mongo_perf.run_program")
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_arg_valid_false(self, mock_arg, mock_help, mock_lock, mock_run):
+
+        """Function:  test_arg_valid_false
+
+        Description:  Test arg_valid_val if returns false.
+
+        Arguments:
+
+        """
+
+        self.args.opt_valid_val2 = False
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        self.assertFalse(mongo_perf.main())
+        self.assertFalse(mock_lock.called)
+        self.assertFalse(mock_run.called)
+
+    @mock.patch("mongo_perf.zstandard", None)
+    @mock.patch("mongo_perf.run_program")
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_zstd_missing(self, mock_arg, mock_help, mock_lock, mock_run):
+
+        """Function:  test_zstd_missing
+
+        Description:  Test with zstd compression and no zstandard package.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "zstd"
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            self.assertFalse(mongo_perf.main())
+
+        self.assertFalse(mock_lock.called)
+        self.assertFalse(mock_run.called)
+
+    @mock.patch("mongo_perf.dump_rrd")
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_dump_rrd(self, mock_arg, mock_help, mock_lock, mock_dump):
+
+        """Function:  test_dump_rrd
+
+        Description:  Test dumping a round-robin file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-L": "Server1.rrd"}
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mongo_perf.main())
+        mock_dump.assert_called_once_with(self.args)
+        self.assertEqual(self.args.opt_req, [])
+
+    @mock.patch("mongo_perf.convert_json")
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_convert_json(self, mock_arg, mock_help, mock_lock, mock_convert):
+
+        """Function:  test_convert_json
+
+        Description:  Test converting output files to the columnar archive.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-V": ["perf.json"], "-X": "/dir"}
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mongo_perf.main())
+        mock_convert.assert_called_once_with(self.args)
+        self.assertEqual(self.args.opt_req, [])
+
+    @mock.patch("mongo_perf.check_options")
+    @mock.patch("mongo_perf.run_program")
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_bad_option(                                # pylint:disable=R0913
+            self, mock_arg, mock_help, mock_lock, mock_run, mock_check):
+
+        """Function:  test_bad_option
+
+        Description:  Test with an option value that is not valid.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_check.return_value = False
+
+        self.assertFalse(mongo_perf.main())
+        mock_check.assert_called_once_with(self.args)
+        self.assertFalse(mock_lock.called)
+        self.assertFalse(mock_run.called)
+
+    @mock.patch("mongo_perf.run_replay")
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_replay(self, mock_arg, mock_help, mock_lock, mock_replay):
+
+        """Function:  test_replay
+
+        Description:  Test replaying recorded mongostat output.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-I": ["mongostat.json"]}
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mongo_perf.main())
+        mock_replay.assert_called_once_with(self.args)
+        self.assertEqual(self.args.opt_req, [])
+
+    @mock.patch("mongo_perf.run_program")
+    @mock.patch("mongo_perf.run_fleet")
+    @mock.patch("mongo_perf.gen_class.ProgramLock")
+    @mock.patch("mongo_perf.gen_libs.help_func")
+    @mock.patch("mongo_perf.gen_class.ArgParser")
+    def test_fleet(                                     # pylint:disable=R0913
+            self, mock_arg, mock_help, mock_lock, mock_fleet, mock_run):
+
+        """Function:  test_fleet
+
+        Description:  Test with fleet mode.
+
+        Arguments:
+
+        """
+
+        mock_arg.return_value = self.args7
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+        mock_fleet.return_value = True
+
+        self.assertFalse(mongo_perf.main())
+        self.assertEqual(self.args7.opt_req, ["-d"])
+        self.assertTrue(mock_fleet.called)
+        self.assertFalse(mock_run.called)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,310 @@
+# Classification (U)
+
+"""Program:  member_stat.py
+
+    Description:  Unit testing of member_stat in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/member_stat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mongo_cfg", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.status = True
+        self.err_msg = None
+        self.retries = []
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        if self.retries:
+            return self.retries.pop(0)
+
+        return self.status, self.err_msg
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.name = "Mongo"
+        self.user = "mongo"
+        self.japd = None
+        self.auth = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_conn_fail_suppress
+        test_connection_fail
+        test_daemon_retry
+        test_native
+        test_mongostat
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.server = Server()
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args3 = ArgParser()
+        self.args2.args_array["-N"] = True
+        self.args3.args_array["-w"] = True
+        self.member = ("host1", 27017)
+        self.results = [{"insert": 1, "time": "timestamp"}]
+
+    @mock.patch("mongo_perf.mongo_libs")
+    @mock.patch("mongo_perf.mongo_class.Server")
+    def test_conn_fail_suppress(self, mock_inst, mock_mongo):
+
+        """Function:  test_conn_fail_suppress
+
+        Description:  Test with failed connection with suppression.
+
+        Arguments:
+
+        """
+
+        self.server.status = False
+        self.server.err_msg = "Error Connection Message"
+
+        mock_inst.return_value = self.server
+        mock_mongo.create_security_config.return_value = {}
+
+        self.assertEqual(
+            list(mongo_perf.member_stat(self.cfg, self.member, self.args3)),
+            [])
+
+    @mock.patch("mongo_perf.mongo_libs")
+    @mock.patch("mongo_perf.mongo_class.Server")
+    def test_connection_fail(self, mock_inst, mock_mongo):
+
+        """Function:  test_connection_fail
+
+        Description:  Test with failed connection.
+
+        Arguments:
+
+        """
+
+        self.server.status = False
+        self.server.err_msg = "Error Connection Message"
+
+        mock_inst.return_value = self.server
+        mock_mongo.create_security_config.return_value = {}
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                list(mongo_perf.member_stat(
+                    self.cfg, self.member, self.args)), [])
+
+        self.assertFalse(mock_mongo.disconnect.called)
+
+    @mock.patch("mongo_perf.time.sleep")
+    @mock.patch("mongo_perf.daemon_stat")
+    @mock.patch("mongo_perf.mongo_libs")
+    @mock.patch("mongo_perf.mongo_class.Server")
+    def test_daemon_retry(self, mock_inst, mock_mongo, mock_stat,
+                          mock_sleep):
+
+        """Function:  test_daemon_retry
+
+        Description:  Test a failed connection is retried in daemon mode
+            until it connects.
+
+        Arguments:
+
+        """
+
+        self.args3.args_array["-D"] = True
+        self.args3.args_array["-b"] = "5"
+        self.server.retries = [(False, "Error"), (False, "Error")]
+
+        mock_inst.return_value = self.server
+        mock_mongo.create_security_config.return_value = {}
+        mock_stat.return_value = iter(self.results)
+
+        self.assertEqual(
+            list(mongo_perf.member_stat(self.cfg, self.member, self.args3)),
+            self.results)
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list], [5.0, 10.0])
+        mock_stat.assert_called_once_with(self.server, 5.0, self.args3)
+
+    @mock.patch("mongo_perf.srv_stat")
+    @mock.patch("mongo_perf.mongo_libs")
+    @mock.patch("mongo_perf.mongo_class.Server")
+    def test_native(self, mock_inst, mock_mongo, mock_stat):
+
+        """Function:  test_native
+
+        Description:  Test with the native serverStatus collector.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.server
+        mock_mongo.create_security_config.return_value = {}
+        mock_stat.return_value = iter(self.results)
+
+        self.assertEqual(
+            list(mongo_perf.member_stat(self.cfg, self.member, self.args2)),
+            self.results)
+        mock_mongo.disconnect.assert_called_once_with([self.server])
+
+    @mock.patch("mongo_perf.get_mongostat")
+    @mock.patch("mongo_perf.mongo_libs")
+    @mock.patch("mongo_perf.mongo_class.Server")
+    def test_mongostat(self, mock_inst, mock_mongo, mock_stat):
+
+        """Function:  test_mongostat
+
+        Description:  Test with the mongostat utility program.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.server
+        mock_mongo.create_security_config.return_value = {}
+        mock_stat.return_value = iter(self.results)
+
+        self.assertEqual(
+            list(mongo_perf.member_stat(self.cfg, self.member, self.args)),
+            self.results)
+        self.assertTrue(mock_inst.call_args[1]["direct_connect"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Classification (U)
+
+"""Program:  merge_samples.py
+
+    Description:  Unit testing of merge_samples in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/merge_samples.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def source(count):
+
+    """Function:  source
+
+    Description:  Sample generator for testing.
+
+    Arguments:
+        (input) count -> Number of samples to return
+
+    """
+
+    for item in range(count):
+        yield {"insert": item}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stop_early
+        test_no_sources
+        test_merge_samples
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sources = {"host1:27017": source(2), "host2:27017": source(3)}
+
+    def test_stop_early(self):
+
+        """Function:  test_stop_early
+
+        Description:  Test with stopping the merge before sources complete.
+
+        Arguments:
+
+        """
+
+        samples = mongo_perf.merge_samples(self.sources)
+        next(samples)
+        samples.close()
+
+        self.assertTrue(samples.gi_frame is None)
+
+    def test_no_sources(self):
+
+        """Function:  test_no_sources
+
+        Description:  Test with no sample sources.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(list(mongo_perf.merge_samples({})), [])
+
+    def test_merge_samples(self):
+
+        """Function:  test_merge_samples
+
+        Description:  Test merge_samples function.
+
+        Arguments:
+
+        """
+
+        results = list(mongo_perf.merge_samples(self.sources))
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(
+            [value for name, value in results if name == "host2:27017"],
+            [{"insert": 0}, {"insert": 1}, {"insert": 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
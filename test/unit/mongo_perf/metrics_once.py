@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  metrics_once.py
+
+    Description:  Unit testing of metrics_once in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/metrics_once.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_record
+        test_metrics_once
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": "*5", "res": "1G"}}
+        self.metrics = mongo_perf.metrics_once()
+
+    def test_new_record(self):
+
+        """Function:  test_new_record
+
+        Description:  Test a new record is decoded again, even if it is
+            equal to the last one.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_perf.sample_metrics",
+                        mock.Mock(side_effect=[1, 2])):
+            self.assertEqual(self.metrics(self.data), 1)
+            self.assertEqual(self.metrics(dict(self.data)), 2)
+
+    def test_metrics_once(self):
+
+        """Function:  test_metrics_once
+
+        Description:  Test metrics_once function.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_perf.sample_metrics",
+                        mock.Mock(return_value=(1, {}))) as mock_decode:
+            self.metrics(self.data)
+
+            self.assertEqual(self.metrics(self.data), (1, {}))
+            mock_decode.assert_called_once_with(self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
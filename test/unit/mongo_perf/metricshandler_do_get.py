@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  metricshandler_do_get.py
+
+    Description:  Unit testing of MetricsHandler.do_GET in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/metricshandler_do_get.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import urllib.error
+import urllib.request
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_found
+        test_do_get
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics = mongo_perf.MetricsServer("127.0.0.1:0")
+        self.url = f"http://127.0.0.1:{self.metrics.httpd.server_address[1]}"
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics.close()
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with a path other than /metrics.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            with urllib.request.urlopen(self.url + "/other"):
+                pass
+
+        self.assertEqual(context.exception.code, 404)
+
+    def test_do_get(self):
+
+        """Function:  test_do_get
+
+        Description:  Test do_GET method.
+
+        Arguments:
+
+        """
+
+        self.metrics.update(self.data)
+
+        with urllib.request.urlopen(self.url + "/metrics") as resp:
+            self.assertEqual(resp.headers["Content-Type"],
+                             "text/plain; version=0.0.4")
+            self.assertEqual(resp.read(), self.metrics.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
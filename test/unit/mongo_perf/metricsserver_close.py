@@ -0,0 +1,58 @@
+# Classification (U)
+
+"""Program:  metricsserver_close.py
+
+    Description:  Unit testing of MetricsServer.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/metricsserver_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_close
+
+    """
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        metrics = mongo_perf.MetricsServer("127.0.0.1:0")
+
+        metrics.close()
+
+        self.assertFalse(metrics.thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# Classification (U)
+
+"""Program:  metricsserver_init.py
+
+    Description:  Unit testing of MetricsServer.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/metricsserver_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics = mongo_perf.MetricsServer("127.0.0.1:0")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics.close()
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.metrics.httpd.server_address[0], "127.0.0.1")
+        self.assertTrue(self.metrics.thread.is_alive())
+        self.assertIs(self.metrics.httpd.metrics, self.metrics)
+        self.assertEqual(self.metrics.samples, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  metricsserver_render.py
+
+    Description:  Unit testing of MetricsServer.render in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/metricsserver_render.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_cached
+        test_no_samples
+        test_render
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics = mongo_perf.MetricsServer("127.0.0.1:0")
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "RepSet": "spock", "RepState": "PRI",
+                     "PerfStats": {"insert": 5, "qrw": "1|0"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics.close()
+
+    def test_cached(self):
+
+        """Function:  test_cached
+
+        Description:  Test the page is only rendered once per sample.
+
+        Arguments:
+
+        """
+
+        self.metrics.update(self.data)
+        page = self.metrics.render()
+
+        self.assertIs(self.metrics.render(), page)
+
+    def test_no_samples(self):
+
+        """Function:  test_no_samples
+
+        Description:  Test with no samples.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.metrics.render(), b"\n")
+
+    def test_render(self):
+
+        """Function:  test_render
+
+        Description:  Test render method.
+
+        Arguments:
+
+        """
+
+        self.metrics.samples = {
+            "host1": ('server="host1"', {"insert": 5, "net.in": 2}),
+            "host2": ('server="host2"', {"insert": 3})}
+
+        self.assertEqual(
+            self.metrics.render().decode("UTF-8").split("\n"),
+            ["# TYPE mongo_perf_insert gauge",
+             'mongo_perf_insert{server="host1"} 5',
+             'mongo_perf_insert{server="host2"} 3',
+             "# TYPE mongo_perf_net_in gauge",
+             'mongo_perf_net_in{server="host1"} 2', ""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  metricsserver_update.py
+
+    Description:  Unit testing of MetricsServer.update in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/metricsserver_update.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_escape
+        test_no_repset
+        test_shared_metrics
+        test_update
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics = mongo_perf.MetricsServer("127.0.0.1:0")
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "RepSet": "spock", "RepState": "PRI",
+                     "PerfStats": {"insert": 5, "qrw": "1|0"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics.close()
+
+    def test_escape(self):
+
+        """Function:  test_escape
+
+        Description:  Test the label values are escaped.
+
+        Arguments:
+
+        """
+
+        self.data["RepSet"] = 'a"b'
+
+        self.metrics.update(self.data)
+
+        self.assertEqual(self.metrics.samples["host:27017"][0],
+                         'server="host:27017",repset="a\\"b",state="PRI"')
+
+    def test_no_repset(self):
+
+        """Function:  test_no_repset
+
+        Description:  Test with a server not in a replica set.
+
+        Arguments:
+
+        """
+
+        del self.data["RepSet"]
+        del self.data["RepState"]
+
+        self.metrics.update(self.data)
+
+        self.assertEqual(self.metrics.samples["host:27017"][0],
+                         'server="host:27017"')
+
+    def test_shared_metrics(self):
+
+        """Function:  test_shared_metrics
+
+        Description:  Test decoded metrics shared with other outputs are
+            used and not changed.
+
+        Arguments:
+
+        """
+
+        stats = {"insert": 5}
+
+        self.metrics.update(self.data, (100.0, stats))
+
+        self.assertEqual(self.metrics.samples["host:27017"][1],
+                         {"insert": 5, "sample_time_seconds": 100.0})
+        self.assertEqual(stats, {"insert": 5})
+
+    def test_update(self):
+
+        """Function:  test_update
+
+        Description:  Test update method.
+
+        Arguments:
+
+        """
+
+        self.metrics.snapshot = b"Old"
+
+        self.metrics.update(self.data)
+
+        labels, stats = self.metrics.samples["host:27017"]
+
+        self.assertEqual(
+            labels, 'server="host:27017",repset="spock",state="PRI"')
+        self.assertEqual(
+            stats, {"insert": 5, "qr": 1, "qw": 0,
+                    "sample_time_seconds": mongo_perf.time.mktime(
+                        (2026, 10, 18, 10, 0, 1, 0, 0, -1))})
+        self.assertIsNone(self.metrics.snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
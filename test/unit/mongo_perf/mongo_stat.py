@@ -160,6 +160,32 @@ class Server():                                         # pylint:disable=R0903
         self.name = "ServerName"
 
 
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.name = "Mongo"
+        self.repset = "spock"
+        self.repset_hosts = "host1:27017, host2:27017"
+
+
 class SubProcess():                                     # pylint:disable=R0903
 
     """Class:  SubProcess
@@ -201,6 +227,13 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_members_no_repset
+        test_members
+        test_rep_tags
+        test_daemon
+        test_native
+        test_stream
+        test_blank_line
         test_standalone_db
         test_multiple_lines
         test_insert_fail
@@ -248,37 +281,224 @@ class UnitTest(unittest.TestCase):
         self.args7a = ArgParser()
         self.args8 = ArgParser()
         self.args8a = ArgParser()
+        self.args9 = ArgParser()
+        self.args10 = ArgParser()
+        self.args11 = ArgParser()
+        self.args12 = ArgParser()
+        self.cfg = CfgTest()
         self.args.args_array = {"-b": 1}
-        self.args2.args_array = {"-j": True, "-z": True}
-        self.args3.args_array = {"-j": True, "-a": True, "-z": True}
-        self.args4.args_array = {"-j": True, "-f": True, "-z": True}
-        self.args5.args_array = {"-j": True, "-z": True}
-        self.args6.args_array = {"-j": True}
-        self.args7.args_array = {"-j": True, "-z": True, "-t": "email_addr"}
+        self.args2.args_array = {"-z": True}
+        self.args3.args_array = {"-a": True, "-z": True}
+        self.args4.args_array = {"-f": True, "-z": True}
+        self.args5.args_array = {"-z": True}
+        self.args6.args_array = {}
+        self.args7.args_array = {"-z": True, "-t": "email_addr"}
         self.args7a.args_array = {
-            "-j": True, "-z": True, "-t": "email_addr", "-u": True}
+            "-z": True, "-t": "email_addr", "-u": True}
         self.args8.args_array = {
-            "-j": True, "-z": True, "-t": "email_addr", "-s": "subject_line"}
+            "-z": True, "-t": "email_addr", "-s": "subject_line"}
         self.args8a.args_array = {
-            "-j": True, "-z": True, "-t": "email_addr", "-s": "subject_line",
+            "-z": True, "-t": "email_addr", "-s": "subject_line",
             "-u": True}
+        self.args9.args_array = {"-z": True, "-l": True}
+        self.args10.args_array = {"-z": True, "-N": True, "-n": "2", "-b": "5"}
+        self.args11.args_array = {"-z": True, "-R": True}
+        self.args12.args_array = {"-z": True, "-D": True, "-b": "5"}
         self.fname = "./test/unit/mongo_perf/tmp/outfile.txt"
         self.ofile = "OutputFile"
         self.db_tbl = "database:table"
         self.class_cfg = "mongo_config"
         self.results = \
-            b"{1:{1: 11, 'time': 'timestamp', 'set': 'spock', 'repl':" + \
-            b" 'PRI'}, 2: {2: 22, 'time': 'timestamp', 'set': 'spock'," + \
-            b" 'repl': 'PRI'}}\n"
+            b'{"1": {"1": 11, "time": "timestamp", "set": "spock", "repl":' + \
+            b' "PRI"}, "2": {"2": 22, "time": "timestamp", "set": "spock",' + \
+            b' "repl": "PRI"}}\n'
         self.results2 = \
-            b"{1:{1: 11, 'time': 'timestamp', 'set': 'spock', 'repl':" + \
-            b" 'PRI'}, 2: {2: 22, 'time': 'timestamp', 'set': 'spock'," + \
-            b" 'repl': 'PRI'}}\n{1:{1: 11, 'time': 'timestamp2', 'set':" + \
-            b" 'spock', 'repl': 'PRI'}, 2: {2: 22, 'time': 'timestamp2'," + \
-            b" 'set': 'spock', 'repl': 'PRI'}}\n"
+            b'{"1": {"1": 11, "time": "timestamp", "set": "spock", "repl":' + \
+            b' "PRI"}, "2": {"2": 22, "time": "timestamp", "set": "spock",' + \
+            b' "repl": "PRI"}}\n{"1": {"1": 11, "time": "timestamp2",' + \
+            b' "set": "spock", "repl": "PRI"}, "2": {"2": 22, "time":' + \
+            b' "timestamp2", "set": "spock", "repl": "PRI"}}\n'
         self.results3 = \
-            b"{1:{1: 11, 'time': 'timestamp'}, 2: {2: 22, 'time':" + \
-            b" 'timestamp'}}\n"
+            b'{"1": {"1": 11, "time": "timestamp"}, "2": {"2": 22, "time":' + \
+            b' "timestamp"}}\n'
+        self.results4 = [
+            b'{"1": {"1": 11, "time": "timestamp"}, "2": {"2": 22, "time":'
+            b' "timestamp"}}\n',
+            b'{"1": {"1": 11, "time": "timestamp2"}, "2": {"2": 22, "time":'
+            b' "timestamp2"}}\n']
+        self.results5 = \
+            b'{"1": {"1": 11, "time": "timestamp"}, "2": {"2": 22, "time":' + \
+            b' "timestamp"}}\n\n'
+
+    @mock.patch("mongo_perf.sink_funcs")
+    @mock.patch("mongo_perf.get_mongostat")
+    @mock.patch("mongo_perf.member_stat")
+    def test_members_no_repset(self, mock_member, mock_stat, mock_sinks):
+
+        """Function:  test_members_no_repset
+
+        Description:  Test with replica set members option and a standalone
+            database configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.repset = None
+        mock_stat.return_value = iter([{"insert": 1, "time": "timestamp"}])
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        self.assertFalse(
+            mongo_perf.mongo_stat(
+                self.server, self.args11, mongo_cfg=self.cfg))
+        self.assertFalse(mock_member.called)
+        self.assertEqual(mock_process.call_count, 1)
+
+    @mock.patch("mongo_perf.sink_funcs")
+    @mock.patch("mongo_perf.member_stat")
+    def test_members(self, mock_member, mock_sinks):
+
+        """Function:  test_members
+
+        Description:  Test with the replica set members option.
+
+        Arguments:
+
+        """
+
+        mock_member.side_effect = [
+            iter([{"insert": 1, "time": "timestamp", "set": "spock",
+                   "repl": "PRI"}]),
+            iter([{"insert": 2, "time": "timestamp", "set": "spock",
+                   "repl": "SEC"}])]
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        self.assertFalse(
+            mongo_perf.mongo_stat(
+                self.server, self.args11, mongo_cfg=self.cfg))
+        self.assertEqual(
+            sorted((item[0][0]["Server"], item[0][0]["RepState"])
+                   for item in mock_process.call_args_list),
+            [("host1:27017", "PRI"), ("host2:27017", "SEC")])
+
+    @mock.patch("mongo_perf.sink_funcs")
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_rep_tags(self, mock_mongo, mock_cmds, mock_sinks):
+
+        """Function:  test_rep_tags
+
+        Description:  Test with replica set name and state in the sample.
+
+        Arguments:
+
+        """
+
+        mock_mongo.create_cmd.return_value = ["command"]
+        mock_cmds.return_value = self.results
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        self.assertFalse(mongo_perf.mongo_stat(self.server, self.args5))
+
+        data = mock_process.call_args[0][0]
+
+        self.assertEqual((data["RepSet"], data["RepState"]), ("spock", "PRI"))
+        self.assertFalse("set" in data["PerfStats"])
+
+    @mock.patch("mongo_perf.sink_funcs")
+    @mock.patch("mongo_perf.daemon_stat")
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_daemon(self, mock_mongo, mock_stat, mock_sinks):
+
+        """Function:  test_daemon
+
+        Description:  Test with daemon mode.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = iter(
+            [{"insert": 1, "time": "timestamp"},
+             {"insert": 2, "time": "timestamp2"}])
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        self.assertFalse(mongo_perf.mongo_stat(self.server, self.args12))
+        mock_stat.assert_called_once_with(self.server, 5.0, self.args12)
+        self.assertFalse(mock_mongo.create_cmd.called)
+        self.assertEqual(mock_process.call_count, 2)
+
+    @mock.patch("mongo_perf.sink_funcs")
+    @mock.patch("mongo_perf.srv_stat")
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_native(self, mock_mongo, mock_stat, mock_sinks):
+
+        """Function:  test_native
+
+        Description:  Test with the native serverStatus collector.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = iter(
+            [{"insert": 1, "time": "timestamp"},
+             {"insert": 2, "time": "timestamp2"}])
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        self.assertFalse(mongo_perf.mongo_stat(self.server, self.args10))
+        mock_stat.assert_called_once_with(self.server, 2, 5.0)
+        self.assertFalse(mock_mongo.create_cmd.called)
+        self.assertEqual(mock_process.call_count, 2)
+
+    @mock.patch("mongo_perf.sink_funcs")
+    @mock.patch("mongo_perf.stream_data")
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_stream(self, mock_mongo, mock_cmds, mock_stream, mock_sinks):
+
+        """Function:  test_stream
+
+        Description:  Test with streaming the mongostat output.
+
+        Arguments:
+
+        """
+
+        mock_mongo.create_cmd.return_value = ["command"]
+        mock_stream.return_value = iter(self.results4)
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        self.assertFalse(mongo_perf.mongo_stat(self.server, self.args9))
+        self.assertFalse(mock_cmds.called)
+        self.assertEqual(mock_process.call_count, 2)
+
+    @mock.patch("mongo_perf.sink_funcs")
+    @mock.patch("mongo_perf.get_data")
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_blank_line(self, mock_mongo, mock_cmds, mock_sinks):
+
+        """Function:  test_blank_line
+
+        Description:  Test with blank line in the mongostat output.
+
+        Arguments:
+
+        """
+
+        mock_mongo.create_cmd.return_value = ["command"]
+        mock_cmds.return_value = self.results5
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        self.assertFalse(mongo_perf.mongo_stat(self.server, self.args5))
+        self.assertEqual(mock_process.call_count, 1)
 
     @mock.patch("mongo_perf.json.dumps", mock.Mock(return_value=True))
     @mock.patch("mongo_perf.gen_libs")
@@ -555,11 +775,12 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mongo_perf.mongo_stat(self.server, self.args4, db_tbl=self.db_tbl))
 
+    @mock.patch("mongo_perf.FileWriter")
     @mock.patch("mongo_perf.json.dumps", mock.Mock(return_value=True))
     @mock.patch("mongo_perf.gen_libs")
     @mock.patch("mongo_perf.get_data")
     @mock.patch("mongo_perf.mongo_libs")
-    def test_write_file(self, mock_mongo, mock_cmds, mock_libs):
+    def test_write_file(self, mock_mongo, mock_cmds, mock_libs, mock_file):
 
         """Function:  test_write_file
 
@@ -575,12 +796,16 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(
             mongo_perf.mongo_stat(self.server, self.args5, ofile=self.ofile))
+        self.assertEqual(mock_file.call_args[0], (self.ofile, "w"))
+        mock_file.return_value.write.assert_called_once_with(True)
+        mock_file.return_value.close.assert_called_once_with()
 
+    @mock.patch("mongo_perf.FileWriter")
     @mock.patch("mongo_perf.json.dumps", mock.Mock(return_value=True))
     @mock.patch("mongo_perf.gen_libs")
     @mock.patch("mongo_perf.get_data")
     @mock.patch("mongo_perf.mongo_libs")
-    def test_append_file(self, mock_mongo, mock_cmds, mock_libs):
+    def test_append_file(self, mock_mongo, mock_cmds, mock_libs, mock_file):
 
         """Function:  test_append_file
 
@@ -598,6 +823,7 @@ class UnitTest(unittest.TestCase):
             mongo_perf.mongo_stat(
                 self.server, self.args3, class_cfg=self.class_cfg,
                 ofile=self.ofile))
+        self.assertEqual(mock_file.call_args[0], (self.ofile, "a"))
 
     @mock.patch("mongo_perf.get_data")
     @mock.patch("mongo_perf.mongo_libs")
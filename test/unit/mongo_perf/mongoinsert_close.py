@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  mongoinsert_close.py
+
+    Description:  Unit testing of MongoInsert.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_flush_fail
+        test_retry_wait
+        test_timer
+        test_not_connected
+        test_spool
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert("mongo_cfg", "sysmon:perf")
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_flush_fail(self, mock_flush, mock_disconn):
+
+        """Function:  test_flush_fail
+
+        Description:  Test with a failed insert of the buffered documents.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (False, "Connection Error")
+
+        self.assertEqual(self.ins_conn.close(), (False, "Connection Error"))
+        self.assertFalse(mock_disconn.called)
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_retry_wait(self, mock_flush):
+
+        """Function:  test_retry_wait
+
+        Description:  Test the buffered documents are inserted without
+            waiting for the next connect attempt.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+        self.ins_conn.retry_time = 1000
+
+        self.ins_conn.close()
+
+        self.assertEqual(self.ins_conn.retry_time, 0)
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_timer(self, mock_flush):
+
+        """Function:  test_timer
+
+        Description:  Test the maximum latency timer is cancelled.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+        timer = mock.Mock()
+        self.ins_conn.timer = timer
+
+        self.ins_conn.close()
+
+        timer.cancel.assert_called_once_with()
+        self.assertIsNone(self.ins_conn.timer)
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    def test_not_connected(self, mock_disconn):
+
+        """Function:  test_not_connected
+
+        Description:  Test with no open connection.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.ins_conn.close(), (True, None))
+        self.assertFalse(mock_disconn.called)
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_spool(self, mock_flush):
+
+        """Function:  test_spool
+
+        Description:  Test the spool replay is finished and the spool closed.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+        self.ins_conn.spool = mock.Mock()
+        self.ins_conn.replayer = mock.Mock()
+
+        self.ins_conn.close()
+
+        self.ins_conn.replayer.join.assert_called_once_with()
+        self.ins_conn.spool.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_close(self, mock_flush, mock_disconn):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+        self.ins_conn.coll = "Coll"
+
+        self.assertEqual(self.ins_conn.close(), (True, None))
+        mock_flush.assert_called_once_with()
+        mock_disconn.assert_called_once_with(["Coll"])
+        self.assertIsNone(self.ins_conn.coll)
+
+
+if __name__ == "__main__":
+    unittest.main()
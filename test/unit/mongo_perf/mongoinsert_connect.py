@@ -0,0 +1,238 @@
+# Classification (U)
+
+"""Program:  mongoinsert_connect.py
+
+    Description:  Unit testing of MongoInsert.connect in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_connect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class DbColl():                                         # pylint:disable=R0903
+
+    """Class:  DbColl
+
+    Description:  Class stub holder for pymongo.collection.Collection class.
+
+    Methods:
+        with_options
+
+    """
+
+    def with_options(self, write_concern):
+
+        """Method:  with_options
+
+        Description:  Stub method holder for Collection.with_options.
+
+        Arguments:
+            (input) write_concern
+
+        """
+
+        return write_concern
+
+
+class Coll():                                           # pylint:disable=R0903
+
+    """Class:  Coll
+
+    Description:  Class stub holder for mongo_class.Coll class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, status=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) status
+
+        """
+
+        self.status = status
+        self.db_coll = DbColl()
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Coll.connect.
+
+        Arguments:
+
+        """
+
+        return self.status, None if self.status else "Connection Error"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_connect_fail_twice
+        test_connect_fail
+        test_write_concern
+        test_timeseries_fail
+        test_timeseries
+        test_connect
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert("mongo_cfg", "sysmon:perf")
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=100))
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_connect_fail_twice(self, mock_coll):
+
+        """Function:  test_connect_fail_twice
+
+        Description:  Test the wait increases after each failed connect.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll(status=False)
+
+        self.ins_conn.connect()
+        self.ins_conn.connect()
+
+        self.assertEqual(
+            (self.ins_conn.retry_time, self.ins_conn.backoff), (102, 4))
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=100))
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_connect_fail(self, mock_coll):
+
+        """Function:  test_connect_fail
+
+        Description:  Test with a failed connect.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll(status=False)
+
+        self.assertEqual(
+            self.ins_conn.connect(), (False, "Connection Error"))
+        self.assertIsNone(self.ins_conn.coll)
+        self.assertEqual(self.ins_conn.retry_time, 101)
+
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_write_concern(self, mock_coll):
+
+        """Function:  test_write_concern
+
+        Description:  Test with a write concern.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll()
+        ins_conn = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", write_concern="majority")
+
+        self.assertEqual(ins_conn.connect(), (True, None))
+        self.assertEqual(ins_conn.db_coll.document, {"w": "majority"})
+
+    @mock.patch("mongo_perf.MongoInsert.create_timeseries")
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_timeseries_fail(self, mock_coll, mock_create):
+
+        """Function:  test_timeseries_fail
+
+        Description:  Test with a failed create of the time-series collection.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll()
+        mock_create.return_value = (False, "Create Error")
+        self.ins_conn.timeseries = "seconds"
+
+        self.assertEqual(self.ins_conn.connect(), (False, "Create Error"))
+        self.assertIsNone(self.ins_conn.coll)
+        self.assertEqual(self.ins_conn.backoff, 2)
+
+    @mock.patch("mongo_perf.MongoInsert.create_timeseries")
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_timeseries(self, mock_coll, mock_create):
+
+        """Function:  test_timeseries
+
+        Description:  Test the time-series collection is created.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll()
+        mock_create.return_value = (True, None)
+        self.ins_conn.timeseries = "seconds"
+
+        self.assertEqual(self.ins_conn.connect(), (True, None))
+        mock_create.assert_called_once_with()
+
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_connect(self, mock_coll):
+
+        """Function:  test_connect
+
+        Description:  Test connect method.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll()
+
+        self.assertEqual(self.ins_conn.connect(), (True, None))
+        self.assertEqual(self.ins_conn.db_coll, mock_coll.return_value.db_coll)
+        mock_coll.assert_called_once_with("mongo_cfg", "sysmon", "perf")
+
+
+if __name__ == "__main__":
+    unittest.main()
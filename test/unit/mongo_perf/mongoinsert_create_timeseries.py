@@ -0,0 +1,218 @@
+# Classification (U)
+
+"""Program:  mongoinsert_create_timeseries.py
+
+    Description:  Unit testing of MongoInsert.create_timeseries in
+        mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_create_timeseries.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Database():
+
+    """Class:  Database
+
+    Description:  Class stub holder for pymongo.database.Database class.
+
+    Methods:
+        __init__
+        list_collection_names
+        create_collection
+
+    """
+
+    def __init__(self, names=None, error=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) names
+            (input) error
+
+        """
+
+        self.names = list(names or [])
+        self.error = error
+        self.created = None
+
+    def list_collection_names(self, filter=None):   # pylint:disable=W0622
+
+        """Method:  list_collection_names
+
+        Description:  Stub method holder for
+            Database.list_collection_names.
+
+        Arguments:
+            (input) filter
+
+        """
+
+        return [name for name in self.names if name == filter["name"]]
+
+    def create_collection(self, name, **kwargs):
+
+        """Method:  create_collection
+
+        Description:  Stub method holder for Database.create_collection.
+
+        Arguments:
+            (input) name
+            (input) kwargs
+
+        """
+
+        if self.error:
+            raise self.error
+
+        self.created = (name, kwargs)
+
+
+class DbColl():                                         # pylint:disable=R0903
+
+    """Class:  DbColl
+
+    Description:  Class stub holder for pymongo.collection.Collection class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, database):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) database
+
+        """
+
+        self.database = database
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exists
+        test_created_by_other
+        test_create_fail
+        test_create_timeseries
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", timeseries="minutes")
+        self.ins_conn.coll = "Coll"
+
+    def test_exists(self):
+
+        """Function:  test_exists
+
+        Description:  Test with an existing collection.
+
+        Arguments:
+
+        """
+
+        database = Database(names=["perf"])
+        self.ins_conn.db_coll = DbColl(database)
+
+        self.assertEqual(self.ins_conn.create_timeseries(), (True, None))
+        self.assertIsNone(database.created)
+
+    def test_created_by_other(self):
+
+        """Function:  test_created_by_other
+
+        Description:  Test with the collection created by another process.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.db_coll = DbColl(
+            Database(error=pymongo.errors.CollectionInvalid("exists")))
+
+        self.assertEqual(self.ins_conn.create_timeseries(), (True, None))
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    def test_create_fail(self, mock_disconn):
+
+        """Function:  test_create_fail
+
+        Description:  Test with a failed create.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.db_coll = DbColl(
+            Database(error=pymongo.errors.OperationFailure("Not supported")))
+
+        status = self.ins_conn.create_timeseries()
+
+        self.assertFalse(status[0])
+        mock_disconn.assert_called_once_with(["Coll"])
+
+    def test_create_timeseries(self):
+
+        """Function:  test_create_timeseries
+
+        Description:  Test create_timeseries method.
+
+        Arguments:
+
+        """
+
+        database = Database()
+        self.ins_conn.db_coll = DbColl(database)
+
+        self.assertEqual(self.ins_conn.create_timeseries(), (True, None))
+        self.assertEqual(
+            database.created,
+            ("perf", {"timeseries": {"timeField": "AsOf", "metaField": "Meta",
+                                     "granularity": "minutes"}}))
+
+
+if __name__ == "__main__":
+    unittest.main()
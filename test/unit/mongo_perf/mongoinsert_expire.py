@@ -0,0 +1,195 @@
+# Classification (U)
+
+"""Program:  mongoinsert_expire.py
+
+    Description:  Unit testing of MongoInsert.expire in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_expire.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cancelled
+        test_no_docs
+        test_newer_batch
+        test_flush_fail
+        test_timer
+        test_expire
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", batch_size=10, max_latency=5)
+        self.ins_conn.docs = [{"Server": "ServerName"}]
+        self.ins_conn.first_time = 100
+        self.ins_conn.timer = threading.current_thread()
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_cancelled(self, mock_flush):
+
+        """Function:  test_cancelled
+
+        Description:  Test with a timer cancelled by close.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.timer = None
+
+        self.ins_conn.expire()
+
+        self.assertFalse(mock_flush.called)
+
+    @mock.patch("mongo_perf.MongoInsert.start_timer")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_no_docs(self, mock_flush, mock_timer):
+
+        """Function:  test_no_docs
+
+        Description:  Test with the batch already inserted.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.docs = []
+
+        self.ins_conn.expire()
+
+        self.assertFalse(mock_flush.called)
+        self.assertFalse(mock_timer.called)
+        self.assertIsNone(self.ins_conn.timer)
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=102))
+    @mock.patch("mongo_perf.MongoInsert.start_timer")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_newer_batch(self, mock_flush, mock_timer):
+
+        """Function:  test_newer_batch
+
+        Description:  Test with a newer batch than the timer was started
+            for.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.expire()
+
+        self.assertFalse(mock_flush.called)
+        mock_timer.assert_called_once_with(3)
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=105))
+    @mock.patch("mongo_perf.MongoInsert.start_timer")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_flush_fail(self, mock_flush, mock_timer):
+
+        """Function:  test_flush_fail
+
+        Description:  Test the timer is started again for the next connect
+            attempt when the documents are kept.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (False, "Connection Error")
+        self.ins_conn.retry_time = 0
+
+        with gen_libs.no_std_out():
+            self.ins_conn.expire()
+
+        mock_flush.assert_called_once_with()
+        mock_timer.assert_called_once_with(1)
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_timer(self, mock_flush):
+
+        """Function:  test_timer
+
+        Description:  Test a batch below the batch size is inserted once the
+            maximum latency is reached without another document.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+        ins_conn = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", batch_size=10, max_latency=0.05)
+
+        ins_conn.insert({"Server": "ServerName"})
+        timer = ins_conn.timer
+        self.assertFalse(mock_flush.called)
+
+        timer.join(1)
+
+        mock_flush.assert_called_once_with()
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=105))
+    @mock.patch("mongo_perf.MongoInsert.start_timer")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_expire(self, mock_flush, mock_timer):
+
+        """Function:  test_expire
+
+        Description:  Test expire method.
+
+        Arguments:
+
+        """
+
+        def flush():
+            self.ins_conn.docs = []
+            return True, None
+
+        mock_flush.side_effect = flush
+
+        self.ins_conn.expire()
+
+        mock_flush.assert_called_once_with()
+        self.assertFalse(mock_timer.called)
+        self.assertIsNone(self.ins_conn.timer)
+
+
+if __name__ == "__main__":
+    unittest.main()
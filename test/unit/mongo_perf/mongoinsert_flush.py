@@ -0,0 +1,337 @@
+# Classification (U)
+
+"""Program:  mongoinsert_flush.py
+
+    Description:  Unit testing of MongoInsert.flush in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class DbColl():                                         # pylint:disable=R0903
+
+    """Class:  DbColl
+
+    Description:  Class stub holder for pymongo.collection.Collection class.
+
+    Methods:
+        __init__
+        insert_many
+
+    """
+
+    def __init__(self, error=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) error
+
+        """
+
+        self.error = error
+        self.docs = []
+        self.ordered = None
+
+    def insert_many(self, docs, ordered=True):
+
+        """Method:  insert_many
+
+        Description:  Stub method holder for Collection.insert_many.
+
+        Arguments:
+            (input) docs
+            (input) ordered
+
+        """
+
+        if self.error:
+            raise self.error
+
+        self.docs.append(list(docs))
+        self.ordered = ordered
+
+
+class Coll():                                           # pylint:disable=R0903
+
+    """Class:  Coll
+
+    Description:  Class stub holder for mongo_class.Coll class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, error=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) error
+
+        """
+
+        self.db_coll = DbColl(error)
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Coll.connect.
+
+        Arguments:
+
+        """
+
+        return True, None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_docs
+        test_waiting_retry
+        test_connect_fail
+        test_bulk_write_error
+        test_insert_fail
+        test_unordered
+        test_spool_connect_fail
+        test_spool_insert_fail
+        test_spool_replay
+        test_flush
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert("mongo_cfg", "sysmon:perf")
+        self.docs = [{"Server": "ServerName"}, {"Server": "ServerName2"}]
+        self.ins_conn.docs = list(self.docs)
+
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_no_docs(self, mock_coll):
+
+        """Function:  test_no_docs
+
+        Description:  Test with no buffered documents.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.docs = []
+
+        self.assertEqual(self.ins_conn.flush(), (True, None))
+        self.assertFalse(mock_coll.called)
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=100))
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_waiting_retry(self, mock_coll):
+
+        """Function:  test_waiting_retry
+
+        Description:  Test with flush before the next connect attempt.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.retry_time = 105
+
+        self.assertFalse(self.ins_conn.flush()[0])
+        self.assertFalse(mock_coll.called)
+        self.assertEqual(self.ins_conn.docs, self.docs)
+
+    @mock.patch("mongo_perf.MongoInsert.connect")
+    def test_connect_fail(self, mock_connect):
+
+        """Function:  test_connect_fail
+
+        Description:  Test with a failed connect.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = (False, "Connection Error")
+
+        self.assertEqual(self.ins_conn.flush(), (False, "Connection Error"))
+        self.assertEqual(self.ins_conn.docs, self.docs)
+
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_bulk_write_error(self, mock_coll):
+
+        """Function:  test_bulk_write_error
+
+        Description:  Test the documents are dropped when the server rejects
+            them.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll(
+            pymongo.errors.BulkWriteError({"writeErrors": []}))
+
+        self.assertFalse(self.ins_conn.flush()[0])
+        self.assertEqual(self.ins_conn.docs, [])
+        self.assertTrue(self.ins_conn.coll)
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_insert_fail(self, mock_coll, mock_disconn):
+
+        """Function:  test_insert_fail
+
+        Description:  Test the documents are kept when the connection is lost
+            during the insert.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll(ConnectionError("Connection lost"))
+        mock_disconn.return_value = True
+
+        self.assertEqual(self.ins_conn.flush(), (False, "Connection lost"))
+        self.assertEqual(self.ins_conn.docs, self.docs)
+        self.assertIsNone(self.ins_conn.coll)
+        self.assertEqual(self.ins_conn.backoff, 2)
+
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_unordered(self, mock_coll):
+
+        """Function:  test_unordered
+
+        Description:  Test with unordered inserts.
+
+        Arguments:
+
+        """
+
+        coll = Coll()
+        mock_coll.return_value = coll
+        self.ins_conn.ordered = False
+
+        self.ins_conn.flush()
+
+        self.assertFalse(coll.db_coll.ordered)
+
+    @mock.patch("mongo_perf.MongoInsert.connect")
+    def test_spool_connect_fail(self, mock_connect):
+
+        """Function:  test_spool_connect_fail
+
+        Description:  Test the documents are spooled with a failed connect.
+
+        Arguments:
+
+        """
+
+        mock_connect.return_value = (False, "Connection Error")
+        self.ins_conn.spool = mock.Mock()
+
+        self.assertFalse(self.ins_conn.flush()[0])
+        self.ins_conn.spool.append.assert_called_once_with(self.docs)
+        self.assertEqual(self.ins_conn.docs, [])
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_spool_insert_fail(self, mock_coll, mock_disconn):
+
+        """Function:  test_spool_insert_fail
+
+        Description:  Test the documents are spooled when the connection is
+            lost during the insert.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll(ConnectionError("Connection lost"))
+        mock_disconn.return_value = True
+        self.ins_conn.spool = mock.Mock()
+
+        self.assertFalse(self.ins_conn.flush()[0])
+        self.ins_conn.spool.append.assert_called_once_with(self.docs)
+        self.assertEqual(self.ins_conn.docs, [])
+
+    @mock.patch("mongo_perf.MongoInsert.replay")
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_spool_replay(self, mock_coll, mock_replay):
+
+        """Function:  test_spool_replay
+
+        Description:  Test the spool replay is started after an insert.
+
+        Arguments:
+
+        """
+
+        mock_coll.return_value = Coll()
+
+        self.ins_conn.flush()
+
+        mock_replay.assert_called_once_with()
+
+    @mock.patch("mongo_perf.mongo_libs.crt_coll_inst")
+    def test_flush(self, mock_coll):
+
+        """Function:  test_flush
+
+        Description:  Test flush method.
+
+        Arguments:
+
+        """
+
+        coll = Coll()
+        mock_coll.return_value = coll
+
+        self.assertEqual(self.ins_conn.flush(), (True, None))
+        self.assertEqual(coll.db_coll.docs, [self.docs])
+        self.assertTrue(coll.db_coll.ordered)
+        self.assertEqual(self.ins_conn.docs, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+# Classification (U)
+
+"""Program:  mongoinsert_insert.py
+
+    Description:  Unit testing of MongoInsert.insert in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_insert.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_max_pending
+        test_max_latency
+        test_below_max_latency
+        test_timer_running
+        test_below_batch_size
+        test_doc_not_changed
+        test_spool_id
+        test_timeseries
+        test_insert
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert("mongo_cfg", "sysmon:perf")
+        self.ins_conn2 = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", batch_size=10, max_latency=5)
+        self.doc = {"Server": "ServerName"}
+
+    @mock.patch("mongo_perf.MAX_PENDING", 2)
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_max_pending(self, mock_flush):
+
+        """Function:  test_max_pending
+
+        Description:  Test the oldest documents are dropped when the buffer
+            is full.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (False, "Connection Error")
+
+        for item in range(3):
+            self.ins_conn.insert({"Server": item})
+
+        self.assertEqual(self.ins_conn.docs, [{"Server": 1}, {"Server": 2}])
+
+    @mock.patch("mongo_perf.time.monotonic")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_max_latency(self, mock_flush, mock_time):
+
+        """Function:  test_max_latency
+
+        Description:  Test the buffer is inserted when the oldest document
+            reaches the maximum latency.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100, 100, 105, 105]
+        mock_flush.return_value = (True, None)
+
+        self.ins_conn2.insert(self.doc)
+        self.ins_conn2.insert(self.doc)
+
+        mock_flush.assert_called_once_with()
+
+    @mock.patch("mongo_perf.MongoInsert.start_timer")
+    @mock.patch("mongo_perf.time.monotonic")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_below_max_latency(self, mock_flush, mock_time, mock_timer):
+
+        """Function:  test_below_max_latency
+
+        Description:  Test the buffer is kept before the maximum latency and
+            the timer is started for the rest of the maximum latency.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100, 101, 104]
+
+        self.ins_conn2.insert(self.doc)
+        self.ins_conn2.timer = "Timer"
+
+        self.assertEqual(self.ins_conn2.insert(self.doc), (True, None))
+        self.assertFalse(mock_flush.called)
+        self.assertEqual(len(self.ins_conn2.docs), 2)
+        mock_timer.assert_called_once_with(4)
+
+    @mock.patch("mongo_perf.MongoInsert.start_timer")
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_timer_running(self, mock_flush, mock_timer):
+
+        """Function:  test_timer_running
+
+        Description:  Test no timer is started when one is running.
+
+        Arguments:
+
+        """
+
+        self.ins_conn2.timer = "Timer"
+
+        self.ins_conn2.insert(self.doc)
+
+        self.assertFalse(mock_flush.called)
+        self.assertFalse(mock_timer.called)
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_below_batch_size(self, mock_flush):
+
+        """Function:  test_below_batch_size
+
+        Description:  Test the buffer is kept below the batch size.
+
+        Arguments:
+
+        """
+
+        ins_conn = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", batch_size=3)
+
+        ins_conn.insert(self.doc)
+        ins_conn.insert(self.doc)
+
+        self.assertFalse(mock_flush.called)
+        ins_conn.insert(self.doc)
+        mock_flush.assert_called_once_with()
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_doc_not_changed(self, mock_flush):
+
+        """Function:  test_doc_not_changed
+
+        Description:  Test the document passed in is not changed.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+
+        self.ins_conn2.insert(self.doc)
+        self.ins_conn2.docs[0]["_id"] = "ObjectId"
+
+        self.assertEqual(self.doc, {"Server": "ServerName"})
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_spool_id(self, mock_flush):
+
+        """Function:  test_spool_id
+
+        Description:  Test the document is given an _id with a spool.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+        self.ins_conn.spool = "Spool"
+
+        self.ins_conn.insert({"Server": "Server1", "AsOf": "2026-10-18"})
+
+        self.assertEqual(self.ins_conn.docs[0]["_id"],
+                         "Server1|2026-10-18")
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_timeseries(self, mock_flush):
+
+        """Function:  test_timeseries
+
+        Description:  Test the document is reshaped for a time-series
+            collection.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+        self.ins_conn.timeseries = "seconds"
+        self.ins_conn.spool = "Spool"
+
+        self.ins_conn.insert({"Server": "Server1",
+                              "AsOf": "2026-10-18 10:00:01"})
+
+        self.assertEqual(self.ins_conn.docs[0]["Meta"], {"Server": "Server1"})
+        self.assertEqual(self.ins_conn.docs[0]["_id"],
+                         "Server1|2026-10-18 10:00:01")
+
+    @mock.patch("mongo_perf.MongoInsert.flush")
+    def test_insert(self, mock_flush):
+
+        """Function:  test_insert
+
+        Description:  Test insert method.
+
+        Arguments:
+
+        """
+
+        mock_flush.return_value = (True, None)
+
+        self.assertEqual(self.ins_conn.insert(self.doc), (True, None))
+        mock_flush.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
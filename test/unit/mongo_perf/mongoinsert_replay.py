@@ -0,0 +1,116 @@
+# Classification (U)
+
+"""Program:  mongoinsert_replay.py
+
+    Description:  Unit testing of MongoInsert.replay in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_replay.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_pending
+        test_running
+        test_replay
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.spool = mock.Mock()
+        self.spool.pending = True
+        self.ins_conn = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", spool=self.spool)
+
+    @mock.patch("mongo_perf.threading.Thread")
+    def test_no_pending(self, mock_thread):
+
+        """Function:  test_no_pending
+
+        Description:  Test with nothing in the spool.
+
+        Arguments:
+
+        """
+
+        self.spool.pending = False
+
+        self.ins_conn.replay()
+
+        self.assertFalse(mock_thread.called)
+
+    @mock.patch("mongo_perf.threading.Thread")
+    def test_running(self, mock_thread):
+
+        """Function:  test_running
+
+        Description:  Test with a replay already running.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.replayer = mock.Mock()
+        self.ins_conn.replayer.is_alive.return_value = True
+
+        self.ins_conn.replay()
+
+        self.assertFalse(mock_thread.called)
+
+    @mock.patch("mongo_perf.threading.Thread")
+    def test_replay(self, mock_thread):
+
+        """Function:  test_replay
+
+        Description:  Test replay method.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.db_coll = "DbColl"
+
+        self.ins_conn.replay()
+
+        mock_thread.assert_called_once_with(
+            target=self.spool.replay, args=("DbColl",), name="spool-replay",
+            daemon=True)
+        mock_thread.return_value.start.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
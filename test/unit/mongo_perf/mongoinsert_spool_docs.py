@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  mongoinsert_spool_docs.py
+
+    Description:  Unit testing of MongoInsert.spool_docs in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_spool_docs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_spool
+        test_no_docs
+        test_spool_docs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert("mongo_cfg", "sysmon:perf")
+        self.docs = [{"_id": "Server1|1"}]
+        self.ins_conn.docs = list(self.docs)
+
+    def test_no_spool(self):
+
+        """Function:  test_no_spool
+
+        Description:  Test the documents are kept with no spool.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.spool_docs()
+
+        self.assertEqual(self.ins_conn.docs, self.docs)
+
+    def test_no_docs(self):
+
+        """Function:  test_no_docs
+
+        Description:  Test with no buffered documents.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.spool = mock.Mock()
+        self.ins_conn.docs = []
+
+        self.ins_conn.spool_docs()
+
+        self.assertFalse(self.ins_conn.spool.append.called)
+
+    def test_spool_docs(self):
+
+        """Function:  test_spool_docs
+
+        Description:  Test spool_docs method.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.spool = mock.Mock()
+
+        self.ins_conn.spool_docs()
+
+        self.ins_conn.spool.append.assert_called_once_with(self.docs)
+        self.assertEqual(self.ins_conn.docs, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# Classification (U)
+
+"""Program:  mongoinsert_start_timer.py
+
+    Description:  Unit testing of MongoInsert.start_timer in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongoinsert_start_timer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_start_timer
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.ins_conn = mongo_perf.MongoInsert(
+            "mongo_cfg", "sysmon:perf", batch_size=10, max_latency=5)
+
+    @mock.patch("mongo_perf.threading.Timer")
+    def test_start_timer(self, mock_timer):
+
+        """Function:  test_start_timer
+
+        Description:  Test start_timer method.
+
+        Arguments:
+
+        """
+
+        self.ins_conn.start_timer(3)
+
+        mock_timer.assert_called_once_with(3, self.ins_conn.expire)
+        self.assertIs(self.ins_conn.timer, mock_timer.return_value)
+        self.assertTrue(self.ins_conn.timer.daemon)
+        self.ins_conn.timer.start.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+# Classification (U)
+
+"""Program:  mongostat_cmd.py
+
+    Description:  Unit testing of mongostat_cmd in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/mongostat_cmd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import types
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mongo", "-d": "config", "-S": True,
+                           "-n": "5"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_server_instance
+        test_replica_set
+        test_no_auth
+        test_path
+        test_flag_option
+        test_mongostat_cmd
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = types.ModuleType("mongo")
+        self.cfg.host = "hostname"
+        self.cfg.port = 27017
+        self.cfg.user = "mongo"
+        self.cfg.japd = "japd"
+        self.cfg.auth = True
+        self.cfg.auth_mech = "SCRAM-SHA-1"
+        self.cfg.repset = None
+        self.cfg.repset_hosts = None
+        self.args = ArgParser()
+        self.req_arg = ["--authenticationDatabase=admin", "--json"]
+        self.opt_arg = {"-n": "-n=", "-r": "--tlsInsecure"}
+
+    @mock.patch("mongo_perf.mongo_libs.create_cmd")
+    def test_server_instance(self, mock_cmd):
+
+        """Function:  test_server_instance
+
+        Description:  Test a database server instance goes through
+            mongo_libs.create_cmd.
+
+        Arguments:
+
+        """
+
+        server = mock.Mock()
+        mock_cmd.return_value = ["mongostat"]
+
+        self.assertEqual(
+            mongo_perf.mongostat_cmd(server, self.args, req_arg=self.req_arg),
+            ["mongostat"])
+        mock_cmd.assert_called_once_with(
+            server, self.args, "mongostat", "-p", req_arg=self.req_arg)
+
+    def test_replica_set(self):
+
+        """Function:  test_replica_set
+
+        Description:  Test with a replica set configuration.
+
+        Arguments:
+
+        """
+
+        self.cfg.repset = "rs0"
+        self.cfg.repset_hosts = "host1:27017, host2"
+
+        self.assertEqual(
+            mongo_perf.mongostat_cmd(self.cfg, self.args)[1],
+            "--host=rs0/host1:27017,host2:27017")
+
+    def test_no_auth(self):
+
+        """Function:  test_no_auth
+
+        Description:  Test with a database without authentication.
+
+        Arguments:
+
+        """
+
+        self.cfg.auth = False
+
+        self.assertEqual(mongo_perf.mongostat_cmd(self.cfg, self.args),
+                         ["mongostat", "--host=hostname:27017"])
+
+    def test_path(self):
+
+        """Function:  test_path
+
+        Description:  Test with the mongostat directory path.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-p"] = "/usr/bin"
+
+        self.assertEqual(mongo_perf.mongostat_cmd(self.cfg, self.args)[0],
+                         "/usr/bin/mongostat")
+
+    def test_flag_option(self):
+
+        """Function:  test_flag_option
+
+        Description:  Test with an additional option without a value.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+
+        self.assertEqual(
+            mongo_perf.mongostat_cmd(
+                self.cfg, self.args, opt_arg=self.opt_arg)[-2:],
+            ["-n=5", "--tlsInsecure"])
+
+    def test_mongostat_cmd(self):
+
+        """Function:  test_mongostat_cmd
+
+        Description:  Test mongostat_cmd function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.mongostat_cmd(
+                self.cfg, self.args, req_arg=self.req_arg,
+                opt_arg=self.opt_arg),
+            ["mongostat", "--host=hostname:27017", "--username=mongo",
+             "--password=japd", "--authenticationMechanism=SCRAM-SHA-1",
+             "--authenticationDatabase=admin", "--json", "-n=5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
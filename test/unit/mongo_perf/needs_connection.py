@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  needs_connection.py
+
+    Description:  Unit testing of needs_connection in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/needs_connection.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mongo", "-d": "config", "-S": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class CfgTest():                                        # pylint:disable=R0903
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.host = "hostname"
+        self.auth_type = None
+        self.ssl_client_ca = None
+        self.tls_ca_certs = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mongo_option
+        test_secure_config
+        test_needs_connection
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args = ArgParser()
+
+    def test_mongo_option(self):
+
+        """Function:  test_mongo_option
+
+        Description:  Test with an option that uses the database connection.
+
+        Arguments:
+
+        """
+
+        for opt in ["-i", "-N", "-R", "-D"]:
+            args = ArgParser()
+            args.args_array[opt] = True
+
+            self.assertTrue(mongo_perf.needs_connection(self.cfg, args))
+
+    def test_secure_config(self):
+
+        """Function:  test_secure_config
+
+        Description:  Test with a database using TLS.
+
+        Arguments:
+
+        """
+
+        self.cfg.tls_ca_certs = "/etc/ssl/ca.pem"
+
+        self.assertTrue(mongo_perf.needs_connection(self.cfg, self.args))
+
+    def test_needs_connection(self):
+
+        """Function:  test_needs_connection
+
+        Description:  Test needs_connection function.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mongo_perf.needs_connection(self.cfg, self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  open_text.py
+
+    Description:  Unit testing of open_text in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/open_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import gzip
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_zstd
+        test_gzip
+        test_open_text
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mongo_perf.zstandard")
+    def test_zstd(self, mock_zstd):
+
+        """Function:  test_zstd
+
+        Description:  Test with a zstd compressed file.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "perf.json.zst")
+        mock_zstd.open.return_value = "FileHandle"
+
+        self.assertEqual(mongo_perf.open_text(fname), "FileHandle")
+        mock_zstd.open.assert_called_once_with(
+            fname, mode="rt", encoding="UTF-8")
+
+    def test_gzip(self):
+
+        """Function:  test_gzip
+
+        Description:  Test with a gzip compressed file.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "perf.json.gz")
+
+        with gzip.open(fname, "wt") as fhdr:
+            fhdr.write("Line1\n")
+
+        with mongo_perf.open_text(fname) as fhdr:
+            self.assertEqual(fhdr.read(), "Line1\n")
+
+    def test_open_text(self):
+
+        """Function:  test_open_text
+
+        Description:  Test open_text function.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "perf.json")
+
+        with open(fname, "w", encoding="UTF-8") as fhdr:
+            fhdr.write("Line1\n")
+
+        with mongo_perf.open_text(fname) as fhdr:
+            self.assertEqual(fhdr.read(), "Line1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
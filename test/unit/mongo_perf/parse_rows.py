@@ -0,0 +1,149 @@
+# Classification (U)
+
+"""Program:  parse_rows.py
+
+    Description:  Unit testing of parse_rows in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/parse_rows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_json_literals
+        test_blank_rows
+        test_no_rows
+        test_multiple_rows
+        test_names
+        test_parse_rows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.row = '{"host1:27017": {"insert": "*0", "time": "10:15:31"}}'
+        self.row2 = '{"host1:27017": {"insert": "5", "time": "10:15:32"}}'
+        self.results = {"insert": "*0", "time": "10:15:31"}
+        self.results2 = {"insert": "5", "time": "10:15:32"}
+
+    def test_json_literals(self):
+
+        """Function:  test_json_literals
+
+        Description:  Test with JSON true, false, and null values.
+
+        Arguments:
+
+        """
+
+        row = '{"host1": {"a": true, "b": false, "c": null}}'
+
+        self.assertEqual(mongo_perf.parse_rows([row]),
+                         [{"a": True, "b": False, "c": None}])
+
+    def test_blank_rows(self):
+
+        """Function:  test_blank_rows
+
+        Description:  Test with blank rows in the chunk.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.parse_rows(["", self.row, "  ", self.row2, ""]),
+            [self.results, self.results2])
+
+    def test_no_rows(self):
+
+        """Function:  test_no_rows
+
+        Description:  Test with no rows.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.parse_rows(["", "\n"]), [])
+
+    def test_multiple_rows(self):
+
+        """Function:  test_multiple_rows
+
+        Description:  Test with multiple rows.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.parse_rows([self.row, self.row2]),
+                         [self.results, self.results2])
+
+    def test_names(self):
+
+        """Function:  test_names
+
+        Description:  Test with the host names, including a row of several
+            hosts.
+
+        Arguments:
+
+        """
+
+        row = '{"host1:27017": {"insert": "1"},' \
+            ' "host2:27017": {"insert": "2"}}'
+
+        self.assertEqual(
+            mongo_perf.parse_rows([row, self.row2], names=True),
+            [("host1:27017", {"insert": "1"}),
+             ("host2:27017", {"insert": "2"}),
+             ("host1:27017", self.results2)])
+
+    def test_parse_rows(self):
+
+        """Function:  test_parse_rows
+
+        Description:  Test parse_rows function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.parse_rows([self.row]), [self.results])
+
+
+if __name__ == "__main__":
+    unittest.main()
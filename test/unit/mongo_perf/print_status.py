@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  print_status.py
+
+    Description:  Unit testing of print_status in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/print_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_workers
+        test_label
+        test_print_status
+
+    """
+
+    def test_no_workers(self):
+
+        """Function:  test_no_workers
+
+        Description:  Test with no outputs to print.
+
+        Arguments:
+
+        """
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as mock_err:
+            mongo_perf.print_status([])
+
+        self.assertEqual(mock_err.getvalue(), "")
+
+    def test_label(self):
+
+        """Function:  test_label
+
+        Description:  Test with a label.
+
+        Arguments:
+
+        """
+
+        runner = mock.Mock()
+        runner.name = "plugin"
+        runner.status.return_value = {"retries": 1}
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err:
+            mongo_perf.print_status([runner], label="Output status")
+
+        self.assertEqual(err.getvalue(),
+                         'Output status:  {"plugin": {"retries": 1}}\n')
+
+    def test_print_status(self):
+
+        """Function:  test_print_status
+
+        Description:  Test print_status function.
+
+        Arguments:
+
+        """
+
+        worker = mock.Mock()
+        worker.name = "mongo"
+        worker.status.return_value = {"depth": 5, "lag": 2.5}
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as mock_err:
+            mongo_perf.print_status([worker])
+
+        self.assertEqual(
+            mock_err.getvalue(),
+            'Output queue status:  {"mongo": {"depth": 5, "lag": 2.5}}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
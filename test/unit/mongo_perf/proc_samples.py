@@ -0,0 +1,529 @@
+# Classification (U)
+
+"""Program:  proc_samples.py
+
+    Description:  Unit testing of proc_samples in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/proc_samples.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-z": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_queued
+        test_no_text_output
+        test_encode_once
+        test_email
+        test_file_closed
+        test_file_options
+        test_append_file
+        test_rep_tags
+        test_rrd_closed
+        test_archive_closed
+        test_metrics_closed
+        test_udp_closed
+        test_digest
+        test_plugin
+        test_retry_status
+        test_failed_plugin
+        test_timers
+        test_standalone_db
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.samples = [
+            ("Server1", {"insert": 1, "time": "10:00:01"}),
+            ("Server2", {"insert": 2, "time": "10:00:01", "set": "spock",
+                         "repl": "SEC"})]
+
+    @mock.patch("mongo_perf.process_json")
+    @mock.patch("mongo_perf.queue_records")
+    def test_queued(self, mock_queue, mock_process):
+
+        """Function:  test_queued
+
+        Description:  Test with the queued outputs option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = ["drop"]
+
+        mongo_perf.proc_samples(self.samples, self.args, db_tbl="db:tbl",
+                                class_cfg="mongo_cfg")
+
+        self.assertEqual(list(mock_queue.call_args[0][1].keys()), ["mongo"])
+        self.assertFalse(mock_process.called)
+
+    @mock.patch("mongo_perf.json.dumps")
+    @mock.patch("mongo_perf.process_json")
+    def test_no_text_output(self, mock_process, mock_dumps):
+
+        """Function:  test_no_text_output
+
+        Description:  Test the sample is not encoded without a text output.
+
+        Arguments:
+
+        """
+
+        mongo_perf.proc_samples(self.samples, self.args, db_tbl="db:tbl",
+                                class_cfg="mongo_cfg")
+
+        self.assertFalse(mock_dumps.called)
+        self.assertEqual(mock_process.call_count, 2)
+
+    @mock.patch("mongo_perf.gen_libs.print_data")
+    @mock.patch("mongo_perf.FileWriter")
+    @mock.patch("mongo_perf.json.dumps")
+    @mock.patch("mongo_perf.gen_class.setup_mail")
+    def test_encode_once(self, mock_mail, mock_dumps, mock_file, mock_print):
+
+        """Function:  test_encode_once
+
+        Description:  Test each sample is encoded once for all outputs.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "email_addr"}
+        mock_dumps.return_value = "JSON"
+
+        mongo_perf.proc_samples(self.samples[:1], self.args, ofile="OutFile")
+
+        mock_dumps.assert_called_once()
+        mock_mail.return_value.add_2_msg.assert_called_once_with("JSON")
+        mock_file.return_value.write.assert_called_once_with("JSON")
+        mock_print.assert_called_once_with("JSON")
+
+    @mock.patch("mongo_perf.process_json", mock.Mock(return_value=True))
+    @mock.patch("mongo_perf.gen_class.setup_mail")
+    def test_email(self, mock_mail):
+
+        """Function:  test_email
+
+        Description:  Test with email option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-t"] = "email_addr"
+
+        self.assertFalse(mongo_perf.proc_samples(self.samples, self.args))
+        self.assertEqual(mock_mail.return_value.add_2_msg.call_count, 2)
+        mock_mail.return_value.send_mail.assert_called_once_with(
+            use_mailx=False)
+
+    @mock.patch("mongo_perf.FileWriter")
+    def test_file_closed(self, mock_file):
+
+        """Function:  test_file_closed
+
+        Description:  Test the output file is closed when a sample fails.
+
+        Arguments:
+
+        """
+
+        self.samples.append(("Server3", {"insert": 3}))
+
+        with self.assertRaises(KeyError):
+            mongo_perf.proc_samples(self.samples, self.args, ofile="OutFile")
+
+        mock_file.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.FileWriter")
+    def test_file_options(self, mock_file):
+
+        """Function:  test_file_options
+
+        Description:  Test with the output file buffer and flush options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-a": True, "-B": ["65536", "100", "5"], "-Y": "30"})
+
+        mongo_perf.proc_samples(self.samples, self.args, ofile="OutFile")
+
+        mock_file.assert_called_once_with(
+            "OutFile", "a", buffer_size=65536, flush_count=100,
+            flush_interval=5.0, fsync_interval=30.0)
+        self.assertEqual(mock_file.return_value.write.call_count, 2)
+
+    @mock.patch("mongo_perf.FileWriter")
+    def test_append_file(self, mock_file):
+
+        """Function:  test_append_file
+
+        Description:  Test the file is opened once and every sample is
+            appended to it.
+
+        Arguments:
+
+        """
+
+        mongo_perf.proc_samples(self.samples, self.args, ofile="OutFile")
+
+        self.assertEqual(mock_file.call_args[0], ("OutFile", "w"))
+        self.assertEqual(mock_file.return_value.write.call_count, 2)
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    @mock.patch("mongo_perf.sink_funcs")
+    def test_rep_tags(self, mock_sinks):
+
+        """Function:  test_rep_tags
+
+        Description:  Test with replica set name and state in the sample.
+
+        Arguments:
+
+        """
+
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        mongo_perf.proc_samples(self.samples, self.args)
+
+        self.assertEqual(
+            mock_process.call_args[0][0],
+            {"Server": "Server2", "AsOf": "2026-10-18 10:00:01",
+             "RepSet": "spock", "RepState": "SEC",
+             "PerfStats": {"insert": 2}})
+
+    @mock.patch("mongo_perf.rrd_update")
+    def test_rrd_closed(self, mock_rrd):
+
+        """Function:  test_rrd_closed
+
+        Description:  Test the round-robin files are closed at the end of the
+            run.
+
+        Arguments:
+
+        """
+
+        store = mock.Mock()
+
+        def update(stores, rrd_dir, data, metrics):  # pylint:disable=W0613
+
+            """Stores a round-robin file."""
+
+            stores[data["Server"]] = store
+
+        mock_rrd.side_effect = update
+        self.args.args_array["-J"] = "/dir"
+
+        mongo_perf.proc_samples(self.samples, self.args)
+
+        self.assertEqual(mock_rrd.call_args[0][1], "/dir")
+        store.close.assert_called_with()
+
+    @mock.patch("mongo_perf.ColumnArchive")
+    def test_archive_closed(self, mock_archive):
+
+        """Function:  test_archive_closed
+
+        Description:  Test the columnar archive is closed at the end of the
+            run.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-X"] = "/dir"
+
+        mongo_perf.proc_samples(self.samples, self.args)
+
+        mock_archive.assert_called_once_with("/dir")
+        self.assertEqual(mock_archive.return_value.append.call_count, 2)
+        mock_archive.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.MetricsServer")
+    @mock.patch("mongo_perf.process_json", mock.Mock())
+    def test_metrics_closed(self, mock_metrics):
+
+        """Function:  test_metrics_closed
+
+        Description:  Test the Prometheus endpoint is stopped at the end of the
+            run.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-g"] = "9216"
+
+        mongo_perf.proc_samples(self.samples, self.args)
+
+        mock_metrics.assert_called_once_with("9216")
+        mock_metrics.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.UdpEmitter")
+    @mock.patch("mongo_perf.process_json", mock.Mock())
+    def test_udp_closed(self, mock_udp):
+
+        """Function:  test_udp_closed
+
+        Description:  Test the UDP emitter is closed at the end of the run.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-M"] = ["localhost:2003", "graphite", "extra"]
+
+        mongo_perf.proc_samples(self.samples, self.args)
+
+        mock_udp.assert_called_once_with("localhost:2003", "graphite")
+        mock_udp.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.MailDigest")
+    @mock.patch("mongo_perf.json.dumps")
+    @mock.patch("mongo_perf.gen_class.setup_mail")
+    @mock.patch("mongo_perf.process_json", mock.Mock())
+    def test_digest(self, mock_mail, mock_dumps, mock_digest):
+
+        """Function:  test_digest
+
+        Description:  Test with the mail digest option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-t": "email_addr", "-q": True})
+        mock_digest.return_value.raw = None
+
+        mongo_perf.proc_samples(self.samples, self.args)
+
+        self.assertFalse(mock_dumps.called)
+        self.assertFalse(mock_mail.return_value.send_mail.called)
+        self.assertEqual(mock_digest.return_value.add.call_count, 2)
+        mock_digest.return_value.send.assert_called_once_with(
+            mock_mail.return_value, use_mailx=False)
+
+    @mock.patch("mongo_perf.create_sinks")
+    def test_plugin(self, mock_sinks):
+
+        """Function:  test_plugin
+
+        Description:  Test with an output plugin.
+
+        Arguments:
+
+        """
+
+        sink = mock.Mock(batch_size=5, max_wait=None, retries=0)
+        mock_sinks.return_value = {"plugin": sink}
+
+        mongo_perf.proc_samples(self.samples, self.args)
+
+        self.assertEqual(len(sink.write_batch.call_args[0][0]), 2)
+        sink.flush.assert_called_once_with()
+        sink.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock())
+    @mock.patch("mongo_perf.create_sinks")
+    def test_retry_status(self, mock_sinks):
+
+        """Function:  test_retry_status
+
+        Description:  Test the output status is printed after a retry.
+
+        Arguments:
+
+        """
+
+        sink = mock.Mock(batch_size=1, max_wait=None, retries=1)
+        sink.write_batch.side_effect = [ValueError("Down"), None, None]
+        mock_sinks.return_value = {"plugin": sink}
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err:
+            mongo_perf.proc_samples(self.samples, self.args)
+
+        self.assertIn('Output status:  {"plugin": {"batches": 2',
+                      err.getvalue())
+
+    def test_failed_plugin(self):
+
+        """Function:  test_failed_plugin
+
+        Description:  Test a plugin that always fails does not stop the
+            other outputs from receiving every record.
+
+        Arguments:
+
+        """
+
+        tmp_dir = tempfile.mkdtemp()
+        ofile = os.path.join(tmp_dir, "out.json")
+        sink = mock.Mock(batch_size=1, max_wait=None, retries=0)
+        sink.write_batch.side_effect = ValueError("Down")
+        sink.close.side_effect = ValueError("Down")
+        self.args.args_array["-e"] = ["plugins:Failed"]
+        self.args.args_array["-f"] = True
+        samples = [("Server1", {"insert": num, "time": "10:00:01"})
+                   for num in range(500)]
+
+        try:
+            with mock.patch("mongo_perf.load_sink",
+                            mock.Mock(return_value=lambda: sink)), \
+                    mock.patch("sys.stdout", new_callable=io.StringIO) \
+                    as out, \
+                    mock.patch("sys.stderr", new_callable=io.StringIO) \
+                    as err:
+                mongo_perf.proc_samples(samples, self.args, ofile=ofile)
+
+            with open(ofile, mode="r", encoding="UTF-8") as fhdr:
+                self.assertEqual(len(fhdr.readlines()), 500)
+
+        finally:
+            shutil.rmtree(tmp_dir)
+
+        self.assertEqual(out.getvalue().count("Output error:  plugins"), 501)
+        self.assertIn('"errors": 501', err.getvalue())
+
+    @mock.patch("mongo_perf.process_json", mock.Mock())
+    def test_timers(self):
+
+        """Function:  test_timers
+
+        Description:  Test with the stage timers option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-j": "60", "-z": True})
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err:
+            mongo_perf.proc_samples(self.samples, self.args, db_tbl="db:tbl",
+                                    class_cfg="Cfg")
+
+        stats = mongo_perf.json.loads(err.getvalue()[15:])
+        self.assertEqual(
+            sorted(stats), ["document", "output_mongo", "sample"])
+        self.assertEqual(stats["output_mongo"]["count"], 2)
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    @mock.patch("mongo_perf.sink_funcs")
+    def test_standalone_db(self, mock_sinks):
+
+        """Function:  test_standalone_db
+
+        Description:  Test with a standalone database.
+
+        Arguments:
+
+        """
+
+        mock_process = mock.Mock()
+        mock_sinks.return_value = {"output": mock_process}
+
+        mongo_perf.proc_samples(self.samples[:1], self.args)
+
+        self.assertEqual(
+            mock_process.call_args[0][0],
+            {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+             "PerfStats": {"insert": 1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
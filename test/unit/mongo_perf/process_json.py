@@ -36,14 +36,12 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_ins_conn_fail
+        test_ins_conn
+        test_copy
         test_insert_fail
         test_insert_success
-        test_std
-        test_no_std
-        test_indent_json
-        test_flatten_json
-        test_write_file
-        test_append_file
+        test_no_insert
         test_mongo
 
     """
@@ -58,14 +56,6 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.no_std = True
-        self.no_std2 = False
-        self.mode = "a"
-        self.mode2 = "w"
-        self.indent = None
-        self.indent2 = 4
-        self.outfile = "OutputFile"
-        self.outfile2 = None
         self.db_tbl = "database:table"
         self.class_cfg = "mongo_config"
         self.data = {"Server": "ServerName",
@@ -74,139 +64,111 @@ class UnitTest(unittest.TestCase):
                      "PerfStats": {1: 11, 'time': 'timestamp'}}
 
     @mock.patch("mongo_perf.mongo_libs")
-    def test_insert_fail(self, mock_mongo):
+    def test_ins_conn_fail(self, mock_mongo):
 
-        """Function:  test_insert_fail
+        """Function:  test_ins_conn_fail
 
-        Description:  Test with failed insert into Mongo.
+        Description:  Test with failed insert using an open connection.
 
         Arguments:
 
         """
 
-        mock_mongo.ins_doc.return_value = (False, "Insert Failed")
+        ins_conn = mock.Mock()
+        ins_conn.insert.return_value = (False, "Insert Failed")
 
         with gen_libs.no_std_out():
             self.assertFalse(mongo_perf.process_json(
-                self.data, self.outfile2, self.indent, self.no_std, self.mode2,
-                db_tbl=self.db_tbl, class_cfg=self.class_cfg))
-
-    @mock.patch("mongo_perf.mongo_libs")
-    def test_insert_success(self, mock_mongo):
-
-        """Function:  test_insert_success
-
-        Description:  Test with successful insert into Mongo.
+                self.data, db_tbl=self.db_tbl, class_cfg=self.class_cfg,
+                ins_conn=ins_conn))
 
-        Arguments:
-
-        """
+        self.assertFalse(mock_mongo.ins_doc.called)
 
-        mock_mongo.ins_doc.return_value = (True, None)
-
-        self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile2, self.indent, self.no_std, self.mode2,
-            db_tbl=self.db_tbl, class_cfg=self.class_cfg))
-
-    @mock.patch("mongo_perf.gen_libs")
-    def test_std(self, mock_libs):
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_ins_conn(self, mock_mongo):
 
-        """Function:  test_std
+        """Function:  test_ins_conn
 
-        Description:  Test with standard out suppressed.
+        Description:  Test with insert using an open connection.
 
         Arguments:
 
         """
 
-        mock_libs.print_data.return_value = True
+        ins_conn = mock.Mock()
+        ins_conn.insert.return_value = (True, None)
 
         self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile2, self.indent, self.no_std, self.mode2))
+            self.data, db_tbl=self.db_tbl, class_cfg=self.class_cfg,
+            ins_conn=ins_conn))
+        ins_conn.insert.assert_called_once_with(self.data)
+        self.assertFalse(mock_mongo.ins_doc.called)
 
-    @mock.patch("mongo_perf.gen_libs")
-    def test_no_std(self, mock_libs):
+    def test_copy(self):
 
-        """Function:  test_no_std
+        """Function:  test_copy
 
-        Description:  Test with no standard out suppressed.
+        Description:  Test the _id the insert adds is not added to the
+            document passed in.
 
         Arguments:
 
         """
 
-        mock_libs.print_data.return_value = True
-
-        self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile2, self.indent, self.no_std2, self.mode2))
-
-    @mock.patch("mongo_perf.json.dumps", mock.Mock(return_value=True))
-    @mock.patch("mongo_perf.gen_libs")
-    def test_indent_json(self, mock_libs):
+        ins_conn = mock.Mock()
+        ins_conn.insert.side_effect = lambda doc: (doc.update(_id=1), None)
 
-        """Function:  test_indent_json
+        mongo_perf.process_json(self.data, ins_conn=ins_conn)
 
-        Description:  Test option to flatten JSON data structure.
+        self.assertNotIn("_id", self.data)
 
-        Arguments:
-
-        """
-
-        mock_libs.write_file.return_value = True
-
-        self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile, self.indent2, self.no_std, self.mode2))
-
-    @mock.patch("mongo_perf.json.dumps", mock.Mock(return_value=True))
-    @mock.patch("mongo_perf.gen_libs")
-    def test_flatten_json(self, mock_libs):
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_insert_fail(self, mock_mongo):
 
-        """Function:  test_flatten_json
+        """Function:  test_insert_fail
 
-        Description:  Test option to flatten JSON data structure.
+        Description:  Test with failed insert into Mongo.
 
         Arguments:
 
         """
 
-        mock_libs.write_file.return_value = True
+        mock_mongo.ins_doc.return_value = (False, "Insert Failed")
 
-        self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile, self.indent, self.no_std, self.mode2))
+        with gen_libs.no_std_out():
+            self.assertFalse(mongo_perf.process_json(
+                self.data, db_tbl=self.db_tbl, class_cfg=self.class_cfg))
 
-    @mock.patch("mongo_perf.json.dumps", mock.Mock(return_value=True))
-    @mock.patch("mongo_perf.gen_libs")
-    def test_write_file(self, mock_libs):
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_insert_success(self, mock_mongo):
 
-        """Function:  test_write_file
+        """Function:  test_insert_success
 
-        Description:  Test write to file.
+        Description:  Test with successful insert into Mongo.
 
         Arguments:
 
         """
 
-        mock_libs.write_file.return_value = True
+        mock_mongo.ins_doc.return_value = (True, None)
 
         self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile, self.indent, self.no_std, self.mode2))
+            self.data, db_tbl=self.db_tbl, class_cfg=self.class_cfg))
 
-    @mock.patch("mongo_perf.json.dumps", mock.Mock(return_value=True))
-    @mock.patch("mongo_perf.gen_libs")
-    def test_append_file(self, mock_libs):
+    @mock.patch("mongo_perf.mongo_libs")
+    def test_no_insert(self, mock_mongo):
 
-        """Function:  test_append_file
+        """Function:  test_no_insert
 
-        Description:  Test option to append to file.
+        Description:  Test with no Mongo configuration.
 
         Arguments:
 
         """
 
-        mock_libs.write_file.return_value = True
-
         self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile, self.indent, self.no_std, self.mode))
+            self.data, db_tbl=self.db_tbl))
+        self.assertFalse(mock_mongo.ins_doc.called)
 
     @mock.patch("mongo_perf.mongo_libs")
     def test_mongo(self, mock_mongo):
@@ -222,8 +184,9 @@ class UnitTest(unittest.TestCase):
         mock_mongo.ins_doc.return_value = (True, None)
 
         self.assertFalse(mongo_perf.process_json(
-            self.data, self.outfile2, self.indent, self.no_std, self.mode2,
-            db_tbl=self.db_tbl, class_cfg=self.class_cfg))
+            self.data, db_tbl=self.db_tbl, class_cfg=self.class_cfg))
+        mock_mongo.ins_doc.assert_called_once_with(
+            self.class_cfg, "database", "table", self.data)
 
 
 if __name__ == "__main__":
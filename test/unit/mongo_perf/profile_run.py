@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  profile_run.py
+
+    Description:  Unit testing of profile_run in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profile_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_error
+        test_output_file
+        test_profile
+        test_profile_run
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("mongo_perf.Profiler")
+    def test_error(self, mock_prof):
+
+        """Function:  test_error
+
+        Description:  Test the profiler is stopped when the function fails.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = ["cprofile"]
+        func = mock.Mock(side_effect=ValueError)
+
+        with self.assertRaises(ValueError):
+            mongo_perf.profile_run(self.args, func)
+
+        mock_prof.return_value.stop.assert_called_once_with()
+
+    @mock.patch("mongo_perf.Profiler")
+    def test_output_file(self, mock_prof):
+
+        """Function:  test_output_file
+
+        Description:  Test the reports are written next to the output file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-P": ["alloc", "30"], "-o": "/dir/perf.json"})
+
+        mongo_perf.profile_run(self.args, mock.Mock())
+
+        mock_prof.assert_called_once_with(
+            "alloc", "30", base="/dir/perf.json")
+
+    @mock.patch("mongo_perf.Profiler")
+    def test_profile(self, mock_prof):
+
+        """Function:  test_profile
+
+        Description:  Test with the profile option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = ["sample"]
+        func = mock.Mock()
+
+        mongo_perf.profile_run(self.args, func, "arg", key="value")
+
+        func.assert_called_once_with("arg", key="value")
+        mock_prof.assert_called_once_with("sample", base="mongo_perf")
+        mock_prof.return_value.start.assert_called_once_with()
+        mock_prof.return_value.stop.assert_called_once_with()
+
+    @mock.patch("mongo_perf.Profiler")
+    def test_profile_run(self, mock_prof):
+
+        """Function:  test_profile_run
+
+        Description:  Test profile_run function.
+
+        Arguments:
+
+        """
+
+        func = mock.Mock()
+
+        mongo_perf.profile_run(self.args, func, "arg", key="value")
+
+        func.assert_called_once_with("arg", key="value")
+        self.assertFalse(mock_prof.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
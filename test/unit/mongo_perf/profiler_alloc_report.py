@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  profiler_alloc_report.py
+
+    Description:  Unit testing of Profiler.alloc_report in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_alloc_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_append
+        test_alloc_report
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.base = os.path.join(self.tmp_dir, "perf.json")
+        self.profiler = mongo_perf.Profiler("alloc", base=self.base)
+        mongo_perf.tracemalloc.start(mongo_perf.ALLOC_FRAMES)
+        self.profiler.first = self.profiler.last = self.profiler.snapshot()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        mongo_perf.tracemalloc.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test the reports are appended.
+
+        Arguments:
+
+        """
+
+        self.profiler.alloc_report()
+        self.profiler.alloc_report()
+
+        with open(self.base + ".alloc.txt", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read().count("Growth since start:"), 2)
+
+    def test_alloc_report(self):
+
+        """Function:  test_alloc_report
+
+        Description:  Test alloc_report method.
+
+        Arguments:
+
+        """
+
+        keep = [str(num) * 10 for num in range(1000)]
+
+        self.profiler.alloc_report()
+
+        with open(self.base + ".alloc.txt", encoding="UTF-8") as fhdr:
+            report = fhdr.read()
+
+        self.assertIn("Since last snapshot:", report)
+        self.assertIn("profiler_alloc_report.py", report)
+        self.assertIsNot(self.profiler.last, self.profiler.first)
+        self.assertEqual(len(keep), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
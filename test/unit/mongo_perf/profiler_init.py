@@ -0,0 +1,84 @@
+# Classification (U)
+
+"""Program:  profiler_init.py
+
+    Description:  Unit testing of Profiler.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_interval
+        test_default_alloc
+        test_init
+
+    """
+
+    def test_interval(self):
+
+        """Function:  test_interval
+
+        Description:  Test with an interval.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.Profiler("sample", "0.5").interval, 0.5)
+
+    def test_default_alloc(self):
+
+        """Function:  test_default_alloc
+
+        Description:  Test the default alloc interval.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.Profiler("alloc").interval, 60.0)
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("sample", base="perf.json")
+
+        self.assertEqual(
+            (profiler.mode, profiler.interval, profiler.base),
+            ("sample", 0.01, "perf.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
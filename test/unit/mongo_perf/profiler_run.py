@@ -0,0 +1,81 @@
+# Classification (U)
+
+"""Program:  profiler_run.py
+
+    Description:  Unit testing of Profiler.run in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_alloc
+        test_run
+
+    """
+
+    def test_alloc(self):
+
+        """Function:  test_alloc
+
+        Description:  Test with the alloc mode.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("alloc")
+        profiler.done.wait = mock.Mock(side_effect=[False, True])
+        profiler.alloc_report = mock.Mock()
+
+        profiler.run()
+
+        profiler.alloc_report.assert_called_once_with()
+
+    def test_run(self):
+
+        """Function:  test_run
+
+        Description:  Test run method.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("sample")
+        profiler.done.wait = mock.Mock(side_effect=[False, False, True])
+        profiler.sample = mock.Mock()
+
+        profiler.run()
+
+        self.assertEqual(profiler.sample.call_count, 2)
+        profiler.done.wait.assert_called_with(0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
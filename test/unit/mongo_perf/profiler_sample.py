@@ -0,0 +1,81 @@
+# Classification (U)
+
+"""Program:  profiler_sample.py
+
+    Description:  Unit testing of Profiler.sample in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_sample.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_thread
+        test_sample
+
+    """
+
+    def test_no_thread(self):
+
+        """Function:  test_no_thread
+
+        Description:  Test with a thread that has ended.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("sample")
+        profiler.ident = -1
+
+        profiler.sample()
+
+        self.assertEqual(profiler.stacks, {})
+
+    def test_sample(self):
+
+        """Function:  test_sample
+
+        Description:  Test sample method.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("sample")
+        profiler.ident = mongo_perf.threading.get_ident()
+
+        profiler.sample()
+        profiler.sample()
+
+        (key, count), = profiler.stacks.items()
+        self.assertTrue(key.endswith(";profiler_sample.py:test_sample;"
+                                     "mongo_perf.py:sample"))
+        self.assertEqual(count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
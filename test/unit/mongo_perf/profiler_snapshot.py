@@ -0,0 +1,65 @@
+# Classification (U)
+
+"""Program:  profiler_snapshot.py
+
+    Description:  Unit testing of Profiler.snapshot in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_snapshot
+
+    """
+
+    def test_snapshot(self):
+
+        """Function:  test_snapshot
+
+        Description:  Test snapshot method.
+
+        Arguments:
+
+        """
+
+        mongo_perf.tracemalloc.start()
+
+        try:
+            snapshot = mongo_perf.Profiler.snapshot()
+
+        finally:
+            mongo_perf.tracemalloc.stop()
+
+        self.assertFalse(
+            [trace for trace in snapshot.traces
+             if trace.traceback[0].filename ==
+             mongo_perf.tracemalloc.__file__])
+
+
+if __name__ == "__main__":
+    unittest.main()
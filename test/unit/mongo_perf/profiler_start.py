@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  profiler_start.py
+
+    Description:  Unit testing of Profiler.start in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_start.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_alloc
+        test_sample
+        test_start
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.base = os.path.join(self.tmp_dir, "perf.json")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_alloc(self):
+
+        """Function:  test_alloc
+
+        Description:  Test with the alloc mode.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("alloc", base=self.base)
+        profiler.start()
+
+        try:
+            self.assertTrue(mongo_perf.tracemalloc.is_tracing())
+            self.assertIs(profiler.first, profiler.last)
+
+        finally:
+            profiler.stop()
+
+    def test_sample(self):
+
+        """Function:  test_sample
+
+        Description:  Test with the sample mode.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("sample", base=self.base)
+        profiler.start()
+
+        try:
+            self.assertTrue(profiler.thread.is_alive())
+            self.assertEqual(profiler.ident, mongo_perf.threading.get_ident())
+
+        finally:
+            profiler.stop()
+
+    def test_start(self):
+
+        """Function:  test_start
+
+        Description:  Test start method.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("cprofile", base=self.base)
+        profiler.start()
+        profiler.stop()
+
+        self.assertIsNotNone(profiler.profile)
+        self.assertIsNone(profiler.thread)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  profiler_stop.py
+
+    Description:  Unit testing of Profiler.stop in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_stop.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_alloc
+        test_sample
+        test_stop
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.base = os.path.join(self.tmp_dir, "perf.json")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_alloc(self):
+
+        """Function:  test_alloc
+
+        Description:  Test with the alloc mode.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("alloc", base=self.base)
+        profiler.start()
+        profiler.stop()
+
+        self.assertFalse(mongo_perf.tracemalloc.is_tracing())
+        self.assertTrue(os.path.exists(self.base + ".alloc.txt"))
+
+    def test_sample(self):
+
+        """Function:  test_sample
+
+        Description:  Test with the sample mode.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("sample", base=self.base)
+        profiler.start()
+        profiler.stop()
+
+        self.assertFalse(profiler.thread.is_alive())
+        self.assertTrue(os.path.exists(self.base + ".stacks"))
+        self.assertTrue(os.path.exists(self.base + ".prof.txt"))
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test stop method.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("cprofile", base=self.base)
+        profiler.start()
+        sorted([3, 1, 2])
+        profiler.stop()
+
+        stats = mongo_perf.pstats.Stats(self.base + ".prof")
+        self.assertTrue(stats.total_calls)
+
+        with open(self.base + ".prof.txt", encoding="UTF-8") as fhdr:
+            self.assertIn("cumulative", fhdr.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  profiler_write_stacks.py
+
+    Description:  Unit testing of Profiler.write_stacks in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/profiler_write_stacks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_write_stacks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.base = os.path.join(self.tmp_dir, "perf.json")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_write_stacks(self):
+
+        """Function:  test_write_stacks
+
+        Description:  Test write_stacks method.
+
+        Arguments:
+
+        """
+
+        profiler = mongo_perf.Profiler("sample", base=self.base)
+        profiler.stacks = {"a:main;a:loop": 3, "a:main;a:loop;b:dumps": 1}
+
+        profiler.write_stacks()
+
+        with open(self.base + ".stacks", encoding="UTF-8") as fhdr:
+            self.assertEqual(
+                fhdr.read(), "a:main;a:loop 3\na:main;a:loop;b:dumps 1\n")
+
+        with open(self.base + ".prof.txt", encoding="UTF-8") as fhdr:
+            lines = fhdr.read().split("\n")
+
+        self.assertEqual(lines[0], "4 samples every 0.01 seconds")
+        self.assertEqual(lines[3].split(), ["75.0", "100.0", "a:loop"])
+        self.assertEqual(lines[4].split(), ["25.0", "25.0", "b:dumps"])
+        self.assertEqual(lines[5].split(), ["0.0", "100.0", "a:main"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  put_samples.py
+
+    Description:  Unit testing of put_samples in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/put_samples.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import queue
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def source(count, fail=False):
+
+    """Function:  source
+
+    Description:  Sample generator for testing.
+
+    Arguments:
+        (input) count -> Number of samples to return
+        (input) fail -> Raise an exception after the samples
+
+    """
+
+    for item in range(count):
+        yield {"insert": item}
+
+    if fail:
+        raise ValueError("Source failure")
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stopped
+        test_source_failure
+        test_put_samples
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.samples = queue.Queue()
+        self.stop = threading.Event()
+        self.name = "host1:27017"
+
+    def test_stopped(self):
+
+        """Function:  test_stopped
+
+        Description:  Test with the source stopped.
+
+        Arguments:
+
+        """
+
+        self.stop.set()
+        mongo_perf.put_samples(self.name, source(2), self.samples, self.stop)
+
+        self.assertEqual(self.samples.get_nowait(), (self.name, None))
+        self.assertTrue(self.samples.empty())
+
+    def test_source_failure(self):
+
+        """Function:  test_source_failure
+
+        Description:  Test with the source raising an exception.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            mongo_perf.put_samples(
+                self.name, source(1, fail=True), self.samples, self.stop)
+
+        self.assertEqual(self.samples.get_nowait(), (self.name, {"insert": 0}))
+        self.assertEqual(self.samples.get_nowait(), (self.name, None))
+
+    def test_put_samples(self):
+
+        """Function:  test_put_samples
+
+        Description:  Test put_samples function.
+
+        Arguments:
+
+        """
+
+        mongo_perf.put_samples(self.name, source(2), self.samples, self.stop)
+
+        self.assertEqual(self.samples.qsize(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
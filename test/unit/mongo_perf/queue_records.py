@@ -0,0 +1,197 @@
+# Classification (U)
+
+"""Program:  queue_records.py
+
+    Description:  Unit testing of queue_records in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/queue_records.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-Q": ["block"]}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_status_interval
+        test_policy_size
+        test_closed_on_error
+        test_queue_records
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.records = iter([({"a": 1}, "text1"), ({"a": 2}, "text2")])
+        self.sinks = {"stdout": mock.Mock()}
+
+    @mock.patch("mongo_perf.print_status")
+    @mock.patch("mongo_perf.SinkWorker")
+    @mock.patch("mongo_perf.time.monotonic")
+    def test_status_interval(self, mock_time, mock_worker, mock_status):
+
+        """Function:  test_status_interval
+
+        Description:  Test the status of an output falling behind is printed.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100, 161, 161, 170]
+        mock_worker.return_value.status.return_value = {"depth": 5}
+        mock_worker.return_value.dropped = 0
+        mock_worker.return_value.errors = 0
+
+        mongo_perf.queue_records(self.records, self.sinks, self.args)
+
+        self.assertEqual(mock_status.call_count, 2)
+        self.assertEqual(mock_status.call_args_list[0][0][0],
+                         [mock_worker.return_value])
+
+    @mock.patch("mongo_perf.print_status", mock.Mock())
+    @mock.patch("mongo_perf.SinkWorker")
+    def test_policy_size(self, mock_worker):
+
+        """Function:  test_policy_size
+
+        Description:  Test with a queue policy and size.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = ["drop", "50"]
+
+        mongo_perf.queue_records(self.records, self.sinks, self.args)
+
+        mock_worker.assert_called_once_with(
+            "stdout", self.sinks["stdout"], "drop", 50)
+
+    @mock.patch("mongo_perf.print_status", mock.Mock())
+    @mock.patch("mongo_perf.SinkWorker")
+    def test_closed_on_error(self, mock_worker):
+
+        """Function:  test_closed_on_error
+
+        Description:  Test the workers are closed when collection fails.
+
+        Arguments:
+
+        """
+
+        def records():
+
+            """Records generator that fails."""
+
+            yield {"a": 1}, "text1"
+            raise ValueError("Collection failed")
+
+        with self.assertRaises(ValueError):
+            mongo_perf.queue_records(records(), self.sinks, self.args)
+
+        mock_worker.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.print_status", mock.Mock())
+    def test_queue_records(self):
+
+        """Function:  test_queue_records
+
+        Description:  Test queue_records function.
+
+        Arguments:
+
+        """
+
+        func = mock.Mock()
+
+        mongo_perf.queue_records(self.records, {"file": func}, self.args)
+
+        self.assertEqual(func.call_args_list,
+                         [mock.call({"a": 1}, "text1"),
+                          mock.call({"a": 2}, "text2")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  read_column.py
+
+    Description:  Unit testing of read_column in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/read_column.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_unknown_metric
+        test_time_range
+        test_skip_block
+        test_read_column
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.stamp = mongo_perf.time.mktime((2026, 10, 18, 10, 0, 1, 0, 0, -1))
+        archive = mongo_perf.ColumnArchive(self.tmp_dir)
+        archive.append({"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                        "PerfStats": {"insert": 5}})
+        archive.append({"Server": "host:27017", "AsOf": "2026-10-18 10:00:02",
+                        "PerfStats": {"insert": 6}})
+        archive.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_unknown_metric(self):
+
+        """Function:  test_unknown_metric
+
+        Description:  Test with a metric that is not in the archive.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.read_column(self.tmp_dir, "host:27017", "query"), [])
+
+    def test_time_range(self):
+
+        """Function:  test_time_range
+
+        Description:  Test with a time range.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.read_column(self.tmp_dir, "host:27017", "insert",
+                                   start=self.stamp + 1, end=self.stamp + 1),
+            [(self.stamp + 1, 6)])
+
+    def test_skip_block(self):
+
+        """Function:  test_skip_block
+
+        Description:  Test a block outside the time range is skipped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.read_column(self.tmp_dir, "host:27017", "insert",
+                                   end=self.stamp - 1), [])
+
+    def test_read_column(self):
+
+        """Function:  test_read_column
+
+        Description:  Test read_column function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.read_column(self.tmp_dir, "host:27017", "insert"),
+            [(self.stamp, 5), (self.stamp + 1, 6)])
+
+
+if __name__ == "__main__":
+    unittest.main()
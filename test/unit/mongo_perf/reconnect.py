@@ -0,0 +1,220 @@
+# Classification (U)
+
+"""Program:  reconnect.py
+
+    Description:  Unit testing of reconnect in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/reconnect.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-D": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+        self.status = [(True, None)]
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        return self.status.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_backoff_limit
+        test_reconnect_fail
+        test_reconnect_suppress
+        test_reconnect
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.args2 = ArgParser()
+        self.args2.args_array["-w"] = True
+
+    @mock.patch("mongo_perf.time.sleep")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    def test_backoff_limit(self, mock_disconn, mock_sleep):
+
+        """Function:  test_backoff_limit
+
+        Description:  Test the wait between attempts is limited.
+
+        Arguments:
+
+        """
+
+        self.server.status = [(False, "Error")] * 4 + [(True, None)]
+
+        mock_disconn.return_value = True
+
+        self.assertEqual(
+            mongo_perf.reconnect(self.server, 100, self.args2, "host1"), 300)
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list],
+            [100, 200, 300, 300, 300])
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    def test_reconnect_fail(self, mock_disconn):
+
+        """Function:  test_reconnect_fail
+
+        Description:  Test with a failed attempt.
+
+        Arguments:
+
+        """
+
+        self.server.status = [(False, "Error"), (True, None)]
+
+        mock_disconn.return_value = True
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mongo_perf.reconnect(self.server, 1, self.args, "host1"), 4)
+
+        self.assertEqual(mock_disconn.call_count, 2)
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    def test_reconnect_suppress(self, mock_disconn):
+
+        """Function:  test_reconnect_suppress
+
+        Description:  Test with a failed attempt with suppression.
+
+        Arguments:
+
+        """
+
+        self.server.status = [(False, "Error"), (True, None)]
+
+        mock_disconn.return_value = True
+
+        self.assertEqual(
+            mongo_perf.reconnect(self.server, 1, self.args2, "host1"), 4)
+
+    @mock.patch("mongo_perf.time.sleep")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    def test_reconnect(self, mock_disconn, mock_sleep):
+
+        """Function:  test_reconnect
+
+        Description:  Test reconnect function.
+
+        Arguments:
+
+        """
+
+        mock_disconn.return_value = True
+
+        self.assertEqual(
+            mongo_perf.reconnect(self.server, 5, self.args, "host1"), 10)
+        mock_sleep.assert_called_once_with(5)
+        mock_disconn.assert_called_once_with([self.server])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+# Classification (U)
+
+"""Program:  replay_samples.py
+
+    Description:  Unit testing of replay_samples in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/replay_samples.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pace_next_day
+        test_pace
+        test_date
+        test_next_day
+        test_out_of_order
+        test_timers
+        test_no_pace
+        test_typed
+        test_replay_samples
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lines = [
+            '{"host1:27017": {"insert": "5", "time": "10:00:01"}}\n',
+            "\n",
+            '{"host1:27017": {"insert": "*3", "time": "10:00:01"},'
+            ' "host2:27017": {"insert": "7", "time": "10:00:01"}}\n',
+            '{"host1:27017": {"insert": "6", "time": "10:00:03"}}\n']
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=100.0))
+    @mock.patch("mongo_perf.time.sleep")
+    def test_pace_next_day(self, mock_sleep):
+
+        """Function:  test_pace_next_day
+
+        Description:  Test pacing across midnight.
+
+        Arguments:
+
+        """
+
+        self.lines[0] = self.lines[0].replace("10:00:01", "23:59:59")
+        self.lines[2] = self.lines[2].replace("10:00:01", "00:00:01")
+        self.lines[3] = self.lines[3].replace("10:00:03", "00:00:03")
+
+        list(mongo_perf.replay_samples(self.lines, pace=True,
+                                       date="2024-05-01"))
+
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list],
+                         [0, 2, 2, 4])
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=100.0))
+    @mock.patch("mongo_perf.time.sleep")
+    def test_pace(self, mock_sleep):
+
+        """Function:  test_pace
+
+        Description:  Test pacing at the recorded times.
+
+        Arguments:
+
+        """
+
+        list(mongo_perf.replay_samples(self.lines, pace=True))
+
+        self.assertEqual([call[0][0] for call in mock_sleep.call_args_list],
+                         [0, 0, 0, 2])
+
+    def test_date(self):
+
+        """Function:  test_date
+
+        Description:  Test the samples are given the capture date.
+
+        Arguments:
+
+        """
+
+        samples = list(mongo_perf.replay_samples(
+            self.lines, date="2024-05-01"))
+
+        self.assertEqual([value["time"] for _, value in samples],
+                         ["2024-05-01 10:00:01"] * 3 + ["2024-05-01 10:00:03"])
+
+    def test_next_day(self):
+
+        """Function:  test_next_day
+
+        Description:  Test the date moves to the next day when the recorded
+            time goes back.
+
+        Arguments:
+
+        """
+
+        self.lines[0] = self.lines[0].replace("10:00:01", "23:59:59")
+        self.lines[2] = self.lines[2].replace("10:00:01", "00:00:01")
+        self.lines[3] = self.lines[3].replace("10:00:03", "9:30:00")
+
+        samples = list(mongo_perf.replay_samples(
+            self.lines, date="2024-12-31"))
+
+        self.assertEqual([value["time"] for _, value in samples],
+                         ["2024-12-31 23:59:59", "2025-01-01 00:00:01",
+                          "2025-01-01 00:00:01", "2025-01-01 09:30:00"])
+
+    def test_out_of_order(self):
+
+        """Function:  test_out_of_order
+
+        Description:  Test a small step back in time stays on the same day.
+
+        Arguments:
+
+        """
+
+        self.lines[3] = self.lines[3].replace("10:00:03", "10:00:00")
+
+        samples = list(mongo_perf.replay_samples(
+            self.lines, date="2024-05-01"))
+
+        self.assertEqual(samples[-1][1]["time"], "2024-05-01 10:00:00")
+
+    def test_timers(self):
+
+        """Function:  test_timers
+
+        Description:  Test the parse and decode stages are timed.
+
+        Arguments:
+
+        """
+
+        timers = mongo_perf.StageTimers(60)
+
+        list(mongo_perf.replay_samples(self.lines, typed=True,
+                                       date="2024-05-01", timers=timers))
+
+        self.assertEqual(timers.run["parse"][0], 4)
+        self.assertEqual(timers.run["decode"][0], 4)
+
+    @mock.patch("mongo_perf.time.sleep")
+    def test_no_pace(self, mock_sleep):
+
+        """Function:  test_no_pace
+
+        Description:  Test the samples are not paced by default.
+
+        Arguments:
+
+        """
+
+        list(mongo_perf.replay_samples(self.lines))
+
+        self.assertFalse(mock_sleep.called)
+
+    def test_typed(self):
+
+        """Function:  test_typed
+
+        Description:  Test with typed statistics.
+
+        Arguments:
+
+        """
+
+        samples = list(mongo_perf.replay_samples(
+            self.lines, typed=True, date="2024-05-01"))
+
+        self.assertEqual(samples[0], ("host1:27017", {
+            "insert": 5, "insert_repl": False,
+            "time": "2024-05-01 10:00:01"}))
+
+    def test_replay_samples(self):
+
+        """Function:  test_replay_samples
+
+        Description:  Test replay_samples function.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_perf.gen_libs.get_date",
+                        mock.Mock(return_value="2026-10-18")):
+            samples = list(mongo_perf.replay_samples(self.lines))
+
+        self.assertEqual(
+            samples,
+            [("host1:27017", {"insert": "5", "time": "2026-10-18 10:00:01"}),
+             ("host1:27017", {"insert": "*3",
+                              "time": "2026-10-18 10:00:01"}),
+             ("host2:27017", {"insert": "7", "time": "2026-10-18 10:00:01"}),
+             ("host1:27017", {"insert": "6",
+                              "time": "2026-10-18 10:00:03"})])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  roundrobin_close.py
+
+    Description:  Unit testing of RoundRobin.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/roundrobin_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "Server1.rrd")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)])
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        store = mongo_perf.RoundRobin(self.fname, metrics=["insert"])
+        store.update(100, {"insert": 1})
+
+        store.close()
+
+        self.assertTrue(store.mmap.closed)
+        self.assertTrue(store.fhandle.closed)
+
+        store = mongo_perf.RoundRobin(self.fname, readonly=True)
+        self.assertEqual(store.rows(1), [(100, {"insert": 1})])
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  roundrobin_create.py
+
+    Description:  Unit testing of RoundRobin.create in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/roundrobin_create.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_long_name
+        test_create
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "Server1.rrd")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)])
+    def test_long_name(self):
+
+        """Function:  test_long_name
+
+        Description:  Test a metric name longer than the name field is left
+            out of the file with a warning.
+
+        Arguments:
+
+        """
+
+        long_name = "plugin_output_stage_timer_p95_us_" + "x" * 7
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err:
+            store = mongo_perf.RoundRobin(
+                self.fname, metrics=["insert", long_name])
+
+        self.assertEqual(store.metrics, ["insert"])
+        self.assertIn(long_name, err.getvalue())
+        store.close()
+
+    @mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)])
+    def test_create(self):
+
+        """Function:  test_create
+
+        Description:  Test create method.
+
+        Arguments:
+
+        """
+
+        store = mongo_perf.RoundRobin(self.fname, metrics=["insert"])
+
+        self.assertEqual(os.path.getsize(self.fname),
+                         16 + 32 + 8 * 2 + 24 * 6)
+        self.assertFalse(os.path.exists(self.fname + ".part"))
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
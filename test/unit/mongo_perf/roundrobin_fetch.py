@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  roundrobin_fetch.py
+
+    Description:  Unit testing of RoundRobin.fetch in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/roundrobin_fetch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_step
+        test_range
+        test_unknown_metric
+        test_fetch
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+        with mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)]):
+            self.store = mongo_perf.RoundRobin(
+                os.path.join(self.tmp_dir, "Server1.rrd"), metrics=["insert"])
+
+        self.store.update(60, {"insert": 1})
+        self.store.update(61, {"insert": 2})
+        self.store.update(63, {"insert": 3})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.store.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_step(self):
+
+        """Function:  test_step
+
+        Description:  Test with an archive step.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.store.fetch("insert", step=60), [(60, 2)])
+
+    def test_range(self):
+
+        """Function:  test_range
+
+        Description:  Test with a time range.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.store.fetch("insert", start=61, end=62), [(61, 2)])
+
+    def test_unknown_metric(self):
+
+        """Function:  test_unknown_metric
+
+        Description:  Test with a metric that is not in the file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.store.fetch("query"), [])
+
+    def test_fetch(self):
+
+        """Function:  test_fetch
+
+        Description:  Test fetch method.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.store.fetch("insert"),
+                         [(60, 1), (61, 2), (63, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  roundrobin_init.py
+
+    Description:  Unit testing of RoundRobin.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/roundrobin_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_rrd
+        test_readonly
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "Server1.rrd")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_not_rrd(self):
+
+        """Function:  test_not_rrd
+
+        Description:  Test with a file that is not a round-robin file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="wb") as fhdr:
+            fhdr.write(b"X" * 64)
+
+        with self.assertRaises(ValueError):
+            mongo_perf.RoundRobin(self.fname)
+
+    @mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)])
+    def test_readonly(self):
+
+        """Function:  test_readonly
+
+        Description:  Test opening an existing file for reading only.
+
+        Arguments:
+
+        """
+
+        mongo_perf.RoundRobin(self.fname, metrics=["insert"]).close()
+
+        store = mongo_perf.RoundRobin(self.fname, readonly=True)
+
+        self.assertEqual(store.metrics, ["insert"])
+        self.assertFalse(store.fhandle.writable())
+        store.close()
+
+    @mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)])
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        store = mongo_perf.RoundRobin(self.fname, metrics=["insert", "res"])
+
+        self.assertEqual(store.metrics, ["insert", "res"])
+        self.assertEqual(store.row.size, 32)
+        self.assertEqual(store.archives,
+                         [(1, 4, 96), (60, 2, 96 + 4 * 32)])
+        store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
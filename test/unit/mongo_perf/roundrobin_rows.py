@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  roundrobin_rows.py
+
+    Description:  Unit testing of RoundRobin.rows in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/roundrobin_rows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_archive
+        test_empty
+        test_rows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+        with mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)]):
+            self.store = mongo_perf.RoundRobin(
+                os.path.join(self.tmp_dir, "Server1.rrd"), metrics=["insert"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.store.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_archive(self):
+
+        """Function:  test_no_archive
+
+        Description:  Test with a step that is not an archive.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.store.rows(5), [])
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty archive.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.store.rows(1), [])
+
+    def test_rows(self):
+
+        """Function:  test_rows
+
+        Description:  Test rows method.
+
+        Arguments:
+
+        """
+
+        self.store.update(103, {"insert": 3})
+        self.store.update(105, {"insert": 5})
+
+        self.assertEqual(self.store.rows(1),
+                         [(103, {"insert": 3}), (105, {"insert": 5})])
+
+
+if __name__ == "__main__":
+    unittest.main()
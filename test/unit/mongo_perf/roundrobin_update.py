@@ -0,0 +1,127 @@
+# Classification (U)
+
+"""Program:  roundrobin_update.py
+
+    Description:  Unit testing of RoundRobin.update in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/roundrobin_update.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_missing_metric
+        test_wrap
+        test_update
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+        with mock.patch("mongo_perf.RRD_ARCHIVES", [(1, 4), (60, 2)]):
+            self.store = mongo_perf.RoundRobin(
+                os.path.join(self.tmp_dir, "Server1.rrd"),
+                metrics=["insert", "res"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.store.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_missing_metric(self):
+
+        """Function:  test_missing_metric
+
+        Description:  Test with a metric missing from the sample.
+
+        Arguments:
+
+        """
+
+        self.store.update(100, {"insert": 4})
+
+        self.assertEqual(self.store.rows(1), [(100, {"insert": 4})])
+
+    def test_wrap(self):
+
+        """Function:  test_wrap
+
+        Description:  Test a row from a previous pass of the archive is started
+            over.
+
+        Arguments:
+
+        """
+
+        self.store.update(100, {"insert": 4, "res": 10})
+        self.store.update(104, {"insert": 8, "res": 20})
+
+        self.assertEqual(self.store.rows(1),
+                         [(104, {"insert": 8, "res": 20})])
+
+    def test_update(self):
+
+        """Function:  test_update
+
+        Description:  Test update method.
+
+        Arguments:
+
+        """
+
+        self.store.update(120, {"insert": 4, "res": 10})
+        self.store.update(121, {"insert": 8, "res": 20})
+
+        self.assertEqual(self.store.rows(60),
+                         [(120, {"insert": 6, "res": 15})])
+        self.assertEqual(len(self.store.rows(1)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
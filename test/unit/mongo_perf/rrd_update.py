@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  rrd_update.py
+
+    Description:  Unit testing of rrd_update in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/rrd_update.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_open_once
+        test_rrd_update
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": "*5", "res": "1G",
+                                   "set": "spock"}}
+
+    @mock.patch("mongo_perf.RoundRobin")
+    def test_open_once(self, mock_rrd):
+
+        """Function:  test_open_once
+
+        Description:  Test the round-robin file is opened on the first sample
+            only.
+
+        Arguments:
+
+        """
+
+        stores = {}
+
+        mongo_perf.rrd_update(stores, "/dir", self.data)
+        mongo_perf.rrd_update(stores, "/dir", self.data)
+
+        mock_rrd.assert_called_once_with(
+            "/dir/host_27017.rrd", metrics=["insert", "res"])
+        self.assertEqual(mock_rrd.return_value.update.call_count, 2)
+
+    def test_rrd_update(self):
+
+        """Function:  test_rrd_update
+
+        Description:  Test rrd_update function.
+
+        Arguments:
+
+        """
+
+        stores = {"host:27017": mock.Mock()}
+
+        mongo_perf.rrd_update(stores, "/dir", self.data)
+
+        stores["host:27017"].update.assert_called_once_with(
+            mongo_perf.time.mktime((2026, 10, 18, 10, 0, 1, 0, 0, -1)),
+            {"insert": 5, "res": 2**30})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,313 @@
+# Classification (U)
+
+"""Program:  run_fleet.py
+
+    Description:  Unit testing of run_fleet in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/run_fleet.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {
+            "-F": ["mongo1", "mongo2"], "-d": "config", "-S": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, status=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) status
+
+        """
+
+        self.status = status
+        self.err_msg = None if status else "Error Connection Message"
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mongo_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        return self.status, self.err_msg
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_insert_config
+        test_no_stats_option
+        test_conn_fail_suppress
+        test_daemon_retry
+        test_connection_fail
+        test_run_fleet
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.server = Server()
+        self.server2 = Server(status=False)
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.proc_samples")
+    @mock.patch("mongo_perf.fleet_samples")
+    @mock.patch("mongo_perf.create_server")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    def test_insert_config(                             # pylint:disable=R0913
+            self, mock_cfg, mock_inst, mock_fleet, mock_proc, mock_disconn):
+
+        """Function:  test_insert_config
+
+        Description:  Test with a Mongo insert configuration file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "mongo_insert"
+
+        mock_cfg.side_effect = ["InsertCfg", "Cfg1", "Cfg2"]
+        mock_inst.side_effect = [self.server, self.server]
+        mock_fleet.return_value = iter([])
+        mock_disconn.return_value = True
+
+        self.assertFalse(mongo_perf.run_fleet(self.args))
+        self.assertEqual(mock_proc.call_args[1]["class_cfg"], "InsertCfg")
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.proc_samples")
+    @mock.patch("mongo_perf.create_server")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    def test_no_stats_option(self, mock_cfg, mock_inst, mock_proc,
+                             mock_disconn):
+
+        """Function:  test_no_stats_option
+
+        Description:  Test with no -S option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-S"]
+
+        mock_cfg.side_effect = ["Cfg1", "Cfg2"]
+        mock_inst.side_effect = [self.server, self.server]
+        mock_disconn.return_value = True
+
+        self.assertFalse(mongo_perf.run_fleet(self.args))
+        self.assertFalse(mock_proc.called)
+        mock_disconn.assert_called_once_with([self.server, self.server])
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.proc_samples")
+    @mock.patch("mongo_perf.fleet_samples")
+    @mock.patch("mongo_perf.create_server")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    def test_conn_fail_suppress(                        # pylint:disable=R0913
+            self, mock_cfg, mock_inst, mock_fleet, mock_proc, mock_disconn):
+
+        """Function:  test_conn_fail_suppress
+
+        Description:  Test with failed connection with suppression.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-w"] = True
+
+        mock_cfg.side_effect = ["Cfg1", "Cfg2"]
+        mock_inst.side_effect = [self.server, self.server2]
+        mock_fleet.return_value = iter([])
+        mock_disconn.return_value = True
+
+        self.assertFalse(mongo_perf.run_fleet(self.args))
+        self.assertEqual(
+            list(mock_fleet.call_args[0][0].keys()), ["mongo1"])
+        self.assertTrue(mock_proc.called)
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.proc_samples")
+    @mock.patch("mongo_perf.fleet_samples")
+    @mock.patch("mongo_perf.create_server")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    def test_daemon_retry(                              # pylint:disable=R0913
+            self, mock_cfg, mock_inst, mock_fleet, mock_proc, mock_disconn):
+
+        """Function:  test_daemon_retry
+
+        Description:  Test a failed connection is retried in daemon mode.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-w"] = True
+        self.args.args_array["-D"] = True
+
+        mock_cfg.side_effect = ["Cfg1", "Cfg2"]
+        mock_inst.side_effect = [self.server2, self.server2]
+        mock_fleet.return_value = iter([])
+        mock_disconn.return_value = True
+
+        self.assertFalse(mongo_perf.run_fleet(self.args))
+        self.assertEqual(mock_fleet.call_args[0][0], {})
+        self.assertEqual(list(mock_fleet.call_args[1]["down"].keys()),
+                         ["mongo1", "mongo2"])
+        self.assertTrue(mock_proc.called)
+        mock_disconn.assert_called_once_with([self.server2, self.server2])
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.proc_samples")
+    @mock.patch("mongo_perf.create_server")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    def test_connection_fail(self, mock_cfg, mock_inst, mock_proc,
+                             mock_disconn):
+
+        """Function:  test_connection_fail
+
+        Description:  Test with all connections failing.
+
+        Arguments:
+
+        """
+
+        mock_cfg.side_effect = ["Cfg1", "Cfg2"]
+        mock_inst.side_effect = [self.server2, self.server2]
+        mock_disconn.return_value = True
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mongo_perf.run_fleet(self.args))
+
+        self.assertFalse(mock_proc.called)
+
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.proc_samples")
+    @mock.patch("mongo_perf.fleet_samples")
+    @mock.patch("mongo_perf.create_server")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    def test_run_fleet(                                 # pylint:disable=R0913
+            self, mock_cfg, mock_inst, mock_fleet, mock_proc, mock_disconn):
+
+        """Function:  test_run_fleet
+
+        Description:  Test run_fleet function.
+
+        Arguments:
+
+        """
+
+        mock_cfg.side_effect = ["Cfg1", "Cfg2"]
+        mock_inst.side_effect = [self.server, self.server]
+        mock_fleet.return_value = iter([])
+        mock_disconn.return_value = True
+
+        self.assertFalse(mongo_perf.run_fleet(self.args))
+        self.assertEqual(mock_fleet.call_args[0][1:], (1, 1.0, 10))
+        self.assertTrue(mock_proc.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -201,6 +201,9 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_no_insert_db
+        test_insert_close_fail
+        test_insert_conn
         test_rep_arg
         test_no_rep_arg
         test_conn_fail_suppress
@@ -209,6 +212,8 @@ class UnitTest(unittest.TestCase):
         test_auth_mech
         test_replica_set
         test_mongo
+        test_secure_config
+        test_no_connection
         test_run_program
 
     """
@@ -230,16 +235,94 @@ class UnitTest(unittest.TestCase):
         self.args2 = ArgParser()
         self.args3 = ArgParser()
         self.args4 = ArgParser()
-        self.args.args_array = {"-m": True, "-d": True, "-c": True, "-S": True}
+        self.args5 = ArgParser()
+        self.args.args_array = {
+            "-m": True, "-d": True, "-c": True, "-S": True, "-N": True}
         self.args2.args_array = {
             "-m": True, "-d": True, "-c": True, "-S": True, "-e": "ToEmail",
-            "-s": "SubjectLine"}
+            "-s": "SubjectLine", "-N": True}
         self.args3.args_array = {"-d": True, "-c": True, "-S": True}
         self.args4.args_array = {
-            "-w": True, "-d": True, "-c": True, "-S": True}
+            "-w": True, "-d": True, "-c": True, "-S": True, "-N": True}
+        self.args5.args_array = {
+            "-m": True, "-d": True, "-c": True, "-S": True,
+            "-i": "sysmon:perf"}
         self.repset_list = ["host1:27017", "host2:27017"]
         self.req_arg_list = ["--authenticationDatabase="]
 
+    @mock.patch("mongo_perf.create_insert")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    @mock.patch("mongo_perf.mongo_libs.create_instance")
+    def test_no_insert_db(self, mock_inst, mock_cfg, mock_disconn,
+                          mock_ins):
+
+        """Function:  test_no_insert_db
+
+        Description:  Test with no Mongo database output.
+
+        Arguments:
+
+        """
+
+        del self.args5.args_array["-m"]
+        mock_inst.return_value = self.server
+        mock_cfg.return_value = self.cfg
+        mock_disconn.return_value = True
+
+        self.assertFalse(mongo_perf.run_program(self.args5, self.func_names))
+        self.assertFalse(mock_ins.called)
+
+    @mock.patch("mongo_perf.create_insert")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    @mock.patch("mongo_perf.mongo_libs.create_instance")
+    def test_insert_close_fail(self, mock_inst, mock_cfg, mock_disconn,
+                               mock_ins):
+
+        """Function:  test_insert_close_fail
+
+        Description:  Test with a failed insert of the buffered documents.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.server
+        mock_cfg.side_effect = [self.cfg, "mongo_cfg"]
+        mock_disconn.return_value = True
+        mock_ins.return_value.close.return_value = (False, "Insert Failed")
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mongo_perf.run_program(self.args5, self.func_names))
+
+        mock_disconn.assert_called_once_with([self.server])
+
+    @mock.patch("mongo_perf.create_insert")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    @mock.patch("mongo_perf.mongo_libs.create_instance")
+    def test_insert_conn(self, mock_inst, mock_cfg, mock_disconn, mock_ins):
+
+        """Function:  test_insert_conn
+
+        Description:  Test the insert connection is kept for the run.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.server
+        mock_cfg.side_effect = [self.cfg, "mongo_cfg"]
+        mock_disconn.return_value = True
+        mock_ins.return_value.close.return_value = (True, None)
+
+        self.assertFalse(mongo_perf.run_program(self.args5, self.func_names))
+        mock_ins.assert_called_once_with(
+            "mongo_cfg", "sysmon:perf", self.args5)
+        mock_ins.return_value.close.assert_called_once_with()
+
     @mock.patch("mongo_perf.mongo_libs.disconnect")
     @mock.patch("mongo_perf.gen_libs.load_module")
     @mock.patch("mongo_perf.mongo_class.RepSet")
@@ -414,6 +497,53 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mongo_perf.run_program(self.args, self.func_names))
 
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.mongo_libs.create_instance")
+    def test_secure_config(self, mock_inst, mock_disconn, mock_cfg):
+
+        """Function:  test_secure_config
+
+        Description:  Test a database using TLS is connected for a mongostat
+            run.
+
+        Arguments:
+
+        """
+
+        self.cfg.tls_ca_certs = "/etc/ssl/ca.pem"
+
+        mock_inst.return_value = self.server
+        mock_disconn.return_value = True
+        mock_cfg.return_value = self.cfg
+
+        self.assertFalse(mongo_perf.run_program(self.args3, self.func_names))
+        mock_disconn.assert_called_once_with([self.server])
+
+    @mock.patch("mongo_perf.gen_libs.load_module")
+    @mock.patch("mongo_perf.mongo_libs.disconnect")
+    @mock.patch("mongo_perf.mongo_libs.create_instance")
+    def test_no_connection(self, mock_inst, mock_disconn, mock_cfg):
+
+        """Function:  test_no_connection
+
+        Description:  Test a mongostat run to standard out makes no database
+            connection.
+
+        Arguments:
+
+        """
+
+        mock_func = mock.Mock()
+        mock_cfg.return_value = self.cfg
+
+        self.assertFalse(
+            mongo_perf.run_program(self.args3, {"-S": mock_func}))
+        self.assertFalse(mock_inst.called)
+        self.assertFalse(mock_disconn.called)
+        self.assertIs(mock_func.call_args[0][0], self.cfg)
+        self.assertIsNone(mock_func.call_args[1]["ins_conn"])
+
     @mock.patch("mongo_perf.gen_libs.load_module")
     @mock.patch("mongo_perf.mongo_libs.disconnect")
     @mock.patch("mongo_perf.mongo_libs.create_instance")
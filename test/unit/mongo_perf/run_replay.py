@@ -0,0 +1,274 @@
+# Classification (U)
+
+"""Program:  run_replay.py
+
+    Description:  Unit testing of run_replay in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/run_replay.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_missing_file
+        test_stdin
+        test_known_date
+        test_file_date
+        test_insert
+        test_run_replay
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.text = '{"host1:27017": {"insert": "5", "time": "10:00:01"},' \
+            ' "host2:27017": {"insert": "7", "time": "10:00:01"}}\n'
+        fname = os.path.join(self.tmp_dir, "mongostat.json")
+
+        with open(fname, "w", encoding="UTF-8") as fhdr:
+            fhdr.write(self.text)
+
+        self.args = ArgParser()
+        self.args.args_array = {"-I": [fname], "-z": True}
+        self.fname = fname
+        self.samples = []
+        self.consume = lambda samples, args, **kwargs: self.samples.extend(
+            samples)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mongo_perf.proc_samples")
+    def test_missing_file(self, mock_proc):
+
+        """Function:  test_missing_file
+
+        Description:  Test with an input file that does not exist.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-I"] = [
+            os.path.join(self.tmp_dir, "none.json")]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as out:
+            mongo_perf.run_replay(self.args)
+
+        self.assertIn("Error:  -I", out.getvalue())
+        self.assertFalse(mock_proc.called)
+
+    @mock.patch("mongo_perf.proc_samples")
+    def test_stdin(self, mock_proc):
+
+        """Function:  test_stdin
+
+        Description:  Test with standard in.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-I"] = ["-"]
+        mock_proc.side_effect = self.consume
+
+        with mock.patch("sys.stdin", io.StringIO(self.text)), \
+                mock.patch("sys.stderr", new_callable=io.StringIO), \
+                mock.patch("mongo_perf.gen_libs.get_date",
+                           mock.Mock(return_value="2026-10-18")):
+            mongo_perf.run_replay(self.args)
+
+        self.assertEqual(self.samples, [
+            ("host1:27017", {"insert": "5", "time": "2026-10-18 10:00:01"}),
+            ("host2:27017", {"insert": "7", "time": "2026-10-18 10:00:01"})])
+
+    def test_known_date(self):
+
+        """Function:  test_known_date
+
+        Description:  Test the output has the capture date given with the
+            -I option.
+
+        Arguments:
+
+        """
+
+        ofile = os.path.join(self.tmp_dir, "perf.json")
+        self.args.args_array["-I"].append("2024-05-01")
+        self.args.args_array.update({"-o": ofile, "-f": True})
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO):
+            mongo_perf.run_replay(self.args)
+
+        with open(ofile, mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(
+                [mongo_perf.json.loads(line)["AsOf"] for line in fhdr],
+                ["2024-05-01 10:00:01"] * 2)
+
+    @mock.patch("mongo_perf.proc_samples")
+    def test_file_date(self, mock_proc):
+
+        """Function:  test_file_date
+
+        Description:  Test the capture date defaults to the date the file
+            was last modified.
+
+        Arguments:
+
+        """
+
+        stamp = mongo_perf.time.mktime((2024, 5, 1, 12, 0, 0, 0, 0, -1))
+        os.utime(self.fname, (stamp, stamp))
+        mock_proc.side_effect = self.consume
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO):
+            mongo_perf.run_replay(self.args)
+
+        self.assertEqual(self.samples[0][1]["time"], "2024-05-01 10:00:01")
+
+    @mock.patch("mongo_perf.create_insert")
+    @mock.patch("mongo_perf.gen_libs")
+    @mock.patch("mongo_perf.proc_samples")
+    def test_insert(self, mock_proc, mock_libs, mock_insert):
+
+        """Function:  test_insert
+
+        Description:  Test with the insert database.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update(
+            {"-i": "db:tbl", "-m": "mongo2", "-d": "config"})
+        mock_libs.load_module.return_value = "Cfg"
+        mock_insert.return_value.close.return_value = (True, None)
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO):
+            mongo_perf.run_replay(self.args)
+
+        mock_insert.assert_called_once_with("Cfg", "db:tbl", self.args)
+        self.assertEqual(mock_proc.call_args[1]["ins_conn"],
+                         mock_insert.return_value)
+        mock_insert.return_value.close.assert_called_once_with()
+
+    @mock.patch("mongo_perf.proc_samples")
+    def test_run_replay(self, mock_proc):
+
+        """Function:  test_run_replay
+
+        Description:  Test run_replay function.
+
+        Arguments:
+
+        """
+
+        mock_proc.side_effect = self.consume
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err:
+            mongo_perf.run_replay(self.args)
+
+        self.assertEqual(len(self.samples), 2)
+        self.assertIs(mock_proc.call_args[0][1], self.args)
+        self.assertTrue(err.getvalue().startswith("Replayed 2 samples in"))
+
+
+if __name__ == "__main__":
+    unittest.main()
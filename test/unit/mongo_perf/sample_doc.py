@@ -0,0 +1,103 @@
+# Classification (U)
+
+"""Program:  sample_doc.py
+
+    Description:  Unit testing of sample_doc in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sample_doc.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_rep_tags
+        test_dated
+        test_sample_doc
+
+    """
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    def test_rep_tags(self):
+
+        """Function:  test_rep_tags
+
+        Description:  Test with replica set name and state in the sample.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.sample_doc(
+                "Server2", {"insert": 2, "time": "10:00:01", "set": "spock",
+                            "repl": "SEC"}),
+            {"Server": "Server2", "AsOf": "2026-10-18 10:00:01",
+             "RepSet": "spock", "RepState": "SEC",
+             "PerfStats": {"insert": 2}})
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    def test_dated(self):
+
+        """Function:  test_dated
+
+        Description:  Test a sample that already has its date keeps it.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.sample_doc(
+                "Server1", {"insert": 1, "time": "2024-05-01 10:00:01"}),
+            {"Server": "Server1", "AsOf": "2024-05-01 10:00:01",
+             "PerfStats": {"insert": 1}})
+
+    @mock.patch("mongo_perf.gen_libs.get_date",
+                mock.Mock(return_value="2026-10-18"))
+    def test_sample_doc(self):
+
+        """Function:  test_sample_doc
+
+        Description:  Test sample_doc function.
+
+        Arguments:
+
+        """
+
+        value = {"insert": 1, "time": "10:00:01"}
+
+        self.assertEqual(
+            mongo_perf.sample_doc("Server1", value),
+            {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+             "PerfStats": {"insert": 1}})
+        self.assertEqual(value, {"insert": 1, "time": "10:00:01"})
+
+
+if __name__ == "__main__":
+    unittest.main()
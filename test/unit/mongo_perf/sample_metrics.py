@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  sample_metrics.py
+
+    Description:  Unit testing of sample_metrics in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sample_metrics.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_typed
+        test_sample_metrics
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"Server": "host:27017", "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": "*5", "insert_repl": "x",
+                                   "res": "1G", "qrw": "1|0",
+                                   "set": "spock"}}
+
+    def test_typed(self):
+
+        """Function:  test_typed
+
+        Description:  Test with typed statistics.
+
+        Arguments:
+
+        """
+
+        self.data["PerfStats"] = {"insert": 5, "insert_repl": True,
+                                  "host": "host"}
+
+        self.assertEqual(mongo_perf.sample_metrics(self.data)[1],
+                         {"insert": 5})
+
+    def test_sample_metrics(self):
+
+        """Function:  test_sample_metrics
+
+        Description:  Test sample_metrics function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.sample_metrics(self.data),
+            (mongo_perf.time.mktime((2026, 10, 18, 10, 0, 1, 0, 0, -1)),
+             {"insert": 5, "qr": 1, "qw": 0, "res": 2**30}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  sample_target.py
+
+    Description:  Unit testing of sample_target in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sample_target.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        adm_cmd
+
+    """
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub method holder for mongo_class.Server.adm_cmd.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        return {"cmd": cmd}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sample_target
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=12.5))
+    def test_sample_target(self):
+
+        """Function:  test_sample_target
+
+        Description:  Test sample_target function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_perf.sample_target(self.server),
+            ({"cmd": "serverStatus"}, 12.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Classification (U)
+
+"""Program:  segmentwriter_close.py
+
+    Description:  Unit testing of SegmentWriter.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/segmentwriter_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_segment
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.writer = mongo_perf.SegmentWriter(
+            os.path.join(self.tmp_dir, "perf.json"), compress="gzip")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_segment(self):
+
+        """Function:  test_no_segment
+
+        Description:  Test with no records written.
+
+        Arguments:
+
+        """
+
+        self.writer.close()
+
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        self.writer.write("Record")
+
+        self.writer.close()
+
+        self.assertFalse(self.writer.worker.thread.is_alive())
+        self.assertEqual(len(os.listdir(self.tmp_dir)), 1)
+        self.assertTrue(os.listdir(self.tmp_dir)[0].endswith(".gz"))
+
+
+if __name__ == "__main__":
+    unittest.main()
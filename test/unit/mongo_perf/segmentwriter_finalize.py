@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  segmentwriter_finalize.py
+
+    Description:  Unit testing of SegmentWriter.finalize in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/segmentwriter_finalize.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_retention
+        test_finalize
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.writer = mongo_perf.SegmentWriter(
+            os.path.join(self.tmp_dir, "perf.json"), compress="gzip")
+        self.writer.write_record("Record")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer.worker.close()
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mongo_perf.SegmentWriter.prune")
+    def test_retention(self, mock_prune):
+
+        """Function:  test_retention
+
+        Description:  Test the old segments are removed with a retention count.
+
+        Arguments:
+
+        """
+
+        self.writer.retention = 1
+
+        self.writer.finalize()
+
+        mock_prune.assert_called_once_with()
+
+    def test_finalize(self):
+
+        """Function:  test_finalize
+
+        Description:  Test finalize method.
+
+        Arguments:
+
+        """
+
+        part = self.writer.part
+
+        self.writer.finalize()
+
+        with mongo_perf.gzip.open(part[:-5], mode="rt",
+                                  encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "Record\n")
+
+        self.assertFalse(os.path.exists(part))
+        self.assertIsNone(self.writer.stream)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  segmentwriter_open_segment.py
+
+    Description:  Unit testing of SegmentWriter.open_segment in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/segmentwriter_open_segment.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_zstd
+        test_gzip
+        test_rotate_interval
+        test_open_segment
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "perf.json")
+        self.writer = mongo_perf.SegmentWriter(self.fname)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer.worker.close()
+        shutil.rmtree(self.tmp_dir)
+
+    @mock.patch("mongo_perf.zstandard")
+    def test_zstd(self, mock_zstd):
+
+        """Function:  test_zstd
+
+        Description:  Test with zstd compression.
+
+        Arguments:
+
+        """
+
+        self.writer.compress = "zstd"
+
+        self.writer.open_segment()
+
+        mock_zstd.ZstdCompressor.return_value.stream_writer\
+            .assert_called_once_with(self.writer.raw, closefd=False)
+        self.writer.raw.close()
+
+    def test_gzip(self):
+
+        """Function:  test_gzip
+
+        Description:  Test with gzip compression.
+
+        Arguments:
+
+        """
+
+        self.writer.compress = "gzip"
+        self.writer.ext = ".gz"
+
+        self.writer.open_segment()
+
+        self.assertIsInstance(self.writer.stream, mongo_perf.gzip.GzipFile)
+        self.assertTrue(self.writer.part.endswith(".gz.part"))
+        self.writer.finalize()
+
+    def test_rotate_interval(self):
+
+        """Function:  test_rotate_interval
+
+        Description:  Test the rotate time is on the next interval boundary.
+
+        Arguments:
+
+        """
+
+        self.writer.rotate_interval = 3600
+
+        with mock.patch("mongo_perf.time.time",
+                        mock.Mock(return_value=7300)):
+            self.writer.open_segment()
+
+        self.assertEqual(self.writer.rotate_time, 10800)
+        self.writer.finalize()
+
+    def test_open_segment(self):
+
+        """Function:  test_open_segment
+
+        Description:  Test open_segment method.
+
+        Arguments:
+
+        """
+
+        self.writer.open_segment()
+
+        self.assertIs(self.writer.stream, self.writer.raw)
+        self.assertTrue(os.path.exists(self.writer.part))
+        self.assertIsNone(self.writer.rotate_time)
+        self.writer.finalize()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  segmentwriter_prune.py
+
+    Description:  Unit testing of SegmentWriter.prune in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/segmentwriter_prune.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_under_retention
+        test_prune
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.writer = mongo_perf.SegmentWriter(
+            os.path.join(self.tmp_dir, "perf.json"), compress="gzip",
+            retention=1)
+
+        for name in ["perf.json", "perf.json." + "1" * 20 + ".gz",
+                     "perf.json." + "2" * 20 + ".gz",
+                     "perf.json." + "3" * 20 + ".gz.part"]:
+            with open(os.path.join(self.tmp_dir, name), mode="w",
+                      encoding="UTF-8"):
+                pass
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer.worker.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_under_retention(self):
+
+        """Function:  test_under_retention
+
+        Description:  Test with fewer segments than the retention count.
+
+        Arguments:
+
+        """
+
+        self.writer.retention = 5
+
+        self.writer.prune()
+
+        self.assertEqual(len(os.listdir(self.tmp_dir)), 4)
+
+    def test_prune(self):
+
+        """Function:  test_prune
+
+        Description:  Test prune method.
+
+        Arguments:
+
+        """
+
+        self.writer.prune()
+
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir)),
+            ["perf.json", "perf.json." + "2" * 20 + ".gz",
+             "perf.json." + "3" * 20 + ".gz.part"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  segmentwriter_write.py
+
+    Description:  Unit testing of SegmentWriter.write in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/segmentwriter_write.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_write
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.writer = mongo_perf.SegmentWriter(
+            os.path.join(self.tmp_dir, "perf.json"))
+        self.worker = self.writer.worker
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.worker.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test write method.
+
+        Arguments:
+
+        """
+
+        self.writer.worker = mock.Mock()
+
+        self.writer.write("Record")
+
+        self.writer.worker.put.assert_called_once_with(None, "Record")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  segmentwriter_write_record.py
+
+    Description:  Unit testing of SegmentWriter.write_record in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/segmentwriter_write_record.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_rotate_size
+        test_rotate_size_gzip
+        test_rotate_time
+        test_write_record
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "perf.json")
+        self.writer = mongo_perf.SegmentWriter(self.fname)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.writer.worker.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def test_rotate_size(self):
+
+        """Function:  test_rotate_size
+
+        Description:  Test a new segment is started at the rotate size.
+
+        Arguments:
+
+        """
+
+        self.writer.rotate_size = 5
+
+        self.writer.write_record("Record 1")
+        self.writer.write_record("Record 2")
+        self.writer.finalize()
+
+        self.assertEqual(len(os.listdir(self.tmp_dir)), 2)
+
+    def test_rotate_size_gzip(self):
+
+        """Function:  test_rotate_size_gzip
+
+        Description:  Test a compressed segment is rotated at the size of
+            the records written, not the bytes the compressor has flushed.
+
+        Arguments:
+
+        """
+
+        self.writer.compress = "gzip"
+        self.writer.ext = ".gz"
+        self.writer.rotate_size = 5000
+
+        for num in range(500):
+            self.writer.write_record(f"Record {num:04} " + "x" * 20)
+
+        self.writer.finalize()
+
+        self.assertEqual(len(os.listdir(self.tmp_dir)), 4)
+
+    def test_rotate_time(self):
+
+        """Function:  test_rotate_time
+
+        Description:  Test a new segment is started at the rotate time.
+
+        Arguments:
+
+        """
+
+        self.writer.write_record("Record 1")
+        self.writer.rotate_time = 100
+
+        with mock.patch("mongo_perf.time.time", mock.Mock(return_value=101)):
+            self.writer.write_record("Record 2")
+
+        self.writer.finalize()
+
+        self.assertEqual(len(os.listdir(self.tmp_dir)), 2)
+
+    def test_write_record(self):
+
+        """Function:  test_write_record
+
+        Description:  Test write_record method.
+
+        Arguments:
+
+        """
+
+        self.writer.write_record("Record 1")
+        self.writer.write_record("Record 2")
+        self.writer.finalize()
+
+        with open(os.path.join(self.tmp_dir, os.listdir(self.tmp_dir)[0]),
+                  mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(fhdr.read(), "Record 1\nRecord 2\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# Classification (U)
+
+"""Program:  sigterm_handler.py
+
+    Description:  Unit testing of sigterm_handler in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sigterm_handler.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import signal
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_sigterm_handler
+
+    """
+
+    def test_sigterm_handler(self):
+
+        """Function:  test_sigterm_handler
+
+        Description:  Test sigterm_handler function.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(SystemExit) as context:
+            mongo_perf.sigterm_handler(signal.SIGTERM, None)
+
+        self.assertEqual(context.exception.code, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# Classification (U)
+
+"""Program:  sink_flush.py
+
+    Description:  Unit testing of Sink.flush in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sink_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_flush
+
+    """
+
+    def test_flush(self):
+
+        """Function:  test_flush
+
+        Description:  Test flush method.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_perf.Sink().flush())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+# Classification (U)
+
+"""Program:  sink_funcs.py
+
+    Description:  Unit testing of sink_funcs in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sink_funcs.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mongo_cfg
+        test_no_outputs
+        test_rrd
+        test_archive
+        test_metrics
+        test_udp
+        test_digest
+        test_decode_once
+        test_sink_funcs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"Server": "Server1", "AsOf": "2024-05-01 10:15:31",
+                     "PerfStats": {"insert": 1}}
+        self.metrics = mongo_perf.sample_metrics(self.data)
+
+    @mock.patch("mongo_perf.process_json")
+    def test_mongo_cfg(self, mock_process):
+
+        """Function:  test_mongo_cfg
+
+        Description:  Test with a Mongo configuration and no open connection.
+
+        Arguments:
+
+        """
+
+        sinks = mongo_perf.sink_funcs(
+            None, True, db_tbl="db:tbl", class_cfg="mongo_cfg")
+        sinks["mongo"](self.data, "text")
+
+        mock_process.assert_called_once_with(
+            self.data, db_tbl="db:tbl", class_cfg="mongo_cfg")
+
+    def test_no_outputs(self):
+
+        """Function:  test_no_outputs
+
+        Description:  Test with no outputs.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.sink_funcs(None, True), {})
+
+    @mock.patch("mongo_perf.rrd_update")
+    def test_rrd(self, mock_rrd):
+
+        """Function:  test_rrd
+
+        Description:  Test with round-robin history.
+
+        Arguments:
+
+        """
+
+        stores = {}
+        sinks = mongo_perf.sink_funcs(
+            None, True, rrd=stores, rrd_dir="/dir")
+        sinks["rrd"](self.data, "text")
+
+        mock_rrd.assert_called_once_with(
+            stores, "/dir", self.data, self.metrics)
+
+    def test_archive(self):
+
+        """Function:  test_archive
+
+        Description:  Test with the columnar archive.
+
+        Arguments:
+
+        """
+
+        archive = mock.Mock()
+        sinks = mongo_perf.sink_funcs(None, True, archive=archive)
+        sinks["archive"](self.data, "text")
+
+        archive.append.assert_called_once_with(self.data, self.metrics)
+
+    def test_metrics(self):
+
+        """Function:  test_metrics
+
+        Description:  Test with the Prometheus endpoint.
+
+        Arguments:
+
+        """
+
+        metrics = mock.Mock()
+        sinks = mongo_perf.sink_funcs(None, True, metrics=metrics)
+        sinks["metrics"](self.data, "text")
+
+        metrics.update.assert_called_once_with(self.data, self.metrics)
+
+    def test_udp(self):
+
+        """Function:  test_udp
+
+        Description:  Test with the UDP emitter.
+
+        Arguments:
+
+        """
+
+        udp = mock.Mock()
+        sinks = mongo_perf.sink_funcs(None, True, udp=udp)
+        sinks["udp"](self.data, "text")
+
+        udp.send.assert_called_once_with(self.data, self.metrics)
+
+    def test_digest(self):
+
+        """Function:  test_digest
+
+        Description:  Test with the mail digest.
+
+        Arguments:
+
+        """
+
+        digest = mock.Mock()
+        sinks = mongo_perf.sink_funcs("Mail", True, digest=digest)
+        sinks["mail"](self.data, "text")
+
+        digest.add.assert_called_once_with(self.data, "text", self.metrics)
+
+    @mock.patch("mongo_perf.rrd_update", mock.Mock())
+    def test_decode_once(self):
+
+        """Function:  test_decode_once
+
+        Description:  Test a record is decoded once for all of the numeric
+            outputs.
+
+        Arguments:
+
+        """
+
+        sinks = mongo_perf.sink_funcs(
+            "Mail", True, rrd={}, rrd_dir="/dir", archive=mock.Mock(),
+            metrics=mock.Mock(), udp=mock.Mock(), digest=mock.Mock())
+
+        with mock.patch("mongo_perf.sample_metrics",
+                        mock.Mock(return_value=self.metrics)) as mock_decode:
+            for name in ["rrd", "archive", "metrics", "udp", "mail"]:
+                sinks[name](self.data, "text")
+
+            sinks["rrd"](dict(self.data), "text")
+
+        self.assertEqual(mock_decode.call_count, 2)
+
+    @mock.patch("mongo_perf.gen_libs.print_data")
+    def test_sink_funcs(self, mock_print):
+
+        """Function:  test_sink_funcs
+
+        Description:  Test sink_funcs function.
+
+        Arguments:
+
+        """
+
+        mail = mock.Mock()
+        file_out = mock.Mock()
+        ins_conn = mock.Mock()
+        ins_conn.insert.return_value = (True, None)
+        sinks = mongo_perf.sink_funcs(
+            mail, False, db_tbl="db:tbl", ins_conn=ins_conn,
+            file_out=file_out)
+
+        for func in sinks.values():
+            func(self.data, "text")
+
+        self.assertEqual(
+            list(sinks.keys()), ["mongo", "file", "stdout", "mail"])
+        ins_conn.insert.assert_called_once_with(self.data)
+        file_out.write.assert_called_once_with("text")
+        mock_print.assert_called_once_with("text")
+        mail.add_2_msg.assert_called_once_with("text")
+
+
+if __name__ == "__main__":
+    unittest.main()
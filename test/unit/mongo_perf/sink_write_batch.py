@@ -0,0 +1,69 @@
+# Classification (U)
+
+"""Program:  sink_write_batch.py
+
+    Description:  Unit testing of Sink.write_batch in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sink_write_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_defaults
+        test_write_batch
+
+    """
+
+    def test_defaults(self):
+
+        """Function:  test_defaults
+
+        Description:  Test the batching defaults.
+
+        Arguments:
+
+        """
+
+        self.assertEqual((mongo_perf.Sink.batch_size, mongo_perf.Sink.max_wait,
+                          mongo_perf.Sink.retries), (1, None, 0))
+
+    def test_write_batch(self):
+
+        """Function:  test_write_batch
+
+        Description:  Test write_batch method.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(NotImplementedError):
+            mongo_perf.Sink().write_batch([({"Server": "Server1"}, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
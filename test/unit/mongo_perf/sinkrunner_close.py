@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  sinkrunner_close.py
+
+    Description:  Unit testing of SinkRunner.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkrunner_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_flush_failed
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = mock.Mock(batch_size=1, max_wait=None, retries=0)
+        self.runner = mongo_perf.SinkRunner("plugin", self.sink)
+
+    def test_flush_failed(self):
+
+        """Function:  test_flush_failed
+
+        Description:  Test the output is closed when the flush fails.
+
+        Arguments:
+
+        """
+
+        self.sink.flush.side_effect = ValueError("Down")
+
+        with self.assertRaises(ValueError):
+            self.runner.close()
+
+        self.sink.close.assert_called_once_with()
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        self.runner.close()
+
+        self.sink.flush.assert_called_once_with()
+        self.sink.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
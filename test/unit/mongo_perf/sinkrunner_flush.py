@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  sinkrunner_flush.py
+
+    Description:  Unit testing of SinkRunner.flush in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkrunner_flush.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_flush
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = mock.Mock(batch_size=1, max_wait=None, retries=0)
+        self.runner = mongo_perf.SinkRunner("plugin", self.sink)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no records in the batch.
+
+        Arguments:
+
+        """
+
+        self.runner.flush()
+
+        self.assertFalse(self.sink.write_batch.called)
+        self.sink.flush.assert_called_once_with()
+
+    def test_flush(self):
+
+        """Function:  test_flush
+
+        Description:  Test flush method.
+
+        Arguments:
+
+        """
+
+        self.sink.batch_size = 5
+        self.runner.write({"insert": 1}, "Text")
+
+        self.runner.flush()
+
+        self.sink.write_batch.assert_called_once_with(
+            [({"insert": 1}, "Text")])
+        self.sink.flush.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  sinkrunner_init.py
+
+    Description:  Unit testing of SinkRunner.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkrunner_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = mock.Mock(batch_size=1, max_wait=None, retries=0)
+        self.runner = mongo_perf.SinkRunner("plugin", self.sink)
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        self.assertEqual((self.runner.name, self.runner.batch), ("plugin", []))
+        self.assertEqual((self.runner.batches, self.runner.records,
+                          self.runner.retries, self.runner.errors),
+                         (0, 0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  sinkrunner_send.py
+
+    Description:  Unit testing of SinkRunner.send in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkrunner_send.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_retry_failed
+        test_retry
+        test_no_retry
+        test_send
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = mock.Mock(batch_size=1, max_wait=None, retries=0)
+        self.runner = mongo_perf.SinkRunner("plugin", self.sink)
+        self.batch = [({"insert": 1}, "Text"), ({"insert": 2}, "Text")]
+        self.runner.batch = list(self.batch)
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock())
+    def test_retry_failed(self):
+
+        """Function:  test_retry_failed
+
+        Description:  Test with a batch that fails every retry.
+
+        Arguments:
+
+        """
+
+        self.sink.retries = 2
+        self.sink.write_batch.side_effect = ValueError("Down")
+
+        with self.assertRaises(ValueError):
+            self.runner.send()
+
+        self.assertEqual(self.sink.write_batch.call_count, 3)
+        self.assertEqual(self.runner.retries, 2)
+        self.assertEqual(self.runner.batches, 0)
+
+    @mock.patch("mongo_perf.time.sleep")
+    def test_retry(self, mock_sleep):
+
+        """Function:  test_retry
+
+        Description:  Test with a batch that succeeds on a retry.
+
+        Arguments:
+
+        """
+
+        self.sink.retries = 2
+        self.sink.write_batch.side_effect = [ValueError("Down"), None]
+
+        self.runner.send()
+
+        mock_sleep.assert_called_once_with(mongo_perf.SINK_RETRY_WAIT)
+        self.assertEqual((self.runner.retries, self.runner.batches), (1, 1))
+
+    def test_no_retry(self):
+
+        """Function:  test_no_retry
+
+        Description:  Test with a failed batch and no retries.
+
+        Arguments:
+
+        """
+
+        self.sink.write_batch.side_effect = ValueError("Down")
+
+        with self.assertRaises(ValueError):
+            self.runner.send()
+
+        self.assertEqual(self.runner.batch, [])
+
+    def test_send(self):
+
+        """Function:  test_send
+
+        Description:  Test send method.
+
+        Arguments:
+
+        """
+
+        self.runner.send()
+
+        self.sink.write_batch.assert_called_once_with(self.batch)
+        self.assertEqual((self.runner.batches, self.runner.records), (1, 2))
+        self.assertEqual(self.runner.batch, [])
+        self.assertGreaterEqual(self.runner.max_seconds, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
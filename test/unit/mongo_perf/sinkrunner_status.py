@@ -0,0 +1,76 @@
+# Classification (U)
+
+"""Program:  sinkrunner_status.py
+
+    Description:  Unit testing of SinkRunner.status in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkrunner_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = mock.Mock(batch_size=1, max_wait=None, retries=0)
+        self.runner = mongo_perf.SinkRunner("plugin", self.sink)
+
+    def test_status(self):
+
+        """Function:  test_status
+
+        Description:  Test status method.
+
+        Arguments:
+
+        """
+
+        self.runner.write({"insert": 1}, "Text")
+        self.runner.seconds = 0.12345
+
+        status = self.runner.status()
+
+        self.assertEqual(
+            (status["batches"], status["records"], status["retries"],
+             status["errors"], status["seconds"]), (1, 1, 0, 0, 0.123))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  sinkrunner_write.py
+
+    Description:  Unit testing of SinkRunner.write in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkrunner_write.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_partial_batch
+        test_max_wait
+        test_full_batch
+        test_write
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sink = mock.Mock(batch_size=1, max_wait=None, retries=0)
+        self.runner = mongo_perf.SinkRunner("plugin", self.sink)
+
+    def test_partial_batch(self):
+
+        """Function:  test_partial_batch
+
+        Description:  Test with a batch that is not full.
+
+        Arguments:
+
+        """
+
+        self.sink.batch_size = 3
+
+        self.runner.write({"insert": 1}, "Text")
+
+        self.assertEqual(self.runner.batch, [({"insert": 1}, "Text")])
+        self.assertFalse(self.sink.write_batch.called)
+
+    def test_max_wait(self):
+
+        """Function:  test_max_wait
+
+        Description:  Test with a batch older than max_wait.
+
+        Arguments:
+
+        """
+
+        self.sink.batch_size = 3
+        self.sink.max_wait = 5
+        self.runner.write({"insert": 1}, "Text")
+        self.runner.batch_time -= 10
+
+        self.runner.write({"insert": 2}, "Text")
+
+        self.sink.write_batch.assert_called_once_with(
+            [({"insert": 1}, "Text"), ({"insert": 2}, "Text")])
+
+    def test_full_batch(self):
+
+        """Function:  test_full_batch
+
+        Description:  Test with a full batch.
+
+        Arguments:
+
+        """
+
+        self.sink.batch_size = 2
+
+        self.runner.write({"insert": 1}, "Text")
+        self.runner.write({"insert": 2}, "Text")
+
+        self.assertEqual(self.sink.write_batch.call_count, 1)
+        self.assertEqual(self.runner.batch, [])
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test write method.
+
+        Arguments:
+
+        """
+
+        self.runner.write({"insert": 1}, "Text")
+
+        self.sink.write_batch.assert_called_once_with(
+            [({"insert": 1}, "Text")])
+
+
+if __name__ == "__main__":
+    unittest.main()
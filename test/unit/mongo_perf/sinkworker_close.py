@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  sinkworker_close.py
+
+    Description:  Unit testing of SinkWorker.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkworker_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_spill
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func = mock.Mock()
+
+    def test_spill(self):
+
+        """Function:  test_spill
+
+        Description:  Test the spilled records are sent before the thread
+            stops.
+
+        Arguments:
+
+        """
+
+        event = threading.Event()
+        self.func.side_effect = lambda data, text: event.wait()
+        worker = mongo_perf.SinkWorker("file", self.func, "spill", 1)
+
+        for item in range(4):
+            worker.put({"a": item}, "text")
+
+        event.set()
+        worker.close()
+
+        self.assertEqual(self.func.call_count, 4)
+        self.assertIsNone(worker.spill)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func)
+        worker.put({"a": 1}, "text1")
+        worker.put({"a": 2}, "text2")
+        worker.close()
+
+        self.assertEqual(self.func.call_count, 2)
+        self.assertFalse(worker.thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
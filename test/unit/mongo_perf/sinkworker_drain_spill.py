@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  sinkworker_drain_spill.py
+
+    Description:  Unit testing of SinkWorker.drain_spill in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkworker_drain_spill.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_spill
+        test_drain_spill
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func = mock.Mock()
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_no_spill(self):
+
+        """Function:  test_no_spill
+
+        Description:  Test with no spilled records.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func, "spill", 1)
+        worker.drain_spill()
+
+        self.assertFalse(self.func.called)
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_drain_spill(self):
+
+        """Function:  test_drain_spill
+
+        Description:  Test drain_spill method.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func, "spill", 1)
+        worker.put({"a": 1}, "text1")
+        worker.put({"a": 2}, "text2")
+        worker.drain_spill()
+
+        self.func.assert_called_once_with({"a": 2}, "text2")
+        self.assertEqual(worker.spilled, 0)
+        worker.spill.seek(0)
+        self.assertEqual(worker.spill.read(), "")
+        worker.spill.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  sinkworker_process.py
+
+    Description:  Unit testing of SinkWorker.process in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkworker_process.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_output_error
+        test_process
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func = mock.Mock()
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=102))
+    def test_output_error(self):
+
+        """Function:  test_output_error
+
+        Description:  Test with an output that fails.
+
+        Arguments:
+
+        """
+
+        self.func.side_effect = OSError("Disk full")
+        worker = mongo_perf.SinkWorker("file", self.func)
+
+        with gen_libs.no_std_out():
+            worker.process((100, {"a": 1}, "text1"))
+
+        self.assertEqual(worker.errors, 1)
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    @mock.patch("mongo_perf.time.monotonic", mock.Mock(return_value=102.5))
+    def test_process(self):
+
+        """Function:  test_process
+
+        Description:  Test process method.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func)
+        worker.process((100, {"a": 1}, "text1"))
+
+        self.func.assert_called_once_with({"a": 1}, "text1")
+        self.assertEqual(worker.lag, 2.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  sinkworker_put.py
+
+    Description:  Unit testing of SinkWorker.put in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkworker_put.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_spill_order
+        test_spill
+        test_drop
+        test_put
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func = mock.Mock()
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_spill_order(self):
+
+        """Function:  test_spill_order
+
+        Description:  Test new records follow the spilled records.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func, "spill", 1)
+        worker.put({"a": 1}, "text1")
+        worker.put({"a": 2}, "text2")
+        worker.queue.get_nowait()
+        worker.put({"a": 3}, "text3")
+
+        self.assertTrue(worker.queue.empty())
+        self.assertEqual(worker.spilled, 2)
+        worker.spill.close()
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_spill(self):
+
+        """Function:  test_spill
+
+        Description:  Test with the spill policy and a full queue.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func, "spill", 1)
+        worker.put({"a": 1}, "text1")
+        worker.put({"a": 2}, "text2")
+
+        worker.spill.seek(0)
+        self.assertEqual(
+            mongo_perf.json.loads(worker.spill.readline())[1:],
+            [{"a": 2}, "text2"])
+        self.assertEqual((worker.queue.qsize(), worker.spilled), (1, 1))
+        worker.spill.close()
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_drop(self):
+
+        """Function:  test_drop
+
+        Description:  Test with the drop policy and a full queue.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func, "drop", 2)
+
+        for item in range(3):
+            worker.put({"a": item}, "text")
+
+        self.assertEqual(
+            [worker.queue.get_nowait()[1] for _ in range(2)],
+            [{"a": 1}, {"a": 2}])
+        self.assertEqual(worker.dropped, 1)
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_put(self):
+
+        """Function:  test_put
+
+        Description:  Test put method.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func, "block", 2)
+        worker.put({"a": 1}, "text1")
+
+        self.assertEqual(worker.queue.get_nowait()[1:], ({"a": 1}, "text1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
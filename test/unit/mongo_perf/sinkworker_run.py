@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  sinkworker_run.py
+
+    Description:  Unit testing of SinkWorker.run in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkworker_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_spill
+        test_run
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func = mock.Mock()
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_spill(self):
+
+        """Function:  test_spill
+
+        Description:  Test the spilled records are sent after the queue.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func, "spill", 1)
+        worker.put({"a": 1}, "text1")
+        worker.put({"a": 2}, "text2")
+        worker.put({"a": 3}, "text3")
+        worker.queue.maxsize = 2
+        worker.queue.put(None)
+        worker.run()
+
+        self.assertEqual([item[0][1] for item in self.func.call_args_list],
+                         ["text1", "text2", "text3"])
+        self.assertEqual(worker.spilled, 0)
+        worker.spill.close()
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_run(self):
+
+        """Function:  test_run
+
+        Description:  Test run method.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", self.func)
+        worker.put({"a": 1}, "text1")
+        worker.queue.put(None)
+        worker.run()
+
+        self.func.assert_called_once_with({"a": 1}, "text1")
+
+
+if __name__ == "__main__":
+    unittest.main()
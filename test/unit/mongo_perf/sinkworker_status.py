@@ -0,0 +1,65 @@
+# Classification (U)
+
+"""Program:  sinkworker_status.py
+
+    Description:  Unit testing of SinkWorker.status in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/sinkworker_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_status
+
+    """
+
+    @mock.patch("mongo_perf.threading.Thread", mock.Mock())
+    def test_status(self):
+
+        """Function:  test_status
+
+        Description:  Test status method.
+
+        Arguments:
+
+        """
+
+        worker = mongo_perf.SinkWorker("file", mock.Mock(), "spill", 1)
+        worker.put({"a": 1}, "text1")
+        worker.put({"a": 2}, "text2")
+        worker.lag = 1.23456
+        worker.dropped = 3
+
+        self.assertEqual(
+            worker.status(),
+            {"depth": 2, "lag": 1.235, "dropped": 3, "errors": 0})
+        worker.spill.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  spool_append.py
+
+    Description:  Unit testing of Spool.append in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/spool_append.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_new_segment
+        test_append
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.docs = [{"_id": "Server1|1", "AsOf": 1}]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_new_segment(self):
+
+        """Function:  test_new_segment
+
+        Description:  Test a new segment is started at the segment size.
+
+        Arguments:
+
+        """
+
+        spool = mongo_perf.Spool(self.tmp_dir, segment_size=10)
+
+        spool.append(self.docs)
+        spool.append(self.docs)
+
+        self.assertIsNone(spool.fhandle)
+        self.assertEqual(len(spool.segments()), 2)
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test append method.
+
+        Arguments:
+
+        """
+
+        spool = mongo_perf.Spool(self.tmp_dir)
+
+        spool.append(self.docs)
+        spool.close()
+
+        with open(spool.segments()[0], mode="r", encoding="UTF-8") as fhdr:
+            self.assertEqual(
+                [mongo_perf.json_util.loads(line) for line in fhdr], self.docs)
+
+        self.assertTrue(spool.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  spool_close.py
+
+    Description:  Unit testing of Spool.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/spool_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_segment
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_segment(self):
+
+        """Function:  test_no_segment
+
+        Description:  Test with no open segment.
+
+        Arguments:
+
+        """
+
+        spool = mongo_perf.Spool(self.tmp_dir)
+
+        spool.close()
+
+        self.assertIsNone(spool.fhandle)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        spool = mongo_perf.Spool(self.tmp_dir)
+        spool.append([{"_id": "Server1|1"}])
+        fhandle = spool.fhandle
+
+        spool.close()
+
+        self.assertTrue(fhandle.closed)
+        self.assertIsNone(spool.fhandle)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+# Classification (U)
+
+"""Program:  spool_replay.py
+
+    Description:  Unit testing of Spool.replay in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/spool_replay.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class DbColl():                                         # pylint:disable=R0903
+
+    """Class:  DbColl
+
+    Description:  Class stub holder for pymongo.collection.Collection class.
+
+    Methods:
+        __init__
+        insert_many
+
+    """
+
+    def __init__(self, errors=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) errors
+
+        """
+
+        self.errors = list(errors or [])
+        self.docs = []
+
+    def insert_many(self, docs, ordered=True):
+
+        """Method:  insert_many
+
+        Description:  Stub method holder for Collection.insert_many.
+
+        Arguments:
+            (input) docs
+            (input) ordered
+
+        """
+
+        self.docs.append((list(docs), ordered))
+
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_insert_fail
+        test_partial_doc
+        test_batches
+        test_replay
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.docs = [{"_id": "Server1|1"}, {"_id": "Server1|2"}]
+        self.spool = mongo_perf.Spool(self.tmp_dir)
+        self.spool.append(self.docs)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_insert_fail(self):
+
+        """Function:  test_insert_fail
+
+        Description:  Test the segment is kept when the insert fails.
+
+        Arguments:
+
+        """
+
+        db_coll = DbColl([ConnectionError("Connection lost")])
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            self.spool.replay(db_coll)
+
+        self.assertEqual(len(self.spool.segments()), 1)
+        self.assertTrue(self.spool.pending)
+
+    def test_partial_doc(self):
+
+        """Function:  test_partial_doc
+
+        Description:  Test a partly written document is skipped.
+
+        Arguments:
+
+        """
+
+        with open(self.spool.segments()[0], mode="a",
+                  encoding="UTF-8") as fhdr:
+            fhdr.write('{"_id": "Ser')
+
+        db_coll = DbColl()
+
+        self.spool.replay(db_coll)
+
+        self.assertEqual(db_coll.docs, [(self.docs, False)])
+
+    @mock.patch("mongo_perf.REPLAY_BATCH", 1)
+    def test_batches(self):
+
+        """Function:  test_batches
+
+        Description:  Test the documents are inserted in batches.
+
+        Arguments:
+
+        """
+
+        db_coll = DbColl()
+
+        self.spool.replay(db_coll)
+
+        self.assertEqual(db_coll.docs,
+                         [(self.docs[:1], False), (self.docs[1:], False)])
+
+    def test_replay(self):
+
+        """Function:  test_replay
+
+        Description:  Test replay method.
+
+        Arguments:
+
+        """
+
+        db_coll = DbColl()
+
+        self.spool.replay(db_coll)
+
+        self.assertEqual(db_coll.docs, [(self.docs, False)])
+        self.assertEqual(self.spool.segments(), [])
+        self.assertFalse(self.spool.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
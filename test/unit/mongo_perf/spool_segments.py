@@ -0,0 +1,126 @@
+# Classification (U)
+
+"""Program:  spool_segments.py
+
+    Description:  Unit testing of Spool.segments in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/spool_segments.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_segments
+        test_existing_segments
+        test_segments
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_segments(self):
+
+        """Function:  test_no_segments
+
+        Description:  Test with an empty spool.
+
+        Arguments:
+
+        """
+
+        spool = mongo_perf.Spool(self.tmp_dir)
+
+        self.assertEqual(spool.segments(), [])
+        self.assertFalse(spool.pending)
+
+    def test_existing_segments(self):
+
+        """Function:  test_existing_segments
+
+        Description:  Test segments left from a previous run.
+
+        Arguments:
+
+        """
+
+        for name in ["spool-2.json", "spool-1.json", "other.json"]:
+            with open(os.path.join(self.tmp_dir, name), mode="w",
+                      encoding="UTF-8"):
+                pass
+
+        spool = mongo_perf.Spool(self.tmp_dir)
+
+        self.assertEqual(
+            spool.segments(),
+            [os.path.join(self.tmp_dir, "spool-1.json"),
+             os.path.join(self.tmp_dir, "spool-2.json")])
+        self.assertTrue(spool.pending)
+
+    def test_segments(self):
+
+        """Function:  test_segments
+
+        Description:  Test segments method.
+
+        Arguments:
+
+        """
+
+        spool = mongo_perf.Spool(self.tmp_dir)
+        spool.append([{"_id": "Server1|1"}])
+
+        self.assertEqual(len(spool.segments()), 1)
+        self.assertIsNone(spool.fhandle)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+# Classification (U)
+
+"""Program:  srv_stat.py
+
+    Description:  Unit testing of srv_stat in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/srv_stat.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.count = 0
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub method holder for mongo_class.Server.adm_cmd.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.cmds.append(cmd)
+        self.count += 10
+
+        return {"opcounters": {"insert": self.count},
+                "connections": {"current": 5}}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_run_forever
+        test_missed_interval
+        test_fixed_schedule
+        test_zero_count
+        test_multiple_samples
+        test_srv_stat
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    def test_run_forever(self):
+
+        """Function:  test_run_forever
+
+        Description:  Test with no sample count.
+
+        Arguments:
+
+        """
+
+        stats = mongo_perf.srv_stat(self.server, None, 1)
+
+        for _ in range(5):
+            next(stats)
+
+        self.assertEqual(len(self.server.cmds), 6)
+
+    @mock.patch("mongo_perf.time.monotonic")
+    @mock.patch("mongo_perf.time.sleep")
+    def test_missed_interval(self, mock_sleep, mock_time):
+
+        """Function:  test_missed_interval
+
+        Description:  Test a missed interval is skipped instead of sampling
+            twice in a row.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100.0, 100.0, 101.0, 104.5, 105.0]
+
+        list(mongo_perf.srv_stat(self.server, 2, 1))
+
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list], [1.0, 0.5])
+
+    @mock.patch("mongo_perf.time.monotonic")
+    @mock.patch("mongo_perf.time.sleep")
+    def test_fixed_schedule(self, mock_sleep, mock_time):
+
+        """Function:  test_fixed_schedule
+
+        Description:  Test the polling interval is kept on a fixed schedule.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [100.0, 100.0, 100.5, 101.25, 102.0, 102.5]
+
+        list(mongo_perf.srv_stat(self.server, 2, 1))
+
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list], [1.0, 0.75])
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    def test_zero_count(self):
+
+        """Function:  test_zero_count
+
+        Description:  Test with a zero sample count.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(list(mongo_perf.srv_stat(self.server, 0, 1)), [])
+        self.assertEqual(self.server.cmds, ["serverStatus"])
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    def test_multiple_samples(self):
+
+        """Function:  test_multiple_samples
+
+        Description:  Test with multiple samples.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(len(list(mongo_perf.srv_stat(self.server, 3, 1))), 3)
+        self.assertEqual(len(self.server.cmds), 4)
+
+    @mock.patch("mongo_perf.time.sleep", mock.Mock(return_value=True))
+    def test_srv_stat(self):
+
+        """Function:  test_srv_stat
+
+        Description:  Test srv_stat function.
+
+        Arguments:
+
+        """
+
+        stats = list(mongo_perf.srv_stat(self.server, 1, 1))[0]
+
+        self.assertTrue("time" in stats and stats["conn"] == 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Classification (U)
+
+"""Program:  stagetimers_add.py
+
+    Description:  Unit testing of StageTimers.add in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stagetimers_add.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_top_bucket
+        test_two_stages
+        test_add
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timers = mongo_perf.StageTimers(60)
+
+    def test_top_bucket(self):
+
+        """Function:  test_top_bucket
+
+        Description:  Test with a time beyond the last bucket.
+
+        Arguments:
+
+        """
+
+        self.timers.add("parse", 10 ** 6)
+
+        self.assertEqual(self.timers.run["parse"][-1], 1)
+
+    def test_two_stages(self):
+
+        """Function:  test_two_stages
+
+        Description:  Test with two stages.
+
+        Arguments:
+
+        """
+
+        self.timers.add("parse", 0.000003)
+        self.timers.add("encode", 0.000003)
+
+        self.assertEqual(sorted(self.timers.current), ["encode", "parse"])
+
+    def test_add(self):
+
+        """Function:  test_add
+
+        Description:  Test add method.
+
+        Arguments:
+
+        """
+
+        self.timers.add("parse", 0.000003)
+        self.timers.add("parse", 0.000001)
+
+        for hist in (self.timers.current["parse"], self.timers.run["parse"]):
+            self.assertEqual(hist[:3], [2, 0.000004, 0.000003])
+            self.assertEqual(hist[3:7], [0, 1, 1, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  stagetimers_due.py
+
+    Description:  Unit testing of StageTimers.due in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stagetimers_due.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_due
+        test_due
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_perf.time.monotonic",
+                        mock.Mock(return_value=100.0)):
+            self.timers = mongo_perf.StageTimers(60)
+
+    @mock.patch("mongo_perf.time.monotonic")
+    def test_not_due(self, mock_time):
+
+        """Function:  test_not_due
+
+        Description:  Test before the interval has passed.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 150.0
+
+        self.assertFalse(self.timers.due())
+        self.assertEqual(self.timers.last, 100.0)
+
+    @mock.patch("mongo_perf.time.monotonic")
+    def test_due(self, mock_time):
+
+        """Function:  test_due
+
+        Description:  Test due method.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 160.0
+
+        self.assertTrue(self.timers.due())
+        self.assertEqual(self.timers.last, 160.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# Classification (U)
+
+"""Program:  stagetimers_init.py
+
+    Description:  Unit testing of StageTimers.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stagetimers_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_init
+
+    """
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        timers = mongo_perf.StageTimers(60)
+
+        self.assertEqual(
+            (timers.interval, timers.current, timers.run), (60, {}, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# Classification (U)
+
+"""Program:  stagetimers_iterate.py
+
+    Description:  Unit testing of StageTimers.iterate in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stagetimers_iterate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_iterate
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timers = mongo_perf.StageTimers(60)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty iterable.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(list(self.timers.iterate("sample", [])), [])
+        self.assertEqual(self.timers.run, {})
+
+    def test_iterate(self):
+
+        """Function:  test_iterate
+
+        Description:  Test iterate method.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(self.timers.iterate("sample", ["a", "b"])), ["a", "b"])
+        self.assertEqual(self.timers.run["sample"][0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
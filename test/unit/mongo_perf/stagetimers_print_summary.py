@@ -0,0 +1,80 @@
+# Classification (U)
+
+"""Program:  stagetimers_print_summary.py
+
+    Description:  Unit testing of StageTimers.print_summary in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stagetimers_print_summary.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_stages
+        test_print_summary
+
+    """
+
+    def test_no_stages(self):
+
+        """Function:  test_no_stages
+
+        Description:  Test with no stages timed.
+
+        Arguments:
+
+        """
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err:
+            mongo_perf.StageTimers(60).print_summary()
+
+        self.assertEqual(err.getvalue(), "")
+
+    def test_print_summary(self):
+
+        """Function:  test_print_summary
+
+        Description:  Test print_summary method.
+
+        Arguments:
+
+        """
+
+        timers = mongo_perf.StageTimers(60)
+        timers.add("parse", 0.000002)
+
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as err:
+            timers.print_summary()
+
+        self.assertTrue(err.getvalue().startswith("Stage timers:  "))
+        self.assertEqual(
+            mongo_perf.json.loads(err.getvalue()[15:])["parse"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
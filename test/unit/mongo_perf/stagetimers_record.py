@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  stagetimers_record.py
+
+    Description:  Unit testing of StageTimers.record in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stagetimers_record.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_interval
+        test_record
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timers = mongo_perf.StageTimers(60)
+        self.timers.add("parse", 0.000002)
+
+    def test_new_interval(self):
+
+        """Function:  test_new_interval
+
+        Description:  Test the record starts a new interval.
+
+        Arguments:
+
+        """
+
+        self.timers.record()
+
+        self.assertEqual(self.timers.current, {})
+        self.assertEqual(self.timers.run["parse"][0], 1)
+
+    @mock.patch("mongo_perf.time.strftime",
+                mock.Mock(return_value="2026-10-18 10:00:01"))
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test record method.
+
+        Arguments:
+
+        """
+
+        data = self.timers.record()
+
+        self.assertEqual(
+            (data["Server"], data["AsOf"]),
+            ("mongo_perf", "2026-10-18 10:00:01"))
+        self.assertEqual(
+            data["PerfStats"],
+            {"parse_count": 1, "parse_seconds": 0.000002, "parse_avg_us": 2.0,
+             "parse_p50_us": 2.0, "parse_p95_us": 2.0, "parse_max_us": 2.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  stagetimers_summary.py
+
+    Description:  Unit testing of StageTimers.summary in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stagetimers_summary.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_max_cap
+        test_summary
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timers = mongo_perf.StageTimers(60)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no stages.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.StageTimers.summary({}), {})
+
+    def test_max_cap(self):
+
+        """Function:  test_max_cap
+
+        Description:  Test the percentiles are no more than the maximum.
+
+        Arguments:
+
+        """
+
+        self.timers.add("parse", 0.000005)
+
+        self.assertEqual(
+            self.timers.summary(self.timers.run)["parse"]["p95_us"], 5.0)
+
+    def test_summary(self):
+
+        """Function:  test_summary
+
+        Description:  Test summary method.
+
+        Arguments:
+
+        """
+
+        for secs in [0.000001] * 10 + [0.0001]:
+            self.timers.add("parse", secs)
+
+        self.assertEqual(
+            self.timers.summary(self.timers.run),
+            {"parse": {"count": 11, "seconds": 0.00011, "avg_us": 10.0,
+                       "p50_us": 2.0, "p95_us": 100.0, "max_us": 100.0}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+# Classification (U)
+
+"""Program:  startup.py
+
+    Description:  Unit testing of the start up of mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/startup.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import math
+import subprocess
+import tempfile
+import shutil
+
+# Local
+sys.path.append(os.getcwd())
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+# Import time budget of mongo_perf.py in microseconds.
+STARTUP_BUDGET = 100000
+
+# A mongostat run to an output file and standard out, prints the modules
+#   imported by the run.
+MONGOSTAT_RUN = """
+import sys
+import types
+import mock
+sys.path.append(".")
+import mongo_perf
+
+cfg = types.ModuleType("mongo")
+cfg.__dict__.update(
+    name="mongo", user="mongo", japd="japd", host="localhost", port=27017,
+    auth=True, auth_db="admin", auth_mech="SCRAM-SHA-1", repset=None,
+    repset_hosts=None)
+sys.argv = ["mongo_perf.py", "-c", "mongo", "-d", "config", "-S", "-o",
+            sys.argv[1]]
+row = b'{"localhost:27017": {"insert": "*0", "time": "10:00:01"}}'
+
+with mock.patch("mongo_perf.gen_libs.load_module", return_value=cfg), \\
+        mock.patch("mongo_perf.get_data", return_value=row):
+    mongo_perf.main()
+
+print(" ".join(sys.modules))
+"""
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mongostat_run
+        test_lazy_modules
+        test_budget
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.times = {}
+
+        # Best of three, lines are:  import time: self | cumulative | name
+        for _ in range(3):
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c",
+                 "import mongo_perf"], stderr=subprocess.PIPE, check=True)
+            times = {}
+
+            for line in proc.stderr.decode().split("\n"):
+                fields = line.partition(":")[2].split("|")
+
+                if len(fields) == 3 and fields[1].strip().isdigit():
+                    times[fields[2].strip()] = int(fields[1])
+
+            if times["mongo_perf"] < self.times.get("mongo_perf", math.inf):
+                self.times = times
+
+    def test_mongostat_run(self):
+
+        """Function:  test_mongostat_run
+
+        Description:  Test a mongostat run to an output file and standard
+            out does not import pymongo or the mongo_lib modules.
+
+        Arguments:
+
+        """
+
+        tmp_dir = tempfile.mkdtemp()
+
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-c", MONGOSTAT_RUN,
+                 os.path.join(tmp_dir, "perf.json")],
+                stdout=subprocess.PIPE, check=True)
+
+            with open(os.path.join(tmp_dir, "perf.json"), mode="r",
+                      encoding="UTF-8") as fhdr:
+                self.assertIn('"Server": "mongo"', fhdr.read())
+
+        finally:
+            shutil.rmtree(tmp_dir)
+
+        modules = proc.stdout.decode().split("\n")[-2].split()
+
+        self.assertIn("mongo_perf", modules)
+        self.assertFalse(
+            [name for name in ["pymongo", "bson", "mongo_lib.mongo_libs",
+                               "mongo_lib.mongo_class"] if name in modules])
+
+    def test_lazy_modules(self):
+
+        """Function:  test_lazy_modules
+
+        Description:  Test the modules only some options need are not imported
+            at start up.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            [name for name in ["pymongo", "bson", "mongo_lib.mongo_libs",
+                               "mongo_lib.mongo_class", "http.server",
+                               "concurrent.futures"]
+             if name in self.times])
+
+    def test_budget(self):
+
+        """Function:  test_budget
+
+        Description:  Test the import time is within the start up budget.
+
+        Arguments:
+
+        """
+
+        self.assertLessEqual(self.times["mongo_perf"], STARTUP_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  stream_data.py
+
+    Description:  Unit testing of stream_data in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/stream_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SubProcess():
+
+    """Class:  SubProcess
+
+    Description:  Class which is a representation of the subprocess class.
+
+    Methods:
+        __init__
+        terminate
+        wait
+
+    """
+
+    def __init__(self, data):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the SubProcess class.
+
+        Arguments:
+            (input) data
+
+        """
+
+        self.stdout = io.BytesIO(data)
+        self.terminated = False
+        self.waited = False
+
+    def terminate(self):
+
+        """Method:  terminate
+
+        Description:  Mock representation of subprocess.terminate method.
+
+        Arguments:
+
+        """
+
+        self.terminated = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Mock representation of subprocess.wait method.
+
+        Arguments:
+
+        """
+
+        self.waited = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stop_early
+        test_no_data
+        test_stream_data
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cmd = ["testme"]
+        self.data = b"Line1\nLine2\n"
+        self.results = [b"Line1\n", b"Line2\n"]
+
+    @mock.patch("mongo_perf.subprocess.Popen")
+    def test_stop_early(self, mock_open):
+
+        """Function:  test_stop_early
+
+        Description:  Test with stopping the stream before program completes.
+
+        Arguments:
+
+        """
+
+        proc = SubProcess(self.data)
+        mock_open.return_value = proc
+
+        stream = mongo_perf.stream_data(self.cmd)
+        next(stream)
+        stream.close()
+
+        self.assertTrue(proc.terminated and proc.waited)
+
+    @mock.patch("mongo_perf.subprocess.Popen")
+    def test_no_data(self, mock_open):
+
+        """Function:  test_no_data
+
+        Description:  Test with no data returned from program.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value = SubProcess(b"")
+
+        self.assertEqual(list(mongo_perf.stream_data(self.cmd)), [])
+
+    @mock.patch("mongo_perf.subprocess.Popen")
+    def test_stream_data(self, mock_open):
+
+        """Function:  test_stream_data
+
+        Description:  Test stream_data function.
+
+        Arguments:
+
+        """
+
+        proc = SubProcess(self.data)
+        mock_open.return_value = proc
+
+        self.assertEqual(
+            list(mongo_perf.stream_data(self.cmd)), self.results)
+        self.assertFalse(proc.terminated)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  timed.py
+
+    Description:  Unit testing of timed in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/timed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_error
+        test_timed
+        test_no_timers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timers = mongo_perf.StageTimers(60)
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test the call is timed when the function fails.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mongo_perf.timed(self.timers, "parse", int)("A")
+
+        self.assertEqual(self.timers.run["parse"][0], 1)
+
+    def test_timed(self):
+
+        """Function:  test_timed
+
+        Description:  Test with stage timers.
+
+        Arguments:
+
+        """
+
+        func = mongo_perf.timed(self.timers, "parse", int)
+
+        self.assertIsNot(func, int)
+        self.assertEqual(func("5"), 5)
+        self.assertEqual(self.timers.run["parse"][0], 1)
+
+    def test_no_timers(self):
+
+        """Function:  test_no_timers
+
+        Description:  Test the function is returned without timers.
+
+        Arguments:
+
+        """
+
+        self.assertIs(mongo_perf.timed(None, "parse", int), int)
+
+
+if __name__ == "__main__":
+    unittest.main()
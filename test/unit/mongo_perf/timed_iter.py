@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  timed_iter.py
+
+    Description:  Unit testing of timed_iter in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/timed_iter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timed
+        test_no_timers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timers = mongo_perf.StageTimers(60)
+        self.items = ["a", "b"]
+
+    def test_timed(self):
+
+        """Function:  test_timed
+
+        Description:  Test with stage timers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mongo_perf.timed_iter(self.timers, "sample", self.items)),
+            self.items)
+        self.assertEqual(self.timers.run["sample"][0], 2)
+
+    def test_no_timers(self):
+
+        """Function:  test_no_timers
+
+        Description:  Test the iterable is returned without timers.
+
+        Arguments:
+
+        """
+
+        self.assertIs(
+            mongo_perf.timed_iter(None, "sample", self.items), self.items)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Classification (U)
+
+"""Program:  timeseries_doc.py
+
+    Description:  Unit testing of timeseries_doc in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/timeseries_doc.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import datetime
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_repset
+        test_doc_not_changed
+        test_timeseries_doc
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.doc = {"Server": "Server1", "AsOf": "2026-10-18 10:00:01",
+                    "PerfStats": {"insert": 1}}
+
+    def test_repset(self):
+
+        """Function:  test_repset
+
+        Description:  Test with the replica set name.
+
+        Arguments:
+
+        """
+
+        self.doc["RepSet"] = "spock"
+        self.doc["RepState"] = "PRI"
+
+        data = mongo_perf.timeseries_doc(self.doc)
+
+        self.assertEqual(data["Meta"], {"Server": "Server1",
+                                        "RepSet": "spock"})
+        self.assertEqual(data["RepState"], "PRI")
+        self.assertNotIn("RepSet", data)
+
+    def test_doc_not_changed(self):
+
+        """Function:  test_doc_not_changed
+
+        Description:  Test the passed document is not changed.
+
+        Arguments:
+
+        """
+
+        mongo_perf.timeseries_doc(self.doc)
+
+        self.assertEqual(self.doc["AsOf"], "2026-10-18 10:00:01")
+
+    def test_timeseries_doc(self):
+
+        """Function:  test_timeseries_doc
+
+        Description:  Test timeseries_doc function.
+
+        Arguments:
+
+        """
+
+        data = mongo_perf.timeseries_doc(self.doc)
+
+        self.assertEqual(
+            data["AsOf"],
+            datetime.datetime(2026, 10, 18, 10, 0, 1).astimezone(
+                datetime.timezone.utc))
+        self.assertEqual(data["Meta"], {"Server": "Server1"})
+        self.assertEqual(data["PerfStats"], {"insert": 1})
+        self.assertNotIn("Server", data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  to_number.py
+
+    Description:  Unit testing of to_number in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/to_number.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_invalid
+        test_binary_suffix
+        test_decimal_suffix
+        test_float
+        test_to_number
+
+    """
+
+    def test_invalid(self):
+
+        """Function:  test_invalid
+
+        Description:  Test with a value that is not a number.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mongo_perf.to_number("abc")
+
+    def test_binary_suffix(self):
+
+        """Function:  test_binary_suffix
+
+        Description:  Test with a binary size suffix.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.to_number("1.5G"), 1610612736)
+        self.assertEqual(mongo_perf.to_number("74.0M"), 77594624)
+
+    def test_decimal_suffix(self):
+
+        """Function:  test_decimal_suffix
+
+        Description:  Test with a decimal size suffix.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.to_number("158b"), 158)
+        self.assertEqual(mongo_perf.to_number("62.3k"), 62300)
+
+    def test_float(self):
+
+        """Function:  test_float
+
+        Description:  Test with a float value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.to_number("2.5"), 2.5)
+
+    def test_to_number(self):
+
+        """Function:  test_to_number
+
+        Description:  Test to_number function.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_perf.to_number("45"), 45)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# Classification (U)
+
+"""Program:  udpemitter_close.py
+
+    Description:  Unit testing of UdpEmitter.close in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/udpemitter_close.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_close
+
+    """
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test close method.
+
+        Arguments:
+
+        """
+
+        emitter = mongo_perf.UdpEmitter("127.0.0.1:8125")
+
+        emitter.close()
+
+        self.assertEqual(emitter.sock.fileno(), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
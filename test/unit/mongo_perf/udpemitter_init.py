@@ -0,0 +1,110 @@
+# Classification (U)
+
+"""Program:  udpemitter_init.py
+
+    Description:  Unit testing of UdpEmitter.__init__ in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/udpemitter_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_graphite
+        test_init
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.settimeout(5)
+        self.address = f"127.0.0.1:{self.listener.getsockname()[1]}"
+        self.emitter = mongo_perf.UdpEmitter(self.address)
+        self.data = {"Server": "db1.domain:27017",
+                     "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "net.in": 2.5, "set": "a"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.emitter.close()
+        self.listener.close()
+
+    def test_graphite(self):
+
+        """Function:  test_graphite
+
+        Description:  Test with the graphite format.
+
+        Arguments:
+
+        """
+
+        emitter = mongo_perf.UdpEmitter(self.address, "graphite", 512)
+
+        self.assertEqual((emitter.fmt, emitter.mtu), ("graphite", 512))
+
+        emitter.close()
+
+    def test_init(self):
+
+        """Function:  test_init
+
+        Description:  Test __init__ method.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.emitter.sock.getpeername(),
+                         self.listener.getsockname())
+        self.assertEqual((self.emitter.fmt, self.emitter.mtu),
+                         ("statsd", mongo_perf.UDP_MTU))
+        self.assertEqual((self.emitter.sent, self.emitter.dropped), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
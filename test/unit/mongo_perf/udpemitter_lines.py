@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  udpemitter_lines.py
+
+    Description:  Unit testing of UdpEmitter.lines in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/udpemitter_lines.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_graphite
+        test_statsd
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.settimeout(5)
+        self.address = f"127.0.0.1:{self.listener.getsockname()[1]}"
+        self.emitter = mongo_perf.UdpEmitter(self.address)
+        self.data = {"Server": "db1.domain:27017",
+                     "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "net.in": 2.5, "set": "a"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.emitter.close()
+        self.listener.close()
+
+    def test_graphite(self):
+
+        """Function:  test_graphite
+
+        Description:  Test with the graphite format.
+
+        Arguments:
+
+        """
+
+        self.emitter.fmt = "graphite"
+        stamp = int(mongo_perf.time.mktime((2026, 10, 18, 10, 0, 1, 0, 0, -1)))
+
+        self.assertEqual(
+            self.emitter.lines(self.data),
+            [f"mongo_perf.db1_domain_27017.insert 5 {stamp}".encode(),
+             f"mongo_perf.db1_domain_27017.net_in 2.5 {stamp}".encode()])
+
+    def test_statsd(self):
+
+        """Function:  test_statsd
+
+        Description:  Test with the statsd format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.emitter.lines(self.data),
+            [b"mongo_perf.db1_domain_27017.insert:5|g",
+             b"mongo_perf.db1_domain_27017.net_in:2.5|g"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+# Classification (U)
+
+"""Program:  udpemitter_send.py
+
+    Description:  Unit testing of UdpEmitter.send in mongo_perf.py.
+
+    Usage:
+        test/unit/mongo_perf/udpemitter_send.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import socket
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_perf                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_packed
+        test_dropped
+        test_no_stats
+        test_send
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.settimeout(5)
+        self.address = f"127.0.0.1:{self.listener.getsockname()[1]}"
+        self.emitter = mongo_perf.UdpEmitter(self.address)
+        self.data = {"Server": "db1.domain:27017",
+                     "AsOf": "2026-10-18 10:00:01",
+                     "PerfStats": {"insert": 5, "net.in": 2.5, "set": "a"}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.emitter.close()
+        self.listener.close()
+
+    def test_packed(self):
+
+        """Function:  test_packed
+
+        Description:  Test the lines are packed up to the MTU.
+
+        Arguments:
+
+        """
+
+        self.data["PerfStats"] = {f"stat{num:03}": num for num in range(100)}
+        self.emitter.mtu = 512
+
+        self.emitter.send(self.data)
+        packets = [self.listener.recv(2048)
+                   for _ in range(self.emitter.sent)]
+        lines = b"\n".join(packets).split(b"\n")
+
+        self.assertGreater(self.emitter.sent, 1)
+        self.assertTrue(all(len(packet) <= 512 for packet in packets))
+        self.assertEqual(lines, self.emitter.lines(self.data))
+
+    def test_dropped(self):
+
+        """Function:  test_dropped
+
+        Description:  Test with a datagram that cannot be sent.
+
+        Arguments:
+
+        """
+
+        self.emitter.sock = mock.Mock()
+        self.emitter.sock.send.side_effect = OSError("Connection refused")
+
+        self.emitter.send(self.data)
+
+        self.assertEqual((self.emitter.sent, self.emitter.dropped), (0, 1))
+
+    def test_no_stats(self):
+
+        """Function:  test_no_stats
+
+        Description:  Test with no numeric statistics.
+
+        Arguments:
+
+        """
+
+        self.data["PerfStats"] = {"set": "a"}
+
+        self.emitter.send(self.data)
+
+        self.assertEqual(self.emitter.sent, 0)
+
+    def test_send(self):
+
+        """Function:  test_send
+
+        Description:  Test send method.
+
+        Arguments:
+
+        """
+
+        self.emitter.send(self.data)
+
+        self.assertEqual(
+            self.listener.recv(2048),
+            b"mongo_perf.db1_domain_27017.insert:5|g\n"
+            b"mongo_perf.db1_domain_27017.net_in:2.5|g")
+        self.assertEqual(self.emitter.sent, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,3 +12,145 @@ echo "Unit testing..."
 /usr/bin/python ./test/unit/mongo_perf/main.py
 /usr/bin/python ./test/unit/mongo_perf/mongo_stat.py
 /usr/bin/python ./test/unit/mongo_perf/run_program.py
+/usr/bin/python ./test/unit/mongo_perf/stream_data.py
+/usr/bin/python ./test/unit/mongo_perf/get_mongostat.py
+/usr/bin/python ./test/unit/mongo_perf/get_value.py
+/usr/bin/python ./test/unit/mongo_perf/get_rate.py
+/usr/bin/python ./test/unit/mongo_perf/calc_stats.py
+/usr/bin/python ./test/unit/mongo_perf/srv_stat.py
+/usr/bin/python ./test/unit/mongo_perf/get_members.py
+/usr/bin/python ./test/unit/mongo_perf/member_stat.py
+/usr/bin/python ./test/unit/mongo_perf/put_samples.py
+/usr/bin/python ./test/unit/mongo_perf/merge_samples.py
+/usr/bin/python ./test/unit/mongo_perf/proc_samples.py
+/usr/bin/python ./test/unit/mongo_perf/get_fleet.py
+/usr/bin/python ./test/unit/mongo_perf/create_server.py
+/usr/bin/python ./test/unit/mongo_perf/sample_target.py
+/usr/bin/python ./test/unit/mongo_perf/fleet_samples.py
+/usr/bin/python ./test/unit/mongo_perf/run_fleet.py
+/usr/bin/python ./test/unit/mongo_perf/daemon_stat.py
+/usr/bin/python ./test/unit/mongo_perf/sigterm_handler.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_connect.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_insert.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_close.py
+/usr/bin/python ./test/unit/mongo_perf/parse_rows.py
+/usr/bin/python ./test/unit/mongo_perf/to_number.py
+/usr/bin/python ./test/unit/mongo_perf/decode_op.py
+/usr/bin/python ./test/unit/mongo_perf/decode_pair.py
+/usr/bin/python ./test/unit/mongo_perf/decode_pct.py
+/usr/bin/python ./test/unit/mongo_perf/decode_num.py
+/usr/bin/python ./test/unit/mongo_perf/decode_stats.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_flush.py
+/usr/bin/python ./test/unit/mongo_perf/create_insert.py
+/usr/bin/python ./test/unit/mongo_perf/filewriter_write.py
+/usr/bin/python ./test/unit/mongo_perf/filewriter_flush.py
+/usr/bin/python ./test/unit/mongo_perf/filewriter_close.py
+/usr/bin/python ./test/unit/mongo_perf/sinkworker_put.py
+/usr/bin/python ./test/unit/mongo_perf/sinkworker_run.py
+/usr/bin/python ./test/unit/mongo_perf/sinkworker_drain_spill.py
+/usr/bin/python ./test/unit/mongo_perf/sinkworker_process.py
+/usr/bin/python ./test/unit/mongo_perf/sinkworker_status.py
+/usr/bin/python ./test/unit/mongo_perf/sinkworker_close.py
+/usr/bin/python ./test/unit/mongo_perf/get_records.py
+/usr/bin/python ./test/unit/mongo_perf/sink_funcs.py
+/usr/bin/python ./test/unit/mongo_perf/queue_records.py
+/usr/bin/python ./test/unit/mongo_perf/print_status.py
+/usr/bin/python ./test/unit/mongo_perf/insert_docs.py
+/usr/bin/python ./test/unit/mongo_perf/spool_append.py
+/usr/bin/python ./test/unit/mongo_perf/spool_segments.py
+/usr/bin/python ./test/unit/mongo_perf/spool_replay.py
+/usr/bin/python ./test/unit/mongo_perf/spool_close.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_spool_docs.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_replay.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_create_timeseries.py
+/usr/bin/python ./test/unit/mongo_perf/timeseries_doc.py
+/usr/bin/python ./test/unit/mongo_perf/segmentwriter_write.py
+/usr/bin/python ./test/unit/mongo_perf/segmentwriter_write_record.py
+/usr/bin/python ./test/unit/mongo_perf/segmentwriter_open_segment.py
+/usr/bin/python ./test/unit/mongo_perf/segmentwriter_finalize.py
+/usr/bin/python ./test/unit/mongo_perf/segmentwriter_prune.py
+/usr/bin/python ./test/unit/mongo_perf/segmentwriter_close.py
+/usr/bin/python ./test/unit/mongo_perf/create_writer.py
+/usr/bin/python ./test/unit/mongo_perf/roundrobin_init.py
+/usr/bin/python ./test/unit/mongo_perf/roundrobin_create.py
+/usr/bin/python ./test/unit/mongo_perf/roundrobin_update.py
+/usr/bin/python ./test/unit/mongo_perf/roundrobin_rows.py
+/usr/bin/python ./test/unit/mongo_perf/roundrobin_fetch.py
+/usr/bin/python ./test/unit/mongo_perf/roundrobin_close.py
+/usr/bin/python ./test/unit/mongo_perf/rrd_update.py
+/usr/bin/python ./test/unit/mongo_perf/dump_rrd.py
+/usr/bin/python ./test/unit/mongo_perf/sample_metrics.py
+/usr/bin/python ./test/unit/mongo_perf/columnarchive_append.py
+/usr/bin/python ./test/unit/mongo_perf/columnarchive_open_block.py
+/usr/bin/python ./test/unit/mongo_perf/columnarchive_flush.py
+/usr/bin/python ./test/unit/mongo_perf/columnarchive_close.py
+/usr/bin/python ./test/unit/mongo_perf/read_column.py
+/usr/bin/python ./test/unit/mongo_perf/load_json.py
+/usr/bin/python ./test/unit/mongo_perf/convert_json.py
+/usr/bin/python ./test/unit/mongo_perf/metricsserver_init.py
+/usr/bin/python ./test/unit/mongo_perf/metricsserver_update.py
+/usr/bin/python ./test/unit/mongo_perf/metricsserver_render.py
+/usr/bin/python ./test/unit/mongo_perf/metricsserver_close.py
+/usr/bin/python ./test/unit/mongo_perf/metricshandler_do_get.py
+/usr/bin/python ./test/unit/mongo_perf/udpemitter_init.py
+/usr/bin/python ./test/unit/mongo_perf/udpemitter_lines.py
+/usr/bin/python ./test/unit/mongo_perf/udpemitter_send.py
+/usr/bin/python ./test/unit/mongo_perf/udpemitter_close.py
+/usr/bin/python ./test/unit/mongo_perf/check_options.py
+/usr/bin/python ./test/unit/mongo_perf/aggregate_init.py
+/usr/bin/python ./test/unit/mongo_perf/aggregate_add.py
+/usr/bin/python ./test/unit/mongo_perf/aggregate_quantile.py
+/usr/bin/python ./test/unit/mongo_perf/maildigest_init.py
+/usr/bin/python ./test/unit/mongo_perf/maildigest_add.py
+/usr/bin/python ./test/unit/mongo_perf/maildigest_table.py
+/usr/bin/python ./test/unit/mongo_perf/maildigest_send.py
+/usr/bin/python ./test/unit/mongo_perf/maildigest_close.py
+/usr/bin/python ./test/unit/mongo_perf/create_mail.py
+/usr/bin/python ./test/unit/mongo_perf/sink_open.py
+/usr/bin/python ./test/unit/mongo_perf/sink_write_batch.py
+/usr/bin/python ./test/unit/mongo_perf/sink_flush.py
+/usr/bin/python ./test/unit/mongo_perf/sink_close.py
+/usr/bin/python ./test/unit/mongo_perf/funcsink_init.py
+/usr/bin/python ./test/unit/mongo_perf/funcsink_write_batch.py
+/usr/bin/python ./test/unit/mongo_perf/sinkrunner_init.py
+/usr/bin/python ./test/unit/mongo_perf/sinkrunner_write.py
+/usr/bin/python ./test/unit/mongo_perf/sinkrunner_send.py
+/usr/bin/python ./test/unit/mongo_perf/sinkrunner_flush.py
+/usr/bin/python ./test/unit/mongo_perf/sinkrunner_close.py
+/usr/bin/python ./test/unit/mongo_perf/sinkrunner_status.py
+/usr/bin/python ./test/unit/mongo_perf/create_sinks.py
+/usr/bin/python ./test/unit/mongo_perf/load_sink.py
+/usr/bin/python ./test/unit/mongo_perf/open_text.py
+/usr/bin/python ./test/unit/mongo_perf/replay_samples.py
+/usr/bin/python ./test/unit/mongo_perf/run_replay.py
+/usr/bin/python ./test/unit/mongo_perf/stagetimers_init.py
+/usr/bin/python ./test/unit/mongo_perf/stagetimers_add.py
+/usr/bin/python ./test/unit/mongo_perf/stagetimers_iterate.py
+/usr/bin/python ./test/unit/mongo_perf/stagetimers_due.py
+/usr/bin/python ./test/unit/mongo_perf/stagetimers_summary.py
+/usr/bin/python ./test/unit/mongo_perf/stagetimers_record.py
+/usr/bin/python ./test/unit/mongo_perf/stagetimers_print_summary.py
+/usr/bin/python ./test/unit/mongo_perf/create_timers.py
+/usr/bin/python ./test/unit/mongo_perf/timed.py
+/usr/bin/python ./test/unit/mongo_perf/timed_iter.py
+/usr/bin/python ./test/unit/mongo_perf/sample_doc.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_init.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_start.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_run.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_sample.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_snapshot.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_alloc_report.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_write_stacks.py
+/usr/bin/python ./test/unit/mongo_perf/profiler_stop.py
+/usr/bin/python ./test/unit/mongo_perf/profile_run.py
+/usr/bin/python ./test/unit/mongo_perf/lazy_import.py
+/usr/bin/python ./test/unit/mongo_perf/lazymodule_getattr.py
+/usr/bin/python ./test/unit/mongo_perf/startup.py
+/usr/bin/python ./test/unit/mongo_perf/metrics_once.py
+/usr/bin/python ./test/unit/mongo_perf/guard.py
+/usr/bin/python ./test/unit/mongo_perf/reconnect.py
+/usr/bin/python ./test/unit/mongo_perf/connect_target.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_start_timer.py
+/usr/bin/python ./test/unit/mongo_perf/mongoinsert_expire.py
+/usr/bin/python ./test/unit/mongo_perf/needs_connection.py
+/usr/bin/python ./test/unit/mongo_perf/mongostat_cmd.py
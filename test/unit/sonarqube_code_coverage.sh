@@ -14,6 +14,148 @@ coverage run -a --source=mongo_perf test/unit/mongo_perf/help_message.py
 coverage run -a --source=mongo_perf test/unit/mongo_perf/main.py
 coverage run -a --source=mongo_perf test/unit/mongo_perf/mongo_stat.py
 coverage run -a --source=mongo_perf test/unit/mongo_perf/run_program.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stream_data.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/get_mongostat.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/get_value.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/get_rate.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/calc_stats.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/srv_stat.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/get_members.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/member_stat.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/put_samples.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/merge_samples.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/proc_samples.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/get_fleet.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/create_server.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sample_target.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/fleet_samples.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/run_fleet.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/daemon_stat.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sigterm_handler.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_connect.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_insert.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/parse_rows.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/to_number.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/decode_op.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/decode_pair.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/decode_pct.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/decode_num.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/decode_stats.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_flush.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/create_insert.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/filewriter_write.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/filewriter_flush.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/filewriter_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkworker_put.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkworker_run.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkworker_drain_spill.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkworker_process.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkworker_status.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkworker_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/get_records.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sink_funcs.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/queue_records.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/print_status.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/insert_docs.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/spool_append.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/spool_segments.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/spool_replay.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/spool_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_spool_docs.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_replay.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_create_timeseries.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/timeseries_doc.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/segmentwriter_write.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/segmentwriter_write_record.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/segmentwriter_open_segment.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/segmentwriter_finalize.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/segmentwriter_prune.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/segmentwriter_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/create_writer.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/roundrobin_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/roundrobin_create.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/roundrobin_update.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/roundrobin_rows.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/roundrobin_fetch.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/roundrobin_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/rrd_update.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/dump_rrd.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sample_metrics.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/columnarchive_append.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/columnarchive_open_block.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/columnarchive_flush.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/columnarchive_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/read_column.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/load_json.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/convert_json.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/metricsserver_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/metricsserver_update.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/metricsserver_render.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/metricsserver_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/metricshandler_do_get.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/udpemitter_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/udpemitter_lines.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/udpemitter_send.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/udpemitter_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/check_options.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/aggregate_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/aggregate_add.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/aggregate_quantile.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/maildigest_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/maildigest_add.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/maildigest_table.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/maildigest_send.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/maildigest_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/create_mail.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sink_open.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sink_write_batch.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sink_flush.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sink_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/funcsink_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/funcsink_write_batch.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkrunner_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkrunner_write.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkrunner_send.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkrunner_flush.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkrunner_close.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sinkrunner_status.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/create_sinks.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/load_sink.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/open_text.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/replay_samples.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/run_replay.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stagetimers_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stagetimers_add.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stagetimers_iterate.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stagetimers_due.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stagetimers_summary.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stagetimers_record.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/stagetimers_print_summary.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/create_timers.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/timed.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/timed_iter.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/sample_doc.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_init.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_start.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_run.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_sample.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_snapshot.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_alloc_report.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_write_stacks.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profiler_stop.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/profile_run.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/lazy_import.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/lazymodule_getattr.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/startup.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/metrics_once.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/guard.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/reconnect.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/connect_target.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_start_timer.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongoinsert_expire.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/needs_connection.py
+coverage run -a --source=mongo_perf test/unit/mongo_perf/mongostat_cmd.py
 
 
 echo ""
@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "3.1.2"
+__version__ = "3.2.0"